@@ -13,6 +13,7 @@ import { fileURLToPath } from 'node:url'
 config({ path: '.env.local' })
 
 import { fal } from '@fal-ai/client'
+import { uploadable } from '../../tools/blockout_kit/variants.mts'
 import { VIDEO_MODELS, clampDuration } from '@/lib/video-models'
 
 fal.config({ credentials: process.env.FAL_KEY ?? '' })
@@ -89,12 +90,15 @@ async function prep() {
   if (prov.viewsheet.fal_urls.length === files.length) { console.log('뷰 시트 이미 업로드됨 — skip'); return }
   prov.viewsheet.files = files
   prov.viewsheet.fal_urls = []
+  prov.viewsheet.uploaded = []
   for (const f of files) {
     const srcDir = existsSync(join(DIR, 'views_frozen')) ? join(DIR, 'views_frozen') : join(DIR, 'views')
-    const buf = readFileSync(join(srcDir, f))
-    const url = await fal.storage.upload(new File([buf], f, { type: 'image/png' }))
+    // BLOCKOUT_UPLOAD_BUDGET 이 있으면 예산 안의 WebP 변형을 올린다(없으면 PNG 원본 그대로) — 올린 바이트를 기록
+    const up = await uploadable(join(srcDir, f), { accept: ['webp', 'png'] })
+    const url = await fal.storage.upload(new File([readFileSync(up.path)], up.name, { type: up.mime }))
     prov.viewsheet.fal_urls.push(url)
-    console.log(`uploaded ${f} → ${url}`)
+    prov.viewsheet.uploaded.push({ file: f, sent: up.name, mime: up.mime, bytes: up.bytes, quality: up.variant?.quality })
+    console.log(`uploaded ${up.name} (${(up.bytes / 1024).toFixed(0)} KiB) → ${url}`)
   }
   prov.viewsheet.uploaded_at = new Date().toISOString()
   writeFileSync(MANIFEST, JSON.stringify(prov, null, 2))
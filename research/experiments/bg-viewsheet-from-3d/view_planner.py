@@ -0,0 +1,336 @@
+# 법정 뷰 플래너 — 각도 수요에서 **최소 뷰 세트**를 고른다 (렌더 없음, Blender 불필요)
+#
+# 목적: courtroom_blockout.py 의 VIEWS 5장은 사람이 수요(eye_level 39 / low_angle 10 / high_angle 3,
+#   뷰 클러스터 = 판사석·벽·방청석·천장·디테일)를 읽고 손으로 골랐다. 여기서는 같은 판단을 기계로 한다:
+#     ① 빈 공간 안에 후보 카메라 수천 대를 결정적 수열로 뿌린다(난수 없음 — plate 의 R2 와 같은 방식).
+#     ② 후보마다 랜드마크 점을 투영해 프레임 안·가림 없음 여부를 세고(레이 vs 박스), 피치로 각도 분류.
+#     ③ 수요 스펙(각도별 뷰 수 + 덮어야 할 클러스터)을 탐욕 집합 덮개로 채운다 — 남은 수요를
+#        가장 많이 줄이는 후보부터. 결과는 VIEWS 와 같은 튜플 (파일명, 위치, 타겟, mm, 설명).
+#   렌더는 Cycles 로 장당 수십 초, 여기는 후보 4000대에 수 초. 그래서 "샷이 요구하는 만큼만" 렌더한다.
+#
+# 기하는 courtroom_blockout.py 의 치수를 **가림용 거친 볼륨**으로만 옮겼다(벤치·판사석·단상·측면 단·
+#   의자·깃발 천). 유리(바·증인석·난간)는 투과라 가림에서 뺀다. 블록아웃 치수를 바꾸면 여기도 맞출 것.
+#   카메라가 볼륨 안에 파묻히는 후보는 버린다 — courtroom 헤더의 함정 ④(벤치 안 카메라)를 자동 검산.
+#
+# 실행 (Python 3.9+, 표준 라이브러리만):
+#   python research/experiments/bg-viewsheet-from-3d/view_planner.py                # phase0.json 수요
+#   python .../view_planner.py --demand demand.json --candidates 8000 --out views/plan.json
+#   BG3D_PLAN=views/plan.json blender --background --python .../courtroom_blockout.py  # 플랜대로 렌더
+#
+# 수요 스펙(JSON):
+#   {"angles": {"eye_level": 1, "low_angle": 1, "high_angle": 1},
+#    "clusters": {"bench": 1, "gallery": 1, "wall": 1, "ceiling": 1, "detail": 1},
+#    "min_visible": 0.5}
+#   angles = 각도별 필요한 뷰 수, clusters = 클러스터별 그 클러스터를 "담은" 뷰 수,
+#   min_visible = 클러스터 랜드마크 중 보여야 "담았다"고 치는 비율.
+#   --demand 가 없으면 phase0.json 의 angle_demand 에서 0보다 큰 각도마다 1장 + 클러스터 5개 각 1장.
+import argparse
+import json
+import math
+import os
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# ── 방 치수 (courtroom_blockout.py 와 동일) ──
+HW = 7.0
+Y_FAR = 10.0
+Y_NEAR = -10.0
+Z_SOFFIT = 4.45
+Z_HIGH = 4.95
+RX, RY = 4.6, 6.5
+CH = 1.5
+DAIS_Z = 0.35
+AISLE, BENCH_X, SEAT_TOP = 1.30, 6.50, 0.46
+BENCH_ROWS = (-1.80, -3.40, -5.00, -6.60, -8.20)
+
+SENSOR_W = 36.0
+ASPECT = 16 / 9
+LENSES = (20, 24, 28, 35)
+ANGLE_SHORT = {"eye_level": "eye", "low_angle": "low", "high_angle": "high"}
+
+
+# ── 가림 볼륨 — (xmin,xmax, ymin,ymax, zmin,zmax). 전부 불투명 재질만 ──
+def _occluders():
+    vols = [
+        (-5.6, 5.6, 6.6, Y_FAR, 0.0, DAIS_Z),            # 단상
+        (-4.58, 4.58, 7.0, 8.62, 0.0, 1.31),             # 판사석 데스크 (앞 선반 포함)
+    ]
+    for cxc, back_top, w in ((-2.25, 1.55, 0.52), (0.0, 1.72, 0.60), (2.25, 1.55, 0.52)):
+        vols.append((cxc - w / 2, cxc + w / 2, 8.75, 9.40, DAIS_Z, back_top))
+    for sx in (-1, 1):
+        lo, hi = sorted((sx * 4.70, sx * 6.75))
+        vols.append((lo, hi, 4.20, 6.30, 0.0, 0.28))                 # 측면 단
+        vols.append((lo + 0.20, hi - 0.20, 4.75, 5.85, 0.24, 0.74))  # 측면 단 데스크
+        px = sx * 4.92
+        fx0, fx1 = sorted((px + 0.05, px + 0.62) if sx < 0 else (px - 0.62, px - 0.05))
+        vols.append((fx0, fx1, 8.93, 8.97, DAIS_Z + 1.92, DAIS_Z + 3.52))  # 깃발 천
+    for by in BENCH_ROWS:
+        for sx in (-1, 1):
+            lo, hi = sorted((sx * AISLE, sx * BENCH_X))
+            vols.append((lo, hi, by - 0.28, by + 0.28, 0.0, SEAT_TOP))
+    # 소핏 밴드 — 리세스 개구 바깥의 낮은 천장 (리세스 쪽 랜드마크를 벽 쪽 카메라에서 가린다)
+    vols += [
+        (-HW, HW, Y_NEAR, -RY, Z_SOFFIT, Z_HIGH),
+        (-HW, HW, RY, Y_FAR, Z_SOFFIT, Z_HIGH),
+        (-HW, -RX, -RY, RY, Z_SOFFIT, Z_HIGH),
+        (RX, HW, -RY, RY, Z_SOFFIT, Z_HIGH),
+    ]
+    return vols
+
+
+# ── 랜드마크 — 클러스터별 대표 점. 면에서 2cm 실내 쪽으로 띄워 자기 볼륨에 안 가리게 둔다 ──
+def _landmarks():
+    c = {}
+    c["bench"] = [
+        (0.0, 6.98, 1.00), (-4.2, 6.98, 1.05), (4.2, 6.98, 1.05),   # 판사석 앞면 중앙·양 끝
+        (0.0, 9.20, 1.74),                                          # 판사 의자 등받이
+        (0.0, 9.76, 3.36), (0.0, 9.74, 2.78),                       # 휘장 · 명패
+        (-4.60, 8.90, 3.00), (4.60, 8.90, 3.00),                    # 깃발 2
+        (-6.0, 9.88, 1.30), (6.0, 9.88, 1.30),                      # 출입구 2
+    ]
+    c["gallery"] = []
+    for by in BENCH_ROWS[::2]:
+        c["gallery"] += [(-3.9, by, SEAT_TOP + 0.02), (3.9, by, SEAT_TOP + 0.02)]
+    c["gallery"] += [(0.0, -9.88, 1.30), (0.0, -5.0, 0.02)]         # 입구 문 · 중앙 통로
+    c["wall"] = [(sx * (HW - 0.08), yy, 2.2) for sx in (-1, 1) for yy in (-6.0, -2.0, 2.0, 6.0)]
+    c["ceiling"] = [
+        (0.0, -RY + 0.05, Z_SOFFIT - 0.02), (0.0, RY - 0.05, Z_SOFFIT - 0.02),
+        (-RX + 0.05, 0.0, Z_SOFFIT - 0.02), (RX - 0.05, 0.0, Z_SOFFIT - 0.02),
+        (0.0, 0.0, Z_HIGH - 0.02), (2.6, 1.5, Z_HIGH - 0.02), (-2.6, -1.5, Z_HIGH - 0.02),
+    ]
+    for sx in (-1, 1):
+        for sy in (-1, 1):
+            c["ceiling"].append((sx * (RX - CH / 2), sy * (RY - CH / 2), Z_SOFFIT - 0.02))
+    c["detail"] = [
+        (0.0, 2.90, 0.60), (0.0, 2.90, 1.16),                       # 유리 증인석
+        (-3.5, 0.40, 0.80), (3.5, 0.40, 0.80),                      # 유리 바
+        (-4.72, 5.25, 0.80), (4.72, 5.25, 0.80),                    # 측면 단 유리 난간
+        (-1.70, 7.84, 1.47), (1.70, 7.84, 1.47),                    # 모니터
+    ]
+    return c
+
+
+OCCLUDERS = _occluders()
+LANDMARKS = _landmarks()
+
+
+def _inside(p, vol, pad=0.0):
+    return (vol[0] - pad <= p[0] <= vol[1] + pad and vol[2] - pad <= p[1] <= vol[3] + pad
+            and vol[4] - pad <= p[2] <= vol[5] + pad)
+
+
+def _segment_hits(o, d, vol):
+    """o + t·d (t∈(0,1)) 가 박스를 지나는가 — 슬랩 판정."""
+    t0, t1 = 1e-6, 1.0 - 1e-4
+    for a in range(3):
+        lo, hi = vol[2 * a], vol[2 * a + 1]
+        if abs(d[a]) < 1e-12:
+            if o[a] < lo or o[a] > hi:
+                return False
+            continue
+        inv = 1.0 / d[a]
+        ta, tb = (lo - o[a]) * inv, (hi - o[a]) * inv
+        if ta > tb:
+            ta, tb = tb, ta
+        t0, t1 = max(t0, ta), min(t1, tb)
+        if t0 > t1:
+            return False
+    return True
+
+
+def in_free_space(p, pad=0.25):
+    """실내이고 어느 가림 볼륨에도 (pad 만큼 부풀려도) 안 들어가는가."""
+    if not (-HW + pad <= p[0] <= HW - pad and Y_NEAR + pad <= p[1] <= Y_FAR - pad):
+        return False
+    if not (0.25 <= p[2] <= Z_SOFFIT - pad):
+        return False
+    return not any(_inside(p, v, pad) for v in OCCLUDERS)
+
+
+def _basis(loc, tgt):
+    f = [tgt[i] - loc[i] for i in range(3)]
+    n = math.sqrt(sum(x * x for x in f))
+    f = [x / n for x in f]
+    # 카메라 업 = 월드 +Z 에 가장 가까운 직교축 (to_track_quat("-Z","Y") 와 같은 롤 0)
+    r = [f[1], -f[0], 0.0]
+    rn = math.hypot(r[0], r[1]) or 1.0
+    r = [x / rn for x in r]
+    u = [r[1] * f[2] - r[2] * f[1], r[2] * f[0] - r[0] * f[2], r[0] * f[1] - r[1] * f[0]]
+    return f, r, u
+
+
+def pitch_deg(loc, tgt):
+    dx, dy, dz = (tgt[0] - loc[0], tgt[1] - loc[1], tgt[2] - loc[2])
+    return math.degrees(math.atan2(dz, math.hypot(dx, dy)))
+
+
+def angle_class(loc, tgt):
+    """피치·높이로 각도 분류. views/README.md 의 5장 피치(−0.7~+2.0 / +19.1 / −19.3)와 맞는 경계."""
+    p = pitch_deg(loc, tgt)
+    if p >= 10.0 or (loc[2] < 0.9 and p >= 5.0):
+        return "low_angle"
+    if p <= -10.0:
+        return "high_angle"
+    if abs(p) <= 6.0 and 1.2 <= loc[2] <= 1.95:
+        return "eye_level"
+    return None
+
+
+def visible_fraction(loc, tgt, lens):
+    """클러스터별 보이는 랜드마크 비율 — 프레임 안(가장자리 3% 여유) + 불투명 볼륨에 안 가림."""
+    f, r, u = _basis(loc, tgt)
+    half_w = SENSOR_W / 2 / lens
+    half_h = half_w / ASPECT
+    out = {}
+    for name, pts in LANDMARKS.items():
+        seen = 0
+        for p in pts:
+            d = (p[0] - loc[0], p[1] - loc[1], p[2] - loc[2])
+            z = d[0] * f[0] + d[1] * f[1] + d[2] * f[2]
+            if z < 0.4:
+                continue
+            x = (d[0] * r[0] + d[1] * r[1] + d[2] * r[2]) / z
+            y = (d[0] * u[0] + d[1] * u[1] + d[2] * u[2]) / z
+            if abs(x) > half_w * 0.97 or abs(y) > half_h * 0.97:
+                continue
+            if any(_segment_hits(loc, d, v) for v in OCCLUDERS):
+                continue
+            seen += 1
+        out[name] = seen / len(pts)
+    return out
+
+
+def _seq(i, dim):
+    """R_d 저불일치 수열 (Roberts) — 난수 없이 결정적인 [0,1)^dim 점."""
+    g = 2.0
+    for _ in range(32):
+        g = (1 + g) ** (1.0 / (dim + 1))
+    return [(0.5 + i / g ** (k + 1)) % 1.0 for k in range(dim)]
+
+
+def sample_candidates(n):
+    """빈 공간 위치 × 클러스터 중심 조준 × 렌즈. 반환: [(loc, tgt, lens, 조준 클러스터)]"""
+    centers = {k: tuple(sum(p[a] for p in v) / len(v) for a in range(3)) for k, v in LANDMARKS.items()}
+    names = sorted(centers)
+    out = []
+    i = 0
+    while len(out) < n and i < n * 20:
+        i += 1
+        s = _seq(i, 6)
+        loc = (-HW + 2 * HW * s[0], Y_NEAR + (Y_FAR - Y_NEAR) * s[1], 0.3 + 3.9 * s[2])
+        # 눈높이 밴드(1.45~1.75)로 끌어당긴 후보를 절반 섞는다 — 수요의 대부분이 eye_level 이다
+        if i % 2 == 0:
+            loc = (loc[0], loc[1], 1.45 + 0.30 * s[2])
+        if not in_free_space(loc):
+            continue
+        aim = names[int(s[3] * len(names)) % len(names)]
+        c = centers[aim]
+        tgt = (c[0] + (s[4] - 0.5) * 3.0, c[1] + (s[5] - 0.5) * 3.0, c[2])
+        if math.dist(loc, tgt) < 2.0:
+            continue
+        out.append((loc, tgt, LENSES[i % len(LENSES)], aim))
+    return out
+
+
+def default_demand():
+    """phase0.json 의 angle_demand 에서 유도 — 수요가 있는 각도마다 1장, 클러스터 5개 각 1장."""
+    angles = {"eye_level": 1, "low_angle": 1, "high_angle": 1}
+    path = os.path.join(HERE, "phase0.json")
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as fh:
+            counts = json.load(fh).get("angle_demand", {})
+        angles = {a: 1 for a, n in counts.items() if a in ANGLE_SHORT and n > 0}
+    return {"angles": angles, "clusters": {k: 1 for k in LANDMARKS}, "min_visible": 0.5}
+
+
+def plan(demand, n_candidates=4000):
+    """탐욕 집합 덮개. 반환: (선택 [(loc,tgt,lens,cls,frac,aim)], 남은 수요 dict)"""
+    thr = float(demand.get("min_visible", 0.5))
+    clusters = demand.get("clusters", {})
+    if isinstance(clusters, list):
+        clusters = {k: 1 for k in clusters}
+    unknown = set(clusters) - set(LANDMARKS)
+    if unknown:
+        raise ValueError(f"모르는 클러스터: {sorted(unknown)} (가능: {sorted(LANDMARKS)})")
+    need = {("angle", a): int(n) for a, n in demand.get("angles", {}).items() if int(n) > 0}
+    need.update({("cluster", k): int(n) for k, n in clusters.items() if int(n) > 0})
+
+    scored = []
+    for loc, tgt, lens, aim in sample_candidates(n_candidates):
+        cls = angle_class(loc, tgt)
+        if cls is None:
+            continue
+        frac = visible_fraction(loc, tgt, lens)
+        covers = {("cluster", k) for k, v in frac.items() if v >= thr}
+        covers.add(("angle", cls))
+        scored.append((loc, tgt, lens, cls, frac, covers, aim))
+
+    chosen = []
+    while any(n > 0 for n in need.values()):
+        best, best_key = None, None
+        for cand in scored:
+            gain = sum(1 for e in cand[5] if need.get(e, 0) > 0)
+            if not gain:
+                continue
+            key = (gain, sum(cand[4].values()))
+            if best_key is None or key > best_key:
+                best, best_key = cand, key
+        if best is None:
+            break
+        for e in best[5]:
+            if need.get(e, 0) > 0:
+                need[e] -= 1
+        scored.remove(best)
+        chosen.append(best[:5] + best[6:])
+    return chosen, {f"{k}:{v}": n for (k, v), n in need.items() if n > 0}
+
+
+def to_views(chosen, thr=0.5):
+    """VIEWS 호환 튜플 — (파일명, 위치, 타겟, 초점거리mm, 설명). 파일명은 조준 클러스터 + 각도."""
+    views, used = [], set()
+    for loc, tgt, lens, cls, frac, main in chosen:
+        name = f"view_{main}_{ANGLE_SHORT[cls]}"
+        k = 2
+        while name in used:
+            name = f"view_{main}_{ANGLE_SHORT[cls]}_{k}"
+            k += 1
+        used.add(name)
+        got = ", ".join(f"{c} {v:.0%}" for c, v in sorted(frac.items(), key=lambda kv: -kv[1]) if v >= thr)
+        views.append((name, tuple(round(x, 2) for x in loc), tuple(round(x, 2) for x in tgt), lens,
+                      f"{cls} 피치 {pitch_deg(loc, tgt):+.1f}° — 플래너 선택 ({got})"))
+    return views
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="각도 수요 → 최소 뷰 세트 (VIEWS 호환)")
+    ap.add_argument("--demand", help="수요 스펙 JSON (기본: phase0.json 에서 유도)")
+    ap.add_argument("--candidates", type=int, default=4000)
+    ap.add_argument("--out", default=os.path.join(HERE, "views", "plan.json"))
+    args = ap.parse_args(argv)
+
+    if args.demand:
+        with open(args.demand, encoding="utf-8") as fh:
+            demand = json.load(fh)
+    else:
+        demand = default_demand()
+    chosen, unmet = plan(demand, args.candidates)
+    views = to_views(chosen, float(demand.get("min_visible", 0.5)))
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+    with open(args.out, "w", encoding="utf-8") as fh:
+        json.dump({"demand": demand, "candidates": args.candidates, "unmet": unmet,
+                   "views": [list(v) for v in views]}, fh, ensure_ascii=False, indent=2)
+    print("VIEWS = [")
+    for v in views:
+        print(f"    {v!r},")
+    print("]")
+    print(f"[planner] {len(views)} views → {args.out}", file=sys.stderr)
+    if unmet:
+        print(f"[planner] 못 채운 수요: {unmet} — 후보 수를 늘리거나 min_visible 을 낮출 것", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,12 +6,20 @@ import sys
 from mathutils import Vector
 
 ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(ROOT, '..', '..', 'tools'))
+from blockout_kit import evalcache, telemetry  # noqa: E402
+from blockout_kit.overrides import apply_overrides, output_path, param  # noqa: E402
+
 OUT = os.path.join(ROOT, 'outputs')
 SUMMARY_PATH = os.path.join(ROOT, 'text', 'summary.json')
 FPS = 24
 FRAMES = 120
 WIDTH = 640
 HEIGHT = 360
+# each case / compiled shot is its own scene; only same-case (same-shot) jobs reuse one
+BUILD_PARAMS = ('CAMFOLLOW_CASE', 'CAMFOLLOW_SPEC', 'CAMFOLLOW_SHOT')
+# files the build reads besides this script — their contents are part of the scene cache key
+BUILD_INPUTS = ('text/summary.json', '$CAMFOLLOW_SPEC')
 
 CASES = {
     'hand_in_frame': {'kind': 'hand', 'move': False, 'target_x': 1.15, 'label': 'HAND / IN FRAME'},
@@ -49,7 +57,22 @@ def mat(name, color, emission=0.0):
     return m
 
 
+_PARAMS = {}  # params of the build in progress — cube() reads BLOCKOUT_EVAL_CACHE from it
+
+
 def cube(name, loc, scale, material, bevel=0.08):
+    if bevel:
+        # BLOCKOUT_EVAL_CACHE: the bevelled box is evaluated once per (size, bevel) and shared (evalcache.py)
+        me = evalcache.mesh('cube_bevel', scale, {'width': bevel, 'segments': 3},
+                            lambda: _bevel_cube(name, (0, 0, 0), scale, bevel), _PARAMS)
+        if me is not None:
+            return evalcache.place(name, me, loc, material)
+    o = _bevel_cube(name, loc, scale, bevel)
+    o.data.materials.append(material)
+    return o
+
+
+def _bevel_cube(name, loc, scale, bevel):
     bpy.ops.mesh.primitive_cube_add(location=loc)
     o = bpy.context.object
     o.name = name
@@ -59,7 +82,6 @@ def cube(name, loc, scale, material, bevel=0.08):
         mod = o.modifiers.new('soft_edges', 'BEVEL')
         mod.width = bevel
         mod.segments = 3
-    o.data.materials.append(material)
     return o
 
 
@@ -104,18 +126,63 @@ def setup_camera(move_kind, target_x):
     return camera
 
 
-def build_case(case_id, spec):
+def setup_trajectory(camera_spec):
+    """Camera from a compiled trajectory (compile.mts): lens + location/aim keys, one keyframe pair per key."""
+    bpy.ops.object.camera_add(location=camera_spec['keys'][0]['location'])
+    camera = bpy.context.object
+    camera.data.lens = camera_spec['lens']
+    camera.data.sensor_width = 36
+    camera.rotation_mode = 'XYZ'
+    bpy.context.scene.camera = camera
+    for key in camera_spec['keys']:
+        camera.location = key['location']
+        look_at(camera, key['aim'])
+        camera.keyframe_insert(data_path='location', frame=key['frame'])
+        camera.keyframe_insert(data_path='rotation_euler', frame=key['frame'])
+    return camera
+
+
+_SPECS = {}
+
+
+def load_spec(path):
+    """Compiled project spec (compile.mts → shots.json), cached per path for the session."""
+    path = os.path.abspath(path)
+    if path not in _SPECS:
+        with open(path, encoding='utf-8') as fh:
+            doc = json.load(fh)
+        doc['by_id'] = {shot['shot_id']: shot for shot in doc['shots']}
+        _SPECS[path] = doc
+    return _SPECS[path]
+
+
+def shot_spec(params):
+    return load_spec(param(params, 'CAMFOLLOW_SPEC'))['by_id'][param(params, 'CAMFOLLOW_SHOT')]
+
+
+def split_params(params=None):
+    """One params dict per case, filtered by CAMFOLLOW_CASES (comma list; empty = all six).
+    With CAMFOLLOW_SPEC (a compiled project) it is one per shot instead, filtered by CAMFOLLOW_SHOTS.
+    The batch runner (blockout_kit/batch.py) expands a job with this before building."""
+    if param(params, 'CAMFOLLOW_SPEC'):
+        if param(params, 'CAMFOLLOW_SHOT'):
+            return [dict(params)]
+        shots = load_spec(param(params, 'CAMFOLLOW_SPEC'))['shots']
+        only = [s for s in param(params, 'CAMFOLLOW_SHOTS').split(',') if s]
+        return [dict(params, CAMFOLLOW_SHOT=shot['shot_id']) for shot in shots if not only or shot['shot_id'] in only]
+    only = [c for c in param(params, 'CAMFOLLOW_CASES').split(',') if c]
+    unknown = [c for c in only if c not in CASES]
+    if unknown:
+        raise ValueError(f'unknown case(s): {unknown} — one of {list(CASES)}')
+    return [dict(params or {}, CAMFOLLOW_CASE=case_id) for case_id in CASES if not only or case_id in only]
+
+
+def build_set():
+    """Room + mannequin shared by every case and shot. Returns (materials, arm)."""
     clear_scene()
     scene = bpy.context.scene
-    scene.render.engine = 'BLENDER_EEVEE'
-    scene.render.resolution_x = WIDTH
-    scene.render.resolution_y = HEIGHT
-    scene.render.resolution_percentage = 100
-    scene.render.image_settings.file_format = 'PNG'
-    scene.render.fps = FPS
-    scene.frame_start = 1
-    scene.frame_end = FRAMES
-    scene.render.film_transparent = False
+    if scene.world is None:
+        scene.world = bpy.data.worlds.new('World')
     scene.world.color = (0.008, 0.012, 0.02)
 
     floor_mat = mat('floor', (0.04, 0.07, 0.10))
@@ -135,24 +202,24 @@ def build_case(case_id, spec):
     head = sphere('subject_head', (0, 0.45, 2.45), 0.42, subject_mat)
     head.scale = (0.85, 0.85, 1.0)
     arm = cube('subject_arm', (-0.48, 0.15, 1.65), (0.12, 0.12, 0.52), subject_mat, bevel=0.05)
+    return {'subject': subject_mat, 'target': target_mat, 'gaze': gaze_mat}, arm
+
 
-    if spec['kind'] == 'hand':
-        target = cube('red_lever', (spec['target_x'], 0.35, 1.55), (0.18, 0.18, 0.65), target_mat)
-        cube('lever_base', (spec['target_x'], 0.35, 0.75), (0.38, 0.28, 0.12), target_mat)
-        animate_linear(arm, [(1, (-0.48, 0.15, 1.65)), (FRAMES, (spec['target_x'] - 0.35, 0.15, 1.65))])
-        cam = setup_camera('pan' if spec['move'] else 'static', spec['target_x'])
-    elif spec['kind'] == 'gaze':
-        target = sphere('green_target', (spec['target_x'], 0.4, 2.2), 0.32, gaze_mat)
+def add_target(kind, target_x, mats, arm, frames):
+    """Action target for a hand / gaze / reaction beat; the arm reaches it over the clip for hand."""
+    if kind == 'hand':
+        cube('red_lever', (target_x, 0.35, 1.55), (0.18, 0.18, 0.65), mats['target'])
+        cube('lever_base', (target_x, 0.35, 0.75), (0.38, 0.28, 0.12), mats['target'])
+        animate_linear(arm, [(1, (-0.48, 0.15, 1.65)), (frames, (target_x - 0.35, 0.15, 1.65))])
+    elif kind == 'gaze':
+        sphere('green_target', (target_x, 0.4, 2.2), 0.32, mats['gaze'])
         # A short orange beam shows the intended gaze direction.
-        beam = cube('gaze_beam', (spec['target_x'] / 2, 0.1, 2.2), (abs(spec['target_x']) / 2, 0.025, 0.025), gaze_mat, bevel=0.01)
-        cam = setup_camera('pan' if spec['move'] else 'static', spec['target_x'])
+        cube('gaze_beam', (target_x / 2, 0.1, 2.2), (abs(target_x) / 2, 0.025, 0.025), mats['gaze'], bevel=0.01)
     else:
-        target = sphere('reaction_marker', (0, 0.3, 2.45), 0.12, target_mat)
-        if spec['move']:
-            cam = setup_camera('dolly', 0)
-        else:
-            cam = setup_camera('static', 0)
+        sphere('reaction_marker', (0, 0.3, 2.45), 0.12, mats['target'])
+
 
+def add_lights():
     # Lighting makes the objects readable without pretending this is final viz.
     bpy.ops.object.light_add(type='AREA', location=(-3, -4, 6))
     key = bpy.context.object
@@ -166,15 +233,66 @@ def build_case(case_id, spec):
     fill.data.size = 4
     look_at(fill, (0, 0, 1.5))
 
-    case_dir = os.path.join(OUT, case_id, 'previz')
-    frame_dir = os.path.join(case_dir, 'frames')
-    os.makedirs(frame_dir, exist_ok=True)
-    scene.render.filepath = os.path.join(frame_dir, 'frame_')
+
+def build_scene(params=None):
+    """Scene for the case named by CAMFOLLOW_CASE (or the compiled shot CAMFOLLOW_SHOT of CAMFOLLOW_SPEC):
+    mannequin, target, camera move, lights."""
+    _PARAMS.clear()
+    _PARAMS.update(params or {})
+    if param(params, 'CAMFOLLOW_SPEC'):
+        shot = shot_spec(params)
+        mats, arm = build_set()
+        add_target(shot['action']['kind'], shot['action']['target_x'], mats, arm, shot['frames'])
+        setup_trajectory(shot['camera'])
+        add_lights()
+        return bpy.context.scene
+    spec = CASES[param(params, 'CAMFOLLOW_CASE')]
+    mats, arm = build_set()
+    add_target(spec['kind'], spec['target_x'], mats, arm, FRAMES)
+    if spec['kind'] == 'reaction':
+        setup_camera('dolly' if spec['move'] else 'static', 0)
+    else:
+        setup_camera('pan' if spec['move'] else 'static', spec['target_x'])
+    add_lights()
+    return bpy.context.scene
+
+
+def configure_render(scene, params=None):
+    if param(params, 'CAMFOLLOW_SPEC'):
+        shot = shot_spec(params)
+        view, frames = shot['shot_id'], shot['frames']
+        frame_dir = os.path.join(shot['output'], 'frames')
+    else:
+        view, frames = param(params, 'CAMFOLLOW_CASE'), FRAMES
+        frame_dir = os.path.join(OUT, view, 'previz', 'frames')
+    scene.render.engine = 'BLENDER_EEVEE'
+    scene.render.resolution_x = WIDTH
+    scene.render.resolution_y = HEIGHT
+    scene.render.resolution_percentage = 100
     scene.render.image_settings.file_format = 'PNG'
     scene.render.fps = FPS
+    scene.frame_start = 1
+    scene.frame_end = frames
+    scene.render.film_transparent = False
+
+    os.makedirs(frame_dir, exist_ok=True)
+    scene.render.filepath = output_path(os.path.join(frame_dir, 'frame_'), view, params)
+    scene['blockout_view'] = view  # every case writes frame_####; telemetry keys frames by case instead
+    apply_overrides(scene, params)
+
+
+def render(scene, params=None):
     bpy.ops.render.render(animation=True)
-    print(f'[blockout] {case_id} → {frame_dir}')
+    print(f"[blockout] {scene['blockout_view']} → {os.path.dirname(scene.render.filepath)}")
+    return [scene.render.filepath]
+
+
+def main(params=None):
+    rendered = []
+    for case_params in split_params(params):
+        rendered += telemetry.run(__file__, case_params, build_scene, configure_render, render)
+    return rendered
 
 
-for case_id, spec in CASES.items():
-    build_case(case_id, spec)
+if __name__ == '__main__':
+    main()
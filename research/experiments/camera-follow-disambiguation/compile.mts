@@ -0,0 +1,208 @@
+// 프로젝트 previz 컴파일러 — INTEGRATED.json 의 샷마다 dynamic_spec 전체를 씬·카메라 궤적 스펙으로 한 번에 번역하고,
+//   blockout.py 잡 매니페스트로 만들어 렌더 풀(blockout_kit/pool.py)에 통째로 넘긴다.
+//   blockout.py 의 6케이스는 summary.json 의 camera_type 하나만 읽어 3가지 고정 무브로 갔다. 여기서는
+//   camera_motion(type/direction/speed/magnitude)·character_motion·gaze_arc 를 다 쓴다:
+//     · 어휘 교정은 제품 normalizeCameraMotion 을 그대로 통과(복붙 없음) — 교정 기록은 샷의 repairs 로 남긴다.
+//     · 행동: 손 동사 → 레버 / 좌우로 옮기는 시선 arc·시선 동사 → 시선 대상 / 나머지 → 반응 마커.
+//     · 대상 위치: 카메라가 좌우로 움직이면(pan·tracking) 그 방향 프레임 밖(±3.4), 아니면 프레임 안(±1.1).
+//     · 궤적: 유형별 시작·끝 키. magnitude 가 이동량, speed 가 클립 중 이동에 쓰는 비율(나머지는 홀드).
+//   산출: outputs/projects/<project_id>/shots.json(스펙) · manifest.json(배치) · <샷>/previz/{frames,blockout-0001.png,blockout.mp4}
+// 실행: pnpm dlx tsx research/experiments/camera-follow-disambiguation/compile.mts [INTEGRATED.json]
+//         [--out 폴더] [--shots shot_1,shot_7] [--render] [--workers 8] [--start-only]
+//   --render 없이 돌리면 스펙·매니페스트만 쓴다. --start-only 는 샷마다 시작 프레임 1장만 렌더.
+import { execFileSync } from 'node:child_process'
+import { copyFileSync, existsSync, mkdirSync, readFileSync, writeFileSync } from 'node:fs'
+import { dirname, join, relative, resolve } from 'node:path'
+import { fileURLToPath } from 'node:url'
+import {
+  isCameraStatic,
+  normalizeCameraMotion,
+  normalizeCharacterMagnitude,
+  type NormalizedCameraMotion,
+} from '@/lib/writer/motion-vocabulary'
+
+const ROOT = dirname(fileURLToPath(import.meta.url))
+const REPO = join(ROOT, '..', '..', '..')
+const BASE_FIXTURE = join(REPO, 'logs', '064631aa-f6b2-4f7c-800b-66b0517a2769', 'INTEGRATED.json')
+const SCRIPT = relative(REPO, join(ROOT, 'blockout.py'))
+const POOL = join(REPO, 'research', 'tools', 'blockout_kit', 'pool.py')
+const FPS = 24 // = blockout.py FPS
+const MIN_FRAMES = 24
+const LENS = 48
+const HOME = { location: [0, -10.5, 3.4], aim: [0, 0.2, 1.6] } // = blockout.py setup_camera 시작 구도
+const DOLLY_IN_END = [0, -6.5, 2.8] // = blockout.py 'dolly' 끝 위치 (moderate 기준)
+const DOLLY_OUT_END = [0, -14.5, 4.0]
+const OFF_FRAME_X = 3.4
+const IN_FRAME_X = { hand: 1.15, gaze: 1.1, reaction: 0 }
+const AMOUNT = { minimal: 0.5, moderate: 1, large: 1.6 }
+const SPAN = { slow: 1, medium: 0.75, fast: 0.4 }
+const HAND_VERB = /\b(pull|push|reach|grab|press|lift|pick|open|take|touch|throw|point|hand)/i
+const GAZE_VERB = /\b(gaze|look|glance|turn|stare|watch|eye)/i
+
+type Vec3 = number[]
+type Key = { frame: number; location: Vec3; aim: Vec3 }
+type Action = { kind: 'hand' | 'gaze' | 'reaction'; verb: string | null; magnitude: string; gaze_to: string | null; target_x: number; in_frame: boolean }
+type CompiledShot = {
+  shot_id: string
+  scene_id: string | null
+  duration_s: number
+  frames: number
+  motion: NormalizedCameraMotion
+  repairs: string[]
+  action: Action
+  camera: { lens: number; keys: Key[] }
+  output: string
+}
+
+const lerp = (a: Vec3, b: Vec3, t: number) => a.map((v, i) => +(v + (b[i] - v) * t).toFixed(4))
+const sideOf = (text: unknown) => (/(^|[^a-z])left([^a-z]|$)/i.test(String(text ?? '')) ? -1 : /(^|[^a-z])right([^a-z]|$)/i.test(String(text ?? '')) ? 1 : null)
+
+function projectShots(doc: any) {
+  const designs = new Map<string, any>((doc.shotDesign ?? []).map((d: any) => [d.intent?.shot_id ?? d.dynamic_spec?.shot_id, d]))
+  const seq: any[] = doc.shotSequence?.shots ?? []
+  const raw = seq.length
+    ? seq.map((s) => {
+        const d = designs.get(s.design_ref ?? s.source_shot_id ?? s.shot_id)
+        return { shot_id: s.shot_id, scene_id: s.S?.scene_id ?? d?.intent?.scene_id ?? null,
+          duration: s.duration_seconds ?? d?.intent?.duration_seconds, dynamic: s.dynamic_spec ?? d?.dynamic_spec ?? null,
+          lens: s.static_spec?.lens_mm ?? d?.static_spec?.lens_mm ?? null }
+      })
+    : (doc.shotDesign ?? []).map((d: any) => ({ shot_id: d.intent?.shot_id, scene_id: d.intent?.scene_id ?? null,
+        duration: d.intent?.duration_seconds, dynamic: d.dynamic_spec ?? null, lens: d.static_spec?.lens_mm ?? null }))
+  const seen = new Map<string, number>()
+  return raw.map((s: any) => {
+    const n = seen.get(s.shot_id) ?? 0
+    seen.set(s.shot_id, n + 1)
+    return n ? { ...s, shot_id: `${s.shot_id}_${n + 1}` } : s // shotDesign 만 있는 구 state 는 씬마다 shot_1 이 겹친다
+  })
+}
+
+function compileAction(dyn: any, motion: NormalizedCameraMotion): Action {
+  const first = dyn?.character_motion?.[0]
+  const verb: string | null = first?.verb ?? null
+  const gaze = (dyn?.gaze_arc ?? []).find((g: any) => g.from !== g.to && sideOf(g.to) !== null) ?? null // 좌우로 옮기는 시선만 대상이 있다
+  const kind = HAND_VERB.test(verb ?? '') ? 'hand' : gaze || GAZE_VERB.test(verb ?? '') ? 'gaze' : 'reaction'
+  const lateral = !isCameraStatic(motion) && (motion.type === 'pan' || motion.type === 'tracking') && sideOf(motion.direction) !== null
+  const side = sideOf(motion.direction) ?? sideOf(gaze?.to) ?? 1
+  const inFrame = kind === 'reaction' || !lateral
+  return { kind, verb, magnitude: normalizeCharacterMagnitude(first?.magnitude), gaze_to: gaze?.to ?? null,
+    target_x: kind === 'reaction' ? 0 : side * (inFrame ? IN_FRAME_X[kind] : OFF_FRAME_X), in_frame: inFrame }
+}
+
+function trajectory(motion: NormalizedCameraMotion, action: Action, frames: number, repairs: string[]): Key[] {
+  const a = AMOUNT[motion.magnitude]
+  const end = Math.max(2, Math.round(1 + (frames - 1) * SPAN[motion.speed]))
+  const dir = sideOf(motion.direction)
+  const vertical = motion.direction === 'down' ? -1 : 1
+  const forward = motion.direction === 'backward' ? -1 : motion.direction === 'forward' ? 1 : 0
+  let to = { location: [...HOME.location], aim: [...HOME.aim] }
+  const type = motion.mapped ? motion.type : 'dolly_in'
+  if (!motion.mapped) repairs.push(`previz: 미상 유형 "${motion.type}" — 정지로 접지 않고 작은 dolly_in 으로 그린다`)
+  switch (type) {
+    case 'pan': // 제자리 회전 — 대상이 있으면 대상까지
+      to.aim[0] = action.kind === 'reaction' ? (dir ?? 1) * 1.7 * a : action.target_x
+      break
+    case 'tilt':
+      to.aim[2] = +(HOME.aim[2] + vertical * 1.2 * a).toFixed(4)
+      break
+    case 'dolly_in':
+      to.location = lerp(HOME.location, DOLLY_IN_END, motion.mapped ? a : 0.3)
+      break
+    case 'dolly_out':
+      to.location = lerp(HOME.location, DOLLY_OUT_END, a)
+      break
+    case 'tracking': { // 위치가 같이 움직인다 — 좌우면 대상 쪽으로, 앞뒤면 깊이로
+      const dx = forward ? 0 : action.kind !== 'reaction' && !action.in_frame ? action.target_x : (dir ?? 1) * 2 * a
+      const dy = forward * 4 * a
+      to = { location: [HOME.location[0] + dx, HOME.location[1] + dy, HOME.location[2]], aim: [HOME.aim[0] + dx, HOME.aim[1] + dy, HOME.aim[2]] }
+      break
+    }
+    case 'crane':
+      to.location[2] = +(HOME.location[2] + vertical * 2 * a).toFixed(4)
+      break
+    case 'handheld_drift': { // 위치 이동 없이 흔들림 — 12프레임마다 결정론 지터
+      const keys: Key[] = []
+      for (let f = 1; f <= frames; f += 12) {
+        const j = 0.05 * a
+        keys.push({ frame: f, location: [+(Math.sin(f * 0.37) * j).toFixed(4), HOME.location[1], +(HOME.location[2] + Math.sin(f * 0.53) * j).toFixed(4)], aim: [...HOME.aim] })
+      }
+      return keys
+    }
+    default: // static · rack_focus (초점만 — 블록아웃은 DOF 를 그리지 않는다)
+      return [{ frame: 1, ...HOME }]
+  }
+  const keys: Key[] = [{ frame: 1, location: [...HOME.location], aim: [...HOME.aim] }, { frame: end, ...to }]
+  if (end < frames) keys.push({ frame: frames, ...to })
+  return keys
+}
+
+export function compileProject(doc: any, outDir: string): { project_id: string; shots: CompiledShot[] } {
+  const shots = projectShots(doc).map((s: any): CompiledShot => {
+    const { motion, repairs } = normalizeCameraMotion(s.dynamic?.camera_motion)
+    if (!s.dynamic) repairs.push('dynamic_spec 없음 — static 으로')
+    const duration = Number(s.duration) > 0 ? Number(s.duration) : 5
+    const frames = Math.max(MIN_FRAMES, Math.round(duration * FPS))
+    const action = compileAction(s.dynamic, motion)
+    return { shot_id: s.shot_id, scene_id: s.scene_id, duration_s: duration, frames, motion, repairs, action,
+      camera: { lens: s.lens ?? LENS, keys: trajectory(motion, action, frames, repairs) },
+      output: join(outDir, s.shot_id, 'previz') }
+  })
+  return { project_id: doc.project_id ?? 'project', shots }
+}
+
+function finishShot(shot: CompiledShot, startOnly: boolean) {
+  const frames = join(shot.output, 'frames')
+  const first = join(frames, 'frame_0001.png')
+  if (!existsSync(first)) return { start: null, clip: null }
+  const start = join(shot.output, 'blockout-0001.png') // viz.mts 가 읽는 시작 프레임 이름
+  copyFileSync(first, start)
+  if (startOnly) return { start, clip: null }
+  const clip = join(shot.output, 'blockout.mp4')
+  execFileSync('ffmpeg', ['-y', '-loglevel', 'error', '-framerate', String(FPS), '-i', join(frames, 'frame_%04d.png'),
+    '-c:v', 'libx264', '-pix_fmt', 'yuv420p', '-movflags', '+faststart', clip], { stdio: 'ignore' })
+  return { start, clip }
+}
+
+if (process.argv[1] === fileURLToPath(import.meta.url)) {
+  const args = process.argv.slice(2)
+  const opt = (name: string) => { const i = args.indexOf(name); return i >= 0 ? args.splice(i, 2)[1] : undefined }
+  const flag = (name: string) => { const i = args.indexOf(name); return i >= 0 ? !!args.splice(i, 1) : false }
+  const outArg = opt('--out')
+  const workers = opt('--workers')
+  const only = opt('--shots')?.split(',').filter(Boolean)
+  const render = flag('--render')
+  const startOnly = flag('--start-only')
+  const fixture = resolve(args[0] ?? BASE_FIXTURE)
+
+  const t0 = Date.now()
+  const doc = JSON.parse(readFileSync(fixture, 'utf8'))
+  const outDir = resolve(outArg ?? join(ROOT, 'outputs', 'projects', doc.project_id ?? 'project'))
+  mkdirSync(outDir, { recursive: true })
+  const project = compileProject(doc, outDir)
+  const shots = only ? project.shots.filter((s) => only.includes(s.shot_id)) : project.shots
+  const specPath = join(outDir, 'shots.json')
+  writeFileSync(specPath, JSON.stringify({ project_id: project.project_id, fixture, fps: FPS, compiled_at: new Date().toISOString(), shots }, null, 2))
+  const manifestPath = join(outDir, 'manifest.json')
+  writeFileSync(manifestPath, JSON.stringify({
+    defaults: { CAMFOLLOW_SPEC: specPath },
+    jobs: shots.map((s) => ({ script: SCRIPT, params: { CAMFOLLOW_SHOT: s.shot_id }, cost: startOnly ? 1 : s.frames, ...(startOnly ? { frame_end: 1 } : {}) })),
+  }, null, 2))
+  const byType: Record<string, number> = {}
+  for (const s of shots) byType[String(s.motion.type)] = (byType[String(s.motion.type)] ?? 0) + 1
+  const repaired = shots.filter((s) => s.repairs.length).length
+  console.log(`[compile] ${project.project_id}: 샷 ${shots.length}개 · ${shots.reduce((n, s) => n + s.frames, 0)}프레임 · ` +
+    `교정 ${repaired}샷 · ${Object.entries(byType).map(([k, v]) => `${k}=${v}`).join(' ')} (${Date.now() - t0}ms) → ${specPath}`)
+
+  if (render) {
+    const poolArgs = [POOL, manifestPath, '--keep-going', ...(workers ? ['--workers', workers] : [])]
+    try {
+      execFileSync(process.env.PYTHON ?? 'python3', poolArgs, { stdio: 'inherit' })
+    } catch {
+      console.error('[compile] 렌더 풀에 실패한 샷이 있다 — 끝난 샷만 정리한다 (manifest.pool.json 참조)')
+    }
+    const done = shots.map((s) => ({ shot_id: s.shot_id, type: s.motion.type, action: s.action.kind, frames: s.frames, ...finishShot(s, startOnly) }))
+    writeFileSync(join(outDir, 'previz.json'), JSON.stringify({ project_id: project.project_id, start_only: startOnly,
+      rendered: done.filter((d) => d.start).length, shots: done }, null, 2))
+    console.log(`[compile] previz ${done.filter((d) => d.start).length}/${shots.length}샷 → ${join(outDir, 'previz.json')}`)
+  }
+}
@@ -7,6 +7,7 @@ config({ path: '.env.local' })
 
 import { fal } from '@fal-ai/client'
 import { VIDEO_MODELS, clampDuration } from '@/lib/video-models'
+import { uploadable } from '../../tools/blockout_kit/variants.mts'
 
 fal.config({ credentials: process.env.FAL_KEY ?? '' })
 
@@ -18,7 +19,9 @@ const RATE_PER_SEC = MODEL.pricePerSecNoAudio
 async function uploadStart(caseId: string): Promise<string> {
   const path = join(ROOT, 'outputs', caseId, 'previz', 'blockout-0001.png')
   if (!existsSync(path)) throw new Error(`previz start frame missing: ${path}`)
-  return fal.storage.upload(new File([readFileSync(path)], `${caseId}-start.png`, { type: 'image/png' }))
+  const up = await uploadable(path, { accept: ['webp', 'png'] })
+  const ext = up.name.slice(up.name.lastIndexOf('.'))
+  return fal.storage.upload(new File([readFileSync(up.path)], `${caseId}-start${ext}`, { type: up.mime }))
 }
 
 async function submit() {
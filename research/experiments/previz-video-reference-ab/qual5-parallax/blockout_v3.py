@@ -5,6 +5,10 @@
 #      목적: 카메라에 가까운 물체가 빠르게 흘러야 한다(시차/parallax)는 정보를 영상 모델에 전달.
 #      측면 트래킹(2~7s)에서 카메라 깊이 2.3 m vs 러너 6.0 m → 화면 흐름 속도 2.6배.
 #      나머지(카메라 안무·복도 벽·러너·속도·7s 길이·렌더 설정)는 v2 원본 그대로 — 변인 1개.
+#   검증: python research/tools/blockout_kit/sceneir.py diff \
+#           research/experiments/previz-video-reference-ab/qual2-fullmotion/blockout_v2.py \
+#           research/experiments/previz-video-reference-ab/qual5-parallax/blockout_v3.py --allow 'fg_post_*'
+#         (fg_post_* 밖에 차이가 하나라도 생기면 종료 코드 1)
 #
 # ── 이하 v2 원본 주석 ──
 # v1(blockout_sh_04_16.py) 대비 변경 2축 — 1차 정성평가 관찰(qualitative/notes.md) 대응:
@@ -30,45 +34,27 @@
 # 실행: blender --background \
 #         --python research/experiments/previz-video-reference-ab/qual5-parallax/blockout_v3.py
 #   (이 머신 실측 경로: /opt/homebrew/bin/blender — Blender 5.2.0 LTS)
+#   임포트: main(params) = build_scene → configure_render → render (research/tools/blockout_kit/batch.py)
+#   점진: BLOCKOUT_PROGRESSIVE=1 — 경계·이분 순서로 그리며 <출력 stem>.preview.mp4 를 계속 갱신 (blockout_kit/progressive.py)
+#   긴 추격: PREVIZ_CHASE_S=20 BLOCKOUT_CHUNKS=24 — 프레임 구간마다 시야 안 복도 부품만 세운다 (blockout_kit/chunks.py)
 import bpy
 import math
 import os
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, "..", "..", "..", "tools"))
+from blockout_kit import chunks, location, progressive, telemetry  # noqa: E402
+from blockout_kit.overrides import apply_overrides, output_path, param  # noqa: E402
 
 FPS = 24
 DURATION_S = 7
-FRAMES = FPS * DURATION_S  # 168
+FRAMES = FPS * DURATION_S  # 168 — 기본 길이 (PREVIZ_CHASE_S 로 늘리면 frame_count)
 RUN_SPEED = 5.5            # m/s — 달리기(스프린트 하한, v1과 동일)
-OUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "blockout_v3.mp4")
-
-# ── 씬 리셋 ──
-bpy.ops.wm.read_factory_settings(use_empty=True)
-scene = bpy.context.scene
-scene.render.fps = FPS
-scene.frame_start = 1
-scene.frame_end = FRAMES
-scene.render.resolution_x = 1280
-scene.render.resolution_y = 720
-
-# Workbench 플랫 렌더 — 오브젝트 색 그대로, 질감 없음 (블록아웃 3규칙)
-scene.render.engine = "BLENDER_WORKBENCH"
-shading = scene.display.shading
-shading.light = "STUDIO"
-shading.color_type = "OBJECT"
-shading.show_cavity = False
-scene.display.render_aa = "8"
-world = bpy.data.worlds.new("World")
-world.color = (0.85, 0.87, 0.90)  # 밝은 회색 하늘
-scene.world = world
-
-# h264 mp4 (Blender 5.x: media_type 선분리 후 FFMPEG 선택)
-if hasattr(scene.render.image_settings, "media_type"):
-    scene.render.image_settings.media_type = "VIDEO"
-scene.render.image_settings.file_format = "FFMPEG"
-scene.render.ffmpeg.format = "MPEG4"
-scene.render.ffmpeg.codec = "H264"
-scene.render.ffmpeg.constant_rate_factor = "MEDIUM"
-scene.render.ffmpeg.audio_codec = "NONE"
-scene.render.filepath = OUT
+
+# 씬 기하를 바꾸는 params — 샷 길이(복도·키프레임 길이), 청크 스트리밍(통째 빌드 안 함)
+BUILD_PARAMS = ("PREVIZ_CHASE_S", "BLOCKOUT_CHUNKS")
+PHASE_FRAMES = (1 + FPS, 1 + 2 * FPS)   # phase A→B(1 s)·B→C(2 s) 첫 프레임 — 점진 렌더 앵커 (blockout_kit/progressive.py)
 
 
 def flat_object(mesh_op, name, color, location=(0, 0, 0), scale=(1, 1, 1), **kwargs):
@@ -87,77 +73,23 @@ GRAY_GROUND = (0.70, 0.70, 0.70)
 #   보는 면이 (94,98,104)로 지면(100,102,104)과 거의 같아 전경이 사라졌다(Workbench STUDIO는
 #   카메라를 향한 면에 키라이트를 강하게 먹인다). 실측 후 대비 확보용으로 낮춘 값.
 GRAY_FG = (0.10, 0.10, 0.12)
+COLORS = {"box": GRAY_BOX, "fg": GRAY_FG}   # Part.mat → 색
+
+
+def smoothstep(s):
+    return s * s * (3.0 - 2.0 * s)
 
-# ── 지면: 플랫 플레인 ──
-flat_object(bpy.ops.mesh.primitive_plane_add, "ground", GRAY_GROUND,
-            location=(20, 0, 0), size=1, scale=(300, 100, 1))
-
-# ── 러너: 주황 캡슐 (실린더 몸통 + 구 머리, join → 단일 도형, v1 동일) ──
-flat_object(bpy.ops.mesh.primitive_cylinder_add, "runner_body", ORANGE,
-            location=(0, 0, 0.75), radius=0.28, depth=1.5)
-body = bpy.context.active_object
-flat_object(bpy.ops.mesh.primitive_uv_sphere_add, "runner_head", ORANGE,
-            location=(0, 0, 1.5), radius=0.28, segments=24, ring_count=12)
-head = bpy.context.active_object
-bpy.ops.object.select_all(action="DESELECT")
-body.select_set(True)
-head.select_set(True)
-bpy.context.view_layer.objects.active = body
-bpy.ops.object.join()
-runner = bpy.context.active_object
-runner.name = "runner"
-runner.color = (*ORANGE, 1.0)
 
 # ── 좁은 복도: 양측 벽 열 + 천장 + 시작 문틀 (전부 회색 박스 — 결정적 배치) ──
+# 생성기 corridor_parts(x0, x1) 가 x 구간에 걸치는 부품만 돌려준다. build_scene 은 전 구간을 통째로 세우고,
+#   BLOCKOUT_CHUNKS 면 blockout_kit/chunks.py 가 프레임 구간마다 카메라 시야에 드는 것만 세운다.
 WALL_INNER = 2.4   # 벽 내면 |y| — 복도 폭 4.8 m
 WALL_T = 1.0       # 벽 두께
 SEG_LEN = 5.7      # 벽 세그먼트 길이
-
-# 먼 벽(+Y): 전 구간 x -9..48 — 측면 phase의 배경. 높이 변화 + 교대 인셋(심 라인 파랄락스)
-far_heights = [5.2, 6.0, 4.6, 5.6, 4.9, 6.3, 5.0, 5.8, 4.7, 6.1]
-for i, h in enumerate(far_heights):
-    x = -9 + SEG_LEN * (i + 0.5)
-    inset = 0.25 if i % 2 == 0 else 0.0   # 교대 인셋 → 세그먼트 경계에 세로 심 라인
-    flat_object(bpy.ops.mesh.primitive_cube_add, f"wall_far_{i}", GRAY_BOX,
-                location=(x, WALL_INNER + WALL_T / 2 + inset, h / 2),
-                size=1, scale=(SEG_LEN, WALL_T, h))
-
-# 먼 벽 필라스터: 세그먼트 경계마다 45° 회전 돌출 기둥 — 측면 phase 배경 흐름 가독용
-#   파랄락스 (v1의 박스 간격 역할). 45° 면은 정면 벽과 셰이딩이 달라 어느 각도에서도
-#   보인다 (Workbench 스튜디오 광은 면 방향으로만 명암). 단순 박스 회전 — 디테일 아님.
-for i in range(1, len(far_heights)):
-    x = -9 + SEG_LEN * i
-    flat_object(bpy.ops.mesh.primitive_cube_add, f"pilaster_far_{i}", GRAY_BOX,
-                location=(x, WALL_INNER - 0.05, 2.75), size=1,
-                scale=(0.55, 0.55, 5.5), rotation=(0, 0, math.pi / 4))
-
-# 가까운 벽(-Y): 진입 구간 x -9..9 만 — 정면 도어웨이 구도의 좌측 벽.
-#   x>9 부재 = 와일드 월(측면 트래킹 카메라가 서는 자리). 스윙 카메라 x는 항상 ≥10.3,
-#   시선(카메라→러너)의 x=9 교차점 y는 항상 > -2.4 — 벽과 교차하지 않음 (수치 확인).
-near_heights = [5.4, 4.8, 5.9]
-for i, h in enumerate(near_heights):
-    x = -9 + 6.0 * (i + 0.5)
-    inset = 0.25 if i % 2 == 1 else 0.0
-    flat_object(bpy.ops.mesh.primitive_cube_add, f"wall_near_{i}", GRAY_BOX,
-                location=(x, -(WALL_INNER + WALL_T / 2 + inset), h / 2),
-                size=1, scale=(6.0, WALL_T, h))
-
-# 가까운 벽 필라스터: 진입 구간 대칭 리듬 (정면 phase 깊이 큐)
-for i, x in enumerate((-3.0, 3.0)):
-    flat_object(bpy.ops.mesh.primitive_cube_add, f"pilaster_near_{i}", GRAY_BOX,
-                location=(x, -(WALL_INNER - 0.05), 2.75), size=1,
-                scale=(0.55, 0.55, 5.5), rotation=(0, 0, math.pi / 4))
-
-# 천장 슬랩: 진입 구간 위 x -9..14 (정면 phase 시야 전부 덮음 — 하늘 이탈 차단)
-flat_object(bpy.ops.mesh.primitive_cube_add, "ceiling", GRAY_BOX,
-            location=(2.5, 0, 3.2), size=1, scale=(23, 6.8, 0.4))
-
-# 시작 문틀: 러너 시작 바로 뒤 x=-1 — START의 "문틀 통과 직후" 근사 (잼 2 + 린텔)
-for sy in (+1.5, -1.5):
-    flat_object(bpy.ops.mesh.primitive_cube_add, f"door_jamb_{'l' if sy > 0 else 'r'}",
-                GRAY_BOX, location=(-1, sy, 1.3), size=1, scale=(0.5, 0.9, 2.6))
-flat_object(bpy.ops.mesh.primitive_cube_add, "door_lintel", GRAY_BOX,
-            location=(-1, 0, 2.8), size=1, scale=(0.5, 4.0, 0.4))
+X_START = -9       # 복도 시작 x (시작 문틀 뒤 진입 구간)
+X_END = 48.0       # 7 s 복도 끝 x — 먼 벽 10개
+FAR_HEIGHTS = [5.2, 6.0, 4.6, 5.6, 4.9, 6.3, 5.0, 5.8, 4.7, 6.1]   # 먼 벽 높이 (긴 추격이면 10개 주기로 반복)
+NEAR_HEIGHTS = [5.4, 4.8, 5.9]
 
 # ── [v3 유일 추가] 전경 기둥 열 — 시차(parallax) 전달용 ────────────────────────
 # 배치 근거 (측면 트래킹 phase C: 카메라 (x_runner, -6, 1.1), 시선 +Y, 35mm/36mm 센서):
@@ -179,65 +111,236 @@ FG_W = 0.45         # x 폭
 FG_D = 0.30         # y 두께
 FG_X0 = 14.0        # 첫 기둥 x (스윙 카메라 최대 x 12.14에서 1.7 m 이격)
 FG_GAP = 3.0        # 간격 — 5.5 m/s에서 0.545 s마다 하나씩 통과 (기둥 1개당 화면 체류 0.456 s)
+FG_X1 = 41.0        # 7 s 마지막 기둥 x (카메라 종점 38.27 너머까지 덮음) — 긴 추격이면 복도만큼 늘어난다
 FG_HEIGHTS = (0.85, 0.72)   # 교대 높이 — 높은 쪽은 러너 발치를 스치고 낮은 쪽은 프레임 하단만 스침
-for i in range(10):          # x = 14 … 41 (카메라 종점 38.27 너머까지 덮음)
-    h = FG_HEIGHTS[i % 2]
-    flat_object(bpy.ops.mesh.primitive_cube_add, f"fg_post_{i}", GRAY_FG,
-                location=(FG_X0 + FG_GAP * i, FG_Y, h / 2), size=1,
-                scale=(FG_W, FG_D, h))
+FG_MESH = "fg_post"  # 기둥들이 공유하는 단위 큐브 메시(linked duplicate) — 높이·위치는 오브젝트 변환만 다르다
 # ─────────────────────────────────────────────────────────────────────────────
 
-# ── 카메라 ──
-bpy.ops.object.camera_add(location=(6.0, 0, 1.1), rotation=(math.pi / 2, 0, math.pi / 2))
-cam = bpy.context.active_object
-cam.name = "choreo_cam"
-cam.data.lens = 35
-scene.camera = cam
 
+def chase_seconds(params=None):
+    """PREVIZ_CHASE_S — 샷 길이(초, 기본 7). 7 s 너머는 phase C 측면 트래킹이 이어지고 복도가 그만큼 늘어난다."""
+    v = float(param(params, "PREVIZ_CHASE_S", str(DURATION_S)))
+    if v < 2:
+        raise ValueError(f"PREVIZ_CHASE_S 는 2 초 이상 — phase A·B 가 2 s (받은 값 {v})")
+    return v
 
-def smoothstep(s):
-    return s * s * (3.0 - 2.0 * s)
+
+def frame_count(params=None):
+    return int(round(FPS * chase_seconds(params)))   # 7 s = 168
+
+
+def corridor_end(seconds=DURATION_S):
+    """복도 끝 x — 7 s 는 48, 그 너머는 러너가 더 간 만큼."""
+    return X_END + RUN_SPEED * max(0.0, seconds - DURATION_S)
+
+
+def ground_length(params=None):
+    """지면 x 길이 — 중심 x=20 에서 복도 끝 + 110 m 까지 덮는다 (7 s 는 예전 그대로 300)."""
+    return max(300, 2 * (corridor_end(chase_seconds(params)) + 110 - 20))
+
+
+def corridor_parts(x0, x1, seconds=DURATION_S):
+    """x0~x1 에 걸치는 복도 부품 [location.Part] (mat 는 COLORS 키). 구간에 드는 인덱스만 돈다 —
+    seconds=7 의 전 구간은 예전 통째 배치와 이름·위치·크기가 같다."""
+    end = corridor_end(seconds)
+    x0, x1 = max(x0, X_START - SEG_LEN), min(x1, end + SEG_LEN)   # ±inf (통째 빌드) 도 인덱스로
+    parts = []
+
+    def add(name, center, size, mat="box", rot_z=0.0):
+        part = location.Part(name, center, size, mat, rot_z, location.SOLID)
+        c, half = chunks.aabb(part)
+        if c[0] + half[0] >= x0 and c[0] - half[0] <= x1:
+            parts.append(part)
+
+    # 먼 벽(+Y): 전 구간 x -9..48 — 측면 phase의 배경. 높이 변화 + 교대 인셋(심 라인 파랄락스)
+    n_far = math.ceil((end - X_START) / SEG_LEN - 1e-9)   # 7 s: 10
+    lo = max(0, int((x0 - X_START) // SEG_LEN) - 1)
+    hi = min(n_far, int((x1 - X_START) // SEG_LEN) + 2)
+    for i in range(lo, hi):
+        h = FAR_HEIGHTS[i % len(FAR_HEIGHTS)]
+        inset = 0.25 if i % 2 == 0 else 0.0   # 교대 인셋 → 세그먼트 경계에 세로 심 라인
+        add(f"wall_far_{i}", (X_START + SEG_LEN * (i + 0.5), WALL_INNER + WALL_T / 2 + inset, h / 2),
+            (SEG_LEN, WALL_T, h))
+
+    # 먼 벽 필라스터: 세그먼트 경계마다 45° 회전 돌출 기둥 — 측면 phase 배경 흐름 가독용
+    #   파랄락스 (v1의 박스 간격 역할). 45° 면은 정면 벽과 셰이딩이 달라 어느 각도에서도
+    #   보인다 (Workbench 스튜디오 광은 면 방향으로만 명암). 단순 박스 회전 — 디테일 아님.
+    for i in range(max(1, lo), min(n_far, hi + 1)):
+        add(f"pilaster_far_{i}", (X_START + SEG_LEN * i, WALL_INNER - 0.05, 2.75), (0.55, 0.55, 5.5),
+            rot_z=math.pi / 4)
+
+    # 가까운 벽(-Y): 진입 구간 x -9..9 만 — 정면 도어웨이 구도의 좌측 벽.
+    #   x>9 부재 = 와일드 월(측면 트래킹 카메라가 서는 자리). 스윙 카메라 x는 항상 ≥10.3,
+    #   시선(카메라→러너)의 x=9 교차점 y는 항상 > -2.4 — 벽과 교차하지 않음 (수치 확인).
+    for i, h in enumerate(NEAR_HEIGHTS):
+        inset = 0.25 if i % 2 == 1 else 0.0
+        add(f"wall_near_{i}", (X_START + 6.0 * (i + 0.5), -(WALL_INNER + WALL_T / 2 + inset), h / 2),
+            (6.0, WALL_T, h))
+
+    # 가까운 벽 필라스터: 진입 구간 대칭 리듬 (정면 phase 깊이 큐)
+    for i, x in enumerate((-3.0, 3.0)):
+        add(f"pilaster_near_{i}", (x, -(WALL_INNER - 0.05), 2.75), (0.55, 0.55, 5.5), rot_z=math.pi / 4)
+
+    # 천장 슬랩: 진입 구간 위 x -9..14 (정면 phase 시야 전부 덮음 — 하늘 이탈 차단)
+    add("ceiling", (2.5, 0, 3.2), (23, 6.8, 0.4))
+
+    # 시작 문틀: 러너 시작 바로 뒤 x=-1 — START의 "문틀 통과 직후" 근사 (잼 2 + 린텔)
+    for sy in (+1.5, -1.5):
+        add(f"door_jamb_{'l' if sy > 0 else 'r'}", (-1, sy, 1.3), (0.5, 0.9, 2.6))
+    add("door_lintel", (-1, 0, 2.8), (0.5, 4.0, 0.4))
+    # [v3] 전경 기둥 열 x = 14, 17, … (7 s: 41 까지 10개)
+    n_fg = int((FG_X1 + end - X_END - FG_X0) // FG_GAP) + 1
+    lo = max(0, int((x0 - FG_X0) // FG_GAP))
+    for i in range(lo, min(n_fg, int((x1 - FG_X0) // FG_GAP) + 2)):
+        h = FG_HEIGHTS[i % 2]
+        add(f"fg_post_{i}", (FG_X0 + FG_GAP * i, FG_Y, h / 2), (FG_W, FG_D, h), "fg")
+    return parts
+
+
+def make_part(part):
+    """Part → 플랫 색 박스 (통째 빌드와 chunks 스트리밍이 같이 쓴다)."""
+    if part.mat == "fg":   # [v3] 전경 기둥은 메시 1벌 공유 — 두 번째부터는 오브젝트만 (.data 그대로)
+        me = bpy.data.meshes.get(FG_MESH)
+        if me is not None:
+            ob = bpy.data.objects.new(part.name, me)
+            bpy.context.scene.collection.objects.link(ob)
+            ob.location, ob.scale, ob.color = part.center, part.size, (*GRAY_FG, 1.0)
+            return ob
+    ob = flat_object(bpy.ops.mesh.primitive_cube_add, part.name, COLORS[part.mat],
+                     location=part.center, size=1, scale=part.size, rotation=(0, 0, part.rot_z))
+    if part.mat == "fg":
+        ob.data.name = FG_MESH
+    return ob
+
+
+def build_scene(params=None):
+    """씬 리셋 + 지면·러너·복도·카메라 + 프레임별 키프레임. 렌더 설정은 configure_render() 몫."""
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    scene = bpy.context.scene
+    world = bpy.data.worlds.new("World")
+    world.color = (0.85, 0.87, 0.90)  # 밝은 회색 하늘
+    scene.world = world
+
+    # ── 지면: 플랫 플레인 ──
+    flat_object(bpy.ops.mesh.primitive_plane_add, "ground", GRAY_GROUND,
+                location=(20, 0, 0), size=1, scale=(ground_length(params), 100, 1))
+
+    # ── 러너: 주황 캡슐 (실린더 몸통 + 구 머리, join → 단일 도형, v1 동일) ──
+    flat_object(bpy.ops.mesh.primitive_cylinder_add, "runner_body", ORANGE,
+                location=(0, 0, 0.75), radius=0.28, depth=1.5)
+    body = bpy.context.active_object
+    flat_object(bpy.ops.mesh.primitive_uv_sphere_add, "runner_head", ORANGE,
+                location=(0, 0, 1.5), radius=0.28, segments=24, ring_count=12)
+    head = bpy.context.active_object
+    bpy.ops.object.select_all(action="DESELECT")
+    body.select_set(True)
+    head.select_set(True)
+    bpy.context.view_layer.objects.active = body
+    bpy.ops.object.join()
+    runner = bpy.context.active_object
+    runner.name = "runner"
+    runner.color = (*ORANGE, 1.0)
+
+    # ── 좁은 복도 (corridor_parts) — BLOCKOUT_CHUNKS 면 chunks.render 가 구간마다 세운다 ──
+    seconds = chase_seconds(params)
+    if not chunks.frames(params):
+        for part in corridor_parts(-math.inf, math.inf, seconds):
+            make_part(part)
+
+    # ── 카메라 ──
+    bpy.ops.object.camera_add(location=(6.0, 0, 1.1), rotation=(math.pi / 2, 0, math.pi / 2))
+    cam = bpy.context.active_object
+    cam.name = "choreo_cam"
+    cam.data.lens = 35
+    scene.camera = cam
+
+
+    # ── 애니메이션: 프레임별 키프레임 — 러너 전진 + 카메라 3-phase 안무 ──
+    # 새 키프레임 기본 보간 LINEAR — 프레임별 샘플이 곧 궤적 (5.x 슬롯 액션에서도 유효)
+    bpy.context.preferences.edit.keyframe_new_interpolation_type = "LINEAR"
+    STRIDE_HZ = 3.0   # 보폭 주기 — 스프린트 스텝 감각 (v1 동일)
+    FRONT_D0 = 6.0    # t=0 정면 거리
+    FRONT_D1 = 4.8    # t=1 정면 거리 — 러너가 1.2 m 다가옴 (후퇴가 러너보다 약간 느림)
+    SIDE_R = 6.0      # 측면 트래킹 거리 (v1 동일)
+    for f in range(1, frame_count(params) + 1):
+        t = (f - 1) / FPS
+        x = RUN_SPEED * t
+        bob = 0.10 * abs(math.sin(math.pi * STRIDE_HZ * t))
+        runner.location = (x, 0, bob)
+        runner.rotation_euler = (0, 0.12, 0)  # 전경사 — 질주 감각 (v1 동일)
+        runner.keyframe_insert(data_path="location", frame=f)
+        runner.keyframe_insert(data_path="rotation_euler", frame=f)
+
+        if t < 1.0:            # phase A — 정면 도어웨이 (러너 전방에서 후퇴)
+            phi = 0.0
+            r = FRONT_D0 + (FRONT_D1 - FRONT_D0) * t
+        elif t < 2.0:          # phase B — 측면 스윙 (러너 중심 궤도, smoothstep 완화)
+            ss = smoothstep(t - 1.0)
+            phi = -0.5 * math.pi * ss
+            r = FRONT_D1 + (SIDE_R - FRONT_D1) * ss
+        else:                  # phase C — 측면 동속 트래킹 (v1 동일 구도)
+            phi = -0.5 * math.pi
+            r = SIDE_R
+        cam.location = (x + r * math.cos(phi), r * math.sin(phi), 1.1)
+        cam.rotation_euler = (math.pi / 2, 0, phi + math.pi / 2)  # 항상 러너 조준
+        cam.keyframe_insert(data_path="location", frame=f)
+        cam.keyframe_insert(data_path="rotation_euler", frame=f)
+
+    # 선형 보간 재확인 (구 API가 살아있으면 한 번 더 강제 — 실패해도 preference로 이미 LINEAR)
+    for obj in (runner, cam):
+        try:
+            for fc in obj.animation_data.action.fcurves:
+                for kp in fc.keyframe_points:
+                    kp.interpolation = "LINEAR"
+        except (AttributeError, TypeError):
+            pass
+
+    return scene
+
+
+def configure_render(scene, params=None):
+    """Workbench 플랫 + h264 mp4 + BLOCKOUT_* 덮어쓰기. 씬을 재사용하는 잡마다 다시 불린다."""
+    scene.render.fps = FPS
+    scene.frame_start = 1
+    scene.frame_end = frame_count(params)
+    scene.render.resolution_x = 1280
+    scene.render.resolution_y = 720
+    scene.render.resolution_percentage = 100
+
+    # Workbench 플랫 렌더 — 오브젝트 색 그대로, 질감 없음 (블록아웃 3규칙)
+    scene.render.engine = "BLENDER_WORKBENCH"
+    shading = scene.display.shading
+    shading.light = "STUDIO"
+    shading.color_type = "OBJECT"
+    shading.show_cavity = False
+    scene.display.render_aa = "8"
+
+    # h264 mp4 (Blender 5.x: media_type 선분리 후 FFMPEG 선택)
+    if hasattr(scene.render.image_settings, "media_type"):
+        scene.render.image_settings.media_type = "VIDEO"
+    scene.render.image_settings.file_format = "FFMPEG"
+    scene.render.ffmpeg.format = "MPEG4"
+    scene.render.ffmpeg.codec = "H264"
+    scene.render.ffmpeg.constant_rate_factor = "MEDIUM"
+    scene.render.ffmpeg.audio_codec = "NONE"
+    scene.render.filepath = output_path(os.path.join(HERE, "blockout_v3.mp4"), params=params)
+    apply_overrides(scene, params)   # BLOCKOUT_* — 해상도·프레임 구간 (blockout_kit/overrides.py)
+
+
+def render(scene, params=None):
+    if chunks.frames(params):   # 프레임 구간마다 시야 안 부품만 (blockout_kit/chunks.py)
+        parts = lambda x0, x1: corridor_parts(x0, x1, chase_seconds(params))  # noqa: E731
+        return chunks.render(scene, params, parts, make_part)
+    if progressive.enabled(params):   # 거친→고운 순서 + 프리뷰 MP4 (blockout_kit/progressive.py)
+        return progressive.render(scene, params, PHASE_FRAMES)
+    bpy.ops.render.render(animation=True)
+    print(f"DONE → {scene.render.filepath}")
+    return [scene.render.filepath]
+
+
+def main(params=None):
+    return telemetry.run(__file__, params, build_scene, configure_render, render)
 
 
-# ── 애니메이션: 프레임별 키프레임 — 러너 전진 + 카메라 3-phase 안무 ──
-# 새 키프레임 기본 보간 LINEAR — 프레임별 샘플이 곧 궤적 (5.x 슬롯 액션에서도 유효)
-bpy.context.preferences.edit.keyframe_new_interpolation_type = "LINEAR"
-STRIDE_HZ = 3.0   # 보폭 주기 — 스프린트 스텝 감각 (v1 동일)
-FRONT_D0 = 6.0    # t=0 정면 거리
-FRONT_D1 = 4.8    # t=1 정면 거리 — 러너가 1.2 m 다가옴 (후퇴가 러너보다 약간 느림)
-SIDE_R = 6.0      # 측면 트래킹 거리 (v1 동일)
-for f in range(1, FRAMES + 1):
-    t = (f - 1) / FPS
-    x = RUN_SPEED * t
-    bob = 0.10 * abs(math.sin(math.pi * STRIDE_HZ * t))
-    runner.location = (x, 0, bob)
-    runner.rotation_euler = (0, 0.12, 0)  # 전경사 — 질주 감각 (v1 동일)
-    runner.keyframe_insert(data_path="location", frame=f)
-    runner.keyframe_insert(data_path="rotation_euler", frame=f)
-
-    if t < 1.0:            # phase A — 정면 도어웨이 (러너 전방에서 후퇴)
-        phi = 0.0
-        r = FRONT_D0 + (FRONT_D1 - FRONT_D0) * t
-    elif t < 2.0:          # phase B — 측면 스윙 (러너 중심 궤도, smoothstep 완화)
-        ss = smoothstep(t - 1.0)
-        phi = -0.5 * math.pi * ss
-        r = FRONT_D1 + (SIDE_R - FRONT_D1) * ss
-    else:                  # phase C — 측면 동속 트래킹 (v1 동일 구도)
-        phi = -0.5 * math.pi
-        r = SIDE_R
-    cam.location = (x + r * math.cos(phi), r * math.sin(phi), 1.1)
-    cam.rotation_euler = (math.pi / 2, 0, phi + math.pi / 2)  # 항상 러너 조준
-    cam.keyframe_insert(data_path="location", frame=f)
-    cam.keyframe_insert(data_path="rotation_euler", frame=f)
-
-# 선형 보간 재확인 (구 API가 살아있으면 한 번 더 강제 — 실패해도 preference로 이미 LINEAR)
-for obj in (runner, cam):
-    try:
-        for fc in obj.animation_data.action.fcurves:
-            for kp in fc.keyframe_points:
-                kp.interpolation = "LINEAR"
-    except (AttributeError, TypeError):
-        pass
-
-bpy.ops.render.render(animation=True)
-print(f"DONE → {OUT}")
+if __name__ == "__main__":
+    main()
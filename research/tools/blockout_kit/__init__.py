@@ -0,0 +1,5 @@
+"""블록아웃 스크립트 공용 도구 — research/experiments/*/blockout*.py 가 함께 쓰는 것만 둔다.
+
+Blender 안에서 import 되는 모듈(overrides)과 Blender 밖에서 도는 CLI(tiled)가 섞여 있다.
+Blender 밖 모듈은 표준 라이브러리만 쓴다 — 렌더 노드에 pip 설치를 요구하지 않으려고.
+"""
@@ -0,0 +1,345 @@
+"""CPU 렌더 프로필 자동 튜닝 — 이 머신에서 가장 빠른 Cycles CPU 설정을 재서 캐시해 두고 모든 스크립트가 쓴다.
+
+법정 스크립트는 METAL 을 시도하고 실패하면 CPU 로 떨어진다 — 리눅스 렌더 노드에서는 늘 CPU, 그것도
+Blender 기본값(스레드 자동·타일 2048·BVH 기본·디노이저 최고 품질)으로. 튜너는 짧은 대표 렌더(법정
+view_bench_eye, bench.py 의 courtroom 설정에 샘플·해상도만 낮춘 것)를 축마다 후보를 바꿔 가며 재고,
+가장 빠른 조합을 프로필 파일에 머신 키별로 남긴다.
+
+  축 (좌표 하강 — 앞 축의 승자를 고정하고 다음 축):
+    threads          0(자동) / 코어-1 / 물리 코어 / 코어/2
+    tile             auto 2048 / 1024 / 512 / 256 / 타일 끔
+    spatial_splits   BVH 공간 분할 끔/켬 (빌드는 느려지고 추적은 빨라진다 — 씬마다 다르다)
+    denoise          prefilter ACCURATE/FAST/NONE, quality HIGH/BALANCED/FAST (use_denoising 인 씬만, --axes 로만)
+  후보는 --repeat 회 중앙값. 현재 승자보다 --min-gain(기본 3%) 넘게 빨라야 바꾼다 — 잡음으로 뒤집히지 않게.
+  디노이저 축은 화질을 바꾼다(prefilter NONE·quality FAST 는 거칠다) — 튜너는 초만 보므로 기본 축에 없다.
+  화질이 달라져도 되는 머신에서만 --axes threads,tile,spatial_splits,denoise 로 켠다.
+
+  머신 키 = sha1(Blender 버전 X.Y.Z + CPU 모델 + 논리 코어 수). 프로필 파일은 키 → 항목이라 홈을 공유하는
+  노드끼리 한 파일을 써도 된다. 같은 호스트에 다른 키의 항목만 있으면 "changed" — Blender 를 올렸거나
+  CPU 가 바뀌었다. 그때 스크립트는 기본값으로 돌고(경고 1줄), pool.py 는 렌더 전에 다시 튜닝한다.
+
+적용: overrides.apply_overrides() 끝에서 apply() — 모든 블록아웃 스크립트가 렌더 설정 마지막에 부르므로
+스크립트 수정 없이 따라온다. 프로필은 Cycles + CPU 디바이스일 때만 적용한다(Workbench·EEVEE 는 해당
+없음, GPU 가 잡히면 CPU 프로필은 의미 없음). 프로필이 없으면 기본값으로 되돌린다 — 배치가 씬을 재사용해도
+이전 잡의 프로필이 새지 않게. -t 로 스레드를 정해 띄운 프로세스(tiled.py·pool.py)는 -t 가 threads 를 이긴다.
+
+  BLOCKOUT_PROFILE  프로필 파일 (기본 ~/.cache/blockout/render_profile.json, "off" 면 적용 안 함)
+  telemetry render 이벤트 profile = 적용한 머신 키 (없으면 null).
+
+실행 (Blender 밖, 표준 라이브러리만 — 렌더는 안에서 Blender 1프로세스로):
+  python research/tools/blockout_kit/autotune.py                   # 튜닝 → 프로필 저장
+  python research/tools/blockout_kit/autotune.py --if-stale        # 이 머신 프로필이 없거나 낡았을 때만
+  python research/tools/blockout_kit/autotune.py --check           # 상태만 (fresh 0 / missing·changed 3)
+  python research/tools/blockout_kit/autotune.py --axes threads,tile --repeat 5
+
+Blender 경로는 BLENDER 환경변수(기본 "blender").
+"""
+import argparse
+import hashlib
+import json
+import os
+import platform
+import re
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from blockout_kit.overrides import param  # noqa: E402
+
+DEFAULT_PATH = os.path.join(os.path.expanduser("~"), ".cache", "blockout", "render_profile.json")
+DEFAULT = {"threads": 0, "auto_tile": True, "tile_size": 2048, "spatial_splits": False,
+           "denoise_prefilter": "ACCURATE", "denoise_quality": "HIGH"}   # Blender 기본값 = 튜닝 기준
+AXES = ("threads", "tile", "spatial_splits")   # 기본 축 — 이미지가 안 바뀌는 것만
+OPT_AXES = ("denoise",)                          # --axes 로 명시할 때만
+_warned = set()
+
+
+# ── 머신 키 (Blender 안팎 공통) ──
+def cpu_model():
+    if sys.platform == "darwin":
+        try:
+            return subprocess.run(["sysctl", "-n", "machdep.cpu.brand_string"],
+                                  capture_output=True, text=True, check=True).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            pass
+    try:
+        with open("/proc/cpuinfo", encoding="utf-8") as fh:
+            for line in fh:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or platform.machine()
+
+
+def physical_cores():
+    """(physical id, core id) 쌍 수 — 모르면 None."""
+    try:
+        with open("/proc/cpuinfo", encoding="utf-8") as fh:
+            text = fh.read()
+    except OSError:
+        return None
+    pairs = set()
+    for block in text.split("\n\n"):
+        ids = dict(re.findall(r"^(physical id|core id)\s*:\s*(\d+)", block, re.M))
+        if "core id" in ids:
+            pairs.add((ids.get("physical id"), ids["core id"]))
+    return len(pairs) or None
+
+
+def machine(blender_version):
+    info = {"blender": blender_version, "cpu": cpu_model(), "cores": os.cpu_count() or 1}
+    key = hashlib.sha1(json.dumps(info, sort_keys=True).encode()).hexdigest()[:12]
+    return key, info
+
+
+def blender_version(blender=None):
+    """안에서는 bpy.app.version, 밖에서는 `blender --version` 첫 줄 — 둘 다 "X.Y.Z"."""
+    if blender is None:
+        import bpy
+        return ".".join(str(v) for v in bpy.app.version)
+    out = subprocess.run([blender, "--version"], capture_output=True, text=True, check=True).stdout
+    m = re.search(r"Blender (\d+\.\d+\.\d+)", out)
+    if not m:
+        raise RuntimeError(f"Blender 버전을 읽지 못함: {out.splitlines()[:1]}")
+    return m.group(1)
+
+
+# ── 프로필 파일 ──
+def profile_path(params=None):
+    path = param(params, "BLOCKOUT_PROFILE", DEFAULT_PATH)
+    return None if path.lower() in ("", "0", "off") else path
+
+
+def load(path):
+    if not path or not os.path.exists(path):
+        return {"machines": {}}
+    with open(path, encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def status(doc, key, host=None):
+    """"fresh"(이 키 항목 있음) / "changed"(같은 호스트에 다른 키 항목만) / "missing"."""
+    if key in doc["machines"]:
+        return "fresh"
+    host = host or socket.gethostname()
+    return "changed" if any(e.get("host") == host for e in doc["machines"].values()) else "missing"
+
+
+def save(path, key, entry):
+    """항목 1개를 넣는다 — 같은 호스트의 예전 키 항목은 지운다. 임시 파일 → rename (노드끼리 동시에 써도 안 깨지게)."""
+    doc = load(path)
+    doc["machines"] = {k: e for k, e in doc["machines"].items() if e.get("host") != entry["host"]}
+    doc["machines"][key] = entry
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as fh:
+        json.dump(doc, fh, ensure_ascii=False, indent=2)
+    os.replace(tmp, path)
+
+
+# ── 적용 (Blender 안) ──
+def set_profile(scene, prof):
+    r, c = scene.render, scene.cycles
+    r.threads_mode = "FIXED" if prof["threads"] else "AUTO"
+    if prof["threads"]:
+        r.threads = prof["threads"]
+    c.use_auto_tile = prof["auto_tile"]
+    c.tile_size = prof["tile_size"]
+    c.debug_use_spatial_splits = prof["spatial_splits"]
+    if c.use_denoising:
+        c.denoising_prefilter = prof["denoise_prefilter"]
+        if hasattr(c, "denoising_quality"):   # Blender 4.1+
+            c.denoising_quality = prof["denoise_quality"]
+
+
+def apply(scene, params=None):
+    """overrides.apply_overrides() 끝에서 — Cycles CPU 면 이 머신 프로필(없으면 기본값). 반환: 적용한 키 또는 None."""
+    scene["render_profile"] = ""
+    if scene.render.engine != "CYCLES" or scene.cycles.device != "CPU":
+        return None
+    path = profile_path(params)
+    key, doc = None, {"machines": {}}
+    if path:
+        key, _ = machine(blender_version())
+        try:
+            doc = load(path)
+        except (OSError, ValueError) as exc:
+            print(f"[autotune] 프로필 읽기 실패 {path}: {exc}", file=sys.stderr)
+    entry = doc["machines"].get(key)
+    if path and entry is None and path not in _warned and status(doc, key) == "changed":
+        _warned.add(path)
+        print(f"[autotune] {path} 의 이 호스트 프로필은 다른 Blender/CPU 용 — 기본값으로 렌더. "
+              f"다시 재기: autotune.py --if-stale", file=sys.stderr)
+    prof = dict(DEFAULT, **entry["profile"]) if entry else DEFAULT
+    if entry and "denoise" not in entry.get("axes", ()):   # 디노이저를 명시로 튜닝하지 않은(예전) 항목 — 화질 고정
+        prof = dict(prof, denoise_prefilter=DEFAULT["denoise_prefilter"], denoise_quality=DEFAULT["denoise_quality"])
+    set_profile(scene, prof)
+    if entry:
+        scene["render_profile"] = key
+    return key if entry else None
+
+
+# ── 튜닝 (Blender 안) ──
+def candidates(axis, cores, physical):
+    """축 1개의 후보 패치 목록."""
+    if axis == "threads":
+        counts = sorted({cores - 1, physical or 0, cores // 2} - {0, cores}, reverse=True)
+        return [{"threads": 0}] + [{"threads": n} for n in counts if n > 0]
+    if axis == "tile":
+        return [{"auto_tile": True, "tile_size": s} for s in (2048, 1024, 512, 256)] + [{"auto_tile": False}]
+    if axis == "spatial_splits":
+        return [{"spatial_splits": False}, {"spatial_splits": True}]
+    if axis == "denoise":
+        return ([{"denoise_prefilter": p} for p in ("ACCURATE", "FAST", "NONE")]
+                + [{"denoise_quality": q} for q in ("BALANCED", "FAST")])
+    raise ValueError(f"모르는 축 {axis} (가능: {', '.join(AXES + OPT_AXES)})")
+
+
+def run_tune(result_path, out_dir, axes, repeat, samples, pct, min_gain):
+    """대표 렌더를 축마다 후보를 바꿔 재고 승자를 result_path 에."""
+    import bpy
+    from blockout_kit.batch import Runner, resolve_script
+    from blockout_kit.bench import COURT_FIXED, COURTROOM
+    mod = Runner().module(resolve_script(COURTROOM))
+    params = dict(COURT_FIXED, BG3D_SAMPLES=samples, BG3D_PCT=pct, BLOCKOUT_DEVICE="CPU", BLOCKOUT_PROFILE="off",
+                  BLOCKOUT_OUT=os.path.join(out_dir, "tune_{view}.png"))
+    scene = mod.build_scene(params)
+    mod.configure_render(scene, params)
+
+    def measure(prof):
+        set_profile(scene, prof)
+        secs = []
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            mod.render(scene, params)
+            secs.append(time.perf_counter() - t0)
+        return round(statistics.median(secs), 4)
+
+    set_profile(scene, DEFAULT)
+    mod.render(scene, params)   # 워밍업 — 커널 로드·첫 BVH 가 첫 후보에 얹히지 않게
+    best = dict(DEFAULT)
+    base_s = best_s = measure(best)
+    trials = [{"axis": "baseline", "patch": {}, "seconds": base_s}]
+    cores = os.cpu_count() or 1
+    for axis in axes:
+        if axis == "denoise" and not scene.cycles.use_denoising:
+            continue
+        if axis == "denoise" and not hasattr(scene.cycles, "denoising_quality"):
+            patches = [p for p in candidates(axis, cores, None) if "denoise_quality" not in p]
+        else:
+            patches = candidates(axis, cores, physical_cores())
+        winner, win_s = best, best_s
+        for patch in patches:
+            prof = dict(best, **patch)
+            if prof == best:
+                continue
+            s = measure(prof)
+            trials.append({"axis": axis, "patch": patch, "seconds": s})
+            print(f"[autotune] {axis:15s} {json.dumps(patch):48s} {s:8.3f}s  (현재 {best_s:.3f}s)")
+            if s < win_s:
+                winner, win_s = prof, s
+        if win_s < best_s * (1 - min_gain):
+            best, best_s = winner, win_s
+    key, info = machine(blender_version())
+    out = {"key": key, "machine": info, "profile": best, "axes": list(axes), "baseline_s": base_s, "best_s": best_s,
+           "speedup": round(base_s / best_s, 3) if best_s else None, "samples": samples, "pct": pct,
+           "repeat": repeat, "trials": trials}
+    with open(result_path, "w", encoding="utf-8") as fh:
+        json.dump(out, fh, ensure_ascii=False)
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+
+
+# ── 드라이버 (Blender 밖) ──
+def tune(blender, path, axes=AXES, repeat=3, samples=16, pct=50, min_gain=0.03):
+    """Blender 1프로세스로 튜닝 → 프로필 파일에 저장. 반환: 항목 dict (실패면 None — 로그 경로를 찍는다)."""
+    tmp = tempfile.mkdtemp(prefix="blockout_autotune_")
+    result = os.path.join(tmp, "result.json")
+    log = os.path.join(tmp, "autotune.log")
+    cmd = [blender, "--background", "--factory-startup", "--python", os.path.abspath(__file__), "--",
+           "--run-tune", "--result", result, "--out-dir", tmp, "--axes", ",".join(axes), "--repeat", str(repeat),
+           "--samples", str(samples), "--pct", str(pct), "--min-gain", str(min_gain)]
+    print(f"[autotune] 튜닝 시작 (축 {', '.join(axes)} × {repeat}회) — 로그 {log}")
+    t0 = time.time()
+    with open(log, "w", encoding="utf-8") as fh:
+        code = subprocess.call(cmd, stdout=fh, stderr=subprocess.STDOUT)
+    if code != 0 or not os.path.exists(result):
+        print(f"[autotune] 실패 (exit {code}) — 로그: {log}", file=sys.stderr)
+        return None
+    with open(result, encoding="utf-8") as fh:
+        rec = json.load(fh)
+    key = rec.pop("key")
+    entry = dict(rec, host=socket.gethostname(), tuned_at=time.strftime("%Y-%m-%dT%H:%M:%S"),
+                 tune_s=round(time.time() - t0, 1))
+    save(path, key, entry)
+    changed = {k: v for k, v in entry["profile"].items() if DEFAULT[k] != v}
+    print(f"[autotune] {key} {entry['baseline_s']}s → {entry['best_s']}s (×{entry['speedup']}) "
+          f"{changed or '기본값이 제일 빠름'} → {path}")
+    return entry
+
+
+def ensure(blender, params=None):
+    """렌더 드라이버(pool.py)가 잡 전에 — 이 호스트가 튜닝된 적 있는데 Blender/CPU 가 바뀌었으면 다시 잰다.
+    처음 튜닝(missing)은 명시적으로만 (autotune.py). 튜닝이 실패해도 렌더는 기본값으로 간다."""
+    path = profile_path(params)
+    if not path:
+        return None
+    try:
+        key, _ = machine(blender_version(blender))
+        state = status(load(path), key)
+    except (OSError, ValueError, RuntimeError, subprocess.CalledProcessError) as exc:
+        print(f"[autotune] 프로필 확인 실패: {exc}", file=sys.stderr)
+        return None
+    if state == "changed":
+        print(f"[autotune] 이 호스트의 Blender/CPU 가 바뀜 → 다시 튜닝 ({path})")
+        tune(blender, path)
+    return state
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="이 머신의 가장 빠른 Cycles CPU 렌더 설정을 재서 프로필로 저장")
+    ap.add_argument("--axes", default=",".join(AXES),
+                    help=f"튜닝할 축 (쉼표, 기본 {','.join(AXES)}) — {', '.join(OPT_AXES)} 는 화질이 바뀌어 명시할 때만")
+    ap.add_argument("--repeat", type=int, default=3, help="후보당 렌더 횟수 — 중앙값")
+    ap.add_argument("--samples", type=int, default=16, help="대표 렌더 샘플")
+    ap.add_argument("--pct", type=int, default=50, help="대표 렌더 해상도 %%")
+    ap.add_argument("--min-gain", type=float, default=0.03, help="축 승자가 이만큼 넘게 빨라야 채택")
+    ap.add_argument("--profile", default=None, help=f"프로필 파일 (기본 BLOCKOUT_PROFILE 또는 {DEFAULT_PATH})")
+    ap.add_argument("--if-stale", action="store_true", help="이 머신 프로필이 fresh 면 아무것도 안 한다")
+    ap.add_argument("--check", action="store_true", help="상태만 출력 (fresh 0, 아니면 3)")
+    ap.add_argument("--run-tune", action="store_true", help=argparse.SUPPRESS)   # 내부용 — Blender 안
+    ap.add_argument("--result", help=argparse.SUPPRESS)
+    ap.add_argument("--out-dir", help=argparse.SUPPRESS)
+    args = ap.parse_args(argv)
+    axes = [a for a in args.axes.split(",") if a]
+    unknown = [a for a in axes if a not in AXES + OPT_AXES]
+    if unknown:
+        ap.error(f"모르는 축: {unknown}")
+
+    if args.run_tune:
+        run_tune(args.result, args.out_dir, axes, args.repeat, args.samples, args.pct, args.min_gain)
+        return 0
+    path = args.profile or profile_path() or DEFAULT_PATH
+    blender = os.environ.get("BLENDER", "blender")
+    if args.check or args.if_stale:
+        key, info = machine(blender_version(blender))
+        doc = load(path)
+        state = status(doc, key)
+        entry = doc["machines"].get(key)
+        print(f"[autotune] {state} — {key} (Blender {info['blender']}, {info['cpu']}, {info['cores']}코어)"
+              + (f" 튜닝 {entry['tuned_at']} ×{entry['speedup']}" if entry else ""))
+        if args.check:
+            return 0 if state == "fresh" else 3
+        if state == "fresh":
+            return 0
+    return 0 if tune(blender, path, axes, args.repeat, args.samples, args.pct, args.min_gain) else 1
+
+
+if __name__ == "__main__":
+    # Blender 안(--run-tune)에서는 "--" 뒤 인자만 스크립트 몫이다
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else sys.argv[1:]
+    sys.exit(main(argv))
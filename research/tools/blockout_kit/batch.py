@@ -0,0 +1,209 @@
+"""배치 매니페스트 러너 — 블록아웃 잡 여러 개를 Blender 1세션에서 차례로 돈다.
+
+블록아웃 스크립트는 전부 `build_scene(params) → configure_render(scene, params) → render(scene, params)`
+로 나뉘어 있고 `main(params)` 가 셋을 잇는다. 러너는 그 세 단계를 직접 불러서 잡 사이에 재사용한다:
+
+  ① 스크립트 모듈은 경로당 한 번만 임포트한다 (파싱·컴파일·모듈 상수 계산 1회).
+  ② 직전 잡과 스크립트가 같고 스크립트의 BUILD_PARAMS 값이 같으면 build_scene() 을 건너뛰고
+     configure_render() + render() 만 — 법정 뷰·샘플 실험처럼 씬은 같고 렌더 설정만 다른 잡들.
+     씬을 새로 짓는 잡은 매번 공장 설정(read_factory_settings, 빈 씬)에서 시작한다 — 앞 잡이 바꾼
+     환경설정(새 키프레임 보간 LINEAR)·컬러 관리(Standard 뷰 변환)·렌더 설정이 다음 스크립트로 새지 않게.
+  ③ split_params() 가 있는 스크립트(camera-follow: 케이스마다 씬이 다르다)는 잡 하나를 펼친다.
+  ④ main() 이 없는 스크립트는 예전 방식 — 씬을 비우고 params 를 환경변수로 얹어 톱레벨 실행.
+
+실행 (Blender 안):
+  blender --background --python research/tools/blockout_kit/batch.py -- manifest.json [--group] [--keep-going]
+
+매니페스트 (배열만 써도 된다 = jobs):
+  {"defaults": {"BG3D_SAMPLES": 64},                       # 선택 — 모든 잡 params 밑에 깔린다
+   "jobs": [{"script": "research/experiments/.../courtroom_blockout.py",   # 저장소 루트 기준 또는 절대 경로
+             "params": {"BG3D_VIEWS": "view_bench_eye"},   # 스크립트 환경변수와 같은 이름
+             "frame_start": 1, "frame_end": 24,            # → BLOCKOUT_FRAME_START/END
+             "output": "/tmp/bench.png"}]}                 # → BLOCKOUT_OUT
+
+잡 순서는 매니페스트 그대로다. `--group` 이면 (스크립트, BUILD_PARAMS 값) 이 같은 잡끼리 처음 나온
+자리로 붙인다(안정 정렬) — 재사용 ②가 최대가 된다. 결과는 매니페스트 옆 `<이름>.batch.json`
+(잡별 상태·초·빌드/재사용 횟수·출력 경로). 실패한 잡이 있으면 종료 코드 1.
+"""
+import argparse
+import ast
+import importlib.util
+import json
+import os
+import re
+import runpy
+import sys
+import time
+import traceback
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from blockout_kit import telemetry  # noqa: E402
+from blockout_kit.overrides import param  # noqa: E402
+
+REPO = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", ".."))
+
+
+def resolve_script(path):
+    path = path if os.path.isabs(path) else os.path.join(REPO, path)
+    if not os.path.isfile(path):
+        raise FileNotFoundError(f"스크립트 없음: {path}")
+    return path
+
+
+def job_params(job, defaults=None):
+    """잡 → params dict. defaults 위에 잡 params, 프레임·출력은 BLOCKOUT_* 로."""
+    params = dict(defaults or {})
+    params.update(job.get("params") or {})
+    if job.get("frame_start") is not None:
+        params["BLOCKOUT_FRAME_START"] = job["frame_start"]
+    if job.get("frame_end") is not None:
+        params["BLOCKOUT_FRAME_END"] = job["frame_end"]
+    if job.get("output"):
+        params["BLOCKOUT_OUT"] = job["output"]
+    return params
+
+
+def load_manifest(path):
+    with open(path, encoding="utf-8") as fh:
+        doc = json.load(fh)
+    if isinstance(doc, list):
+        doc = {"jobs": doc}
+    defaults = doc.get("defaults") or {}
+    return [dict(job, params=job_params(job, defaults)) for job in doc["jobs"]]
+
+
+def has_entry(path):
+    """스크립트가 build_scene/configure_render/render 를 톱레벨에 정의하나 — 임포트 전에 AST 로만 본다
+    (예전 스크립트는 임포트하는 순간 렌더가 돌아버린다)."""
+    with open(path, encoding="utf-8") as fh:
+        tree = ast.parse(fh.read(), path)
+    names = {n.name for n in tree.body if isinstance(n, ast.FunctionDef)}
+    return {"build_scene", "configure_render", "render"} <= names
+
+
+class Runner:
+    """잡을 차례로 돌며 모듈·씬을 재사용한다. bpy 는 메인 스레드에서만 — worker.py 도 이걸 쓴다."""
+
+    def __init__(self):
+        self.modules = {}
+        self.scene_key = None   # 지금 씬을 지은 (스크립트, BUILD_PARAMS 값) — None 이면 모른다
+
+    def module(self, path):
+        if path not in self.modules:
+            if not has_entry(path):
+                self.modules[path] = None
+            else:
+                name = "blockout_job_" + re.sub(r"\W", "_", os.path.relpath(path, REPO))
+                spec = importlib.util.spec_from_file_location(name, path)
+                mod = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(mod)
+                self.modules[path] = mod
+        return self.modules[path]
+
+    def build_key(self, path, params):
+        mod = self.module(path)
+        if mod is None:
+            return (path, None)
+        # BLOCKOUT_INSTANCE 는 모든 스크립트에서 씬 구조를 바꾼다 (instancing.py)
+        return (path, tuple(param(params, k) for k in (*getattr(mod, "BUILD_PARAMS", ()), "BLOCKOUT_INSTANCE")))
+
+    def run(self, job):
+        """잡 1개 → {"outputs", "builds", "reused"}. 예외는 그대로 올린다 (씬 상태는 버린다)."""
+        import bpy
+        path = resolve_script(job["script"])
+        params = job.get("params") or {}
+        mod = self.module(path)
+        if mod is None:
+            self.scene_key = None
+            _run_legacy(path, params)
+            return {"outputs": [], "builds": 1, "reused": 0}
+        outputs, builds, reused = [], 0, 0
+        for p in getattr(mod, "split_params", lambda q: [q])(params):
+            key = self.build_key(path, p)
+            reuse = key == self.scene_key
+            self.scene_key = None
+            if not reuse:   # 앞 잡이 바꾼 환경설정(키프레임 보간 등)·씬·렌더 설정이 새 빌드로 새지 않게
+                bpy.ops.wm.read_factory_settings(use_empty=True)
+            try:
+                outputs += telemetry.run(path, p, mod.build_scene, mod.configure_render, mod.render,
+                                         scene=bpy.context.scene if reuse else None)
+                self.scene_key = key
+                reused += reuse
+                builds += not reuse
+            except BaseException:
+                self.scene_key = None
+                raise
+        return {"outputs": outputs, "builds": builds, "reused": reused}
+
+
+def _run_legacy(path, params):
+    """main() 없는 스크립트 — 씬을 비우고 params 를 환경변수로 얹어 톱레벨 실행, 끝나면 되돌린다."""
+    import bpy
+    saved = dict(os.environ)
+    try:
+        bpy.ops.wm.read_factory_settings(use_empty=True)
+        os.environ.update({k: str(v) for k, v in params.items()})
+        runpy.run_path(path, run_name="__main__")
+    finally:
+        os.environ.clear()
+        os.environ.update(saved)
+
+
+def group_jobs(runner, jobs):
+    """(스크립트, BUILD_PARAMS 값) 이 같은 잡을 그 키가 처음 나온 자리로 모은다 — 안정 정렬."""
+    first = {}
+    keyed = []
+    for i, job in enumerate(jobs):
+        key = runner.build_key(resolve_script(job["script"]), job["params"])
+        first.setdefault(key, i)
+        keyed.append((first[key], i, job))
+    return [job for _, _, job in sorted(keyed, key=lambda t: t[:2])]
+
+
+def main(argv):
+    ap = argparse.ArgumentParser(description="블록아웃 잡 매니페스트를 Blender 1세션에서 실행")
+    ap.add_argument("manifest")
+    ap.add_argument("--group", action="store_true", help="같은 씬을 쓰는 잡끼리 붙여 빌드 재사용을 늘린다")
+    ap.add_argument("--keep-going", action="store_true", help="실패한 잡이 있어도 나머지를 돈다")
+    args = ap.parse_args(argv)
+
+    jobs = load_manifest(args.manifest)
+    runner = Runner()
+    if args.group:
+        jobs = group_jobs(runner, jobs)
+    t_all = time.perf_counter()
+    results = []
+    for i, job in enumerate(jobs):
+        rec = {"index": i, "script": job["script"], "params": job["params"]}
+        t0 = time.perf_counter()
+        try:
+            rec.update(runner.run(job))
+            rec["state"] = "done"
+        except Exception as exc:  # noqa: BLE001 — 잡 실패는 보고서에 남기고 다음 잡 판단
+            rec["state"] = "failed"
+            rec["error"] = f"{type(exc).__name__}: {exc}"
+            traceback.print_exc()
+        rec["seconds"] = round(time.perf_counter() - t0, 3)
+        results.append(rec)
+        print(f"[batch] {i + 1}/{len(jobs)} {rec['state']} {rec['seconds']}s "
+              f"build {rec.get('builds', 0)} / reuse {rec.get('reused', 0)} ← {job['script']}")
+        if rec["state"] == "failed" and not args.keep_going:
+            break
+
+    failed = [r for r in results if r["state"] == "failed"]
+    report = {"manifest": args.manifest, "jobs": len(jobs), "ran": len(results), "failed": len(failed),
+              "builds": sum(r.get("builds", 0) for r in results),
+              "reused": sum(r.get("reused", 0) for r in results),
+              "total_seconds": round(time.perf_counter() - t_all, 2), "results": results}
+    out = os.path.splitext(args.manifest)[0] + ".batch.json"
+    with open(out, "w", encoding="utf-8") as fh:
+        json.dump(report, fh, ensure_ascii=False, indent=2)
+    print(f"[batch] DONE {len(results)}/{len(jobs)} 잡, 빌드 {report['builds']} · 재사용 {report['reused']}, "
+          f"{report['total_seconds']}s → {out}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    # Blender 는 "--" 뒤 인자만 스크립트 몫이다
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else sys.argv[1:]
+    sys.exit(main(argv))
@@ -0,0 +1,284 @@
+"""렌더 성능 벤치 — 기존 블록아웃 씬 + 합성 스케일링 변형의 빌드·렌더 시간과 메모리를 잰다.
+
+Blender 를 올리거나 씬을 고친 뒤 "느려졌나"를 숫자로 답하기 위한 것. 케이스마다 Blender 프로세스를
+새로 띄워(최대 RSS 가 케이스끼리 섞이지 않게) telemetry.run() 으로 돌리고, 그 phase 이벤트에서
+build / configure / render 초·삼각형 수·최대 RSS 를 뽑는다. 결과는 이력 JSONL 에 한 줄씩 쌓이고,
+같은 호스트의 직전 --window 회 중앙값보다 --threshold 이상 나빠진 지표는 회귀로 표시한다.
+
+  courtroom        법정, view_bench_eye 1장 · 32 spp 고정 · 50% (적응 예산 끔)
+  courtroom_x10    벤치·벽 패널을 10배 (복사본을 Z 로 2 mm 씩 쌓는다 — 기하·BVH 규모만 키운다)
+  courtroom_x100   〃 100배
+  courtroom_x100_inst  x100 + BLOCKOUT_INSTANCE=mesh — 같은 메시를 1벌로 공유(instancing.py). x100 과의
+                   차이가 메모리(mesh_mb·peak_rss_mb)·씬 동기화(sync_s = 프레임 sync_s 합) 절감이다
+  v3               v3 복도 애니 24프레임 MP4
+  camfollow        camera-follow 6케이스를 한 프로세스에서, 케이스마다 시작 프레임 1장 (빌드·평가가 주인공)
+  camfollow_evalcache  〃 + BLOCKOUT_EVAL_CACHE=1 — 베벨 박스를 세션에 1번만 평가(evalcache.py).
+                   camfollow 와의 차이가 build_s·depsgraph_s(scene 이벤트 depsgraph 평가 초 합) 절감이다
+  plate            잔해 플레이트 스틸
+  plate_10k … 1m   플레이트에 R2 산포 잔해 박스 1만/10만/100만 개 추가
+
+합성 잔해는 오브젝트 대신 청크당 메시 1개(10만 박스)로 짓는다 — 100만 오브젝트는 빌드가
+렌더를 압도해 벤치가 아니라 bpy 오퍼레이터 오버헤드 측정이 된다.
+
+실행 (Blender 밖, 표준 라이브러리만 — 케이스는 안에서 Blender 로 돈다):
+  python research/tools/blockout_kit/bench.py                          # 기본 케이스 전부
+  python research/tools/blockout_kit/bench.py courtroom plate_100k --repeat 3 --threshold 0.1
+  python research/tools/blockout_kit/bench.py --list
+
+Blender 경로는 BLENDER 환경변수(기본 "blender"). 이력은 --history (기본 ~/.cache/blockout/bench.jsonl).
+케이스가 실패하면 종료 코드 1, 회귀가 있으면 2. 튜닝된 CPU 프로필(autotune.py)로 돈 케이스는 profile 에
+그 키가 남는다 — 프로필을 새로 잰 직후의 변화는 회귀가 아니라 그 차이다.
+"""
+import argparse
+import json
+import math
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from blockout_kit import instancing, telemetry  # noqa: E402
+
+REPO = telemetry.REPO
+DEFAULT_HISTORY = os.path.join(os.path.expanduser("~"), ".cache", "blockout", "bench.jsonl")
+COURTROOM = "research/experiments/bg-viewsheet-from-3d/courtroom_blockout.py"
+V3 = "research/experiments/previz-video-reference-ab/qual5-parallax/blockout_v3.py"
+PLATE = "research/experiments/previz-bg-plate-ab/blockout_plate_sh_04_19.py"
+CAMFOLLOW = "research/experiments/camera-follow-disambiguation/blockout.py"
+CAMFOLLOW_START = {"BLOCKOUT_FRAME_START": 1, "BLOCKOUT_FRAME_END": 1}
+COURT_FIXED = {"BG3D_SAMPLES": 32, "BG3D_PCT": 50, "BG3D_VIEWS": "view_bench_eye", "BG3D_ADAPTIVE": "0"}
+
+# 이름 → (스크립트, params, 합성 변형). 변형은 build_scene() 뒤에 씬에 얹는다.
+CASES = {
+    "courtroom": (COURTROOM, COURT_FIXED, None),
+    "courtroom_x10": (COURTROOM, COURT_FIXED, ("multiply", 10)),
+    "courtroom_x100": (COURTROOM, COURT_FIXED, ("multiply", 100)),
+    "courtroom_x100_inst": (COURTROOM, dict(COURT_FIXED, BLOCKOUT_INSTANCE="mesh"), ("multiply", 100)),
+    "v3": (V3, {"BLOCKOUT_FRAME_START": 1, "BLOCKOUT_FRAME_END": 24}, None),
+    "camfollow": (CAMFOLLOW, CAMFOLLOW_START, None),
+    "camfollow_evalcache": (CAMFOLLOW, dict(CAMFOLLOW_START, BLOCKOUT_EVAL_CACHE="1"), None),
+    "plate": (PLATE, {}, None),
+    "plate_10k": (PLATE, {}, ("rubble", 10_000)),
+    "plate_100k": (PLATE, {}, ("rubble", 100_000)),
+    "plate_1m": (PLATE, {}, ("rubble", 1_000_000)),
+}
+METRICS = ("build_s", "depsgraph_s", "render_s", "sync_s", "peak_rss_mb", "mesh_mb")
+FLOOR = {"build_s": 0.05, "depsgraph_s": 0.02, "render_s": 0.05, "sync_s": 0.05, "peak_rss_mb": 16.0, "mesh_mb": 1.0}   # 이보다 작은 차는 잡음으로 본다
+MULTIPLY_PREFIXES = ("bench_", "panel_")
+RUBBLE_CHUNK = 100_000
+
+
+# ── 합성 변형 (Blender 안) ──
+def multiply(scene, factor, prefixes=MULTIPLY_PREFIXES):
+    """이름이 prefixes 로 시작하는 오브젝트를 factor 배로 — 메시까지 복사(인스턴싱 없음), Z 로 2 mm 씩 쌓는다."""
+    import bpy
+    src = [o for o in scene.objects if o.name.startswith(prefixes)]
+    for k in range(1, factor):
+        for ob in src:
+            dup = ob.copy()
+            dup.data = ob.data.copy()
+            dup.name = f"{ob.name}_x{k}"
+            dup.location.z += 0.002 * k
+            scene.collection.objects.link(dup)
+    bpy.context.view_layer.update()
+    return len(src) * (factor - 1)
+
+
+def scatter_rubble(scene, n, r2, color):
+    """R2 산포 잔해 박스 n 개 — 플레이트 잔해밭 A 와 같은 분포·크기, 청크당 메시 1개."""
+    import bpy
+    faces_1 = ((0, 1, 3, 2), (4, 6, 7, 5), (0, 4, 5, 1), (2, 3, 7, 6), (0, 2, 6, 4), (1, 5, 7, 3))
+    for c0 in range(0, n, RUBBLE_CHUNK):
+        verts, faces = [], []
+        for i in range(c0, min(n, c0 + RUBBLE_CHUNK)):
+            u, v = r2(i + 1000)
+            y = 3.4 + 36.6 * (v ** 0.85)
+            x = (u - 0.5) * (9.0 + 1.30 * y)
+            s = 0.13 + 0.28 * ((u * 3.7) % 1.0) + 0.017 * y
+            yaw = 2 * math.pi * ((u * 5.3 + v * 2.9) % 1.0)
+            cy, sy = math.cos(yaw), math.sin(yaw)
+            hx, hy, hz = s * 0.85, s * 0.625, s * 0.40
+            base = len(verts)
+            for dx in (-hx, hx):
+                for dy in (-hy, hy):
+                    for dz in (0.0, 2 * hz):
+                        verts.append((x + dx * cy - dy * sy, y + dx * sy + dy * cy, dz))
+            faces.extend(tuple(base + j for j in f) for f in faces_1)
+        me = bpy.data.meshes.new(f"bench_rubble_{c0 // RUBBLE_CHUNK}")
+        me.from_pydata(verts, [], faces)
+        ob = bpy.data.objects.new(me.name, me)
+        ob.color = (*color, 1.0)
+        scene.collection.objects.link(ob)
+    return n
+
+
+def run_case(name, result_path, out_dir):
+    """Blender 안: 케이스 1개를 telemetry.run 으로 돌리고 phase 이벤트를 요약해 result_path 에 쓴다."""
+    import bpy
+    from blockout_kit.batch import Runner, resolve_script
+    script, params, variant = CASES[name]
+    path = resolve_script(script)
+    mod = Runner().module(path)
+    events = os.path.join(out_dir, "telemetry.jsonl")
+    ext = ".mp4" if script == V3 else "_" if script == CAMFOLLOW else ".png"   # camera-follow 은 프레임 접두어
+    params = dict(params, BLOCKOUT_TELEMETRY=events, BLOCKOUT_OUT=os.path.join(out_dir, name + "_{view}" + ext))
+    added = 0
+
+    def build(p):
+        nonlocal added
+        scene = mod.build_scene(p)
+        if variant and variant[0] == "multiply":
+            added = multiply(scene, variant[1])
+        elif variant and variant[0] == "rubble":
+            added = scatter_rubble(scene, variant[1], mod.r2, mod.GRAY_STRUCT)
+        return scene
+
+    for p in getattr(mod, "split_params", lambda q: [q])(params):   # camera-follow: 케이스마다 run 1회
+        telemetry.run(path, p, build, mod.configure_render, mod.render)
+    with open(events, encoding="utf-8") as fh:
+        recs = [json.loads(line) for line in fh]
+    phases = {}
+    for r in recs:
+        if r["event"] == "phase":
+            phases[r["phase"]] = round(phases.get(r["phase"], 0.0) + r["seconds"], 4)
+    scenes = [r for r in recs if r["event"] == "scene"]
+    scene = scenes[0]
+    end = [r for r in recs if r["event"] == "run_end"][-1]
+    frames = [r for r in recs if r["event"] == "frame"]
+    syncs = [r["sync_s"] for r in frames if r.get("sync_s") is not None]
+    shared = next((r for r in recs if r["event"] == "instancing"), None)
+    render = next((r for r in recs if r["event"] == "render"), {})
+    mesh_mb = shared["mesh_mb"] if shared else instancing.report(bpy.context.scene)["mesh_mb"]
+    out = {"case": name, "blender": bpy.app.version_string, "added": added,
+           "build_s": phases.get("build"), "configure_s": phases.get("configure"), "render_s": phases.get("render"),
+           "depsgraph_s": round(sum(r["depsgraph_s"] for r in scenes), 4), "runs": len(scenes),
+           "sync_s": round(sum(syncs), 4) if syncs else None,
+           "frames": len(frames), "objects": scene["objects"], "meshes": scene["meshes"],
+           "triangles": scene["triangles"], "peak_rss_mb": end["peak_rss_mb"], "mesh_mb": mesh_mb,
+           "profile": render.get("profile")}
+    with open(result_path, "w", encoding="utf-8") as fh:
+        json.dump(out, fh)
+
+
+# ── 드라이버 (Blender 밖) ──
+def measure(blender, name, tmp, log):
+    """케이스 1회 = Blender 프로세스 1개. 실패면 None (로그는 log 에)."""
+    case_dir = tempfile.mkdtemp(prefix=name + "_", dir=tmp)
+    result = os.path.join(case_dir, "result.json")
+    cmd = [blender, "--background", "--factory-startup", "--python", os.path.abspath(__file__),
+           "--", "--run-case", name, "--result", result, "--out-dir", case_dir]
+    t0 = time.time()
+    with open(log, "a", encoding="utf-8") as fh:
+        code = subprocess.call(cmd, stdout=fh, stderr=subprocess.STDOUT)
+    if code != 0 or not os.path.exists(result):
+        return None
+    with open(result, encoding="utf-8") as fh:
+        rec = json.load(fh)
+    rec["wall_s"] = round(time.time() - t0, 2)   # Blender 기동 포함
+    return rec
+
+
+def summarize(runs):
+    """반복 측정 → 지표별 중앙값 (나머지 필드는 첫 회 값)."""
+    rec = dict(runs[0])
+    for k in METRICS + ("configure_s", "wall_s"):
+        vals = [r[k] for r in runs if r.get(k) is not None]
+        rec[k] = round(statistics.median(vals), 4) if vals else None
+    rec["repeat"] = len(runs)
+    return rec
+
+
+def load_history(path):
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8") as fh:
+        return [json.loads(line) for line in fh if line.strip()]
+
+
+def regressions(rec, history, window, threshold):
+    """같은 호스트·케이스 직전 window 회 중앙값 대비 threshold 넘게 나빠진 지표 목록."""
+    prev = [h for h in history if h["case"] == rec["case"] and h["host"] == rec["host"]][-window:]
+    out = []
+    for k in METRICS:
+        vals = [h[k] for h in prev if h.get(k) is not None]
+        if not vals or rec.get(k) is None:
+            continue
+        base = statistics.median(vals)
+        if rec[k] > base * (1 + threshold) and rec[k] - base > FLOOR[k]:
+            out.append({"metric": k, "baseline": round(base, 4), "value": rec[k],
+                        "ratio": round(rec[k] / base, 3) if base else None, "runs": len(vals)})
+    return out
+
+
+def git_rev():
+    try:
+        return subprocess.run(["git", "-C", REPO, "rev-parse", "--short", "HEAD"],
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="블록아웃 렌더 성능 벤치 (+ 합성 스케일링 씬) · 회귀 표시")
+    ap.add_argument("cases", nargs="*", help=f"케이스 (기본 전부): {', '.join(CASES)}")
+    ap.add_argument("--repeat", type=int, default=1, help="케이스당 반복 — 지표는 중앙값")
+    ap.add_argument("--threshold", type=float, default=0.15, help="회귀 판정 비율 (0.15 = 기준보다 15%% 느림)")
+    ap.add_argument("--window", type=int, default=5, help="기준 = 같은 호스트 직전 N회 중앙값")
+    ap.add_argument("--history", default=DEFAULT_HISTORY)
+    ap.add_argument("--no-record", action="store_true", help="이력에 남기지 않는다 (비교만)")
+    ap.add_argument("--list", action="store_true")
+    ap.add_argument("--run-case", help=argparse.SUPPRESS)   # 내부용 — Blender 안에서 케이스 1개
+    ap.add_argument("--result", help=argparse.SUPPRESS)
+    ap.add_argument("--out-dir", help=argparse.SUPPRESS)
+    args = ap.parse_args(argv)
+
+    if args.run_case:
+        run_case(args.run_case, args.result, args.out_dir)
+        return 0
+    if args.list:
+        for name, (script, params, variant) in CASES.items():
+            print(f"{name:16s} {os.path.basename(script):32s} {variant or ''}")
+        return 0
+    unknown = [c for c in args.cases if c not in CASES]
+    if unknown:
+        ap.error(f"모르는 케이스: {unknown}")
+
+    blender = os.environ.get("BLENDER", "blender")
+    history = load_history(args.history)
+    tmp = tempfile.mkdtemp(prefix="blockout_bench_")
+    log = os.path.join(tmp, "bench.log")
+    stamp = {"ts": round(time.time(), 3), "host": socket.gethostname(), "git": git_rev()}
+    failed, flagged = [], []
+    print(f"[bench] {len(args.cases or CASES)} 케이스 × {args.repeat}, 로그 {log}")
+    for name in args.cases or CASES:
+        runs = [r for r in (measure(blender, name, tmp, log) for _ in range(args.repeat)) if r]
+        if not runs:
+            failed.append(name)
+            print(f"[bench] {name:16s} 실패 — 로그: {log}", file=sys.stderr)
+            continue
+        rec = dict(stamp, **summarize(runs))
+        rec["regressions"] = regressions(rec, history, args.window, args.threshold)
+        if not args.no_record:
+            os.makedirs(os.path.dirname(os.path.abspath(args.history)), exist_ok=True)
+            with open(args.history, "a", encoding="utf-8") as fh:
+                fh.write(json.dumps(rec, ensure_ascii=False) + "\n")
+        history.append(rec)
+        mark = "  ⚠ " + ", ".join(f"{r['metric']} ×{r['ratio']}" for r in rec["regressions"]) if rec["regressions"] else ""
+        print(f"[bench] {name:16s} build {rec['build_s']:8.3f}s  render {rec['render_s']:8.3f}s  "
+              f"sync {rec.get('sync_s')}s  rss {rec['peak_rss_mb']}MB  mesh {rec.get('mesh_mb')}MB  "
+              f"tris {rec['triangles']:,}{mark}")
+        if rec["regressions"]:
+            flagged.append(name)
+    print(f"[bench] DONE → {args.history if not args.no_record else '(기록 안 함)'}"
+          f"  실패 {failed or '없음'} · 회귀 {flagged or '없음'} (임계 {args.threshold:.0%})")
+    return 1 if failed else 2 if flagged else 0
+
+
+if __name__ == "__main__":
+    # Blender 안(--run-case)에서는 "--" 뒤 인자만 스크립트 몫이다
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else sys.argv[1:]
+    sys.exit(main(argv))
@@ -0,0 +1,357 @@
+"""카메라 움직임 자동 판독 — 생성 영상 클립의 전역 모션을 위상 상관으로 재서 static / pan / tilt / tracking /
+dolly 로 분류하고, 블록아웃이 구운 카메라 경로·기대 카메라와 맞춰 본다.
+
+camera-follow-disambiguation 은 expectedCamera(static/move)·expectedTypes(pan/tracking/dolly_in)와 영상 모델이
+실제로 만든 카메라를 사람이 재생해 보고 판정했다. 여기서는:
+  ① 디코드 — ffmpeg 로 축소(--width, 기본 192)·회색·--fps(기본 12) rawvideo 파이프. 클립(MP4 등)이든
+     프레임 폴더(*.png)든 같다.
+  ② 전역 모션 — 연속 프레임 쌍마다 화면을 --grid(기본 4x4) 타일로 나눠 타일별 위상 상관(Hann 창 → rfft2 →
+     정규화 교차 스펙트럼 → 역변환 피크, 포물선 부화소). 전 쌍·전 타일을 한 번에 FFT 한다.
+     타일 이동에 유사 변환 (tx, ty, 배율 s, 회전 r) 을 가중 최소제곱으로 맞추고(가중치 = 피크 높이),
+     잔차가 큰 타일(움직이는 피사체)을 빼고 한 번 더 맞춘다.
+  ③ 누적 — pan = −Σtx/W (화면 내용이 왼쪽으로 흐르면 카메라는 오른쪽), tilt = Σty/H, zoom = Σs (로그 배율 근사),
+     parallax = 움직이는 쌍에서 타일 가로 이동의 사분위 폭 / |중앙값| 의 중앙값 — 회전(pan)은 화면 전체가 같이 흐르고
+     평행 이동(tracking)은 깊이마다 다르게 흐른다.
+  ④ 분류 — |zoom| ≥ --min-zoom 이고 가로·세로 이동보다 크면 dolly_in/dolly_out, 아니면 이동 ≥ --min-pan 이면
+     pan/tilt (parallax ≥ --parallax 면 tracking) + 방향, 둘 다 아니면 static. 2D 만으로 pan 과 tracking,
+     zoom 과 dolly 는 완전히 갈리지 않는다 — 비교는 축(가로·세로·깊이)과 방향으로 한다.
+  ⑤ 구운 경로 — 매니페스트에 블록아웃 script 가 있으면 sceneir IR(Blender 1회, 캐시)에서 카메라 행렬을 프레임마다
+     읽어 직전 카메라 좌표계로 회전(yaw·pitch °)·이동(좌우·상하·전후 m)을 누적하고 같은 어휘로 분류한다.
+
+실행 (Blender 밖, NumPy + ffmpeg):
+  python research/tools/blockout_kit/cammotion.py clips/*.mp4 [--jobs 8] [--out cammotion.json]
+  python research/tools/blockout_kit/cammotion.py --manifest research/experiments/camera-follow-disambiguation/cammotion.json
+매니페스트: {"script": 블록아웃(선택), "params": {...}, "clips": [{"id", "clip", "previz"(선택), "expect": {"camera",
+  "types"}, "params": {...}}]} — 경로는 매니페스트 기준. 결과 JSON 은 클립마다 분류·지표·누적 곡선과
+  기대(expect)·구운 경로(baked)·프리비즈 렌더(previz) 대비 일치 여부. 기대와 어긋난 클립이 있으면 종료 코드 1.
+Blender 경로는 BLENDER 환경변수(기본 "blender").
+"""
+import argparse
+import concurrent.futures
+import glob
+import json
+import math
+import os
+import shutil
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from blockout_kit import raster, sceneir  # noqa: E402
+
+AXIS = {"pan": "lateral", "tracking": "lateral", "tilt": "vertical", "dolly_in": "depth", "dolly_out": "depth",
+        "static": None}
+
+
+# ── 디코드 ──
+def _source(path):
+    """(ffmpeg 입력 인자, 크기를 물을 파일) — 폴더면 *.png 글롭."""
+    if os.path.isdir(path):
+        files = sorted(glob.glob(os.path.join(path, "*.png")))
+        if not files:
+            raise ValueError(f"PNG 프레임 없음: {path}")
+        return ["-framerate", "24", "-pattern_type", "glob", "-i", os.path.join(path, "*.png")], files[0]
+    return ["-i", path], path
+
+
+def probe(path):
+    out = subprocess.run(["ffprobe", "-v", "error", "-select_streams", "v:0", "-show_entries", "stream=width,height",
+                          "-of", "csv=p=0", path], capture_output=True, text=True, check=True).stdout
+    w, h = (int(v) for v in out.strip().split(",")[:2])
+    return w, h
+
+
+def decode(path, width=192, fps=12, grid=(4, 4)):
+    """클립·프레임 폴더 → 회색 float32 (N, H, W). H·W 는 타일 격자로 나눠 떨어지게 맞춘다."""
+    args, first = _source(path)
+    w0, h0 = probe(first)
+    cols, rows = grid
+    w = max(cols * 8, width // (2 * cols) * 2 * cols)
+    h = max(rows * 8, round(w * h0 / w0 / (2 * rows)) * 2 * rows)
+    raw = subprocess.run(["ffmpeg", "-v", "error", *args, "-vf", f"fps={fps},scale={w}:{h}:flags=area,format=gray",
+                          "-f", "rawvideo", "-"], capture_output=True, check=True).stdout
+    return np.frombuffer(raw, dtype=np.uint8).reshape(-1, h, w).astype(np.float32)
+
+
+# ── 전역 모션 (NumPy) ──
+def tiles(frames, cols, rows):
+    n, h, w = frames.shape
+    th, tw = h // rows, w // cols
+    t = frames[:, :rows * th, :cols * tw].reshape(n, rows, th, cols, tw).transpose(0, 1, 3, 2, 4)
+    return t.reshape(n, rows * cols, th, tw)
+
+
+def phase_shifts(frames, cols=4, rows=4):
+    """연속 쌍 × 타일 위상 상관 → (이동 (P, K, 2) — 화면 내용이 a→b 로 간 픽셀 (x 오른쪽, y 아래), 피크 (P, K))."""
+    t = tiles(frames, cols, rows)
+    th, tw = t.shape[-2:]
+    t = t - t.mean(axis=(-2, -1), keepdims=True)
+    t *= np.outer(np.hanning(th), np.hanning(tw)).astype(np.float32)
+    spec = np.fft.rfft2(t)
+    cross = spec[1:] * np.conj(spec[:-1])
+    cross /= np.abs(cross) + 1e-9
+    corr = np.fft.irfft2(cross, s=(th, tw))
+    p, k = corr.shape[:2]
+    flat = corr.reshape(p, k, -1)
+    idx = flat.argmax(axis=-1)
+    py, px = np.divmod(idx, tw)
+    peak = np.take_along_axis(flat, idx[..., None], -1)[..., 0]
+
+    def at(dy, dx):
+        return np.take_along_axis(flat, (((py + dy) % th) * tw + (px + dx) % tw)[..., None], -1)[..., 0]
+
+    def refine(lo, hi):   # 포물선 꼭짓점
+        den = lo - 2 * peak + hi
+        return np.where(np.abs(den) > 1e-9, 0.5 * (lo - hi) / np.where(den == 0, 1, den), 0.0)
+
+    sx = px + refine(at(0, -1), at(0, 1))
+    sy = py + refine(at(-1, 0), at(1, 0))
+    sx = np.where(sx > tw / 2, sx - tw, sx)
+    sy = np.where(sy > th / 2, sy - th, sy)
+    return np.stack([sx, sy], axis=-1), peak
+
+
+def tile_centers(w, h, cols, rows):
+    """타일 중심 (K, 2) — 화면 중심 기준 픽셀."""
+    xs = (np.arange(cols) + 0.5) * (w / cols) - w / 2
+    ys = (np.arange(rows) + 0.5) * (h / rows) - h / 2
+    gx, gy = np.meshgrid(xs, ys)
+    return np.stack([gx.ravel(), gy.ravel()], axis=-1)
+
+
+def fit_similarity(shifts, weights, centers):
+    """쌍마다 (tx, ty, s, r) 가중 최소제곱 — dx = tx + s·x − r·y, dy = ty + s·y + r·x. 반환 (P, 4), 잔차 (P, K)."""
+    k = len(centers)
+    x, y = centers[:, 0], centers[:, 1]
+    m = np.zeros((2 * k, 4))
+    m[:k, 0], m[:k, 2], m[:k, 3] = 1, x, -y
+    m[k:, 1], m[k:, 2], m[k:, 3] = 1, y, x
+    d = np.concatenate([shifts[..., 0], shifts[..., 1]], axis=1)
+    w = np.concatenate([weights, weights], axis=1)
+    ata = np.einsum("kj,pk,kl->pjl", m, w, m) + np.eye(4) * 1e-6
+    atb = np.einsum("kj,pk,pk->pj", m, w, d)
+    theta = np.linalg.solve(ata, atb[..., None])[..., 0]
+    res = d - theta @ m.T
+    return theta, np.hypot(res[:, :k], res[:, k:])
+
+
+def motion(frames, grid=(4, 4), min_peak=0.05):
+    """클립 전역 모션 → 지표 dict + 누적 곡선."""
+    n, h, w = frames.shape
+    if n < 2:
+        raise ValueError("프레임이 2장 미만")
+    cols, rows = grid
+    shifts, peak = phase_shifts(frames, cols, rows)
+    weights = np.where(peak >= min_peak, peak, 0.0)
+    centers = tile_centers(w, h, cols, rows)
+    theta, res = fit_similarity(shifts, weights, centers)
+    cut = np.maximum(1.0, 2.5 * np.median(res, axis=1, keepdims=True))   # 움직이는 피사체 타일 빼고 다시
+    theta, res = fit_similarity(shifts, np.where(res <= cut, weights, 0.0), centers)
+    tx, ty, s = theta[:, 0], theta[:, 1], theta[:, 2]
+    moving = np.hypot(tx, ty) >= 0.25
+    if moving.any():
+        dx = shifts[moving][..., 0]
+        q1, q3 = np.percentile(dx, [25, 75], axis=1)
+        parallax = float(np.median((q3 - q1) / (np.abs(np.median(dx, axis=1)) + 0.25)))
+    else:
+        parallax = 0.0
+    curve = np.stack([np.cumsum(-tx / w), np.cumsum(ty / h), np.cumsum(s)], axis=-1)
+    return {"pan": float(curve[-1, 0]), "tilt": float(curve[-1, 1]), "zoom": float(curve[-1, 2]),
+            "parallax": round(parallax, 3), "confidence": round(float(peak.mean()), 3),
+            "samples": int(n), "size": [int(w), int(h)],
+            "curve": [[round(float(v), 4) for v in row] for row in curve]}
+
+
+def classify(pan, tilt, zoom, parallax=0.0, min_pan=0.05, min_zoom=0.05, min_parallax=0.5):
+    """누적 지표 → (family, direction). pan·tilt 는 화면 폭·높이 비, zoom 은 로그 배율."""
+    lateral = max(abs(pan), abs(tilt))
+    if abs(zoom) >= min_zoom and abs(zoom) >= lateral:
+        return ("dolly_in", "forward") if zoom > 0 else ("dolly_out", "backward")
+    if lateral >= min_pan:
+        if abs(pan) >= abs(tilt):
+            return ("tracking" if parallax >= min_parallax else "pan"), ("right" if pan > 0 else "left")
+        return ("tracking" if parallax >= min_parallax else "tilt"), ("up" if tilt > 0 else "down")
+    if abs(zoom) >= min_zoom:
+        return ("dolly_in", "forward") if zoom > 0 else ("dolly_out", "backward")
+    return "static", None
+
+
+def label(family, direction):
+    return f"{family}_{direction}" if family in ("pan", "tilt") else family
+
+
+# ── 구운 카메라 경로 (sceneir IR) ──
+def baked_path(ir):
+    """IR 카메라 → 누적 yaw·pitch(°, 오른쪽·위 +), 좌우·상하·전후 이동(m, 직전 카메라 좌표계)."""
+    first, last = ir["render"]["frames"]
+    w, h = ir["render"]["res"]
+    mats = [np.linalg.inv(raster.camera(ir, f, w, h)[0]) for f in range(first, last + 1)]
+    yaw = pitch = 0.0
+    move = np.zeros(3)
+    for a, b in zip(mats, mats[1:]):
+        rot = a[:3, :3].T
+        view = rot @ -b[:3, 2]
+        yaw += math.degrees(math.atan2(view[0], -view[2]))
+        pitch += math.degrees(math.atan2(view[1], -view[2]))
+        move += rot @ (b[:3, 3] - a[:3, 3])
+    return {"yaw": round(yaw, 3), "pitch": round(pitch, 3), "right": round(float(move[0]), 4),
+            "up": round(float(move[1]), 4), "forward": round(float(-move[2]), 4)}
+
+
+def classify_baked(p, min_deg=2.0, min_move=0.2):
+    """구운 경로 → (family, direction) — 이동이 있으면 dolly/tracking, 회전만이면 pan/tilt."""
+    axis = max(("forward", "right", "up"), key=lambda k: abs(p[k]))
+    if abs(p[axis]) >= min_move:
+        if axis == "forward":
+            return ("dolly_in", "forward") if p[axis] > 0 else ("dolly_out", "backward")
+        if axis == "right":
+            return "tracking", "right" if p[axis] > 0 else "left"
+        return "tracking", "up" if p[axis] > 0 else "down"
+    if max(abs(p["yaw"]), abs(p["pitch"])) >= min_deg:
+        if abs(p["yaw"]) >= abs(p["pitch"]):
+            return "pan", "right" if p["yaw"] > 0 else "left"
+        return "tilt", "up" if p["pitch"] > 0 else "down"
+    return "static", None
+
+
+def agree(a, b):
+    """같은 카메라로 보나 — static 끼리, 또는 같은 축·같은 방향 (pan↔tracking, 2D 로는 못 가른다). 방향 None 은 아무 쪽."""
+    if a[0] == "static" or b[0] == "static":
+        return a[0] == b[0]
+    axis = AXIS.get(a[0])
+    return axis is not None and axis == AXIS.get(b[0]) and (None in (a[1], b[1]) or a[1] == b[1])
+
+
+def parse_type(t):
+    """스펙 어휘 → (family, direction): 'pan_right' → ('pan', 'right'), 'tracking' → ('tracking', None)."""
+    if t in ("dolly_in", "dolly_out"):
+        return t, "forward" if t == "dolly_in" else "backward"
+    if t in AXIS:
+        return t, None
+    fam, _, direction = t.rpartition("_")
+    return (fam, direction) if fam in AXIS else (t, None)
+
+
+def matches_expect(got, expect):
+    """expect: {"camera": static|move, "types": [static|pan|tracking|dolly_in|pan_right …]} — types 중 하나와 agree."""
+    camera = "static" if got[0] == "static" else "move"
+    if expect.get("camera") and camera != expect["camera"]:
+        return False
+    types = expect.get("types")
+    return not types or any(agree(got, parse_type(t)) for t in types)
+
+
+# ── 배치 ──
+def analyze(path, opts):
+    t0 = time.perf_counter()
+    m = motion(decode(path, opts.width, opts.fps, opts.grid_size), opts.grid_size)
+    fam, direction = classify(m["pan"], m["tilt"], m["zoom"], m["parallax"], opts.min_pan, opts.min_zoom,
+                              opts.parallax)
+    return dict(family=fam, direction=direction, type=label(fam, direction),
+                pan=round(m["pan"], 4), tilt=round(m["tilt"], 4), zoom=round(m["zoom"], 4),
+                **{k: m[k] for k in ("parallax", "confidence", "samples", "size", "curve")},
+                seconds=round(time.perf_counter() - t0, 3))
+
+
+def load_manifest(path):
+    with open(path, encoding="utf-8") as fh:
+        doc = json.load(fh)
+    base = os.path.dirname(os.path.abspath(path))
+
+    def rel(p):
+        return p if p is None or os.path.isabs(p) else os.path.join(base, p)
+    doc["script"] = rel(doc.get("script"))
+    for c in doc["clips"]:
+        c["clip"], c["previz"] = rel(c["clip"]), rel(c.get("previz"))
+    return doc
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="생성 클립 카메라 움직임 분류 + 블록아웃 의도 대조")
+    ap.add_argument("clips", nargs="*", help="클립 또는 PNG 프레임 폴더")
+    ap.add_argument("--manifest", help="클립·기대·블록아웃 script 매니페스트 JSON")
+    ap.add_argument("--width", type=int, default=192, help="분석 폭(px)")
+    ap.add_argument("--fps", type=float, default=12, help="분석 프레임 레이트")
+    ap.add_argument("--grid", default="4x4", help="타일 격자 COLSxROWS")
+    ap.add_argument("--min-pan", type=float, default=0.05, help="누적 이동 임계 (화면 폭 비)")
+    ap.add_argument("--min-zoom", type=float, default=0.05, help="누적 배율 임계 (로그)")
+    ap.add_argument("--parallax", type=float, default=0.5, help="이 이상이면 pan 대신 tracking")
+    ap.add_argument("--jobs", type=int, default=os.cpu_count() or 4, help="동시 클립 수")
+    ap.add_argument("--no-baked", action="store_true", help="매니페스트 script 가 있어도 구운 경로 대조 안 함")
+    ap.add_argument("--out", help="결과 JSON (기본: 매니페스트 옆 cammotion.result.json, 아니면 출력만)")
+    args = ap.parse_args(argv)
+    args.grid_size = tuple(int(v) for v in args.grid.lower().split("x"))
+    for tool in ("ffmpeg", "ffprobe"):
+        if not shutil.which(tool):
+            raise SystemExit(f"[cammotion] {tool} 없음")
+
+    doc = load_manifest(args.manifest) if args.manifest else {"clips": [{"id": os.path.basename(c), "clip": c}
+                                                                         for c in args.clips]}
+    if not doc["clips"]:
+        raise SystemExit("[cammotion] 클립이 없다 (인자나 --manifest)")
+    t0 = time.perf_counter()
+    work = [(i, key, c[key]) for i, c in enumerate(doc["clips"]) for key in ("clip", "previz") if c.get(key)]
+    results = [{"id": c.get("id") or os.path.basename(c["clip"])} for c in doc["clips"]]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=args.jobs) as ex:   # ffmpeg·FFT 는 GIL 밖
+        futures = {ex.submit(analyze, path, args): (i, key, path) for i, key, path in work}
+        for fut in concurrent.futures.as_completed(futures):
+            i, key, path = futures[fut]
+            try:
+                results[i][key] = fut.result()
+            except (subprocess.CalledProcessError, ValueError) as exc:
+                results[i][key] = {"error": f"{type(exc).__name__}: {exc}", "path": path}
+
+    baked = {}
+    if doc.get("script") and not args.no_baked:
+        blender = os.environ.get("BLENDER", "blender")
+        for i, c in enumerate(doc["clips"]):
+            params = dict(doc.get("params") or {}, **(c.get("params") or {}))
+            ir, = sceneir.load([doc["script"]], params, blender)
+            baked[i] = baked_path(ir)
+
+    misses = 0
+    for i, (c, r) in enumerate(zip(doc["clips"], results)):
+        got = r.get("clip", {})
+        if "family" not in got:
+            misses += 1
+            continue
+        g = (got["family"], got["direction"])
+        if c.get("expect"):
+            r["expect"] = c["expect"]
+            r["matches_expect"] = matches_expect(g, c["expect"])
+            misses += not r["matches_expect"]
+        if i in baked:
+            b = classify_baked(baked[i])
+            r["baked"] = dict(baked[i], family=b[0], direction=b[1], type=label(*b))
+            r["matches_baked"] = agree(g, b)
+        if "family" in r.get("previz", {}):
+            r["matches_previz"] = agree(g, (r["previz"]["family"], r["previz"]["direction"]))
+    elapsed = time.perf_counter() - t0
+    n = len(work)
+    summary = {"clips": len(results), "analyzed": n, "seconds": round(elapsed, 2),
+               "clips_per_min": round(n / elapsed * 60, 1) if elapsed else None,
+               "settings": {"width": args.width, "fps": args.fps, "grid": args.grid, "min_pan": args.min_pan,
+                            "min_zoom": args.min_zoom, "parallax": args.parallax},
+               "results": results}
+    for r in results:
+        got = r.get("clip", {})
+        marks = " ".join(f"{k[8:]}={'O' if r[k] else 'X'}" for k in ("matches_expect", "matches_baked",
+                                                                        "matches_previz") if k in r)
+        print(f"[cammotion] {r['id']:<24} {got.get('type', got.get('error', '?')):<14} "
+              f"pan {got.get('pan', 0):+.3f} tilt {got.get('tilt', 0):+.3f} zoom {got.get('zoom', 0):+.3f} "
+              f"parallax {got.get('parallax', 0):.2f}  {marks}")
+    print(f"[cammotion] {n} 클립 · {elapsed:.1f}s ({summary['clips_per_min']} 클립/분) · 기대 불일치·실패 {misses}")
+    out = args.out or (os.path.join(os.path.dirname(os.path.abspath(args.manifest)), "cammotion.result.json")
+                       if args.manifest else None)
+    if out:
+        with open(out, "w", encoding="utf-8") as fh:
+            json.dump(summary, fh, ensure_ascii=False, indent=1)
+        print(f"[cammotion] → {out}")
+    return 1 if misses else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
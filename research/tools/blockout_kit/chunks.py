@@ -0,0 +1,179 @@
+"""월드 청크 스트리밍 — 긴 트래킹 샷을 프레임 구간별로, 그 구간 카메라 시야에 드는 부품만 세워 렌더한다.
+
+v2/v3 복도는 38.5 m 질주에 벽·필라스터·기둥 57 m 를 통째로 미리 세운다. 추격이 길어지면 기하가 길이에
+비례해 늘고 매 프레임 전부가 메모리에 있다. 스트리밍은 스크립트의 부품 생성기(x 구간 → 박스 부품)를
+구간마다 질의해 보이는 것만 만들고, 안 보이게 된 것은 지운다 — 살아 있는 부품 수가 샷 길이가 아니라
+시야 크기에 묶인다.
+
+  구간      BLOCKOUT_CHUNKS=N 프레임씩 (scene.frame_start~frame_end — BLOCKOUT_FRAME_* 그대로)
+  시야      구간의 프레임마다 카메라 절두체(view_frame × clip_start/clip_end, 월드 좌표 8점 → 평면 6개).
+            부품 AABB(+ margin)가 어느 프레임에서든 절두체 평면 6개 중 하나의 완전히 바깥이 아니면 세운다 —
+            보수적 판정이라 보이는 부품은 빠지지 않는다. 그래서 시야 안 출력은 통째 빌드와 같다
+            (Workbench 플랫·그림자 없음 전제 — 시야 밖 부품이 그림자·반사로 화면에 들어오는 엔진이면 margin 을 키운다).
+  부품      location.Part(name, center, size, mat, rot_z, role) — 생성기가 x 구간에 걸치는 부품을 돌려주고
+            make(part) 가 오브젝트를 만든다. 같은 이름은 구간이 바뀌어도 살아 있는 한 다시 만들지 않는다.
+  출력      MP4 스크립트는 구간마다 PNG 프레임(<출력 stem>.frames/) → 끝에 VSE 로 MP4 1개 (sequence.encode).
+            이미지 포맷(BLOCKOUT_FORMAT)이면 그 프레임을 그대로. <출력 stem>.chunks.json 에 구간별 부품·생성·삭제 수.
+
+  BLOCKOUT_CHUNKS         구간 프레임 수 (기본 끔 — 스크립트가 부품을 통째로 세운다)
+  BLOCKOUT_CHUNK_MARGIN   AABB 여유 m (기본 0.05)
+
+스크립트 쪽 (blockout_v2.py / blockout_v3.py):
+  def render(scene, params=None):
+      if chunks.frames(params):
+          return chunks.render(scene, params, corridor_parts, make_part)
+"""
+import json
+import math
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from blockout_kit.overrides import param  # noqa: E402
+
+
+def frames(params):
+    """구간 프레임 수 (끄면 0)."""
+    v = param(params, "BLOCKOUT_CHUNKS").lower()
+    if v in ("", "0", "off"):
+        return 0
+    if not v.isdigit():
+        raise ValueError(f"BLOCKOUT_CHUNKS 는 구간 프레임 수 (받은 값 {v})")
+    return int(v)
+
+
+# ── 기하 (표준 라이브러리만) ──
+def _sub(a, b):
+    return (a[0] - b[0], a[1] - b[1], a[2] - b[2])
+
+
+def _dot(a, b):
+    return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
+
+
+def _cross(a, b):
+    return (a[1] * b[2] - a[2] * b[1], a[2] * b[0] - a[0] * b[2], a[0] * b[1] - a[1] * b[0])
+
+
+def frustum_planes(near, far):
+    """절두체 8점(near 4 · far 4, 같은 순서로 둘레) → 안쪽 법선 평면 6개 [(점, 법선)]."""
+    pts = near + far
+    center = tuple(sum(p[i] for p in pts) / 8 for i in range(3))
+    quads = [near, far] + [(near[i], near[(i + 1) % 4], far[(i + 1) % 4], far[i]) for i in range(4)]
+    planes = []
+    for q in quads:
+        n = _cross(_sub(q[1], q[0]), _sub(q[2], q[0]))
+        if _dot(n, _sub(center, q[0])) < 0:
+            n = (-n[0], -n[1], -n[2])
+        planes.append((q[0], n))
+    return planes
+
+
+def aabb(part, margin=0.0):
+    """Z 회전 박스 → (중심, 반크기)."""
+    c, s = abs(math.cos(part.rot_z)), abs(math.sin(part.rot_z))
+    hx, hy, hz = (v / 2 for v in part.size)
+    return part.center, (c * hx + s * hy + margin, s * hx + c * hy + margin, hz + margin)
+
+
+def outside(planes, box):
+    """AABB 가 어느 평면 하나의 완전히 바깥인가 (True 면 안 보인다)."""
+    center, half = box
+    for p, n in planes:
+        if _dot(n, _sub(center, p)) + abs(n[0]) * half[0] + abs(n[1]) * half[1] + abs(n[2]) * half[2] < 0:
+            return True
+    return False
+
+
+# ── Blender 안 ──
+def camera_frustum(scene):
+    """지금 프레임의 활성 카메라 절두체 → (평면 6개, x 범위)."""
+    cam = scene.camera
+    m = cam.matrix_world
+    corners = cam.data.view_frame(scene=scene)
+
+    def world(v, d):
+        k = d / -v.z
+        return tuple(m @ (v * k))
+
+    near = [world(v, cam.data.clip_start) for v in corners]
+    far = [world(v, cam.data.clip_end) for v in corners]
+    xs = [p[0] for p in near + far]
+    return frustum_planes(near, far), (min(xs), max(xs))
+
+
+def visible(scene, parts_fn, a, b, margin):
+    """프레임 a~b 에서 한 번이라도 절두체에 걸치는 부품 {이름: Part}."""
+    frusta = []
+    for f in range(a, b + 1):
+        scene.frame_set(f)
+        frusta.append(camera_frustum(scene))
+    x0 = min(x[0] for _, x in frusta)
+    x1 = max(x[1] for _, x in frusta)
+    out = {}
+    for part in parts_fn(x0, x1):
+        box = aabb(part, margin)
+        if any(not outside(planes, box) for planes, _ in frusta):
+            out[part.name] = part
+    return out
+
+
+def _remove(ob):
+    import bpy
+    me = ob.data
+    bpy.data.objects.remove(ob)
+    if me is not None and me.users == 0:
+        bpy.data.meshes.remove(me)
+
+
+def render(scene, params, parts_fn, make):
+    """구간마다 보이는 부품만 세우고 렌더. 반환: [출력 경로] (MP4 면 끝에 인코딩한 MP4)."""
+    import bpy
+    from blockout_kit import progressive, sequence
+    n = frames(params)
+    if progressive.enabled(params):
+        raise ValueError("BLOCKOUT_CHUNKS 는 BLOCKOUT_PROGRESSIVE 와 같이 못 쓴다 (구간마다 연속 프레임)")
+    margin = float(param(params, "BLOCKOUT_CHUNK_MARGIN", "0.05"))
+    if scene.frame_step != 1:
+        raise ValueError("BLOCKOUT_CHUNKS 는 BLOCKOUT_FRAME_STEP 과 같이 못 쓴다 (구간마다 연속 프레임)")
+    first, last = scene.frame_start, scene.frame_end
+    final = scene.render.filepath
+    movie = scene.render.is_movie_format
+    if movie:   # 구간마다 PNG → 끝에 MP4 하나
+        if hasattr(scene.render.image_settings, "media_type"):
+            scene.render.image_settings.media_type = "IMAGE"
+        scene.render.image_settings.file_format = "PNG"
+        scene.render.filepath = os.path.join(os.path.splitext(final)[0] + ".frames", "f_")
+    live, ranges = {}, []
+    try:
+        for a in range(first, last + 1, n):
+            b = min(last, a + n - 1)
+            t0 = time.perf_counter()
+            want = visible(scene, parts_fn, a, b, margin)
+            gone = [name for name in live if name not in want]
+            for name in gone:
+                _remove(live.pop(name))
+            new = [name for name in want if name not in live]
+            for name in new:
+                live[name] = make(want[name])
+            stream_s = time.perf_counter() - t0
+            scene.frame_start, scene.frame_end = a, b
+            bpy.ops.render.render(animation=True)
+            ranges.append({"frames": [a, b], "parts": len(live), "created": len(new), "removed": len(gone),
+                           "stream_s": round(stream_s, 4)})
+            print(f"[chunks] {a}-{b} 부품 {len(live)} (+{len(new)} −{len(gone)}) {stream_s:.3f}s")
+    finally:
+        scene.frame_start, scene.frame_end = first, last
+        for ob in live.values():
+            _remove(ob)
+    if movie:
+        sequence.encode(scene, [(final, first, last)])
+        scene.render.filepath = final
+        sequence.video_settings(scene)
+    report = {"chunk_frames": n, "margin": margin, "frames": [first, last], "ranges": ranges,
+              "max_parts": max(r["parts"] for r in ranges), "created": sum(r["created"] for r in ranges)}
+    with open(os.path.splitext(final)[0] + ".chunks.json", "w", encoding="utf-8") as fh:
+        json.dump(report, fh, ensure_ascii=False, indent=2)
+    print(f"[chunks] 구간 {len(ranges)}개, 동시 부품 최대 {report['max_parts']} · 생성 합 {report['created']}")
+    return [final]
@@ -0,0 +1,178 @@
+"""완료 이벤트 스트림 — 렌더 파일 하나가 디스크에 다 써지는 즉시 한 줄 (경로·sha256·바이트·타이밍).
+
+법정 스크립트는 5뷰를 다 그린 뒤에야 목록을 찍고, 애니는 MP4 를 닫은 뒤 DONE 을 찍는다. 업로드·점수 단계가
+가장 느린 뷰를 기다리지 않고 렌더 뒤에 파이프라인으로 붙을 수 있게, telemetry.run 이 파일마다 곧바로 알린다:
+  · 스틸·프레임 이미지 — render_write 핸들러(파일 저장 직후). 법정 뷰 1장, 프레임 샤드의 프레임 1장마다.
+  · MP4 — 컨테이너가 닫히는 render() 반환 직후 (프레임 중간에는 재생 가능한 파일이 아니다).
+  · 노이즈 프리패스(씬 blockout_prepass)의 임시 PNG 는 알리지 않는다 — 쓰자마자 지워진다.
+
+  BLOCKOUT_EVENTS  "경로.jsonl"          줄 append + flush + fsync — tail -f / follow() 로 읽는다
+                   "unix:/tmp/x.sock"     유닉스 소켓에 줄 단위 (listen 이 받는다)
+                   "tcp:127.0.0.1:8766"   TCP 에 줄 단위
+                   (기본: 끔. 소켓에 못 붙거나 쓰기가 실패하면 경고하고 그 실행은 끈다 — 렌더는 안 죽인다)
+
+줄 = {"event": "complete", ts, run_id, script, view, frame(스틸·MP4 는 null 가능), path(절대), bytes, sha256,
+      render_s(그 프레임 렌더 초 — MP4 는 render 단계 전체), write_s, since_start_s}
+
+소비 (Blender 밖):
+  python research/tools/blockout_kit/completions.py follow ~/.cache/blockout/events.jsonl [--from-start]
+  python research/tools/blockout_kit/completions.py listen unix:/tmp/blockout.sock [--append events.jsonl]
+  파이썬에서는 for ev in follow(path): ...  (제너레이터 — 새 줄을 기다린다)
+"""
+import argparse
+import hashlib
+import json
+import os
+import socket
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from blockout_kit.overrides import param  # noqa: E402
+
+
+def sha256(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class Stream:
+    """BLOCKOUT_EVENTS 싱크 하나. write() 는 실패해도 예외를 내지 않는다."""
+
+    def __init__(self, spec):
+        self.spec = spec
+        self._sock = None
+        if spec.startswith(("unix:", "tcp:")):
+            try:
+                if spec.startswith("unix:"):
+                    self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                    self._sock.connect(spec[5:])
+                else:
+                    host, port = spec[4:].rsplit(":", 1)
+                    self._sock = socket.create_connection((host, int(port)), timeout=5)
+            except OSError as exc:
+                print(f"[completions] 소켓 연결 실패 {spec}: {exc}", file=sys.stderr)
+                self.spec = None
+
+    def write(self, rec):
+        if not self.spec:
+            return
+        line = json.dumps(rec, ensure_ascii=False, default=str) + "\n"
+        try:
+            if self._sock is not None:
+                self._sock.sendall(line.encode())
+            else:
+                os.makedirs(os.path.dirname(os.path.abspath(self.spec)), exist_ok=True)
+                with open(self.spec, "a", encoding="utf-8") as fh:
+                    fh.write(line)
+                    fh.flush()
+                    os.fsync(fh.fileno())   # 소비자가 줄을 보면 그 줄이 가리키는 파일은 이미 디스크에 있다
+        except OSError as exc:
+            print(f"[completions] 쓰기 실패 {self.spec}: {exc}", file=sys.stderr)
+            self.close()
+            self.spec = None
+
+    def close(self):
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+            self._sock = None
+
+
+def open_stream(params):
+    spec = param(params, "BLOCKOUT_EVENTS")
+    return None if spec.lower() in ("", "0", "off") else Stream(spec)
+
+
+def complete_record(path, **fields):
+    """완료 이벤트 dict — 경로는 절대, 바이트·sha256 은 지금 디스크 내용."""
+    path = os.path.abspath(path)
+    return {"ts": round(time.time(), 3), "event": "complete", **fields, "path": path,
+            "bytes": os.path.getsize(path), "sha256": sha256(path)}
+
+
+# ── 소비 (Blender 밖) ──
+def follow(path, from_start=False, poll=0.2, stop=None):
+    """JSONL 스트림을 tail -f 처럼 — 완료 이벤트 dict 를 하나씩. stop() 이 참이면 끝낸다."""
+    while not os.path.exists(path):
+        if stop and stop():
+            return
+        time.sleep(poll)
+    with open(path, encoding="utf-8") as fh:
+        if not from_start:
+            fh.seek(0, os.SEEK_END)
+        buf = ""
+        while True:
+            chunk = fh.readline()
+            if chunk:
+                buf += chunk
+                if buf.endswith("\n"):   # 쓰는 중인 반쪽 줄은 다음 readline 에 이어 붙인다
+                    line, buf = buf.strip(), ""
+                    if line:
+                        yield json.loads(line)
+                continue
+            if stop and stop():
+                return
+            time.sleep(poll)
+
+
+def listen(spec, on_event):
+    """소켓 싱크의 받는 쪽 — 연결마다 줄 단위로 on_event(dict). Ctrl-C 로 끝낸다."""
+    import socketserver
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            for raw in self.rfile:
+                if raw.strip():
+                    on_event(json.loads(raw))
+
+    if spec.startswith("unix:"):
+        if os.path.exists(spec[5:]):
+            os.remove(spec[5:])
+        server = socketserver.ThreadingUnixStreamServer(spec[5:], Handler)
+    else:
+        host, port = spec[4:].rsplit(":", 1)
+        server = socketserver.ThreadingTCPServer((host, int(port)), Handler)
+    with server:
+        server.serve_forever()
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="블록아웃 완료 이벤트 스트림 소비")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    p = sub.add_parser("follow", help="JSONL 스트림을 따라가며 한 줄씩 출력")
+    p.add_argument("path")
+    p.add_argument("--from-start", action="store_true", help="처음부터 (기본: 지금부터)")
+    p = sub.add_parser("listen", help="unix:/tcp: 소켓으로 받아 출력")
+    p.add_argument("spec")
+    p.add_argument("--append", help="받은 줄을 이 JSONL 에도 쓴다")
+    args = ap.parse_args(argv)
+
+    def show(ev):
+        print(f"[complete] {ev.get('view') or '-':24s} f{ev.get('frame') or '-'} "
+              f"{ev['bytes']:>10d}B {ev['sha256'][:12]} {ev['path']}", flush=True)
+
+    try:
+        if args.cmd == "follow":
+            for ev in follow(args.path, args.from_start):
+                show(ev)
+        else:
+            sink = Stream(args.append) if args.append else None
+
+            def on_event(ev):
+                show(ev)
+                if sink:
+                    sink.write(ev)
+            listen(args.spec, on_event)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+"""평가된 프리미티브 메시 캐시 — 모디파이어를 얹은 프리미티브를 (모양, 치수, 파라미터) 키로 한 번만 평가해 재사용.
+
+camera-follow 의 cube() 는 거의 모든 박스에 3단 BEVEL 모디파이어를 붙인다. 케이스 6개가 clear_scene() 뒤에
+같은 박스를 다시 만들고 depsgraph 가 베벨을 매번 다시 평가한다. 캐시는 평가 결과 메시(모디파이어 적용)를
+가짜 사용자(fake user)로 붙잡아 두고, 같은 키의 박스는 그 메시를 가리키는 오브젝트만 새로 만든다 —
+빌드에서 오퍼레이터·모디파이어가 빠지고, 평가할 모디파이어가 없어 depsgraph 도 가벼워진다. 같은 치수의 박스끼리는
+메시도 공유한다(벽 라인 5개 등).
+
+  BLOCKOUT_EVAL_CACHE  "1"    세션 캐시 — 같은 Blender 프로세스(배치·워커·main 의 케이스 루프) 안에서 재사용
+                       "disk" + BLOCKOUT_EVAL_DIR(기본 ~/.cache/blockout/evalgeo)/<키>.blend 에 메시를 써 두고
+                              다음 프로세스는 파일에서 읽는다
+                       (기본: 끔 — 예전처럼 오브젝트마다 모디파이어)
+  키 = sha1(모양 + 치수(µm 반올림) + 파라미터 + Blender 버전). 재질은 키에 없다 — 메시에는 빈 슬롯 1개만 두고
+  재질은 오브젝트 슬롯(link="OBJECT")에 건다. 평가된 기하·월드 행렬이 같아 telemetry scene_hash 도 같다.
+
+사용 (빌더 안):
+  me = evalcache.mesh("cube_bevel", (sx, sy, sz), {"width": 0.08, "segments": 3}, make, params)
+  make() 는 모디파이어를 얹은 오브젝트를 만들어 돌려준다(캐시 미스 때만 불린다 — 평가 뒤 지운다).
+보고: telemetry.run 이 build 뒤 "evalcache" 이벤트 — hits / misses / disk_hits / eval_s(미스 평가 초) / meshes.
+"""
+import hashlib
+import json
+import os
+import time
+
+from blockout_kit.overrides import param
+
+DEFAULT_DIR = os.path.join(os.path.expanduser("~"), ".cache", "blockout", "evalgeo")
+_meshes = {}
+_stats = {"hits": 0, "misses": 0, "disk_hits": 0, "eval_s": 0.0}
+
+
+def mode(params):
+    m = param(params, "BLOCKOUT_EVAL_CACHE").lower()
+    if m in ("", "0", "off"):
+        return None
+    if m not in ("1", "on", "disk"):
+        raise ValueError(f"BLOCKOUT_EVAL_CACHE 는 1/disk (받은 값 {m})")
+    return "disk" if m == "disk" else "session"
+
+
+def key(shape, dims, options):
+    import bpy
+    doc = [shape, [round(v, 6) for v in dims], options, bpy.app.version_string]
+    return hashlib.sha1(json.dumps(doc, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def _alive(me):
+    try:
+        return me.name is not None
+    except ReferenceError:   # 씬 리셋(read_factory_settings)으로 datablock 이 사라졌다
+        return False
+
+
+def _load(path, name):
+    import bpy
+    with bpy.data.libraries.load(path, link=False) as (src, dst):
+        dst.meshes = [n for n in src.meshes if n == name]
+    return dst.meshes[0] if dst.meshes else None
+
+
+def _evaluate(make, name):
+    """make() 가 만든 오브젝트의 평가 결과를 새 메시로 — 원본 오브젝트·메시는 지운다."""
+    import bpy
+    ob = make()
+    dg = bpy.context.evaluated_depsgraph_get()
+    me = bpy.data.meshes.new_from_object(ob.evaluated_get(dg), preserve_all_data_layers=True, depsgraph=dg)
+    me.name = name
+    me.materials.clear()
+    me.materials.append(None)   # 재질은 오브젝트 슬롯에
+    src = ob.data
+    bpy.data.objects.remove(ob)
+    if src.users == 0:
+        bpy.data.meshes.remove(src)
+    return me
+
+
+def mesh(shape, dims, options, make, params=None):
+    """키에 해당하는 평가된 메시 (없으면 make() 로 만들어 평가). 캐시가 꺼져 있으면 None."""
+    m = mode(params)
+    if m is None:
+        return None
+    import bpy
+    k = key(shape, dims, options)
+    me = _meshes.get(k)
+    if me is not None and _alive(me):
+        _stats["hits"] += 1
+        return me
+    name = f"evalgeo_{shape}_{k}"
+    path = os.path.join(param(params, "BLOCKOUT_EVAL_DIR", DEFAULT_DIR), k + ".blend")
+    me = bpy.data.meshes.get(name)
+    if me is not None:
+        _stats["hits"] += 1
+    elif m == "disk" and os.path.exists(path):
+        me = _load(path, name)
+        _stats["disk_hits"] += me is not None
+    if me is None:
+        t0 = time.perf_counter()
+        me = _evaluate(make, name)
+        _stats["eval_s"] += time.perf_counter() - t0
+        _stats["misses"] += 1
+        if m == "disk":
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            bpy.data.libraries.write(path, {me}, fake_user=True)
+    me.use_fake_user = True   # clear_scene() 의 users == 0 정리에서 살아남게
+    _meshes[k] = me
+    return me
+
+
+def place(name, me, location, material):
+    """캐시 메시를 가리키는 오브젝트 — 재질은 오브젝트 슬롯에."""
+    import bpy
+    ob = bpy.data.objects.new(name, me)
+    ob.location = location
+    bpy.context.collection.objects.link(ob)
+    ob.material_slots[0].link = "OBJECT"
+    ob.material_slots[0].material = material
+    return ob
+
+
+def take_stats():
+    """지난 take_stats() 이후 통계 (아무 일도 없었으면 None) — telemetry 가 build 뒤 부른다."""
+    if not (_stats["hits"] or _stats["misses"] or _stats["disk_hits"]):
+        return None
+    out = dict(_stats, eval_s=round(_stats["eval_s"], 4), meshes=len(_meshes))
+    _stats.update(hits=0, misses=0, disk_hits=0, eval_s=0.0)
+    return out
@@ -0,0 +1,184 @@
+"""골든 이미지 회귀 — 블록아웃 전부를 저해상도·저샘플·CPU 로 렌더해 커밋된 썸네일과 비교한다.
+
+Blender 1세션에서 batch.Runner 로 돈다(모듈·씬 재사용 — 법정 5뷰는 방을 한 번, v2/v3 세 프레임도 씬 한 번).
+비교는 휘도 SSIM(8×8 블록) — 전체 평균이 min_ssim 아래거나 **가장 나쁜 블록**이 min_block 아래면 실패.
+평균만 보면 놓치는 국소 결함(셰도 애크니 줄무늬, 벽에 묻힌 카메라의 검은 모서리)을 최악 블록이 잡는다.
+실패한 케이스는 out-dir 에 [골든 | 새 렌더 | 차이×4] 를 나란히 붙인 <케이스>.diff.png 를 쓴다.
+
+  법정      courtroom_<뷰> ×5                 Cycles 8 spp · CPU · 디노이즈 (노이즈 여유로 허용치 낮춤)
+  플레이트  plate                             Workbench
+  v2 / v3   v2_f0001 · v2_f0084 · v2_f0168 …  Workbench — 첫·중간·마지막 프레임
+  카메라    camfollow_<케이스>_f0001 ×6        EEVEE 8 샘플 — 시작 프레임
+
+실행 (Blender 안):
+  blender --background --factory-startup --python research/tools/blockout_kit/golden.py -- [패턴…] [--update] [--allow-missing]
+    패턴은 케이스 이름 glob (courtroom_* 등). --update 는 렌더 결과로 골든을 새로 쓴다(의도한 변경 뒤에만).
+    --allow-missing 은 골든이 없는 케이스를 실패가 아니라 건너뜀으로 센다(골든을 처음 만들기 전 시험 실행용).
+골든은 research/tools/blockout_kit/golden/<케이스>.png (320×180 RGB) — 기준 렌더 머신에서 --update 로 만들어 커밋한다.
+골든이 없는 케이스(no-golden)는 기본으로 실패다 — 아무것도 비교하지 않고 통과하는 일이 없게.
+종료 코드: 전부 통과 0, 실패·누락·골든 없음 1, --allow-missing 에서 실패는 없지만 골든 없는 케이스가 있으면 3.
+"""
+import argparse
+import fnmatch
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from blockout_kit.batch import Runner  # noqa: E402
+from blockout_kit.images import read_bmp, read_png, write_png  # noqa: E402
+
+GOLDEN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "golden")
+RES = "320x180"
+SAMPLES = 8
+EXP = "research/experiments"
+COMMON = {"BLOCKOUT_RES": RES, "BLOCKOUT_FORMAT": "BMP", "BLOCKOUT_SAMPLES": SAMPLES, "BLOCKOUT_DEVICE": "CPU",
+          "BLOCKOUT_TELEMETRY": "off", "BLOCKOUT_RENDER_DB": "off",   # 썸네일 렌더로 이력을 흐리지 않는다
+          "BLOCKOUT_PROFILE": "off"}   # 머신별 CPU 프로필(autotune.py)이 골든을 호스트마다 다르게 만들지 않게
+# 허용치 (평균 SSIM, 최악 블록 SSIM) — Cycles 는 저샘플 노이즈·디노이저 차가 있어 느슨하게
+TOL = {"courtroom": (0.93, 0.55), "default": (0.985, 0.80)}
+BLOCK = 8
+
+
+def jobs(tmp):
+    """(스크립트, params) 목록. 출력 파일 이름(확장자 뺀 것)이 곧 케이스 이름이다."""
+    out = [(f"{EXP}/bg-viewsheet-from-3d/courtroom_blockout.py",
+            {"BLOCKOUT_OUT": os.path.join(tmp, "courtroom_{view}.bmp")}),
+           (f"{EXP}/previz-bg-plate-ab/blockout_plate_sh_04_19.py", {"BLOCKOUT_OUT": os.path.join(tmp, "plate.bmp")})]
+    for tag, script in (("v2", f"{EXP}/previz-video-reference-ab/qual2-fullmotion/blockout_v2.py"),
+                        ("v3", f"{EXP}/previz-video-reference-ab/qual5-parallax/blockout_v3.py")):
+        for f in (1, 84, 168):   # 168프레임(7s) 의 첫·중간·끝
+            out.append((script, {"BLOCKOUT_OUT": os.path.join(tmp, f"{tag}_f"),
+                                 "BLOCKOUT_FRAME_START": f, "BLOCKOUT_FRAME_END": f}))
+    out.append((f"{EXP}/camera-follow-disambiguation/blockout.py",
+                {"BLOCKOUT_OUT": os.path.join(tmp, "camfollow_{view}_f"),
+                 "BLOCKOUT_FRAME_START": 1, "BLOCKOUT_FRAME_END": 1}))
+    return [{"script": s, "params": dict(COMMON, **p)} for s, p in out]
+
+
+def wanted(job, patterns):
+    """패턴이 이 잡의 케이스를 건드릴 수 있나 — 출력 이름 앞부분과 패턴의 와일드카드 앞부분으로만 본다."""
+    if not patterns:
+        return True
+    stem = os.path.basename(job["params"]["BLOCKOUT_OUT"]).split("{")[0]
+    lits = [re.split(r"[*?\[]", p)[0] for p in patterns]
+    return any(lit.startswith(stem) or stem.startswith(lit) for lit in lits)
+
+
+# ── 비교 (표준 라이브러리) ──
+def luma(rows):
+    return [[(54 * r[i] + 183 * r[i + 1] + 19 * r[i + 2]) >> 8 for i in range(0, len(r), 3)] for r in rows]
+
+
+def ssim_blocks(a, b, w, h):
+    """8×8 블록별 SSIM 목록 (휘도, 8비트 상수)."""
+    c1, c2 = (0.01 * 255) ** 2, (0.03 * 255) ** 2
+    out = []
+    for by in range(0, h - BLOCK + 1, BLOCK):
+        for bx in range(0, w - BLOCK + 1, BLOCK):
+            xs = [a[y][x] for y in range(by, by + BLOCK) for x in range(bx, bx + BLOCK)]
+            ys = [b[y][x] for y in range(by, by + BLOCK) for x in range(bx, bx + BLOCK)]
+            n = len(xs)
+            mx, my = sum(xs) / n, sum(ys) / n
+            vx = sum((v - mx) ** 2 for v in xs) / n
+            vy = sum((v - my) ** 2 for v in ys) / n
+            cov = sum((u - mx) * (v - my) for u, v in zip(xs, ys)) / n
+            out.append(((2 * mx * my + c1) * (2 * cov + c2)) / ((mx * mx + my * my + c1) * (vx + vy + c2)))
+    return out
+
+
+def compare(golden_rows, rows, w, h):
+    blocks = ssim_blocks(luma(golden_rows), luma(rows), w, h)
+    return sum(blocks) / len(blocks), min(blocks)
+
+
+def diff_image(path, golden_rows, rows, w):
+    """[골든 | 새 렌더 | |차|×4] 가로로 붙인 PNG."""
+    out = []
+    for g, r in zip(golden_rows, rows):
+        d = bytes(min(255, abs(x - y) * 4) for x, y in zip(g, r))
+        out.append(g + r + d)
+    write_png(path, w * 3, len(out), out)
+
+
+def tolerance(case):
+    return TOL.get(case.split("_")[0], TOL["default"])
+
+
+def main(argv):
+    ap = argparse.ArgumentParser(description="블록아웃 골든 이미지 회귀 (저해상도·저샘플·CPU)")
+    ap.add_argument("patterns", nargs="*", help="케이스 이름 glob (기본 전부)")
+    ap.add_argument("--update", action="store_true", help="렌더 결과로 골든을 새로 쓴다")
+    ap.add_argument("--allow-missing", action="store_true",
+                    help="골든 없는 케이스를 실패가 아니라 건너뜀으로 (종료 코드 3)")
+    ap.add_argument("--out-dir", help="렌더·diff 이미지 폴더 (기본 임시 폴더)")
+    args = ap.parse_args(argv)
+
+    tmp = args.out_dir or tempfile.mkdtemp(prefix="blockout_golden_")
+    os.makedirs(tmp, exist_ok=True)
+    runner = Runner()
+    t0 = time.perf_counter()
+    for job in jobs(tmp):
+        if not wanted(job, args.patterns):
+            continue
+        try:
+            runner.run(job)
+        except Exception as exc:  # noqa: BLE001 — 그 잡의 케이스는 아래에서 missing/no-golden 으로 드러난다
+            print(f"[golden] 렌더 실패 {job['script']}: {type(exc).__name__}: {exc}", file=sys.stderr)
+    render_s = time.perf_counter() - t0
+
+    rendered = {os.path.splitext(f)[0]: os.path.join(tmp, f) for f in os.listdir(tmp) if f.endswith(".bmp")}
+    golden = {os.path.splitext(f)[0]: os.path.join(GOLDEN_DIR, f)
+              for f in (os.listdir(GOLDEN_DIR) if os.path.isdir(GOLDEN_DIR) else []) if f.endswith(".png")}
+    cases = sorted(c for c in set(rendered) | set(golden)
+                   if not args.patterns or any(fnmatch.fnmatchcase(c, p) for p in args.patterns))
+    results = []
+    for case in cases:
+        rec = {"case": case}
+        if case not in rendered:
+            rec["state"] = "missing"   # 골든은 있는데 렌더가 안 나왔다 — 뷰·케이스가 사라졌거나 렌더 실패
+        elif args.update:
+            w, h, rows = read_bmp(rendered[case])
+            os.makedirs(GOLDEN_DIR, exist_ok=True)
+            write_png(os.path.join(GOLDEN_DIR, case + ".png"), w, h, rows)
+            rec["state"] = "updated"
+        elif case not in golden:
+            rec["state"] = "no-golden"
+        else:
+            w, h, rows = read_bmp(rendered[case])
+            gw, gh, grows = read_png(golden[case])
+            if (gw, gh) != (w, h):
+                rec.update(state="fail", reason=f"크기 {gw}x{gh} ≠ {w}x{h}")
+            else:
+                mean, worst = compare(grows, rows, w, h)
+                min_mean, min_block = tolerance(case)
+                ok = mean >= min_mean and worst >= min_block
+                rec.update(state="ok" if ok else "fail", ssim=round(mean, 4), worst_block=round(worst, 4),
+                           tol=[min_mean, min_block])
+                if not ok:
+                    rec["diff"] = os.path.join(tmp, case + ".diff.png")
+                    diff_image(rec["diff"], grows, rows, w)
+        results.append(rec)
+        detail = f"ssim {rec['ssim']:.4f} / 최악 블록 {rec['worst_block']:.4f}" if "ssim" in rec else rec.get("reason", "")
+        print(f"[golden] {rec['state']:9s} {case:34s} {detail}{'  → ' + rec['diff'] if 'diff' in rec else ''}")
+
+    no_golden = [r for r in results if r["state"] == "no-golden"]
+    skipped = no_golden if args.allow_missing else []
+    bad = [r for r in results if r["state"] in ("fail", "missing")] + ([] if args.allow_missing else no_golden)
+    with open(os.path.join(tmp, "golden.json"), "w", encoding="utf-8") as fh:
+        json.dump({"render_seconds": round(render_s, 2), "results": results}, fh, ensure_ascii=False, indent=2)
+    print(f"[golden] DONE {len(results) - len(bad) - len(skipped)}/{len(results) - len(skipped)} 통과"
+          + (f" · 골든 없음 {len(no_golden)} ({'건너뜀' if args.allow_missing else '실패'} — --update 로 만든다)"
+             if no_golden else "")
+          + f" · 렌더 {render_s:.1f}s → {tmp}")
+    if bad or not results:
+        return 1
+    return 3 if skipped else 0
+
+
+if __name__ == "__main__":
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else sys.argv[1:]
+    sys.exit(main(argv))
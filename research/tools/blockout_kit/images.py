@@ -0,0 +1,97 @@
+"""8비트 RGB 이미지 입출력 — 표준 라이브러리만 (Blender·Pillow 없이 타일을 잇고 쓰려고).
+
+행(row)은 전부 **위→아래** 순서의 bytes (픽셀당 RGB 3바이트)로 주고받는다.
+"""
+import struct
+import zlib
+
+
+def read_bmp(path):
+    """Blender 가 쓴 무압축 BMP(24/32비트) → (w, h, rows). 32비트는 알파를 버린다."""
+    with open(path, "rb") as fh:
+        data = fh.read()
+    if data[:2] != b"BM":
+        raise ValueError(f"BMP 아님: {path}")
+    offset = struct.unpack_from("<I", data, 10)[0]
+    w, h = struct.unpack_from("<ii", data, 18)
+    bpp, comp = struct.unpack_from("<HI", data, 28)
+    if bpp not in (24, 32) or comp not in (0, 3):
+        raise ValueError(f"지원 안 하는 BMP ({bpp}bit, compression={comp}): {path}")
+    top_down = h < 0
+    h = abs(h)
+    step = bpp // 8
+    stride = (w * step + 3) & ~3
+    rows = []
+    for y in range(h):
+        src = y if top_down else h - 1 - y
+        raw = data[offset + src * stride: offset + src * stride + w * step]
+        row = bytearray(w * 3)
+        row[0::3] = raw[2::step]
+        row[1::3] = raw[1::step]
+        row[2::3] = raw[0::step]
+        rows.append(bytes(row))
+    return w, h, rows
+
+
+def read_png(path):
+    """8비트 RGB/RGBA PNG(비인터레이스) → (w, h, rows). write_png 가 쓴 것과 일반 인코더 출력 둘 다."""
+    with open(path, "rb") as fh:
+        data = fh.read()
+    if data[:8] != b"\x89PNG\r\n\x1a\n":
+        raise ValueError(f"PNG 아님: {path}")
+    pos, idat = 8, []
+    while pos < len(data):
+        n, tag = struct.unpack_from(">I4s", data, pos)
+        body = data[pos + 8:pos + 8 + n]
+        if tag == b"IHDR":
+            w, h, depth, ctype, _, _, interlace = struct.unpack(">IIBBBBB", body)
+        elif tag == b"IDAT":
+            idat.append(body)
+        elif tag == b"IEND":
+            break
+        pos += 12 + n
+    if depth != 8 or ctype not in (2, 6) or interlace:
+        raise ValueError(f"지원 안 하는 PNG (depth={depth}, color={ctype}, interlace={interlace}): {path}")
+    step = 3 if ctype == 2 else 4
+    stride = w * step
+    raw = zlib.decompress(b"".join(idat))
+    rows, prev = [], bytearray(stride)
+    for y in range(h):
+        ft = raw[y * (stride + 1)]
+        cur = bytearray(raw[y * (stride + 1) + 1:(y + 1) * (stride + 1)])
+        for i in range(stride):
+            a = cur[i - step] if i >= step else 0
+            b = prev[i]
+            c = prev[i - step] if i >= step else 0
+            if ft == 1:
+                cur[i] = (cur[i] + a) & 0xFF
+            elif ft == 2:
+                cur[i] = (cur[i] + b) & 0xFF
+            elif ft == 3:
+                cur[i] = (cur[i] + ((a + b) >> 1)) & 0xFF
+            elif ft == 4:
+                pa, pb, pc = abs(b - c), abs(a - c), abs(a + b - 2 * c)
+                cur[i] = (cur[i] + (a if pa <= pb and pa <= pc else b if pb <= pc else c)) & 0xFF
+        prev = cur
+        if step == 4:
+            rgb = bytearray(w * 3)
+            rgb[0::3], rgb[1::3], rgb[2::3] = cur[0::4], cur[1::4], cur[2::4]
+            rows.append(bytes(rgb))
+        else:
+            rows.append(bytes(cur))
+    return w, h, rows
+
+
+def _chunk(tag, payload):
+    return (struct.pack(">I", len(payload)) + tag + payload
+            + struct.pack(">I", zlib.crc32(tag + payload) & 0xFFFFFFFF))
+
+
+def write_png(path, w, h, rows, level=6):
+    """RGB 8비트 PNG. 필터는 전부 None — 바이트 그대로라 무손실이 자명하다."""
+    raw = b"".join(b"\x00" + r for r in rows)
+    with open(path, "wb") as fh:
+        fh.write(b"\x89PNG\r\n\x1a\n")
+        fh.write(_chunk(b"IHDR", struct.pack(">IIBBBBB", w, h, 8, 2, 0, 0, 0)))
+        fh.write(_chunk(b"IDAT", zlib.compress(raw, level)))
+        fh.write(_chunk(b"IEND", b""))
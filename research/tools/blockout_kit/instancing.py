@@ -0,0 +1,126 @@
+"""반복 조립품 인스턴싱 — 같은 기하를 메시 1벌로 가리키게 해 메모리와 씬 동기화(Cycles sync·BVH)를 줄인다.
+
+빌더는 박스마다 primitive_cube_add 로 단위 큐브 메시를 새로 만든다. 법정 벤치 10개(상판·에이프런·다리 2)·
+의자·모니터·슬롯·증인석 기둥, v3 전경 기둥이 전부 자기 메시를 갖고, 렌더러는 같은 큐브를 수백 번 올린다.
+잔해·경기장 좌석·기둥 숲처럼 반복이 많은 세트는 CPU 노드 RAM 을 넘긴다.
+
+  BLOCKOUT_INSTANCE  "mesh"        build 뒤 같은 기하·재질 메시를 하나로 (scenecache.share_meshes). 스크립트 수정 없음.
+                                   Cycles 는 메시를 공유하는 오브젝트를 인스턴스로 올린다(메시·BVH 1벌 + 변환 N개)
+                     "collection"  + Assembly 로 정의한 조립품을 컬렉션 1개 + 컬렉션 인스턴스(엠프티 N개)로 놓는다
+                     (기본 끔 — Assembly 는 예전처럼 부품 오브젝트를 같은 이름으로 펼쳐 놓는다)
+  세 모드의 렌더 결과는 같다 — 같은 기하를 가리킬 뿐. 단 "collection" 은 부품이 씬 오브젝트가 아니라서
+  sceneir IR·raster 프리뷰에는 엠프티만 남는다(그 도구들엔 "mesh" 를 쓴다).
+
+조립품 (빌더 안) — 원점 기준으로 부품을 만들어 돌려주는 함수. 이름의 "{i}" 는 놓을 때 접미사로 바뀐다:
+  def bench_parts():
+      return [box("bench_seat_{i}", ...), box("bench_apron_{i}", ...), ...]
+  bench = instancing.Assembly("bench", bench_parts, params)
+  bench.place("0_-1", (x, y, 0.0))            # 끔/mesh: bench_seat_0_-1 …  /  collection: 엠프티 bench_0_-1
+
+보고: telemetry.run 이 build 뒤 apply() 하고 "instancing" 이벤트를 남긴다 — 인스턴스·고유 메시 수, 메시 MB
+(공유 전/후, 전부 따로일 때). sync 절감은 frame 이벤트 sync_s 로 A/B 한다 (bench.py courtroom_x100 vs _inst).
+"""
+import math
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from blockout_kit import scenecache  # noqa: E402
+from blockout_kit.overrides import param  # noqa: E402
+
+MODES = ("mesh", "collection")
+
+
+def mode(params):
+    m = param(params, "BLOCKOUT_INSTANCE").lower()
+    if m in ("", "0", "off"):
+        return None
+    if m not in MODES:
+        raise ValueError(f"BLOCKOUT_INSTANCE 는 {'/'.join(MODES)} (받은 값 {m})")
+    return m
+
+
+class Assembly:
+    """반복 조립품 1종. make() 는 원점 기준 부품 오브젝트 목록을 만들어 돌려준다."""
+
+    def __init__(self, name, make, params=None):
+        self.name = name
+        self.make = make
+        self.mode = mode(params)
+        self.collection = None
+        self.placed = 0
+
+    def place(self, suffix, location, rot_z=0.0):
+        """조립품 1개를 location(+ Z 회전) 에. 반환: 만든 오브젝트 목록(collection 모드는 엠프티 1개)."""
+        import bpy
+        self.placed += 1
+        if self.mode == "collection":
+            if self.collection is None:
+                self.collection = bpy.data.collections.new(f"asm_{self.name}")
+                for ob in self.make():
+                    for coll in list(ob.users_collection):
+                        coll.objects.unlink(ob)
+                    self.collection.objects.link(ob)
+                    ob.name = ob.name.replace("{i}", "asm")
+            inst = bpy.data.objects.new(f"{self.name}_{suffix}", None)
+            inst.instance_type = "COLLECTION"
+            inst.instance_collection = self.collection
+            inst.location = location
+            inst.rotation_euler = (0.0, 0.0, rot_z)
+            bpy.context.scene.collection.objects.link(inst)
+            return [inst]
+        c, s = math.cos(rot_z), math.sin(rot_z)
+        made = self.make()
+        for ob in made:
+            x, y, z = ob.location
+            if rot_z:
+                x, y = x * c - y * s, x * s + y * c
+                ob.rotation_euler.z += rot_z
+            ob.location = (location[0] + x, location[1] + y, location[2] + z)
+            ob.name = ob.name.replace("{i}", suffix)
+        return made
+
+
+def _instanced(scene):
+    """렌더되는 (오브젝트, 메시) — 씬 오브젝트 + 컬렉션 인스턴스가 가리키는 부품(인스턴스 수만큼)."""
+    for ob in scene.objects:
+        if ob.type == "MESH":
+            yield ob, ob.data
+        elif ob.instance_type == "COLLECTION" and ob.instance_collection:
+            for part in ob.instance_collection.all_objects:
+                if part.type == "MESH":
+                    yield part, part.data
+
+
+def mesh_bytes(me):
+    """메시 데이터 근사 바이트 — 위치·법선(정점당 24) + 모서리 8 + 코너(정점·모서리 인덱스) 8 + 면 오프셋 4."""
+    return 24 * len(me.vertices) + 8 * len(me.edges) + 8 * len(me.loops) + 4 * len(me.polygons)
+
+
+def report(scene):
+    pairs = list(_instanced(scene))
+    uniq = {me.name: me for _, me in pairs}
+    return {"objects": len(scene.objects), "instances": len(pairs), "meshes": len(uniq),
+            "mesh_mb": round(sum(mesh_bytes(me) for me in uniq.values()) / 2 ** 20, 3),
+            "mesh_mb_unshared": round(sum(mesh_bytes(me) for _, me in pairs) / 2 ** 20, 3)}
+
+
+def apply(scene, params):
+    """BLOCKOUT_INSTANCE 가 켜져 있으면 메시 공유 → 보고 dict (꺼져 있으면 None)."""
+    m = mode(params)
+    if m is None:
+        return None
+    before = report(scene)
+    t0 = time.perf_counter()
+    objs = [ob for ob, _ in _instanced(scene)]
+    groups = scenecache.share_meshes(scene, {ob.name: ob for ob in objs}.values())
+    after = report(scene)
+    assemblies = sorted(c.name for c in {ob.instance_collection for ob in scene.objects
+                                         if ob.instance_type == "COLLECTION" and ob.instance_collection})
+    return {"mode": m, "share_s": round(time.perf_counter() - t0, 4), "objects": after["objects"],
+            "instances": after["instances"], "meshes_before": before["meshes"], "meshes": after["meshes"],
+            "mesh_mb_before": before["mesh_mb"], "mesh_mb": after["mesh_mb"],
+            "mesh_mb_unshared": after["mesh_mb_unshared"],
+            "saved_mb": round(after["mesh_mb_unshared"] - after["mesh_mb"], 3),
+            "shared_groups": len(groups), "assemblies": assemblies}
@@ -0,0 +1,111 @@
+"""잡 격리 회귀 — 같은 잡을 상주 세션의 앞·뒤에서 렌더해 앞 잡의 상태가 새지 않는지 본다.
+
+워커(worker.py)와 배치(batch.py)는 Blender 1세션에서 잡을 계속 돈다. 스크립트가 건드리는 환경설정·씬 설정
+(sh_04_16·sequence.py 의 새 키프레임 보간 LINEAR, 법정·플레이트의 Standard 뷰 변환)이 다음 잡으로 새면
+카메라팔로우의 Bezier 팬·돌리가 선형이 되고 톤이 바뀐다 — 단독 실행과 다른 그림이 조용히 나온다.
+Runner 는 씬을 새로 짓는 잡마다 공장 설정에서 시작한다. 이 도구는 그걸 워커 실행 경로(run_job)로 확인한다:
+
+  ① 새 Runner 에서 카메라팔로우 6케이스를 한 프레임씩 (before/)
+  ② 같은 Runner 에서 상태를 더럽히는 잡 — 시퀀스 프리비즈 세트(sh_04_16, LINEAR) · 플레이트(Standard)
+  ③ 같은 Runner 에서 ①과 똑같은 잡 (after/)
+  ④ before/after 를 케이스별로 비교 — 픽셀이 같으면 ok, 다르면 휘도 SSIM 과 함께 fail + diff 이미지
+
+프레임은 30 — 120프레임 팬의 1/4 지점. 한가운데(60)는 Bezier 와 선형이 대칭으로 겹쳐 차이가 안 보인다.
+
+실행 (Blender 안):
+  blender --background --factory-startup --python research/tools/blockout_kit/isolation.py -- [--out-dir DIR] [--frame 30]
+결과는 out-dir 의 isolation.json. 종료 코드: 전부 같으면 0, 다르거나 렌더가 빠지면 1.
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from blockout_kit.batch import Runner  # noqa: E402
+from blockout_kit.golden import COMMON, EXP, compare, diff_image  # noqa: E402
+from blockout_kit.images import read_bmp  # noqa: E402
+from blockout_kit.worker import run_job  # noqa: E402
+
+FRAME = 30
+PROBE = f"{EXP}/camera-follow-disambiguation/blockout.py"
+# 프로브 앞에서 돌려 세션 상태를 바꿔 놓는 잡 — (스크립트, 출력 이름)
+DIRTY = ((f"{EXP}/previz-video-reference-ab/blockout_sh_04_16.py", "sh_04_16_f"),   # 새 키 보간 LINEAR
+         (f"{EXP}/previz-bg-plate-ab/blockout_plate_sh_04_19.py", "plate"))          # Standard 뷰 변환
+
+
+def probe_job(out_dir, frame):
+    return {"script": PROBE, "params": dict(COMMON, BLOCKOUT_OUT=os.path.join(out_dir, "{view}_f"),
+                                            BLOCKOUT_FRAME_START=frame, BLOCKOUT_FRAME_END=frame)}
+
+
+def dirty_jobs(out_dir):
+    return [{"script": s, "params": dict(COMMON, BLOCKOUT_OUT=os.path.join(out_dir, name),
+                                         BLOCKOUT_FRAME_START=1, BLOCKOUT_FRAME_END=1)} for s, name in DIRTY]
+
+
+def step(runner, job, jid):
+    rec = {"id": jid, "job": job}
+    run_job(runner, rec)
+    return {k: rec.get(k) for k in ("id", "state", "seconds", "builds", "reused", "error")}
+
+
+def bmps(path):
+    return {os.path.splitext(f)[0]: os.path.join(path, f) for f in os.listdir(path) if f.endswith(".bmp")}
+
+
+def main(argv):
+    ap = argparse.ArgumentParser(description="상주 세션 잡 격리 회귀 (카메라팔로우 앞·뒤 비교)")
+    ap.add_argument("--out-dir", help="렌더·diff 이미지 폴더 (기본 임시 폴더)")
+    ap.add_argument("--frame", type=int, default=FRAME, help=f"비교할 프레임 (기본 {FRAME})")
+    args = ap.parse_args(argv)
+
+    tmp = args.out_dir or tempfile.mkdtemp(prefix="blockout_isolation_")
+    dirs = {d: os.path.join(tmp, d) for d in ("before", "dirty", "after")}
+    for d in dirs.values():
+        os.makedirs(d, exist_ok=True)
+    runner = Runner()
+    t0 = time.perf_counter()
+    steps = [step(runner, probe_job(dirs["before"], args.frame), "before")]
+    steps += [step(runner, job, f"dirty{i}") for i, job in enumerate(dirty_jobs(dirs["dirty"]))]
+    steps.append(step(runner, probe_job(dirs["after"], args.frame), "after"))
+    render_s = time.perf_counter() - t0
+
+    before, after = bmps(dirs["before"]), bmps(dirs["after"])
+    results = []
+    for case in sorted(set(before) | set(after)):
+        rec = {"case": case}
+        if case not in before or case not in after:
+            rec["state"] = "missing"
+        else:
+            w, h, rows = read_bmp(after[case])
+            bw, bh, brows = read_bmp(before[case])
+            if (bw, bh) != (w, h):
+                rec.update(state="fail", reason=f"크기 {bw}x{bh} ≠ {w}x{h}")
+            elif brows == rows:
+                rec["state"] = "ok"
+            else:
+                mean, worst = compare(brows, rows, w, h)
+                rec.update(state="fail", ssim=round(mean, 4), worst_block=round(worst, 4),
+                           diff=os.path.join(tmp, case + ".diff.png"))
+                diff_image(rec["diff"], brows, rows, w)
+        results.append(rec)
+        detail = f"ssim {rec['ssim']:.4f} / 최악 블록 {rec['worst_block']:.4f}" if "ssim" in rec else rec.get("reason", "")
+        print(f"[isolation] {rec['state']:7s} {case:30s} {detail}{'  → ' + rec['diff'] if 'diff' in rec else ''}")
+
+    bad = [r for r in results if r["state"] != "ok"]
+    failed = [s for s in steps if s["state"] != "done"]
+    with open(os.path.join(tmp, "isolation.json"), "w", encoding="utf-8") as fh:
+        json.dump({"frame": args.frame, "render_seconds": round(render_s, 2), "steps": steps, "results": results},
+                  fh, ensure_ascii=False, indent=2)
+    print(f"[isolation] DONE {len(results) - len(bad)}/{len(results)} 같음"
+          + (f" · 실패한 잡 {', '.join(s['id'] for s in failed)}" if failed else "")
+          + f" · 렌더 {render_s:.1f}s → {tmp}")
+    return 1 if bad or not results or failed else 0
+
+
+if __name__ == "__main__":
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else sys.argv[1:]
+    sys.exit(main(argv))
@@ -0,0 +1,273 @@
+"""키프레임 간격 렌더 + 사이 프레임 합성 — Workbench 애니를 k 프레임마다만 Blender 로 그리고 나머지는 워핑.
+
+v1~v3 는 플랫 셰이딩·결정적이라 168프레임 전부 렌더하는 건 대부분 중복이다:
+  ① IR — sceneir.load(geometry=True) (Blender 1회, 캐시). 모션 벡터는 여기서 해석적으로 나온다:
+     Workbench 는 Vector 패스를 주지 않지만(passes.py) 오브젝트·카메라 키프레임은 IR 에 다 있다.
+  ② Blender 1세션(batch.py): 키 프레임 1, 1+k, …, 끝 (BLOCKOUT_FRAME_STEP) + 검사 프레임(구간 가운데 --checks 개).
+  ③ NumPy: 사이 프레임 t 의 픽셀마다 raster.py 로 오브젝트·깊이 → 그 오브젝트 로컬 점 → 앞뒤 키 시점의
+     화면 좌표. 키 렌더를 거기서 쌍선형으로 가져와(backward warp — forward splat 의 구멍이 없다) 시간 가중 평균.
+     키 시점 z-버퍼의 오브젝트·깊이가 안 맞으면(가려짐) 그 키는 빼고, 둘 다 빠진 픽셀은 구멍.
+  ④ 오차 — 모든 사이 프레임: 같은 워핑을 raster 키 이미지에 걸어 raster 진짜 프레임과 PSNR(대리 오차,
+     Blender 비용 0 — 가림·시점 따라 바뀌는 명암을 잡는다). 검사 프레임: 합성 vs 진짜 렌더 PSNR.
+     대리 PSNR 이 --min-psnr 아래거나 구멍이 --max-holes 넘는 프레임, 진짜 PSNR 이 임계 아래인 검사 구간 전체는
+     Blender 로 다시 렌더한다(2차 배치 1회, 연속 프레임은 구간 하나로).
+  ⑤ 프레임 PNG 순서열 (+ ffmpeg 있으면 MP4) + keyframes.json(키·합성·폴백 프레임, PSNR, 초).
+합성도 공짜는 아니다(사이 프레임마다 raster 1회 + 워핑 — 640×360 에서 수백 ms). 고해상도·긴 클립일수록 이득이
+크고, 저해상도 Workbench 는 렌더 자체가 싸다 — keyframes.json 의 render_s / synth_s 로 판단할 것.
+
+실행 (Blender 밖, NumPy):
+  python research/tools/blockout_kit/keyframes.py research/experiments/previz-video-reference-ab/qual5-parallax/blockout_v3.py \\
+    --step 4 --out /tmp/v3_k/f --mp4 /tmp/v3_k.mp4 [--res 640x360] [--param K=V]
+Blender 경로는 BLENDER 환경변수(기본 "blender"). 폴백 렌더가 실패하면 종료 코드 1.
+"""
+import argparse
+import json
+import math
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from blockout_kit import raster, sceneir  # noqa: E402
+from blockout_kit.images import read_bmp, write_png  # noqa: E402
+
+BATCH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "batch.py")
+
+
+# ── Blender ──
+def run_batch(blender, script, jobs, params, work, tag):
+    """[(start, end, step)] 를 Blender 1세션으로 — BMP 를 work/r_####.bmp 에. 반환: 렌더 초."""
+    manifest = os.path.join(work, f"{tag}.json")
+    doc = {"defaults": dict(params, BLOCKOUT_FORMAT="BMP", BLOCKOUT_OUT=os.path.join(work, "r_")),
+           "jobs": [{"script": script, "frame_start": a, "frame_end": b, "params": {"BLOCKOUT_FRAME_STEP": s}}
+                    for a, b, s in jobs]}
+    with open(manifest, "w", encoding="utf-8") as fh:
+        json.dump(doc, fh, indent=1)
+    t0 = time.perf_counter()
+    with open(os.path.join(work, f"{tag}.log"), "w") as log:
+        code = subprocess.call([blender, "--background", "--factory-startup", "--python", BATCH, "--", manifest],
+                               stdout=log, stderr=subprocess.STDOUT)
+    if code != 0:
+        raise SystemExit(f"[keyframes] Blender 배치 실패 ({tag}) — {os.path.join(work, tag + '.log')}")
+    return time.perf_counter() - t0
+
+
+def runs(frames):
+    """정렬된 프레임 → 연속 구간 [(start, end, 1)]."""
+    out = []
+    for f in frames:
+        if out and f == out[-1][1] + 1:
+            out[-1] = (out[-1][0], f, 1)
+        else:
+            out.append((f, f, 1))
+    return out
+
+
+def read_render(work, frame):
+    w, h, rows = read_bmp(os.path.join(work, f"r_{frame:04d}.bmp"))
+    return np.frombuffer(b"".join(rows), dtype=np.uint8).reshape(h, w, 3).astype(np.float32)
+
+
+# ── 워핑 ──
+class Warper:
+    """raster 버퍼(오브젝트·1/z)로 프레임 t 픽셀 → 키 프레임 화면 좌표. 키 시점 버퍼는 캐시."""
+
+    def __init__(self, prep, w, h):
+        self.prep, self.w, self.h = prep, w, h
+        self._buf = {}
+        px, py = np.meshgrid(np.arange(w) + 0.5, np.arange(h) + 0.5)
+        self.px, self.py = px, py
+
+    def buffers(self, frame):
+        if frame not in self._buf:
+            img, zbuf, obj = raster.rasterize(self.prep, frame, self.w, self.h)
+            self._buf[frame] = ((raster.srgb(img) * 255).astype(np.float32), zbuf, obj)
+        return self._buf[frame]
+
+    def drop(self, keep):
+        for f in [f for f in self._buf if f not in keep]:
+            del self._buf[f]
+
+    def mapping(self, t, key):
+        """프레임 t 픽셀별 (키 화면 x, y, 보이나). 배경 픽셀은 같은 자리·보임."""
+        w, h = self.w, self.h
+        _, zbuf, obj = self.buffers(t)
+        _, kz, kobj = self.buffers(key)
+        view_t, f_t, _ = raster.camera(self.prep.ir, t, w, h)
+        view_k, f_k, _ = raster.camera(self.prep.ir, key, w, h)
+        mx, my = self.px.copy(), self.py.copy()
+        ok = obj < 0
+        fg = ~ok
+        z = 1.0 / zbuf[fg]
+        cam = np.stack([(self.px[fg] - w / 2) * z / f_t, (h / 2 - self.py[fg]) * z / f_t, -z, np.ones_like(z)])
+        world = np.linalg.inv(view_t) @ cam
+        ids = obj[fg]
+        moves = np.broadcast_to(np.eye(4), (len(self.prep.items), 4, 4)).copy()   # 정지 오브젝트는 항등
+        for k, (name, *_) in enumerate(self.prep.items):
+            if name in self.prep.animated:
+                moves[k] = raster.object_matrix(self.prep.objects, name, key) @ \
+                    np.linalg.inv(raster.object_matrix(self.prep.objects, name, t))
+        world = np.einsum("nij,jn->in", moves[ids], world)
+        ck = view_k @ world
+        zk = -ck[2]
+        front = zk > 1e-6
+        zk = np.where(front, zk, 1.0)
+        sx = f_k * ck[0] / zk + w / 2
+        sy = h / 2 - f_k * ck[1] / zk
+        ix = np.clip(np.floor(sx).astype(int), 0, w - 1)
+        iy = np.clip(np.floor(sy).astype(int), 0, h - 1)
+        inside = front & (sx >= 0) & (sx < w) & (sy >= 0) & (sy < h)
+        seen = inside & (kobj[iy, ix] == ids) & (np.abs(kz[iy, ix] * zk - 1.0) < 0.02)
+        mx[fg], my[fg], ok[fg] = sx, sy, seen
+        return mx, my, ok
+
+
+def sample(img, mx, my):
+    """쌍선형 — 픽셀 중심 좌표 (mx, my). 평탄 인덱스 take 로 (팬시 인덱싱보다 몇 배 빠르다)."""
+    h, w = img.shape[:2]
+    flat = img.reshape(-1, img.shape[2])
+    x = np.clip(mx - 0.5, 0, w - 1).astype(np.float32)
+    y = np.clip(my - 0.5, 0, h - 1).astype(np.float32)
+    x0, y0 = x.astype(np.int32), y.astype(np.int32)
+    dx, dy = (x0 < w - 1).astype(np.int32), (y0 < h - 1).astype(np.int32) * w
+    i = (y0 * w + x0).ravel()
+    fx, fy = (x - x0).reshape(-1, 1), (y - y0).reshape(-1, 1)
+    top = flat.take(i, axis=0) * (1 - fx) + flat.take(i + dx.ravel(), axis=0) * fx
+    bot = flat.take(i + dy.ravel(), axis=0) * (1 - fx) + flat.take(i + (dx + dy).ravel(), axis=0) * fx
+    return (top * (1 - fy) + bot * fy).reshape(img.shape)
+
+
+def blend(t, a, b, img_a, img_b, map_a, map_b):
+    """앞뒤 키에서 가져와 시간 가중 평균. 반환: (이미지 float, 구멍 비율)."""
+    wa = (b - t) / (b - a)
+    sa, sb = sample(img_a, *map_a[:2]), sample(img_b, *map_b[:2])
+    va, vb = map_a[2] * wa, map_b[2] * (1 - wa)
+    total = va + vb
+    holes = total == 0
+    out = (sa * va[..., None] + sb * vb[..., None]) / np.where(holes, 1, total)[..., None]
+    near = sa if wa >= 0.5 else sb   # 구멍 — 가까운 키에서 가림 검사 없이
+    out[holes] = near[holes]
+    return out, float(holes.mean())
+
+
+def psnr(a, b):
+    mse = float(np.mean((a.astype(np.float32) - b.astype(np.float32)) ** 2))
+    return math.inf if mse == 0 else 10 * math.log10(255.0 ** 2 / mse)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="키프레임만 렌더하고 사이 프레임은 워핑으로 합성")
+    ap.add_argument("script", help="Workbench 애니 블록아웃 스크립트 (v1/v2/v3)")
+    ap.add_argument("--step", type=int, default=4, help="키 간격 k")
+    ap.add_argument("--checks", type=int, default=4, help="진짜로도 렌더해 비교할 구간 수")
+    ap.add_argument("--min-psnr", type=float, default=32.0, help="이 아래면 폴백 (dB)")
+    ap.add_argument("--max-holes", type=float, default=0.005, help="구멍 픽셀 비율이 넘으면 폴백")
+    ap.add_argument("--res", help="WxH (BLOCKOUT_RES)")
+    ap.add_argument("--param", action="append", default=[], help="K=V (여러 번)")
+    ap.add_argument("--out", required=True, help="PNG 접두어 → <접두어>0001.png")
+    ap.add_argument("--mp4", help="ffmpeg 가 있으면 MP4 도")
+    ap.add_argument("--work", help="중간 BMP·매니페스트 폴더 (기본 임시)")
+    args = ap.parse_args(argv)
+    if args.step < 2:
+        raise SystemExit("[keyframes] --step 은 2 이상")
+
+    blender = os.environ.get("BLENDER", "blender")
+    script = os.path.abspath(args.script)
+    params = dict(kv.split("=", 1) for kv in args.param)
+    if args.res:
+        params["BLOCKOUT_RES"] = args.res
+    work = args.work or tempfile.mkdtemp(prefix="blockout_keyframes_")
+    os.makedirs(work, exist_ok=True)
+    t_all = time.perf_counter()
+
+    ir, = sceneir.load([script], params, blender, geometry=True)
+    start, end = ir["render"]["frames"]
+    w, h = (round(v * ir["render"].get("pct", 100) / 100) for v in ir["render"]["res"])
+    keys = list(range(start, end + 1, args.step))
+    if keys[-1] != end:
+        keys.append(end)
+    intervals = [(a, b) for a, b in zip(keys, keys[1:]) if b - a > 1]
+    pick = np.linspace(0, len(intervals) - 1, min(args.checks, len(intervals))).round().astype(int) if intervals else []
+    checked = {intervals[i]: (intervals[i][0] + intervals[i][1]) // 2 for i in sorted(set(pick))}
+
+    key_jobs = [(start, end, args.step)] + ([(end, end, 1)] if (end - start) % args.step else [])
+    render_s = run_batch(blender, script, key_jobs + runs(sorted(checked.values())), params, work, "keys")
+    n_rendered = len(keys) + len(checked)
+
+    prep = raster.Prepared(ir)
+    warper = Warper(prep, w, h)
+    frames, report, fallback = {}, [], set()
+    t_synth = time.perf_counter()
+    for f in keys:
+        frames[f] = read_render(work, f)
+    for a, b in intervals:
+        img_a, img_b = frames[a], frames[b]
+        ras_a, ras_b = warper.buffers(a)[0], warper.buffers(b)[0]
+        bad_interval = False
+        for t in range(a + 1, b):
+            map_a, map_b = warper.mapping(t, a), warper.mapping(t, b)
+            img, holes = blend(t, a, b, img_a, img_b, map_a, map_b)
+            proxy = psnr(blend(t, a, b, ras_a, ras_b, map_a, map_b)[0], warper.buffers(t)[0])
+            rec = {"frame": t, "keys": [a, b], "holes": round(holes, 5), "proxy_psnr": round(proxy, 2)}
+            if checked.get((a, b)) == t:
+                true = read_render(work, t)
+                rec["psnr"] = round(psnr(img, true), 2)
+                bad_interval = rec["psnr"] < args.min_psnr
+                img = true
+            if proxy < args.min_psnr or holes > args.max_holes:
+                fallback.add(t)
+            frames[t] = img
+            report.append(rec)
+        if bad_interval:
+            fallback.update(t for t in range(a + 1, b) if t != checked[(a, b)])
+        warper.drop({b})
+    fallback -= set(checked.values())
+    synth_s = time.perf_counter() - t_synth
+
+    fallback_s = 0.0
+    if fallback:
+        fallback_s = run_batch(blender, script, runs(sorted(fallback)), params, work, "fallback")
+        for t in fallback:
+            frames[t] = read_render(work, t)
+    for rec in report:
+        rec["source"] = "fallback" if rec["frame"] in fallback else "check" if "psnr" in rec else "warp"
+
+    ff = None
+    if args.mp4 and shutil.which("ffmpeg"):
+        ff = subprocess.Popen(["ffmpeg", "-y", "-loglevel", "error", "-f", "rawvideo", "-pix_fmt", "rgb24",
+                               "-s", f"{w}x{h}", "-r", str(ir["render"].get("fps", 24)), "-i", "-",
+                               "-c:v", "libx264", "-pix_fmt", "yuv420p", args.mp4], stdin=subprocess.PIPE)
+    os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+    for f in range(start, end + 1):
+        img = np.clip(frames[f] + 0.5, 0, 255).astype(np.uint8)
+        write_png(f"{args.out}{f:04d}.png", w, h, [row.tobytes() for row in img])
+        if ff:
+            ff.stdin.write(img.tobytes())
+    if ff:
+        ff.stdin.close()
+        ff.wait()
+
+    total = end - start + 1
+    real = n_rendered + len(fallback)
+    summary = {"script": os.path.relpath(script), "frames": total, "step": args.step, "keys": keys,
+               "checks": sorted(checked.values()), "fallback": sorted(fallback), "rendered": real,
+               "synthesized": total - real, "render_s": round(render_s + fallback_s, 2), "synth_s": round(synth_s, 2),
+               "total_s": round(time.perf_counter() - t_all, 2),
+               "check_psnr": [r["psnr"] for r in report if "psnr" in r], "frames_detail": report}
+    path = os.path.join(os.path.dirname(os.path.abspath(args.out)), "keyframes.json")
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(summary, fh, ensure_ascii=False, indent=1)
+    print(f"[keyframes] {total} 프레임 중 렌더 {real} (키 {len(keys)} · 검사 {len(checked)} · 폴백 {len(fallback)}) "
+          f"· 합성 {total - real} · 검사 PSNR {summary['check_psnr']} · {summary['total_s']}s → {path}")
+    if args.mp4 and not ff:
+        print("[keyframes] ffmpeg 없음 — MP4 는 건너뜀", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,564 @@
+"""파라메트릭 로케이션 — 방 셸·패널 벽·좌석 그리드·유리 칸막이·단상·데스크·출입구를 조립해 블록아웃을 짓는다.
+
+법정(courtroom_blockout.py)은 wall_panels·벤치 행 루프·소핏/챔퍼 계산을 손으로 짰다. 새 로케이션마다 그 600줄을
+다시 쓰지 않도록 같은 수치 관례의 블록을 여기 둔다. 블록은 bpy 없이 Layout 에 박스(중심·크기·재질 키·rot_z·역할)만
+쌓는다 — 그래서 Blender 밖에서 검사·계측하고, 안에서는 realize() 가 오퍼레이터 없이 bpy.data 로 한 번에 만든다.
+
+  Layout                  박스 목록 + 개구부 목록. 이름 중복은 validate 가 잡는다(Blender 는 .001 로 조용히 바꾼다)
+  room_shell              바닥(윗면 -4 mm) · 네 벽 · 천장 슬래브 · 소핏 밴드 · 리세스 45° 챔퍼 코너
+  panel_wall              세로 조인트 패널 — 벽에 0.03 파묻고, skip 구간과 그 벽에 등록된 개구부를 비운다
+  door_opening            어두운 개구부 + 헤드·잼 — 패널면보다 앞으로 뺀다(개구부로 등록)
+  seating_grid            통로로 끊긴 벤치/개별 좌석 행렬, rise 를 주면 계단식 단(단도 바닥처럼 -4 mm)
+  glass_partition         유리 + 난간 + 바닥 레일 + 멀리언, 가운데 게이트 개구
+  dais / desk             단상(+ 앞 노즈) / 2단 프로파일 데스크(본체·상판·앞 선반·플린스)
+  corridor                끝벽 없는 셸 + 베이마다 필라스터 — 긴 복도
+
+검사 validate(layout, cameras) — 파일 머리 규칙(courtroom_blockout.py "렌더 중 실제로 밟은 함정")을 기계로:
+  ① coplanar  같은 방향 두 면이 MIN_GAP 안에서 겹친다 (챔퍼 밑면 vs 소핏 → Cycles acne 로 새까맣게)
+     contact  반대 방향 두 면이 맞닿는데 한쪽이 셸(바닥·벽·천장·단)이다 (가구 밑면 vs 바닥). 가구끼리 얹힌 건 허용
+  ② covers    역할 panel 박스가 개구부 구간에서 개구부 앞면보다 실내 쪽으로 나와 있다 (패널이 문을 덮음)
+  ④ camera    카메라 좌표가 어느 박스 안에 있다 (벤치 슬래브 안의 카메라)
+  면 비교는 (축, 평면 좌표/MIN_GAP, 격자 칸) 해시로 이웃만 보므로 박스 수에 선형이다. 격자는 1 m · 8 m · 64 m …
+  여러 단이라 바닥·벽처럼 큰 면이 방 넓이만큼 칸을 채우지 않는다.
+  회전 박스는 윗면·밑면만 본다(방향 사각형 SAT). 옆면은 축 정렬 박스끼리만.
+
+Blender 안에서:
+  from blockout_kit import location as loc
+  L = loc.Layout(); loc.room_shell(L, 7.0, -10.0, 10.0, soffit=4.45, high=4.95, recess=(4.6, 6.5), chamfer=1.5) ...
+  loc.check(L, cameras=[...]); loc.realize(L, {"wall": M_WALL, ...})   # 값이 RGB 튜플이면 오브젝트 색(Workbench)
+
+Blender 밖 (표준 라이브러리만):
+  python research/tools/blockout_kit/location.py demo --seats 5000 --corridor 300 [--json arena.json]
+  python research/tools/blockout_kit/location.py check arena.json [--camera 0,-20,1.6 ...]
+"""
+import argparse
+import collections
+import json
+import math
+import sys
+import time
+
+MIN_GAP = 0.003      # 이보다 가까운 평행 두 면은 같은 평면으로 본다 — 블록들은 4~6 mm 씩 어긋낸다
+FLOOR_GAP = 0.004    # 바닥·단 윗면을 가구 밑면(Z=0)보다 내리는 양
+STAGGER = 0.006      # 한 블록 안에서 같은 높이에 놓일 부품 밑면·윗면을 어긋내는 양
+CELL = 1.0           # 면 해시 격자 (m)
+BIG_CELLS = 64       # 면 하나가 덮는 칸 수 상한 — 넘으면 LEVEL_STEP 배 거친 격자 단으로 올린다
+LEVEL_STEP = 8
+
+SHELL, PANEL, OPENING, SOLID = "shell", "panel", "opening", "solid"
+
+Part = collections.namedtuple("Part", "name center size mat rot_z role")
+
+
+class Layout:
+    """박스 부품 + 개구부. 블록 함수들이 여기에 쌓는다 (순서 = realize 생성 순서)."""
+
+    def __init__(self):
+        self.parts = []
+        self.openings = []   # {"name", "axis"(법선 0/1), "plane", "sign", "span", "z", "face"}
+
+    def box(self, name, xr, yr, zr, mat, rot_z=0.0, role=SOLID):
+        """(min,max) 범위로 — 법정 box() 와 같은 꼴."""
+        self.parts.append(Part(name, ((xr[0] + xr[1]) / 2, (yr[0] + yr[1]) / 2, (zr[0] + zr[1]) / 2),
+                               (xr[1] - xr[0], yr[1] - yr[0], zr[1] - zr[0]), mat, rot_z, role))
+
+    def box_at(self, name, center, size, mat, rot_z=0.0, role=SOLID):
+        self.parts.append(Part(name, tuple(center), tuple(size), mat, rot_z, role))
+
+    def counts(self):
+        by_mat = collections.Counter(p.mat for p in self.parts)
+        return {"parts": len(self.parts), "openings": len(self.openings), "materials": dict(by_mat)}
+
+    def to_json(self):
+        return {"parts": [p._asdict() for p in self.parts], "openings": self.openings}
+
+    @classmethod
+    def from_json(cls, data):
+        lay = cls()
+        lay.parts = [Part(d["name"], tuple(d["center"]), tuple(d["size"]), d["mat"], d.get("rot_z", 0.0),
+                          d.get("role", SOLID)) for d in data["parts"]]
+        lay.openings = list(data.get("openings", []))
+        return lay
+
+
+def _wall_box(lay, name, along, fixed, sign, n0, n1, a, b, zr, mat, role):
+    """벽 좌표계 → 박스. along='Y' 면 좌우 벽(고정 X), 'X' 면 앞뒤 벽(고정 Y). n0·n1 은 실내 방향 거리."""
+    u0, u1 = sorted((fixed + sign * n0, fixed + sign * n1))
+    if along == "Y":
+        lay.box(name, (u0, u1), (a, b), zr, mat, role=role)
+    else:
+        lay.box(name, (a, b), (u0, u1), zr, mat, role=role)
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# 블록
+# ═══════════════════════════════════════════════════════════════════════════
+def chamfer_corners(rx, ry, ch):
+    """리세스 개구(반폭 rx, 반깊이 ry)의 45° 챔퍼 코너 4개 → [(sx, sy, 중점(x,y), 바깥 단위벡터, rot_z)].
+    rot_z 는 박스 로컬 X 가 챔퍼 선을 따르고 로컬 +Y 가 바깥을 향하게 고른다(법정 §1·§2 계산과 같다)."""
+    out = []
+    for sx, sy in ((1, 1), (1, -1), (-1, 1), (-1, -1)):
+        mid = (sx * (rx - ch / 2), sy * (ry - ch / 2))
+        o = (sx / math.sqrt(2), sy / math.sqrt(2))
+        theta = math.atan2(-sy, sx)
+        if math.cos(theta + math.pi / 2) * o[0] + math.sin(theta + math.pi / 2) * o[1] < 0:
+            theta += math.pi
+        out.append((sx, sy, mid, o, theta))
+    return out
+
+
+def room_shell(lay, hw, y_near, y_far, height=5.2, wall_t=0.4, soffit=None, high=None, recess=None,
+               chamfer=0.0, ends=(True, True), prefix="", wall="wall", floor="floor", ceiling="ceiling"):
+    """바닥 / 네 벽 / 천장. soffit·high·recess=(rx, ry) 를 주면 벽 쪽 소핏 밴드 + 중앙 리세스(+ chamfer 코너).
+    ends=(near, far) 가 False 인 끝벽은 만들지 않는다(복도·이어 붙이는 방). 바닥 윗면은 -FLOOR_GAP."""
+    top = high if high is not None else height - 0.25
+    y0, y1 = y_near - (wall_t if ends[0] else 0.0), y_far + (wall_t if ends[1] else 0.0)
+    lay.box(f"{prefix}floor", (-hw - wall_t, hw + wall_t), (y0, y1), (-0.3, -FLOOR_GAP), floor, role=SHELL)
+    lay.box(f"{prefix}wall_left", (-hw - wall_t, -hw), (y_near, y_far), (0, height), wall, role=SHELL)
+    lay.box(f"{prefix}wall_right", (hw, hw + wall_t), (y_near, y_far), (0, height), wall, role=SHELL)
+    if ends[1]:
+        lay.box(f"{prefix}wall_far", (-hw - wall_t, hw + wall_t), (y_far, y_far + wall_t), (0, height), wall,
+                role=SHELL)
+    if ends[0]:
+        lay.box(f"{prefix}wall_near", (-hw - wall_t, hw + wall_t), (y_near - wall_t, y_near), (0, height), wall,
+                role=SHELL)
+    # 천장 슬래브는 벽 두께 절반까지만, 벽 윗단보다 낮게 — 벽 바깥면·윗면과 같은 평면이 되지 않는다
+    half = wall_t / 2
+    lay.box(f"{prefix}ceiling_high", (-hw - half, hw + half),
+            (y_near - half if ends[0] else y_near + STAGGER, y_far + half if ends[1] else y_far - STAGGER),
+            (top, min(top + 0.25, height - STAGGER)), ceiling, role=SHELL)
+    if soffit is None or recess is None:
+        return
+    rx, ry = recess
+    zr = (soffit, top + 0.06)   # 윗면은 슬래브에 파묻는다
+    lay.box(f"{prefix}soffit_near", (-hw, hw), (y_near, -ry), zr, ceiling, role=SHELL)
+    lay.box(f"{prefix}soffit_far", (-hw, hw), (ry, y_far), zr, ceiling, role=SHELL)
+    lay.box(f"{prefix}soffit_left", (-hw, -rx), (-ry, ry), zr, ceiling, role=SHELL)
+    lay.box(f"{prefix}soffit_right", (rx, hw), (-ry, ry), zr, ceiling, role=SHELL)
+    if chamfer <= 0:
+        return
+    # 웨지 밑면은 소핏보다 6 mm 낮게, 윗면은 밴드 윗면보다 1 cm 낮게 — 어느 쪽도 같은 평면이 아니다
+    z0, z1 = soffit - STAGGER, top + 0.05
+    for sx, sy, mid, o, theta in chamfer_corners(rx, ry, chamfer):
+        c = (mid[0] + o[0] * 0.65, mid[1] + o[1] * 0.65)
+        lay.box_at(f"{prefix}soffit_chamfer_{sx}_{sy}", (c[0], c[1], (z0 + z1) / 2),
+                   (chamfer * math.sqrt(2) + 0.5, 1.3, z1 - z0), ceiling, rot_z=theta, role=SHELL)
+
+
+def panel_wall(lay, prefix, along, fixed, sign, lo, hi, skip=(), z=(0.13, 4.28), width=2.55, gap=0.075,
+               proud=0.055, embed=0.03, mat="panel"):
+    """법정 wall_panels 와 같은 배치 — 폭 width 패널을 가운데 정렬로 깔고 skip 구간과 겹치는 패널은 뺀다.
+    이 벽(같은 축·평면 ±0.5 m)에 이미 등록된 개구부 구간도 skip 에 더한다 — 출입구를 먼저 놓으면 된다.
+    반환: 놓은 패널 수."""
+    axis = 0 if along == "Y" else 1
+    skip = list(skip) + [tuple(op["span"]) for op in lay.openings
+                         if op["axis"] == axis and abs(op["plane"] - fixed) < 0.5]
+    n = int((hi - lo) // (width + gap))
+    start = lo + (hi - lo - (n * (width + gap) - gap)) / 2
+    placed = 0
+    for i in range(n):
+        a = start + i * (width + gap)
+        b = a + width
+        if any(not (b < s0 or a > s1) for s0, s1 in skip):
+            continue
+        _wall_box(lay, f"{prefix}_{i}", along, fixed, sign, -embed, proud, a, b, z, mat, PANEL)
+        placed += 1
+    return placed
+
+
+def door_opening(lay, name, along, fixed, sign, center, width, height=2.62, frame=0.14, proud=(0.09, 0.18),
+                 depth=0.30, clear=0.15, mullion=None, void="dark", trim="panel"):
+    """어두운 개구부 + 헤드·잼 2. 개구부 앞면은 벽면에서 실내로 0.10, 프레임은 proud 구간(패널 돌출 0.055 보다 앞).
+    mullion 이 재질 키면 가운데 세로 멀리언. 구간 center±(width/2+frame+clear) 를 개구부로 등록한다."""
+    a, b = center - width / 2, center + width / 2
+    # 개구부는 바닥을 뚫고 내려가고(벽 밑면과 같은 평면 회피), 잼은 헤드 밑에서 끝난다(앞면이 겹치지 않게)
+    _wall_box(lay, f"{name}_void", along, fixed, sign, -depth, 0.10, a, b, (-0.10, height), void, OPENING)
+    _wall_box(lay, f"{name}_head", along, fixed, sign, proud[0], proud[1], a - frame, b + frame,
+              (height, height + frame), trim, SOLID)
+    for s2, (j0, j1) in ((-1, (a - frame, a)), (1, (b, b + frame))):
+        _wall_box(lay, f"{name}_jamb_{s2}", along, fixed, sign, proud[0], proud[1], j0, j1,
+                  (STAGGER, height), trim, SOLID)
+    if mullion:
+        _wall_box(lay, f"{name}_mullion", along, fixed, sign, 0.10, 0.15, center - 0.05, center + 0.05,
+                  (STAGGER, height - STAGGER), mullion, SOLID)
+    lay.openings.append({"name": name, "axis": 0 if along == "Y" else 1, "plane": fixed, "sign": sign,
+                         "span": (a - frame - clear, b + frame + clear), "z": (0.0, height + frame), "face": 0.10})
+
+
+def _segments(x_range, aisles):
+    """x_range 에서 통로 구간들을 뺀 좌석 구간."""
+    segs, lo = [], x_range[0]
+    for a, b in sorted(aisles):
+        if a > lo:
+            segs.append((lo, min(a, x_range[1])))
+        lo = max(lo, b)
+    if lo < x_range[1]:
+        segs.append((lo, x_range[1]))
+    return [(a, b) for a, b in segs if b - a > 0.3]
+
+
+def seating_grid(lay, prefix, x_range, rows, aisles=((-1.3, 1.3),), seat_top=0.46, depth=0.56, seat_w=None,
+                 pitch=0.55, rise=0.0, mat="bench", riser="floor"):
+    """행(Y 중심 목록) × 통로로 끊긴 구간. seat_w=None 이면 구간마다 법정 석재 벤치(상판·에이프런·다리 2),
+    아니면 pitch 간격 개별 좌석(상판·받침). rise>0 이면 r 번째 행이 r·rise 위 계단 단에 앉는다.
+    반환: 좌석 수(벤치는 구간 수)."""
+    rows = list(rows)
+    edges = [rows[0] - (rows[1] - rows[0]) / 2 if len(rows) > 1 else rows[0] - depth]
+    edges += [(a + b) / 2 for a, b in zip(rows, rows[1:])]
+    edges.append(rows[-1] + (rows[-1] - rows[-2]) / 2 if len(rows) > 1 else rows[0] + depth)
+    segs = _segments(x_range, aisles)
+    seats = 0
+    for r, by in enumerate(rows):
+        z0 = r * rise
+        if z0 > 0:
+            lay.box(f"{prefix}_riser_{r}", x_range, tuple(sorted((edges[r], edges[r + 1]))), (0.0, z0 - FLOOR_GAP),
+                    riser, role=SHELL)
+        top = z0 + seat_top
+        for k, (lo, hi) in enumerate(segs):
+            if seat_w is None:
+                lay.box(f"{prefix}_seat_{r}_{k}", (lo, hi), (by - depth / 2, by + depth / 2), (top - 0.14, top), mat)
+                lay.box(f"{prefix}_apron_{r}_{k}", (lo + 0.10, hi - 0.10), (by - depth / 2 + 0.07, by + depth / 2 - 0.07),
+                        (top - 0.24, top - 0.12), mat)
+                for j, lx in enumerate((lo + 0.55, hi - 0.55)):
+                    lay.box(f"{prefix}_leg_{r}_{k}_{j}", (lx - 0.26, lx + 0.26), (by - depth / 2 + 0.03, by + depth / 2 - 0.03),
+                            (z0, top - 0.22), mat)
+                seats += 1
+                continue
+            n = int((hi - lo + pitch - seat_w) // pitch)
+            x0 = lo + (hi - lo - ((n - 1) * pitch + seat_w)) / 2
+            for i in range(n):
+                a = x0 + i * pitch
+                lay.box(f"{prefix}_seat_{r}_{k}_{i}", (a, a + seat_w), (by - depth / 2, by + depth / 2),
+                        (top - 0.10, top), mat)
+                lay.box(f"{prefix}_post_{r}_{k}_{i}", (a + seat_w / 2 - 0.06, a + seat_w / 2 + 0.06),
+                        (by - 0.06, by + 0.06), (z0, top - 0.08), mat)
+            seats += n
+    return seats
+
+
+def glass_partition(lay, prefix, along, fixed, lo, hi, top=1.35, gate=None, bays=3, glass="glass", metal="metal"):
+    """유리 판 + 윗 난간 + 바닥 레일 + 멀리언(구간마다 bays 칸). gate=(a,b) 구간은 비운다(법정 §9 유리 바).
+    멀리언은 난간 윗면·레일 밑면과 같은 평면이 되지 않게 위아래로 STAGGER 씩 줄인다."""
+    spans = [(lo, hi)] if gate is None else [(lo, gate[0]), (gate[1], hi)]
+    for s, (a, b) in enumerate(spans):
+        if b - a <= 0:
+            continue
+        _wall_box(lay, f"{prefix}_glass_{s}", along, fixed, 1, -0.022, 0.022, a + STAGGER, b - STAGGER,
+                  (0.04, top - 0.04), glass, SOLID)
+        _wall_box(lay, f"{prefix}_rail_{s}", along, fixed, 1, -0.05, 0.05, a, b, (top - 0.06, top), metal, SOLID)
+        _wall_box(lay, f"{prefix}_foot_{s}", along, fixed, 1, -0.05, 0.05, a, b, (0.0, 0.07), metal, SOLID)
+        for k in range(bays + 1):
+            m = a + (b - a) * k / bays
+            _wall_box(lay, f"{prefix}_mull_{s}_{k}", along, fixed, 1, -0.045, 0.045, m - 0.032, m + 0.032,
+                      (STAGGER, top - STAGGER), metal, SOLID)
+
+
+def dais(lay, name, xr, yr, height, front=-1, nose=0.08, mat="desk", nose_mat="panel"):
+    """단상(셸 — 위에 놓는 것은 바닥처럼 띄운다, 윗면 height-FLOOR_GAP) + front(±1, Y 방향) 쪽 낮은 노즈."""
+    lay.box(name, xr, yr, (0.0, height - FLOOR_GAP), mat, role=SHELL)
+    edge = yr[0] if front < 0 else yr[1]
+    lay.box(f"{name}_nose", (xr[0] + STAGGER, xr[1] - STAGGER), tuple(sorted((edge - front * 0.02, edge + front * nose))), (STAGGER, height - 0.06),
+            nose_mat)   # 단 안으로 2 cm 묻는다 — 맞닿으면 셸 접촉
+
+
+def desk(lay, prefix, xr, yr, top, slab=0.09, overhang=(0.18, 0.12), ledge=(0.30, 0.86), front=-1, z0=0.0,
+         mat="desk", plinth="panel"):
+    """2단 프로파일 데스크 — 본체(top 까지) + 넘치는 상판 + front 쪽 낮은 선반(깊이, 높이) + 플린스.
+    흰 대리석끼리 실루엣 단차가 없으면 긴 덩어리로 뭉개진다(법정 §6). 본체·선반 밑면은 플린스보다 STAGGER 위."""
+    ox, oy = overhang
+    base = z0 + STAGGER
+    lay.box(f"{prefix}_body", xr, yr, (base, top), mat)
+    lay.box(f"{prefix}_top", (xr[0] - ox, xr[1] + ox), (yr[0] - oy, yr[1] + oy), (top, top + slab), mat)
+    lay.box(f"{prefix}_plinth", (xr[0] + 0.06, xr[1] - 0.06), (yr[0] - 0.04, yr[1] + 0.04), (z0, z0 + 0.10), plinth)
+    if ledge:
+        d, h = ledge
+        edge = yr[0] if front < 0 else yr[1]
+        ly = tuple(sorted((edge, edge + front * d)))
+        lay.box(f"{prefix}_ledge", xr, ly, (base, z0 + h), mat)
+        lay.box(f"{prefix}_ledge_top", (xr[0] - 0.12, xr[1] + 0.12), (ly[0] - 0.08, ly[1] + 0.02),
+                (z0 + h, z0 + h + 0.07), mat)
+
+
+def corridor(lay, prefix, hw, y0, y1, height=3.2, bay=4.0, pilaster=(0.35, 0.18), wall="wall", floor="floor",
+             ceiling="ceiling", post="panel"):
+    """끝벽 없는 긴 셸 + 베이마다 양 벽 필라스터(벽에 0.03 파묻음). 반환: 필라스터 수."""
+    room_shell(lay, hw, y0, y1, height=height, ends=(False, False), prefix=f"{prefix}_", wall=wall, floor=floor,
+               ceiling=ceiling)
+    w, d = pilaster
+    n = int((y1 - y0) // bay)
+    for i in range(1, n):
+        y = y0 + i * bay
+        for sx in (-1, 1):
+            _wall_box(lay, f"{prefix}_pilaster_{i}_{sx}", "Y", sx * hw, -sx, -0.03, d, y - w / 2, y + w / 2,
+                      (STAGGER, height - 0.25 - STAGGER), post, SOLID)
+    return 2 * max(0, n - 1)
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# 검사 — 동일 평면 / 셸 접촉 / 개구부 덮음 / 카메라 매몰
+# ═══════════════════════════════════════════════════════════════════════════
+def _is_axis_aligned(rot_z):
+    q = rot_z / (math.pi / 2)
+    return abs(q - round(q)) < 1e-6, int(round(q)) % 2 == 1
+
+
+def _faces(i, p):
+    """(축, 좌표, 방향, 2D 사각형) — 사각형은 축 정렬이면 ((a0,a1),(b0,b1)), 회전이면 꼭짓점 4개."""
+    aligned, swap = _is_axis_aligned(p.rot_z)
+    (cx, cy, cz), (sx, sy, sz) = p.center, p.size
+    if aligned:
+        if swap:
+            sx, sy = sy, sx
+        lo = (cx - sx / 2, cy - sy / 2, cz - sz / 2)
+        hi = (cx + sx / 2, cy + sy / 2, cz + sz / 2)
+        for ax in range(3):
+            u, v = [k for k in range(3) if k != ax]
+            rect = ((lo[u], hi[u]), (lo[v], hi[v]))
+            yield ax, lo[ax], -1, rect, None
+            yield ax, hi[ax], 1, rect, None
+        return
+    c, s = math.cos(p.rot_z), math.sin(p.rot_z)
+    poly = [(cx + dx * c - dy * s, cy + dx * s + dy * c)
+            for dx, dy in ((-sx / 2, -sy / 2), (sx / 2, -sy / 2), (sx / 2, sy / 2), (-sx / 2, sy / 2))]
+    rect = ((min(q[0] for q in poly), max(q[0] for q in poly)), (min(q[1] for q in poly), max(q[1] for q in poly)))
+    yield 2, cz - sz / 2, -1, rect, poly
+    yield 2, cz + sz / 2, 1, rect, poly
+
+
+def _poly(rect, poly):
+    if poly is not None:
+        return poly
+    (a0, a1), (b0, b1) = rect
+    return [(a0, b0), (a1, b0), (a1, b1), (a0, b1)]
+
+
+def _overlap(fa, fb, eps=1e-6):
+    """두 면의 2D 사각형이 넓이를 갖고 겹치나 (모서리만 닿는 건 아니다). 회전이 끼면 SAT."""
+    (ra, pa), (rb, pb) = fa, fb
+    if ra[0][1] - rb[0][0] <= eps or rb[0][1] - ra[0][0] <= eps or ra[1][1] - rb[1][0] <= eps \
+            or rb[1][1] - ra[1][0] <= eps:
+        return False
+    if pa is None and pb is None:
+        return True
+    qa, qb = _poly(ra, pa), _poly(rb, pb)
+    for poly in (qa, qb):
+        for k in range(4):
+            ex, ey = poly[(k + 1) % 4][0] - poly[k][0], poly[(k + 1) % 4][1] - poly[k][1]
+            nx, ny = -ey, ex
+            n = math.hypot(nx, ny) or 1.0
+            pa_ = [(q[0] * nx + q[1] * ny) / n for q in qa]
+            pb_ = [(q[0] * nx + q[1] * ny) / n for q in qb]
+            if min(max(pa_), max(pb_)) - max(min(pa_), min(pb_)) <= eps:
+                return False
+    return True
+
+
+def _inside(p, pt):
+    (cx, cy, cz), (sx, sy, sz) = p.center, p.size
+    dx, dy = pt[0] - cx, pt[1] - cy
+    c, s = math.cos(-p.rot_z), math.sin(-p.rot_z)
+    lx, ly = dx * c - dy * s, dx * s + dy * c
+    return abs(lx) < sx / 2 and abs(ly) < sy / 2 and abs(pt[2] - cz) < sz / 2
+
+
+def validate(lay, cameras=(), gap=MIN_GAP):
+    """규칙 위반 목록 [{"rule", "parts", "detail"}]. 비어 있으면 통과."""
+    problems = []
+    seen_names = {}
+    for p in lay.parts:
+        if p.name in seen_names:
+            problems.append({"rule": "duplicate", "parts": [p.name], "detail": "같은 이름 — Blender 가 .001 로 바꾼다"})
+        seen_names[p.name] = p
+        if min(p.size) <= 0:
+            problems.append({"rule": "degenerate", "parts": [p.name], "detail": f"크기 {p.size}"})
+
+    # ① 동일 평면 / 셸 접촉 — 면마다 (축, 평면 버킷, 격자 칸) 해시. 격자는 CELL·LEVEL_STEP^k 여러 단이고
+    #   면은 BIG_CELLS 칸 안에 드는 가장 고운 단에 들어간다. 비교는 같은 단(앞 번호만) + 더 거친 단 전부 —
+    #   바닥·벽처럼 큰 면을 1 m 칸마다 넣으면 비용이 방 넓이를 따라 커진다(좌석이 늘면 홀도 넓어진다).
+    faces = []
+    reported = set()
+
+    def test(fid, gid):
+        i, ax, coord, sign, rect, poly = faces[fid][:6]
+        j, _, c2, s2, r2, p2 = faces[gid][:6]
+        if j == i or abs(c2 - coord) >= gap or (min(i, j), max(i, j)) in reported:
+            return
+        p, other = lay.parts[i], lay.parts[j]
+        if s2 == sign:
+            rule = "coplanar"
+        elif (p.role == SHELL) != (other.role == SHELL):
+            rule = "contact"
+        else:
+            return
+        if not _overlap((rect, poly), (r2, p2)):
+            return
+        reported.add((min(i, j), max(i, j)))
+        problems.append({"rule": rule, "parts": [other.name, p.name],
+                         "detail": f"{'XYZ'[ax]}={coord:.4f} vs {c2:.4f} ({'같은' if s2 == sign else '반대'} 방향)"})
+
+    def cells(rect, level):
+        size = CELL * LEVEL_STEP ** level
+        return [(ci, cj) for ci in range(math.floor(rect[0][0] / size), math.floor(rect[0][1] / size) + 1)
+                for cj in range(math.floor(rect[1][0] / size), math.floor(rect[1][1] / size) + 1)]
+
+    grid = collections.defaultdict(list)
+    occupied = collections.defaultdict(set)   # (축, 버킷) → 면이 든 단 — 빈 단은 묻지 않는다
+    for i, p in enumerate(lay.parts):
+        for ax, coord, sign, rect, poly in _faces(i, p):
+            level, cs = 0, cells(rect, 0)
+            while len(cs) > BIG_CELLS:
+                level += 1
+                cs = cells(rect, level)
+            q = math.floor(coord / gap)
+            faces.append((i, ax, coord, sign, rect, poly, level, q, cs))
+            occupied[(ax, q)].add(level)
+            for c in cs:
+                grid[(level, ax, q, c)].append(len(faces) - 1)
+    for fid, (_, ax, _, _, rect, _, level, q, cs) in enumerate(faces):
+        tested = set()
+        near = occupied.get((ax, q - 1), set()) | occupied[(ax, q)] | occupied.get((ax, q + 1), set())
+        for lv in sorted(lv for lv in near if lv >= level):
+            for c in (cs if lv == level else cells(rect, lv)):
+                for dq in (-1, 0, 1):
+                    for gid in grid.get((lv, ax, q + dq, c), ()):
+                        if (lv > level or gid < fid) and gid not in tested:
+                            tested.add(gid)
+                            test(fid, gid)
+
+    # ② 개구부를 덮는 패널 — 개구부 벽마다 패널을 모아 구간·높이·돌출을 본다
+    by_wall = collections.defaultdict(list)
+    for op in lay.openings:
+        by_wall[(op["axis"], round(op["plane"]))].append(op)
+    if by_wall:
+        for p in lay.parts:
+            if p.role != PANEL:
+                continue
+            for ax in (0, 1):
+                for op in by_wall.get((ax, round(p.center[ax])), ()):
+                    if abs(p.center[ax] - op["plane"]) > 0.5:
+                        continue
+                    along = 1 - ax
+                    a, b = p.center[along] - p.size[along] / 2, p.center[along] + p.size[along] / 2
+                    pz0, pz1 = p.center[2] - p.size[2] / 2, p.center[2] + p.size[2] / 2
+                    front = op["sign"] * (p.center[ax] - op["plane"]) + p.size[ax] / 2   # 실내 쪽 면까지의 거리
+                    s0, s1 = op["span"]
+                    if b > s0 and a < s1 and pz1 > op["z"][0] and pz0 < op["z"][1] and front > op["face"] - gap:
+                        problems.append({"rule": "covers", "parts": [p.name, op["name"]],
+                                         "detail": f"패널 앞면 {front:.3f} ≥ 개구부 앞면 {op['face']:.3f}"})
+
+    # ④ 카메라 매몰
+    for k, cam in enumerate(cameras):
+        for p in lay.parts:
+            if _inside(p, cam):
+                problems.append({"rule": "camera", "parts": [p.name], "detail": f"카메라 {k} {tuple(cam)}"})
+    return problems
+
+
+def check(lay, cameras=(), gap=MIN_GAP, strict=True):
+    """validate 결과를 찍고 strict 면 위반이 있을 때 ValueError — 빌더가 깨진 방을 렌더하지 않게."""
+    problems = validate(lay, cameras, gap)
+    for pr in problems:
+        print(f"[location] {pr['rule']:9s} {' / '.join(pr['parts'])}  {pr['detail']}", file=sys.stderr)
+    if problems and strict:
+        raise ValueError(f"로케이션 검사 실패 {len(problems)}건 (첫 건: {problems[0]['rule']} {problems[0]['parts']})")
+    return problems
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Blender — 오퍼레이터 없이 bpy.data 로 (primitive_cube_add 는 호출마다 씬 갱신이라 수천 개에서 제곱으로 는다)
+# ═══════════════════════════════════════════════════════════════════════════
+UNIT_VERTS = [(x, y, z) for x in (-0.5, 0.5) for y in (-0.5, 0.5) for z in (-0.5, 0.5)]
+UNIT_FACES = [(0, 1, 3, 2), (4, 6, 7, 5), (0, 4, 5, 1), (2, 3, 7, 6), (0, 2, 6, 4), (1, 5, 7, 3)]
+
+
+def realize(lay, materials, collection=None):
+    """부품마다 단위 큐브 메시 + 오브젝트(scale = 크기) — 법정 box() 와 같은 꼴이라 scenecache 인스턴싱이 그대로 먹는다.
+    materials[키] 가 bpy 재질이면 슬롯에, RGB(A) 튜플이면 오브젝트 색에. 반환: {이름: 오브젝트}."""
+    import bpy
+    coll = collection or bpy.context.scene.collection
+    made = {}
+    for p in lay.parts:
+        me = bpy.data.meshes.new(p.name)
+        me.from_pydata(UNIT_VERTS, [], UNIT_FACES)
+        me.update()
+        ob = bpy.data.objects.new(p.name, me)
+        ob.location = p.center
+        ob.scale = p.size
+        ob.rotation_euler = (0.0, 0.0, p.rot_z)
+        value = materials[p.mat]
+        if isinstance(value, tuple):
+            ob.color = (*value[:3], value[3] if len(value) > 3 else 1.0)
+        else:
+            me.materials.append(value)
+        coll.objects.link(ob)
+        made[p.name] = ob
+    return made
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# 데모 — 큰 공연장(계단식 개별 좌석 수천 석) + 긴 복도. 빌드·검사 시간이 좌석 수에 선형인지 본다
+# ═══════════════════════════════════════════════════════════════════════════
+def arena(seats=5000, corridor_m=300.0):
+    """좌석 ≈ seats 개를 담을 만큼 행을 늘린 계단식 홀 + 뒤로 이어진 corridor_m 길이 복도.
+    반환: (Layout, 좌석 수, 검사용 카메라 3 — 단상 / 맨 뒷줄 통로 / 복도 중간)."""
+    lay = Layout()
+    hw = 24.0
+    seg_seats = int((hw * 2 - 0.6 - 2 * 1.6) // 0.55)   # 통로 2줄을 뺀 한 행 좌석 수 근사
+    n_rows = max(2, math.ceil(seats / max(1, seg_seats)))
+    depth = 8.0 + n_rows * 0.9 + 4.0
+    y_far, y_near = 10.0, 10.0 - depth
+    room_shell(lay, hw, y_near, y_far, height=max(9.0, n_rows * 0.35 + 6.0), prefix="hall_")
+    dais(lay, "stage", (-12.0, 12.0), (4.0, y_far), 1.1)
+    desk(lay, "lectern", (-0.6, 0.6), (5.0, 5.6), 2.2, z0=1.1)
+    for sx in (-1, 1):
+        door_opening(lay, f"hall_door_{sx}", "X", y_far, -1, sx * 18.0, 1.6, height=2.8)
+    door_opening(lay, "hall_entry", "X", y_near, 1, 0.0, 2.3, mullion="metal")   # 뒤 복도로
+    panel_wall(lay, "hall_panel_n", "X", y_near, 1, -hw + 0.2, hw - 0.2, z=(0.13, 6.0))
+    panel_wall(lay, "hall_panel_f", "X", y_far, -1, -hw + 0.2, hw - 0.2, z=(0.13, 6.0))
+    panel_wall(lay, "hall_panel_l", "Y", -hw, 1, y_near + 0.2, y_far - 0.2, z=(0.13, 6.0))
+    panel_wall(lay, "hall_panel_r", "Y", hw, -1, y_near + 0.2, y_far - 0.2, z=(0.13, 6.0))
+    glass_partition(lay, "pit", "X", 2.6, -hw + 0.5, hw - 0.5, gate=(-1.0, 1.0), bays=6)
+    rows = [1.0 - 0.9 * r for r in range(n_rows)]
+    n = seating_grid(lay, "hall", (-hw + 0.3, hw - 0.3), rows, aisles=((-12.0, -10.4), (10.4, 12.0)),
+                     seat_w=0.5, pitch=0.55, rise=0.35, mat="seat", riser="floor")
+    corridor(lay, "corr", 2.2, y_near - 0.4 - corridor_m, y_near - 0.4, height=3.2)
+    cams = [(0.0, 7.0, 1.1 + 1.6), (11.2, rows[-1], (n_rows - 1) * 0.35 + 1.6), (0.0, y_near - 0.4 - corridor_m / 2, 1.6)]
+    return lay, n, cams
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="파라메트릭 로케이션 — 검사 · 데모 빌드 계측 (Blender 밖)")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    p = sub.add_parser("demo", help="계단식 홀 + 복도를 짓고 검사·시간을 찍는다")
+    p.add_argument("--seats", type=int, default=5000)
+    p.add_argument("--corridor", type=float, default=300.0, help="복도 길이 m")
+    p.add_argument("--json", help="레이아웃을 이 JSON 으로 저장")
+    p = sub.add_parser("check", help="저장한 레이아웃 JSON 검사")
+    p.add_argument("path")
+    p.add_argument("--camera", action="append", default=[], help="x,y,z (여러 번)")
+    args = ap.parse_args(argv)
+
+    if args.cmd == "demo":
+        t0 = time.perf_counter()
+        lay, n, cams = arena(args.seats, args.corridor)
+        t1 = time.perf_counter()
+        problems = check(lay, cameras=cams, strict=False)
+        t2 = time.perf_counter()
+        print(json.dumps({**lay.counts(), "seats": n, "build_s": round(t1 - t0, 3), "validate_s": round(t2 - t1, 3),
+                          "problems": len(problems)}, ensure_ascii=False))
+        if args.json:
+            with open(args.json, "w", encoding="utf-8") as fh:
+                json.dump(lay.to_json(), fh, ensure_ascii=False)
+    else:
+        with open(args.path, encoding="utf-8") as fh:
+            lay = Layout.from_json(json.load(fh))
+        cams = [tuple(float(v) for v in c.split(",")) for c in args.camera]
+        t0 = time.perf_counter()
+        problems = check(lay, cameras=cams, strict=False)
+        print(json.dumps({**lay.counts(), "validate_s": round(time.perf_counter() - t0, 3),
+                          "problems": len(problems)}, ensure_ascii=False))
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
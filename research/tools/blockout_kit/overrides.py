@@ -0,0 +1,79 @@
+"""BLOCKOUT_* 덮어쓰기 → 씬. 블록아웃 스크립트가 렌더 설정 끝에 한 번 부른다.
+
+스크립트 고유 변수(BG3D_* 등)는 각 스크립트가 읽고, 여기는 **모든 스크립트에 공통인 것만** 다룬다:
+
+  BLOCKOUT_RES     "3840x2160" — 출력 해상도 (퍼센트는 100으로 고정)
+  BLOCKOUT_REGION  "x0,x1,y0,y1" — 렌더 영역(0~1, y는 아래→위). 잘라내지 않고 전체 크기 이미지에
+                   영역만 그린다 — 타일끼리 픽셀 좌표가 같아야 이음새를 바이트 단위로 비교할 수 있다.
+  BLOCKOUT_FORMAT  "BMP" 등 — 스틸 파일 포맷 (타일은 BMP: 무압축이라 Blender 밖에서 바로 읽힌다).
+                   MP4 스크립트에 주면 프레임별 이미지로 바뀐다 (골든 이미지 — golden.py)
+  BLOCKOUT_OUT     출력 경로(스틸·MP4·프레임 접두어). "{view}" 가 있으면 뷰/케이스 이름으로 채운다
+  BLOCKOUT_FRAME_START / BLOCKOUT_FRAME_END — 렌더 프레임 구간 (애니메이션 일부만 — 워커 잡 단위)
+  BLOCKOUT_FRAME_STEP  k — 구간에서 k 프레임마다 (키프레임만 렌더 — keyframes.py). 없으면 1
+  BLOCKOUT_SAMPLES 렌더 샘플 (Cycles samples / EEVEE taa_render_samples. Workbench 는 해당 없음)
+  BLOCKOUT_DEVICE  "CPU" — Cycles 를 CPU 로 고정 (스크립트의 GPU 우선 설정보다 뒤에 적용)
+  BLOCKOUT_PROFILE 튜닝된 CPU 렌더 프로필 파일 — Cycles 가 CPU 로 돌면 맨 끝에 적용 (autotune.py)
+
+값은 main(params) 의 params dict 가 먼저, 없으면 환경변수 — 스크립트 단독 실행(환경변수)과
+batch.py/worker.py 잡(params)이 같은 이름을 쓴다.
+"""
+import os
+
+
+def param(params, name, default=""):
+    """params → 환경변수 → default 순으로 값 하나 (문자열, 앞뒤 공백 제거)."""
+    if params and params.get(name) is not None:
+        return str(params[name]).strip()
+    return os.environ.get(name, default).strip()
+
+
+def apply_overrides(scene, params=None):
+    """해상도·영역·포맷·프레임 구간을 씬에 적용한다. 출력 경로는 output_path() 가 따로 푼다.
+    스크립트가 자기 값(해상도·frame_end 등)을 다 정한 **뒤에** 불러야 덮어쓴다.
+    영역이 없으면 border 를 끈다 — 한 세션에서 씬을 재사용하는 배치 잡끼리 영역이 새지 않게."""
+    res = param(params, "BLOCKOUT_RES")
+    if res:
+        w, h = (int(v) for v in res.lower().split("x"))
+        scene.render.resolution_x = w
+        scene.render.resolution_y = h
+        scene.render.resolution_percentage = 100
+    region = param(params, "BLOCKOUT_REGION")
+    if region:
+        x0, x1, y0, y1 = (float(v) for v in region.split(","))
+        scene.render.use_border = True
+        scene.render.use_crop_to_border = False
+        scene.render.border_min_x, scene.render.border_max_x = x0, x1
+        scene.render.border_min_y, scene.render.border_max_y = y0, y1
+    else:
+        scene.render.use_border = False
+    if param(params, "BLOCKOUT_FRAME_START"):
+        scene.frame_start = int(param(params, "BLOCKOUT_FRAME_START"))
+    if param(params, "BLOCKOUT_FRAME_END"):
+        scene.frame_end = int(param(params, "BLOCKOUT_FRAME_END"))
+    scene.frame_step = int(param(params, "BLOCKOUT_FRAME_STEP", "1"))   # 재사용 씬에 이전 잡 값이 남지 않게 늘 쓴다
+    fmt = param(params, "BLOCKOUT_FORMAT")
+    if fmt:
+        if fmt != "FFMPEG" and hasattr(scene.render.image_settings, "media_type"):
+            scene.render.image_settings.media_type = "IMAGE"   # Blender 5.x: 비디오 → 이미지 전환
+        scene.render.image_settings.file_format = fmt
+    samples = param(params, "BLOCKOUT_SAMPLES")
+    if samples:
+        if scene.render.engine == "CYCLES":
+            scene.cycles.samples = int(samples)
+        elif scene.render.engine.startswith("BLENDER_EEVEE"):
+            scene.eevee.taa_render_samples = int(samples)
+    if param(params, "BLOCKOUT_DEVICE").upper() == "CPU" and scene.render.engine == "CYCLES":
+        scene.cycles.device = "CPU"
+        scene["gpu_fallback"] = ""   # 요청한 CPU — 폴백 아님
+    from blockout_kit import autotune   # 지연 import — autotune 이 이 모듈의 param 을 쓴다
+    autotune.apply(scene, params)
+
+
+def output_path(default, view=None, params=None):
+    """BLOCKOUT_OUT 이 있으면 그 경로(뷰 이름 치환), 없으면 default."""
+    out = param(params, "BLOCKOUT_OUT")
+    if not out:
+        return default
+    out = out.replace("{view}", view or "")
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    return out
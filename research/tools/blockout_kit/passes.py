@@ -0,0 +1,292 @@
+"""보조 패스 — 깊이·법선·오브젝트/재질 인덱스·모션 벡터를 비치 렌더와 같은 렌더에서 함께 쓴다.
+
+점수·합성·재투영 도구가 기하 정보를 얻으려고 Blender 를 다시 띄우지 않게. telemetry.run 이 configure 뒤에
+attach() 로 뷰 레이어 패스를 켜고 컴포지터에 File Output 노드를 붙인다 — 비치 출력(PNG·MP4)은 그대로다.
+
+  BLOCKOUT_PASSES         "depth,normal,index,vector" 중 고른 것 / "all" (기본: 끔). index = 오브젝트+재질 인덱스
+  BLOCKOUT_PASSES_FORMAT  "exr" — 프레임당 멀티레이어 EXR 1개 (32비트 float, ZIP 무손실) /
+                          "npz" — 프레임당 np.savez_compressed 1개 (Blender 밖에서 NumPy 만으로 읽는다)
+
+출력은 비치 경로 옆 <비치 경로(확장자 뗀)>.passes/ — 법정 뷰마다·애니 출력마다 폴더 하나:
+  passes_0001.exr 또는 0001.npz …   프레임마다
+  index.json                         엔진, 패스별 채널, 엔진이 못 주는 패스(unavailable),
+                                     오브젝트·재질 인덱스 → 이름, 프레임 → 파일 + 카메라(matrix_world·렌즈·센서·클립)
+
+NPZ 배열 (행은 위→아래): depth (H,W) float32 · normal (H,W,3) float32 · object_index / material_index
+(H,W) uint16 (0 = 배경) · vector (H,W,4) float32. 모션 벡터는 Blender Vector 패스 그대로 —
+(이전 프레임으로 x, y, 다음 프레임으로 x, y) 픽셀 단위. 스틸은 0 이고, 모션 블러를 켠 Cycles 는 주지 않는다.
+
+엔진마다 주는 패스가 다르다 — Workbench(플레이트·v1~v3)는 depth 만, EEVEE(camera-follow)는 depth·normal·vector,
+Cycles(법정)는 전부. 못 주는 패스는 index.json 의 unavailable 에 남기고 건너뛴다.
+오브젝트·재질 pass_index 가 전부 0 이면 이름순 1.. 로 매겨 쓴다(이미 매긴 스크립트는 그대로).
+"""
+import glob
+import json
+import os
+import re
+
+from blockout_kit.overrides import param
+
+# 패스 → (뷰 레이어 플래그, Render Layers 소켓 이름 후보, 채널 수, NPZ dtype)
+PASSES = {
+    "depth": ("use_pass_z", ("Depth", "Z"), 1, "float32"),
+    "normal": ("use_pass_normal", ("Normal",), 3, "float32"),
+    "object_index": ("use_pass_object_index", ("IndexOB", "Object Index"), 1, "uint16"),
+    "material_index": ("use_pass_material_index", ("IndexMA", "Material Index"), 1, "uint16"),
+    "vector": ("use_pass_vector", ("Vector",), 4, "float32"),
+}
+ALIASES = {"index": ("object_index", "material_index")}
+_MOVIE_EXT = {".png", ".bmp", ".jpg", ".jpeg", ".exr", ".tif", ".tiff", ".webp", ".mp4", ".mkv", ".mov", ".avi"}
+
+
+def requested(params):
+    """BLOCKOUT_PASSES → 패스 이름 목록 (PASSES 순서)."""
+    spec = param(params, "BLOCKOUT_PASSES").lower()
+    if spec in ("", "0", "off"):
+        return []
+    if spec in ("1", "all"):
+        return list(PASSES)
+    names = set()
+    for part in filter(None, (p.strip() for p in spec.split(","))):
+        if part not in PASSES and part not in ALIASES:
+            raise ValueError(f"BLOCKOUT_PASSES: 모르는 패스 {part!r} (가능: depth, normal, index, vector)")
+        names.update(ALIASES.get(part, (part,)))
+    return [n for n in PASSES if n in names]
+
+
+def passes_dir(filepath):
+    """비치 출력 경로 → 패스 폴더. 확장자가 있으면 떼고, 프레임 접두어면 그대로 .passes 를 붙인다."""
+    import bpy
+    path = os.path.abspath(bpy.path.abspath(filepath))
+    root, ext = os.path.splitext(path)
+    return (root if ext.lower() in _MOVIE_EXT else path) + ".passes"
+
+
+def assign_indices(scene):
+    """렌더되는 메시 오브젝트·재질의 pass_index 가 전부 0 이면 이름순 1.. 로 매긴다. 반환: ({id: 이름}, {id: 이름}).
+    컬렉션 인스턴스(instancing.py)의 부품도 매긴다 — 같은 조립품의 인스턴스들은 한 id 를 공유한다."""
+    parts = [p for ob in scene.objects if ob.instance_type == "COLLECTION" and ob.instance_collection
+             and not ob.hide_render for p in ob.instance_collection.all_objects]
+    obs = sorted({ob for ob in list(scene.objects) + parts if ob.type == "MESH" and not ob.hide_render},
+                 key=lambda o: o.name)
+    mats = sorted({s.material for ob in obs for s in ob.material_slots if s.material}, key=lambda m: m.name)
+    for items in (obs, mats):
+        if items and not any(it.pass_index for it in items):
+            for i, it in enumerate(items, 1):
+                it.pass_index = i
+    return ({str(o.pass_index): o.name for o in obs if o.pass_index},
+            {str(m.pass_index): m.name for m in mats if m.pass_index})
+
+
+# ── 컴포지터 (4.x: scene.node_tree / 5.x: scene.compositing_node_group) ──
+def _compositor(scene):
+    """(노드 트리, 되돌리기 함수). 컴포지터가 없던 씬은 비치를 그대로 내보내는 최소 트리를 만든다."""
+    import bpy
+    if hasattr(scene, "compositing_node_group"):
+        tree = scene.compositing_node_group
+        if tree is not None:
+            return tree, lambda: None
+        tree = bpy.data.node_groups.new("blockout_passes", "CompositorNodeTree")
+        tree.interface.new_socket("Image", in_out="OUTPUT", socket_type="NodeSocketColor")
+        rl, out = tree.nodes.new("CompositorNodeRLayers"), tree.nodes.new("NodeGroupOutput")
+        tree.links.new(rl.outputs["Image"], out.inputs["Image"])
+        scene.compositing_node_group = tree
+
+        def restore():
+            scene.compositing_node_group = None
+            bpy.data.node_groups.remove(tree)
+        return tree, restore
+    was = scene.use_nodes
+    scene.use_nodes = True   # 처음 켜면 Render Layers → Composite 기본 트리가 생긴다
+    return scene.node_tree, lambda: setattr(scene, "use_nodes", was)
+
+
+def _socket(node, names):
+    for s in node.outputs:
+        if s.name in names and getattr(s, "enabled", True):
+            return s
+    return None
+
+
+def _file_output(tree, names, multilayer):
+    node = tree.nodes.new("CompositorNodeOutputFile")
+    node.name = node.label = "blockout_passes"
+    fmt = node.format
+    if hasattr(fmt, "media_type"):
+        fmt.media_type = "MULTI_LAYER_IMAGE" if multilayer else "IMAGE"
+    fmt.file_format = "OPEN_EXR_MULTILAYER" if multilayer else "OPEN_EXR"
+    fmt.color_depth = "32"
+    fmt.exr_codec = "ZIP"
+    if hasattr(node, "file_output_items"):   # 5.x
+        node.file_output_items.clear()
+        for n in names:
+            node.file_output_items.new("FLOAT" if PASSES[n][2] == 1 else "VECTOR" if PASSES[n][2] == 3 else "RGBA",
+                                       n if multilayer else n + "_")
+    else:
+        slots = node.layer_slots if multilayer else node.file_slots
+        slots.clear()
+        for n in names:
+            slots.new(n if multilayer else n + "_")
+    return node
+
+
+def _set_dir(node, directory, multilayer):
+    if hasattr(node, "directory"):   # 5.x
+        node.directory = directory + os.sep
+        node.file_name = "passes_" if multilayer else ""
+    else:
+        node.base_path = os.path.join(directory, "passes_") if multilayer else directory + os.sep
+
+
+def _camera(scene):
+    cam = scene.camera
+    if cam is None:
+        return None
+    d = cam.data
+    return {"matrix_world": [[round(v, 6) for v in row] for row in cam.matrix_world],
+            "lens": d.lens, "sensor_width": d.sensor_width, "sensor_fit": d.sensor_fit,
+            "shift": [d.shift_x, d.shift_y], "clip": [d.clip_start, d.clip_end]}
+
+
+def _exr_array(path):
+    """단일 레이어 EXR → (H, W, 4) float32, 행은 위→아래 (Blender 안 — 번들 NumPy)."""
+    import bpy
+    import numpy as np
+    img = bpy.data.images.load(path, check_existing=False)
+    try:
+        img.colorspace_settings.is_data = True
+        w, h = img.size
+        buf = np.empty(w * h * 4, dtype=np.float32)
+        img.pixels.foreach_get(buf)
+    finally:
+        bpy.data.images.remove(img)
+    return buf.reshape(h, w, 4)[::-1]
+
+
+class Passes:
+    """한 번의 run 동안 켜 둔 보조 패스. render_pre 에서 출력 폴더를 맞추고 render_post 에서 인덱스를 쓴다."""
+
+    def __init__(self, scene, names, fmt):
+        self.scene, self.fmt = scene, fmt
+        self.multilayer = fmt == "exr"
+        vl = scene.view_layers[0]
+        self._flags = {PASSES[n][0]: getattr(vl, PASSES[n][0]) for n in names}
+        for flag in self._flags:
+            setattr(vl, flag, True)
+        self.tree, self._restore_tree = _compositor(scene)
+        rl = next((n for n in self.tree.nodes if n.bl_idname == "CompositorNodeRLayers"), None) \
+            or self.tree.nodes.new("CompositorNodeRLayers")
+        sockets = {n: _socket(rl, PASSES[n][1]) for n in names}
+        self.names = [n for n in names if sockets[n] is not None]
+        self.unavailable = [n for n in names if sockets[n] is None]
+        self.node = None
+        if self.names:
+            self.node = _file_output(self.tree, self.names, self.multilayer)
+            for i, n in enumerate(self.names):
+                self.tree.links.new(sockets[n], self.node.inputs[i])
+        self.objects, self.materials = assign_indices(scene)
+        self.indexes = {}   # 패스 폴더 → index dict
+        self._dir = None
+        self._handlers = []
+
+    def attach(self):
+        import bpy
+        h = bpy.app.handlers
+        self._handlers = [(h.render_pre, self._on_pre), (h.render_post, self._on_post)]
+        for lst, fn in self._handlers:
+            lst.append(fn)
+
+    def detach(self):
+        for lst, fn in self._handlers:
+            if fn in lst:
+                lst.remove(fn)
+        self._handlers = []
+        if self.node is not None:
+            self.tree.nodes.remove(self.node)   # 씬을 재사용하는 다음 잡이 패스를 안 켰을 수 있다
+        self._restore_tree()
+        vl = self.scene.view_layers[0]
+        for flag, was in self._flags.items():
+            setattr(vl, flag, was)
+
+    def _on_pre(self, scene, *_):
+        if scene is not self.scene or self.node is None:
+            return
+        self.node.mute = bool(scene.get("blockout_prepass"))
+        if self.node.mute:   # 노이즈 프리패스 (courtroom noise_prepass) — 임시 폴더에 그리고 바로 지운다
+            self._dir = None
+            return
+        self._dir = passes_dir(scene.render.filepath)
+        os.makedirs(self._dir, exist_ok=True)
+        _set_dir(self.node, self._dir, self.multilayer)
+
+    def _on_post(self, scene, *_):
+        if scene is not self.scene or self._dir is None:
+            return
+        frame = scene.frame_current
+        files = sorted(glob.glob(os.path.join(glob.escape(self._dir), f"*{frame:04d}.exr")))
+        if self.fmt == "npz" and files:
+            files = [self._to_npz(files, frame)]
+        index = self.indexes.setdefault(self._dir, {
+            "engine": scene.render.engine, "format": self.fmt,
+            "res": [scene.render.resolution_x * scene.render.resolution_percentage // 100,
+                    scene.render.resolution_y * scene.render.resolution_percentage // 100],
+            "passes": {n: {"channels": PASSES[n][2], "dtype": PASSES[n][3]} for n in self.names},
+            "unavailable": self.unavailable, "objects": self.objects, "materials": self.materials,
+            "vector": "Blender Vector 패스 — (이전 x, 이전 y, 다음 x, 다음 y) 픽셀", "frames": {}})
+        index["frames"][str(frame)] = {"files": [os.path.basename(f) for f in files], "camera": _camera(scene)}
+        with open(os.path.join(self._dir, "index.json"), "w", encoding="utf-8") as fh:
+            json.dump(index, fh, ensure_ascii=False, indent=1)
+
+    def _to_npz(self, files, frame):
+        import numpy as np
+        arrays = {}
+        for path in files:
+            m = re.match(r"(.+?)_\d+\.exr$", os.path.basename(path))
+            name = m.group(1) if m else None
+            if name not in PASSES:
+                continue
+            px = _exr_array(path)
+            ch, dtype = PASSES[name][2], PASSES[name][3]
+            arr = px[..., 0] if ch == 1 else px[..., :ch]
+            arrays[name] = np.rint(arr).astype(dtype) if dtype == "uint16" else np.ascontiguousarray(arr, dtype=dtype)
+        out = os.path.join(self._dir, f"{frame:04d}.npz")
+        np.savez_compressed(out, **arrays)
+        for path in files:
+            os.remove(path)
+        return out
+
+    def summary(self):
+        """telemetry 의 passes 이벤트용 — 폴더별 프레임 수·바이트."""
+        out = []
+        for d, index in self.indexes.items():
+            if not os.path.isdir(d):   # 실행 중에 지워진 폴더 (임시 출력)
+                continue
+            size = sum(os.path.getsize(os.path.join(d, f)) for f in os.listdir(d))
+            out.append({"dir": d, "frames": len(index["frames"]), "bytes": size, "passes": self.names,
+                        "unavailable": self.unavailable, "format": self.fmt})
+        return out
+
+
+def attach(scene, params):
+    """BLOCKOUT_PASSES 가 켜져 있으면 패스를 켜고 핸들러를 건 Passes, 아니면 None."""
+    names = requested(params)
+    if not names:
+        return None
+    fmt = param(params, "BLOCKOUT_PASSES_FORMAT", "exr").lower()
+    if fmt not in ("exr", "npz"):
+        raise ValueError(f"BLOCKOUT_PASSES_FORMAT: exr 또는 npz (받은 값 {fmt!r})")
+    p = Passes(scene, names, fmt)
+    p.attach()
+    return p
+
+
+def load(index_path, frame):
+    """(Blender 밖) NPZ 패스 폴더의 index.json + 프레임 → {패스: 배열}. EXR 은 OpenEXR 리더로 직접 읽을 것."""
+    import numpy as np
+    with open(index_path, encoding="utf-8") as fh:
+        index = json.load(fh)
+    if index["format"] != "npz":
+        raise ValueError(f"NPZ 패스가 아님 ({index['format']}): {index_path}")
+    entry = index["frames"][str(frame)]
+    with np.load(os.path.join(os.path.dirname(index_path), entry["files"][0])) as z:
+        return {k: z[k] for k in z.files}
@@ -0,0 +1,140 @@
+"""블록아웃 렌더 풀 — 배치 매니페스트 1개를 Blender 프로세스 N개에 나눠 병렬로 돈다.
+
+batch.py 는 Blender 1세션에서 잡을 차례로 돈다(모듈·씬 재사용). 프로젝트 전체 previz(샷 수백 개)처럼
+잡끼리 씬을 공유하지 않는 배치는 한 프로세스로는 코어가 논다. 풀은 매니페스트를 N 조각으로 나눠
+조각마다 batch.py 를 띄운다 — tiled.py 처럼 프로세스당 스레드 = 코어 / N.
+
+  분배: 잡의 "cost"(없으면 frame_end - frame_start + 1, 그것도 없으면 1)가 큰 잡부터 지금 가장 가벼운
+        조각에 넣는다(LPT). "group" 이 같은 잡은 한 덩어리로 같은 조각에 — 씬 재사용(batch ②)을 지킨다.
+  결과: 매니페스트 옆 <이름>.pool/shard_NN.json (+ .batch.json · .log), 합본은 <이름>.pool.json
+        (조각별 초·잡 수·실패, 잡별 결과는 원래 매니페스트 순서로).
+
+실행 (Blender 밖, 표준 라이브러리만):
+  python research/tools/blockout_kit/pool.py manifest.json --workers 8 [--keep-going]
+  python research/tools/blockout_kit/pool.py manifest.json --plan          # 분배만 찍고 끝
+
+Blender 경로는 BLENDER 환경변수(기본 "blender"). 실패한 잡이 있으면 종료 코드 1.
+렌더 전에 autotune.ensure() — 이 호스트의 CPU 프로필이 다른 Blender/CPU 용이면 다시 튜닝하고 띄운다.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from blockout_kit import autotune  # noqa: E402
+from blockout_kit.batch import job_params  # noqa: E402
+
+BATCH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "batch.py")
+
+
+def job_cost(job):
+    if job.get("cost") is not None:
+        return float(job["cost"])
+    p = job_params(job)
+    if p.get("BLOCKOUT_FRAME_START") is not None and p.get("BLOCKOUT_FRAME_END") is not None:
+        return max(1, int(p["BLOCKOUT_FRAME_END"]) - int(p["BLOCKOUT_FRAME_START"]) + 1)
+    return 1.0
+
+
+def plan(jobs, workers):
+    """잡 → 조각 N개 (잡 인덱스 목록). group 단위 LPT — 조각 안 순서는 매니페스트 순서."""
+    units = {}
+    for i, job in enumerate(jobs):
+        units.setdefault(job.get("group", f"#{i}"), []).append(i)
+    cost = {k: sum(job_cost(jobs[i]) for i in idx) for k, idx in units.items()}
+    shards = [[] for _ in range(max(1, min(workers, len(units))))]
+    load = [0.0] * len(shards)
+    for k in sorted(units, key=lambda k: (-cost[k], units[k][0])):
+        s = load.index(min(load))
+        shards[s] += units[k]
+        load[s] += cost[k]
+    return [sorted(s) for s in shards], load
+
+
+def launch(blender, shard_paths, threads, keep_going):
+    procs = []
+    for path in shard_paths:
+        log = open(os.path.splitext(path)[0] + ".log", "w")
+        cmd = [blender, "--background", "-t", str(threads), "--python", BATCH, "--", path]
+        if keep_going:
+            cmd.append("--keep-going")
+        procs.append((path, subprocess.Popen(cmd, stdout=log, stderr=subprocess.STDOUT), log, time.time()))
+    done = []
+    for path, p, log, t0 in procs:
+        code = p.wait()
+        log.close()
+        done.append({"shard": path, "exit": code, "seconds": round(time.time() - t0, 2), "log": log.name})
+    return done
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="배치 매니페스트를 Blender N개 프로세스로 나눠 렌더")
+    ap.add_argument("manifest")
+    ap.add_argument("--workers", type=int, default=max(1, (os.cpu_count() or 1) // 4),
+                    help="Blender 프로세스 수 (기본 코어/4)")
+    ap.add_argument("--keep-going", action="store_true", help="조각 안에서 실패한 잡이 있어도 나머지를 돈다")
+    ap.add_argument("--plan", action="store_true", help="분배만 출력")
+    args = ap.parse_args(argv)
+
+    with open(args.manifest, encoding="utf-8") as fh:
+        doc = json.load(fh)
+    if isinstance(doc, list):
+        doc = {"jobs": doc}
+    jobs = doc["jobs"]
+    shards, load = plan(jobs, args.workers)
+    print(f"[pool] 잡 {len(jobs)}개 → 조각 {len(shards)}개, 비용 "
+          f"{' / '.join(f'{v:g}' for v in load)} (최대/평균 {max(load) / (sum(load) / len(load)):.2f})")
+    if args.plan:
+        for k, idx in enumerate(shards):
+            print(f"  shard_{k:02d}  {len(idx):4d}잡  비용 {load[k]:g}")
+        return 0
+
+    out_dir = os.path.splitext(args.manifest)[0] + ".pool"
+    os.makedirs(out_dir, exist_ok=True)
+    paths = []
+    for k, idx in enumerate(shards):
+        path = os.path.join(out_dir, f"shard_{k:02d}.json")
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump({"defaults": doc.get("defaults") or {}, "jobs": [jobs[i] for i in idx]}, fh,
+                      ensure_ascii=False, indent=2)
+        paths.append(path)
+
+    blender = os.environ.get("BLENDER", "blender")
+    autotune.ensure(blender, doc.get("defaults"))
+    t0 = time.perf_counter()
+    threads = max(1, (os.cpu_count() or 1) // len(paths))
+    procs = launch(blender, paths, threads, args.keep_going)
+
+    results = [None] * len(jobs)
+    for k, (proc, idx) in enumerate(zip(procs, shards)):
+        report = os.path.splitext(proc["shard"])[0] + ".batch.json"
+        recs = []
+        if os.path.exists(report):
+            with open(report, encoding="utf-8") as fh:
+                recs = json.load(fh)["results"]
+        for rec in recs:
+            results[idx[rec["index"]]] = dict(rec, index=idx[rec["index"]], shard=k)
+        proc.update(jobs=len(idx), ran=len(recs), failed=sum(r["state"] == "failed" for r in recs))
+    for i, rec in enumerate(results):
+        if rec is None:   # 조각이 죽었거나 앞선 실패로 멈췄다
+            results[i] = {"index": i, "script": jobs[i].get("script"), "state": "not_run"}
+
+    failed = [r for r in results if r["state"] != "done"]
+    merged = {"manifest": args.manifest, "jobs": len(jobs), "workers": len(paths), "threads": threads,
+              "failed": len(failed), "total_seconds": round(time.perf_counter() - t0, 2),
+              "shards": procs, "results": results}
+    out = os.path.splitext(args.manifest)[0] + ".pool.json"
+    with open(out, "w", encoding="utf-8") as fh:
+        json.dump(merged, fh, ensure_ascii=False, indent=2)
+    for p in procs:
+        print(f"[pool] {os.path.basename(p['shard'])} exit {p['exit']} {p['seconds']}s "
+              f"{p['ran']}/{p['jobs']}잡 실패 {p['failed']}")
+    print(f"[pool] DONE {len(jobs) - len(failed)}/{len(jobs)} 잡, {merged['total_seconds']}s → {out}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
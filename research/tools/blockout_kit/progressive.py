@@ -0,0 +1,125 @@
+"""점진 렌더 — 애니 프레임을 1→끝 순서가 아니라 거친→고운 순서로, 지금까지 프레임으로 늘 재생되는 프리뷰 MP4.
+
+v1~v3 애니는 1 에서 168 까지 차례로 그려서 안무 끝(v2 phase C 측면 트래킹 등)은 렌더가 다 끝나야 본다.
+점진 모드는 구간 양 끝·phase 경계(스크립트의 PHASE_FRAMES, 타임라인 마커)를 먼저 그리고, 그다음은 남은 가장
+긴 틈의 가운데를 계속 채운다(이분). 그린 프레임 수가 앵커 수 → 2배 → 4배 … 가 될 때마다 프리뷰를 다시 쓴다.
+프리뷰는 전 구간 길이 그대로이고 아직 안 그린 프레임은 직전에 그린 프레임을 유지해서, 실제 타이밍으로 재생된다.
+10% 쯤 그렸을 때 카메라 움직임이 틀렸으면 거기서 끊으면 된다.
+
+  BLOCKOUT_PROGRESSIVE  "1" — 점진 모드 (기본 끔 — 예전처럼 애니 렌더 1번)
+  순서      앵커(frame_start, frame_end, PHASE_FRAMES, 마커) → 가장 긴 틈부터 가운데 (같으면 앞쪽 먼저)
+  출력      MP4 스크립트는 PNG 프레임(<출력 stem>.frames/) → 다 그리면 VSE 로 MP4 (sequence.encode).
+            이미지 포맷(BLOCKOUT_FORMAT)이면 그 프레임 그대로.
+  프리뷰    <출력 stem>.preview.mp4 — 임시 파일에 인코딩한 뒤 os.replace 로 바꿔 끼운다(재생 중에도 깨지지 않는다).
+            <출력 stem>.progressive.json 에 순서·그린 수·프리뷰 갱신 이력(그린 비율, 초).
+
+스크립트 쪽 (blockout_sh_04_16.py / blockout_v2.py / blockout_v3.py):
+  def render(scene, params=None):
+      if progressive.enabled(params):
+          return progressive.render(scene, params, PHASE_FRAMES)
+"""
+import bisect
+import heapq
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from blockout_kit.overrides import param  # noqa: E402
+
+
+def enabled(params):
+    v = param(params, "BLOCKOUT_PROGRESSIVE").lower()
+    if v in ("", "0", "off"):
+        return False
+    if v not in ("1", "on"):
+        raise ValueError(f"BLOCKOUT_PROGRESSIVE 는 1/on (받은 값 {v})")
+    return True
+
+
+# ── 순서 (표준 라이브러리만) ──
+def order(first, last, anchors=()):
+    """first~last 를 거친→고운 순서로. 앵커(구간 밖은 버린다) 먼저, 그다음 가장 긴 틈의 가운데."""
+    head = sorted({first, last, *(f for f in anchors if first <= f <= last)})
+    out = list(head)
+    gaps = [(-(b - a), a, b) for a, b in zip(head, head[1:]) if b - a > 1]
+    heapq.heapify(gaps)
+    while gaps:
+        _, a, b = heapq.heappop(gaps)
+        m = (a + b) // 2
+        out.append(m)
+        for lo, hi in ((a, m), (m, b)):
+            if hi - lo > 1:
+                heapq.heappush(gaps, (-(hi - lo), lo, hi))
+    return out
+
+
+def held(done, first, last):
+    """프레임마다 그 자리 또는 직전에 그린 프레임 (done: 정렬된 그린 프레임, first 포함)."""
+    return [done[bisect.bisect_right(done, f) - 1] for f in range(first, last + 1)]
+
+
+def checkpoints(n_anchors, total):
+    """프리뷰를 다시 쓸 그린 수 — 앵커 수, 그 2배, 4배 … (끝은 최종 출력이 대신한다)."""
+    out, n = [], max(2, n_anchors)
+    while n < total:
+        out.append(n)
+        n *= 2
+    return out
+
+
+# ── Blender 안 ──
+def render(scene, params, anchors=()):
+    """점진 순서로 프레임을 그리며 프리뷰 갱신. 반환: [출력 경로] (MP4 면 다 그린 뒤 인코딩한 MP4)."""
+    import bpy
+    from blockout_kit import sequence
+    if scene.frame_step != 1:
+        raise ValueError("BLOCKOUT_PROGRESSIVE 는 BLOCKOUT_FRAME_STEP 과 같이 못 쓴다 (전 프레임을 채운다)")
+    first, last = scene.frame_start, scene.frame_end
+    marks = [m.frame for m in scene.timeline_markers]
+    head = {first, last, *(f for f in (*anchors, *marks) if first <= f <= last)}
+    seq = order(first, last, head)
+    final = scene.render.filepath
+    stem = os.path.splitext(final)[0]
+    movie = scene.render.is_movie_format
+    if movie:   # 프레임은 PNG 로 → 끝에 MP4 하나
+        if hasattr(scene.render.image_settings, "media_type"):
+            scene.render.image_settings.media_type = "IMAGE"
+        scene.render.image_settings.file_format = "PNG"
+        scene.render.filepath = os.path.join(stem + ".frames", "f_")
+    preview, status = stem + ".preview.mp4", stem + ".progressive.json"
+    todo = set(checkpoints(len(head), len(seq)))
+    report = {"frames": [first, last], "anchors": sorted(head), "order": seq, "rendered": 0,
+              "preview": preview, "updates": []}
+    t0 = time.perf_counter()
+    done = []
+    try:
+        for f in seq:
+            scene.frame_set(f)
+            bpy.ops.render.render(write_still=True)
+            bisect.insort(done, f)
+            if len(done) not in todo:
+                continue
+            part = stem + ".preview.part.mp4"
+            sequence.encode(scene, [(part, first, last)],
+                            files=[scene.render.frame_path(frame=g) for g in held(done, first, last)])
+            os.replace(part, preview)
+            report["rendered"] = len(done)
+            report["updates"].append({"rendered": len(done), "fraction": round(len(done) / len(seq), 3),
+                                      "seconds": round(time.perf_counter() - t0, 2)})
+            with open(status, "w", encoding="utf-8") as fh:
+                json.dump(report, fh, ensure_ascii=False, indent=1)
+            print(f"[progressive] {len(done)}/{len(seq)} 프레임 → 프리뷰 {preview}")
+    finally:
+        scene.frame_set(first)
+    if movie:
+        sequence.encode(scene, [(final, first, last)])
+        scene.render.filepath = final
+        sequence.video_settings(scene)
+    report["rendered"] = len(done)
+    report["seconds"] = round(time.perf_counter() - t0, 2)
+    with open(status, "w", encoding="utf-8") as fh:
+        json.dump(report, fh, ensure_ascii=False, indent=1)
+    print(f"[progressive] DONE {len(done)} 프레임 · 프리뷰 {len(report['updates'])}번 → {final}")
+    return [final]
@@ -0,0 +1,389 @@
+"""NumPy 플랫 셰이딩 래스터라이저 — Blender 없이 씬 IR 로 블록아웃 프리뷰를 그린다.
+
+블록아웃 3규칙(단순 도형만 / 색으로 종류만 / Workbench 플랫, 질감 없음)이면 Blender 렌더러가 할 일은
+투영 + z-버퍼 + 면 단위 명암뿐이다. 그래서 Blender 없는 기계에서도 시작 프레임·모션 레퍼런스를 만들 수
+있게 sceneir.py 의 IR(--geometry)을 직접 그린다:
+
+  · 변환 — 오브젝트 loc/rot(XYZ 오일러)/scale + 키프레임(선형 보간; 블록아웃 애니는 프레임마다 키) → 월드.
+  · 카메라 — 렌즈·센서 폭(AUTO 맞춤)·해상도 → 핀홀 투영. 근평면 클리핑(지면 판은 카메라 뒤까지 뻗는다).
+  · 면 단위 명암 — Workbench STUDIO 근사: 뷰 공간 키라이트(카메라 쪽에서, 약간 왼쪽 위) + 필 + 앰비언트.
+    카메라를 향한 면이 가장 밝고 윗면이 어두운 Workbench 의 성질(blockout_plate 주석의 실측)을 따른다.
+  · 색 — color_type OBJECT 면 오브젝트 색, MATERIAL 이면 첫 재질 기본색. 선형 → sRGB(Standard 뷰 변환).
+  · 배경 — 월드 색. 캐비티·그림자·AA 없음 (--ss 로 슈퍼샘플링).
+
+명암은 근사라 픽셀 값은 Workbench 와 다르다 — 구도·가림·시차·움직임 확인용이지 골든 이미지 대체가 아니다.
+bbox 가 작은 삼각형(박스 면 대부분)은 (삼각형, 화면 타일) 쌍 전부에 모서리 함수를 한꺼번에 평가해 조각
+(픽셀·1/z·삼각형)으로 모으고 z 판정은 픽셀별 최댓값 한 번(np.maximum.at)으로, bbox 가 큰 몇십 개(지면 판·가까운
+벽)만 하나씩 칠한다. 640×360 박스 수백 개 한 프레임이 삼각형마다 도는 루프의 절반 남짓. 정지 오브젝트의 월드
+삼각형은 첫 프레임에 한 번만 놓는다.
+
+IR 만들기 (Blender 있는 기계에서 한 번):
+  blender --background --python research/tools/blockout_kit/sceneir.py -- capture \\
+    research/experiments/previz-video-reference-ab/qual5-parallax/blockout_v3.py --geometry --out-dir irs/
+그리기 (NumPy 만):
+  python research/tools/blockout_kit/raster.py irs/blockout_v3.ir.json --frames 1,84,168 --out /tmp/v3_f
+  python research/tools/blockout_kit/raster.py irs/blockout_v3.ir.json --all --res 640x360 --mp4 /tmp/v3.mp4
+"""
+import argparse
+import json
+import math
+import os
+import shutil
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from blockout_kit.images import write_png  # noqa: E402
+
+# Workbench STUDIO 근사 — 뷰 공간(카메라 -Z 를 봄, +Y 위). 키는 카메라 쪽(+Z)에서 약간 왼쪽 위.
+KEY = np.array([-0.35, 0.25, 1.0]) / np.linalg.norm([-0.35, 0.25, 1.0])
+FILL = np.array([0.6, -0.2, 0.5]) / np.linalg.norm([0.6, -0.2, 0.5])
+AMBIENT, KEY_W, FILL_W = 0.12, 0.78, 0.18
+
+
+# ── 변환 ──
+def euler_xyz(rx, ry, rz):
+    cx, sx, cy, sy, cz, sz = math.cos(rx), math.sin(rx), math.cos(ry), math.sin(ry), math.cos(rz), math.sin(rz)
+    rot_x = np.array([[1, 0, 0], [0, cx, -sx], [0, sx, cx]])
+    rot_y = np.array([[cy, 0, sy], [0, 1, 0], [-sy, 0, cy]])
+    rot_z = np.array([[cz, -sz, 0], [sz, cz, 0], [0, 0, 1]])
+    return rot_z @ rot_y @ rot_x
+
+
+def key_value(keys, channel, frame, default):
+    """키프레임 채널 선형 보간 (구간 밖은 끝값 유지)."""
+    pts = keys.get(channel)
+    if not pts:
+        return default
+    if frame <= pts[0][0]:
+        return pts[0][1]
+    if frame >= pts[-1][0]:
+        return pts[-1][1]
+    fs = [p[0] for p in pts]
+    i = int(np.searchsorted(fs, frame))
+    (f0, v0), (f1, v1) = pts[i - 1], pts[i]
+    return v0 + (v1 - v0) * (frame - f0) / (f1 - f0)
+
+
+def object_matrix(objects, name, frame):
+    rec = objects[name]
+    keys = rec.get("keys", {})
+    loc = [key_value(keys, f"location[{i}]", frame, rec["loc"][i]) for i in range(3)]
+    rot = [key_value(keys, f"rotation_euler[{i}]", frame, rec["rot"][i]) for i in range(3)]
+    scl = [key_value(keys, f"scale[{i}]", frame, rec["scale"][i]) for i in range(3)]
+    m = np.eye(4)
+    m[:3, :3] = euler_xyz(*rot) * np.array(scl)
+    m[:3, 3] = loc
+    if rec.get("parent"):
+        m = object_matrix(objects, rec["parent"], frame) @ m
+    return m
+
+
+def srgb(linear):
+    linear = np.clip(linear, 0.0, 1.0)
+    return np.where(linear <= 0.0031308, linear * 12.92, 1.055 * np.power(linear, 1 / 2.4) - 0.055)
+
+
+# ── 장면 → 삼각형 ──
+class Prepared:
+    """프레임과 무관한 것 — 오브젝트별 로컬 삼각형·색. 애니 여러 프레임을 그릴 때 한 번만."""
+
+    def __init__(self, ir):
+        self.ir = ir
+        self.objects = ir["objects"]
+        render = ir["render"]
+        by_material = render.get("color_type") == "MATERIAL"
+        self.items = []
+        for name, rec in self.objects.items():
+            geom = rec.get("geom")
+            if rec["type"] != "MESH" or not geom or rec.get("hide_render"):
+                continue
+            verts = np.asarray(geom["v"], dtype=np.float64).reshape(-1, 3)
+            tris = [(f[0], f[i], f[i + 1]) for f in geom["f"] for i in range(1, len(f) - 1)]
+            if not tris:
+                continue
+            color = rec.get("color", [0.8, 0.8, 0.8, 1])[:3]
+            if by_material and rec.get("materials"):
+                color = rec["materials"][0]["color"][:3]
+            self.items.append((name, verts, np.asarray(tris, dtype=np.int64), np.asarray(color, dtype=np.float64)))
+        self.animated = {n for n, r in self.objects.items() if r.get("keys")}
+        self.world = np.asarray(ir.get("world", {}).get("color", [0.05, 0.05, 0.05])[:3])
+        # 프레임마다 다시 놓을 오브젝트 — 자기나 조상에 키가 있는 것. 나머지는 첫 프레임 월드 좌표를 그대로 쓴다.
+        self.moving = [k for k, (name, *_) in enumerate(self.items) if self._keyed(name)]
+        bounds = np.cumsum([0] + [len(idx) for _, _, idx, _ in self.items])
+        self.slices = [slice(a, b) for a, b in zip(bounds, bounds[1:])]
+        self._tris = None
+
+    def _keyed(self, name):
+        while name:
+            if self.objects[name].get("keys"):
+                return True
+            name = self.objects[name].get("parent")
+        return False
+
+    def triangles(self, frame):
+        """월드 좌표 삼각형 (N,3,3), 색 (N,3), 오브젝트 번호 (N,) — 번호는 self.items 순서.
+        삼각형 배열은 다음 호출이 덮어쓴다 (정지 오브젝트는 첫 호출 때 한 번만 채운다)."""
+        if not self.items:
+            return np.zeros((0, 3, 3)), np.zeros((0, 3)), np.zeros(0, dtype=np.int64)
+        todo = self.moving
+        if self._tris is None:
+            self._tris = np.empty((self.slices[-1].stop, 3, 3))
+            self._cols = np.concatenate([np.broadcast_to(c, (len(idx), 3)) for _, _, idx, c in self.items])
+            self._ids = np.concatenate([np.full(len(idx), k) for k, (_, _, idx, _) in enumerate(self.items)])
+            todo = range(len(self.items))
+        for k in todo:
+            name, verts, idx, _ = self.items[k]
+            m = object_matrix(self.objects, name, frame)
+            self._tris[self.slices[k]] = (verts @ m[:3, :3].T + m[:3, 3])[idx]
+        return self._tris, self._cols, self._ids
+
+
+def camera(ir, frame, w, h):
+    """(뷰 행렬 4×4, 픽셀 초점거리, 근평면)."""
+    objects = ir["objects"]
+    name = ir["render"].get("camera") or next(n for n, r in objects.items() if r["type"] == "CAMERA")
+    m = object_matrix(objects, name, frame)
+    m[:3, :3] /= np.linalg.norm(m[:3, :3], axis=0)   # 카메라 scale 무시
+    data = objects[name].get("data", {})
+    keys = objects[name].get("keys", {})
+    lens = key_value(keys, "data.lens[0]", frame, data.get("lens", 50.0))
+    sensor = data.get("sensor_width", 36.0)
+    fit = data.get("sensor_fit", "AUTO")
+    span = h if fit == "VERTICAL" or (fit == "AUTO" and h > w) else w
+    near = (data.get("clip") or [0.1])[0]
+    return np.linalg.inv(m), lens / sensor * span, near
+
+
+def clip_near(tri_cam, cols, near):
+    """카메라 공간 삼각형을 z = -near 평면으로 자른다 (앞: z < -near). 걸친 것은 1~2개로 쪼갠다.
+    cols 는 삼각형마다 붙은 속성 행(색 등) — 쪼갠 조각이 그대로 물려받는다."""
+    inside = tri_cam[:, :, 2] < -near
+    n_in = inside.sum(axis=1)
+    keep_t, keep_c = [tri_cam[n_in == 3]], [cols[n_in == 3]]
+    for t, c, ins in zip(tri_cam[(n_in == 1) | (n_in == 2)], cols[(n_in == 1) | (n_in == 2)],
+                         inside[(n_in == 1) | (n_in == 2)]):
+        poly = []
+        for i in range(3):
+            a, b = t[i], t[(i + 1) % 3]
+            ia, ib = ins[i], ins[(i + 1) % 3]
+            if ia:
+                poly.append(a)
+            if ia != ib:
+                s = (-near - a[2]) / (b[2] - a[2])
+                poly.append(a + s * (b - a))
+        for i in range(1, len(poly) - 1):
+            keep_t.append(np.array([[poly[0], poly[i], poly[i + 1]]]))
+            keep_c.append(c[None])
+    return np.concatenate(keep_t), np.concatenate(keep_c)
+
+
+BIG = 1024   # bbox 픽셀 수 — 이 이상은 삼각형 하나씩 (루프 1회 고정비 < 그만큼 조각을 모으고 가르는 비용)
+TILE = 4     # 작을수록 걸친 타일의 헛검사가 줄고 쌍이 늘어난다 (박스 블록아웃에서 4·8 이 비슷)
+
+
+def planes(sx, sy, inv_z):
+    """화면 삼각형 → 모서리 함수 A x + B y + C (각 (N, 3) — 모서리 k 는 맞은편 꼭짓점 k 의 무게중심 좌표 × |area|,
+    안쪽이 양수), 1/z 평면 (N, 3) = Dx x + Dy y + Dc, 넓이가 0 이 아닌지 (N,)."""
+    (ax, bx, cx), (ay, by, cy) = sx.T, sy.T
+    area = (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+    sign = np.sign(area)[:, None]   # 시계 방향 삼각형도 안쪽이 양수가 되게
+    A = np.stack([by - cy, cy - ay, ay - by], 1) * sign
+    B = np.stack([cx - bx, ax - cx, bx - ax], 1) * sign
+    C = np.stack([bx * cy - by * cx, cx * ay - cy * ax, ax * by - ay * bx], 1) * sign
+    ok = np.abs(area) >= 1e-12
+    norm = inv_z / np.where(ok, np.abs(area), 1.0)[:, None]   # 1/z 도 화면 공간에서 선형
+    D = np.stack([np.einsum("ij,ij->i", K, norm) for K in (A, B, C)], 1)
+    return A, B, C, D, ok
+
+
+def fragments(edges, x0s, x1s, y0s, y1s, W, H, which, chunk=1 << 22):
+    """which 삼각형이 덮는 픽셀 조각 → (픽셀 번호 y*W+x, 1/z, 삼각형 번호). 모서리 함수를 타일 묶음에 벡터로.
+    삼각형 bbox 를 화면 고정 TILE×TILE 타일로 나눠 (삼각형, 타일) 쌍을 만든다. 모서리 함수는 선형이라 타일 안
+    최소·최대가 귀퉁이 픽셀 중심에서 나온다 — 한 모서리라도 최대가 음수면 버리고, 세 모서리 모두 최소가 0
+    이상이면 검사 없이 타일 전부, 나머지(걸친 타일)만 픽셀마다 (n, T, T) 로 검사한다. 한 묶음은 chunk 원소 이하."""
+    A, B, C, D, ok = edges
+    live = which[ok[which]]
+    tx0, ty0 = x0s[live] // TILE, y0s[live] // TILE
+    ntx = -(-x1s[live] // TILE) - tx0
+    count = ntx * (-(-y1s[live] // TILE) - ty0)
+    k = np.arange(count.sum()) - np.repeat(np.cumsum(count) - count, count)
+    tri = np.repeat(live, count)
+    ntx = np.repeat(ntx, count)
+    tx = (np.repeat(tx0, count) + k % ntx) * TILE
+    ty = (np.repeat(ty0, count) + k // ntx) * TILE
+    a, b = A[tri], B[tri]   # (P, 3)
+    corner = C[tri] + a * (tx + 0.5)[:, None] + b * (ty + 0.5)[:, None]
+    da, db = a * (TILE - 1), b * (TILE - 1)
+    keep = (corner + np.maximum(da, 0) + np.maximum(db, 0) >= 0).all(1)
+    full = (corner + np.minimum(da, 0) + np.minimum(db, 0) >= 0).all(1) & (tx + TILE <= W) & (ty + TILE <= H)
+    jj, ii = np.divmod(np.arange(TILE * TILE), TILE)
+    step = max(1, chunk // (TILE * TILE))
+    out = []
+
+    sel = keep & full   # 다 덮인 타일 — 픽셀 전부, 검사·nonzero 없이
+    t, x, y = tri[sel], tx[sel], ty[sel]
+    for s in range(0, len(t), step):
+        tt, xx, yy = t[s:s + step], x[s:s + step], y[s:s + step]
+        dx, dy = D[tt, 0, None], D[tt, 1, None]
+        z0 = dx * (xx[:, None] + 0.5) + dy * (yy[:, None] + 0.5) + D[tt, 2, None]
+        out.append((((yy * W + xx)[:, None] + (jj * W + ii)).ravel(),
+                    (z0 + dx * ii + dy * jj).ravel(), np.repeat(tt, TILE * TILE)))
+
+    sel = keep & ~full   # 걸친 타일 — 픽셀마다 세 모서리
+    t, x, y = tri[sel], tx[sel], ty[sel]
+    for s in range(0, len(t), step):
+        tt, xx, yy = t[s:s + step], x[s:s + step], y[s:s + step]
+        ox = xx[:, None] + np.arange(TILE)   # (n, T)
+        oy = yy[:, None] + np.arange(TILE)
+        ex = A[tt, :, None] * (ox + 0.5)[:, None] + C[tt, :, None]   # (n, 3, T) 모서리별 열 몫
+        ey = B[tt, :, None] * (oy + 0.5)[:, None]                    # (n, 3, T) 행 몫
+        ex[:, 0][ox >= W] = -np.inf   # 화면 밖 열·행 (bbox 밖 픽셀은 이미 삼각형 밖)
+        ey[:, 0][oy >= H] = -np.inf
+        mask = ex[:, 0, None, :] + ey[:, 0, :, None] >= 0
+        mask &= ex[:, 1, None, :] + ey[:, 1, :, None] >= 0
+        mask &= ex[:, 2, None, :] + ey[:, 2, :, None] >= 0
+        n, p = np.divmod(np.flatnonzero(mask), TILE * TILE)
+        px, py = xx[n] + ii[p], yy[n] + jj[p]
+        t_n = tt[n]
+        out.append((py * W + px, D[t_n, 0] * (px + 0.5) + D[t_n, 1] * (py + 0.5) + D[t_n, 2], t_n))
+    if not out:
+        return np.zeros(0, dtype=np.int64), np.zeros(0), np.zeros(0, dtype=np.int64)
+    return tuple(np.concatenate(c) for c in zip(*out))
+
+
+def rasterize(prep, frame, W, H):
+    """프레임 1장 → (선형 색 (H,W,3), 1/z 버퍼 (H,W) — 0 = 배경, 오브젝트 번호 (H,W) — -1 = 배경)."""
+    view, focal, near = camera(prep.ir, frame, W, H)
+    tris, cols, ids = prep.triangles(frame)
+    cam = tris @ view[:3, :3].T + view[:3, 3]
+    # 면 법선(뷰 공간) — 후면 제거 + 명암
+    n = np.cross(cam[:, 1] - cam[:, 0], cam[:, 2] - cam[:, 0])
+    n /= np.linalg.norm(n, axis=1, keepdims=True) + 1e-12
+    front = np.einsum("ij,ij->i", n, cam[:, 0]) < 0
+    cam, cols, ids, n = cam[front], cols[front], ids[front], n[front]
+    shade = AMBIENT + KEY_W * np.clip(n @ KEY, 0, None) + FILL_W * np.clip(n @ FILL, 0, None)
+    attrs = np.column_stack([cols * shade[:, None], ids])   # 근평면에서 쪼갠 삼각형도 색·번호를 따라간다
+    cam, attrs = clip_near(cam, attrs, near)
+    cols, ids = attrs[:, :3], attrs[:, 3].astype(np.int64)
+
+    # 투영 — 픽셀 중심 좌표, y 아래로
+    z = -cam[:, :, 2]
+    sx = focal * cam[:, :, 0] / z + W / 2
+    sy = H / 2 - focal * cam[:, :, 1] / z
+    edges = planes(sx, sy, 1.0 / z)
+    A, B, C, D, ok = edges
+    img = np.empty((H, W, 3))
+    img[:] = prep.world
+    zbuf = np.zeros((H, W))   # 1/z — 클수록 가깝다, 0 = 무한대
+    obj = np.full((H, W), -1, dtype=np.int64)
+    x0s = np.clip(np.floor(sx.min(1)).astype(int), 0, W)
+    x1s = np.clip(np.ceil(sx.max(1)).astype(int) + 1, 0, W)
+    y0s = np.clip(np.floor(sy.min(1)).astype(int), 0, H)
+    y1s = np.clip(np.ceil(sy.max(1)).astype(int) + 1, 0, H)
+    size = (x1s - x0s) * (y1s - y0s)
+    # 큰 삼각형(지면 판·가까운 벽)은 하나씩 bbox 통째로 — 호출 몇 번에 픽셀이 많아 루프가 싸다.
+    # 모서리 함수·1/z 가 선형이라 열 몫 + 행 몫의 합으로 편다.
+    first = np.full((H, W), len(cols), dtype=np.int64)   # 픽셀마다 이긴 삼각형 번호, len(cols) = 배경
+    for i in np.nonzero((size >= BIG) & ok)[0]:
+        px = np.arange(x0s[i], x1s[i]) + 0.5
+        py = (np.arange(y0s[i], y1s[i]) + 0.5)[:, None]
+        ex, ey = A[i, :, None] * px + C[i, :, None], B[i, :, None, None] * py
+        win = ex[0] + ey[0] >= 0
+        win &= ex[1] + ey[1] >= 0
+        win &= ex[2] + ey[2] >= 0
+        iz = (D[i, 0] * px + D[i, 2]) + D[i, 1] * py
+        tile = zbuf[y0s[i]:y1s[i], x0s[i]:x1s[i]]
+        win &= iz > tile
+        tile[win] = iz[win]
+        first[y0s[i]:y1s[i], x0s[i]:x1s[i]][win] = i
+    # 나머지(박스 면 수천 개)는 조각으로 한꺼번에 — 픽셀마다 가장 가까운 조각, 같은 깊이면 앞 삼각형
+    # (삼각형 순서대로 칠하던 것과 같은 결과)
+    pix, iz, tri = fragments(edges, x0s, x1s, y0s, y1s, W, H, np.nonzero((size > 0) & (size < BIG))[0])
+    flat, first = zbuf.reshape(-1), first.reshape(-1)
+    before = flat.copy()
+    np.maximum.at(flat, pix, iz)
+    first[flat > before] = len(cols)   # 큰 삼각형보다 가까운 조각이 생긴 픽셀
+    win = iz == flat[pix]
+    np.minimum.at(first, pix[win], tri[win])
+    hit = first < len(cols)
+    img.reshape(-1, 3)[hit] = cols[first[hit]]
+    obj.reshape(-1)[hit] = ids[first[hit]]
+    return img, zbuf, obj
+
+
+def render_frame(prep, frame, w, h, ss=1):
+    """프레임 1장 → (h, w, 3) uint8."""
+    img, _, _ = rasterize(prep, frame, w * ss, h * ss)
+    out = srgb(img)
+    if ss > 1:
+        out = out.reshape(h, ss, w, ss, 3).mean(axis=(1, 3))
+    return (out * 255 + 0.5).astype(np.uint8)
+
+
+def parse_frames(spec, ir):
+    start, end = ir["render"]["frames"]
+    if spec == "all":
+        return list(range(start, end + 1))
+    out = []
+    for part in spec.split(","):
+        if "-" in part:
+            a, b = part.split("-")
+            out += list(range(int(a), int(b) + 1))
+        else:
+            out.append(int(part))
+    return out
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="씬 IR → 플랫 셰이딩 프리뷰 (Blender 없이)")
+    ap.add_argument("ir", help="sceneir.py capture --geometry 결과")
+    ap.add_argument("--frames", default=None, help="1,84,168 또는 1-24 (기본: 시작 프레임)")
+    ap.add_argument("--all", action="store_true", help="IR 의 프레임 구간 전부")
+    ap.add_argument("--res", help="WxH (기본: IR 해상도 × pct)")
+    ap.add_argument("--ss", type=int, default=1, help="슈퍼샘플 배수 (AA)")
+    ap.add_argument("--out", default="preview_", help="PNG 접두어 → <접두어>0001.png")
+    ap.add_argument("--mp4", help="ffmpeg 가 있으면 프레임을 MP4 로 (PNG 는 안 쓴다)")
+    args = ap.parse_args(argv)
+
+    with open(args.ir, encoding="utf-8") as fh:
+        ir = json.load(fh)
+    if not any("geom" in r for r in ir["objects"].values()):
+        raise SystemExit("[raster] IR 에 기하가 없다 — sceneir.py capture --geometry 로 다시 뜰 것")
+    r = ir["render"]
+    if args.res:
+        w, h = (int(v) for v in args.res.lower().split("x"))
+    else:
+        w, h = (round(v * r.get("pct", 100) / 100) for v in r["res"])
+    frames = parse_frames("all" if args.all else args.frames or str(r["frames"][0]), ir)
+    prep = Prepared(ir)
+
+    ff = None
+    if args.mp4:
+        if not shutil.which("ffmpeg"):
+            raise SystemExit("[raster] ffmpeg 없음 — --out 으로 PNG 를 쓸 것")
+        ff = subprocess.Popen(["ffmpeg", "-y", "-loglevel", "error", "-f", "rawvideo", "-pix_fmt", "rgb24",
+                               "-s", f"{w}x{h}", "-r", str(r.get("fps", 24)), "-i", "-",
+                               "-c:v", "libx264", "-pix_fmt", "yuv420p", args.mp4], stdin=subprocess.PIPE)
+    t0 = time.perf_counter()
+    for f in frames:
+        img = render_frame(prep, f, w, h, args.ss)
+        if ff:
+            ff.stdin.write(img.tobytes())
+        else:
+            path = f"{args.out}{f:04d}.png"
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            write_png(path, w, h, [row.tobytes() for row in img])
+    if ff:
+        ff.stdin.close()
+        ff.wait()
+    dt = time.perf_counter() - t0
+    print(f"[raster] {len(frames)} 프레임 {w}x{h} · {1000 * dt / len(frames):.1f} ms/프레임 → {args.mp4 or args.out + '####.png'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
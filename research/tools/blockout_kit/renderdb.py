@@ -0,0 +1,266 @@
+"""렌더 이력 SQLite — 모든 블록아웃 실행의 렌더 시간을 쌓고 실행 간 회귀를 질의한다.
+
+telemetry.run() 이 실행 끝에 record() 로 그 실행의 이벤트를 넣는다(단독·배치·워커·벤치 전부).
+JSONL(telemetry.py)이 실행 1회의 원본 기록이라면 여기는 "법정 시트가 CPU 노드에서 2분 → 10분으로
+늘었나" 같은 질문용 — 뷰·프레임 단위 행에 스크립트·scene_hash·샘플·해상도·디바이스가 붙어 있다.
+
+  runs    실행 1행: script, shot, host, blender, scene_hash, engine, device, samples, 해상도,
+          status, build_s, render_s, seconds, peak_rss_mb, params(JSON)
+  frames  렌더 1행(스틸 1장·애니 1프레임): run_id, view, frame, samples, device, total/sync/trace/write 초,
+          phase (노이즈 프리패스면 "prepass" — views·frames 질의는 빼고 본다. 예전 DB 는 connect 가 열을 붙이고,
+          열 생기기 전에 쌓인 프리패스 행은 ingest 로 JSONL 을 다시 넣으면 갈린다)
+
+device 는 실제 쓰인 것 — "CPU-fallback" 은 GPU 를 골랐는데 장치가 없거나 설정이 실패한 실행이다.
+shot 은 params 의 BLOCKOUT_SHOT, 없으면 스크립트 경로의 sh_NN_NN, 그것도 없으면 스크립트 이름.
+
+질의 (Blender 밖, 표준 라이브러리만):
+  python research/tools/blockout_kit/renderdb.py views --script courtroom --by week     # 뷰별 p50/p95 추이
+  python research/tools/blockout_kit/renderdb.py frames --script blockout_v3 --limit 10   # 최근 실행의 느린 프레임
+  python research/tools/blockout_kit/renderdb.py shots --days 30                          # 샷별 렌더 비용
+  python research/tools/blockout_kit/renderdb.py ingest ~/.cache/blockout/telemetry.jsonl # JSONL 소급 적재
+
+  BLOCKOUT_RENDER_DB  DB 경로 (기본 ~/.cache/blockout/renders.sqlite, "off" 면 record() 가 아무것도 안 한다)
+"""
+import argparse
+import json
+import os
+import re
+import sqlite3
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from blockout_kit.overrides import param  # noqa: E402
+
+DEFAULT_PATH = os.path.join(os.path.expanduser("~"), ".cache", "blockout", "renders.sqlite")
+_SHOT = re.compile(r"sh_\d+_\d+")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+  run_id TEXT PRIMARY KEY, ts REAL, script TEXT, shot TEXT, host TEXT, blender TEXT, scene_hash TEXT,
+  engine TEXT, device TEXT, samples INTEGER, res_x INTEGER, res_y INTEGER, pct INTEGER,
+  status TEXT, error TEXT, build_s REAL, render_s REAL, seconds REAL, peak_rss_mb REAL, params TEXT);
+CREATE TABLE IF NOT EXISTS frames (
+  run_id TEXT, ts REAL, script TEXT, scene_hash TEXT, view TEXT, frame INTEGER, samples INTEGER,
+  res_x INTEGER, res_y INTEGER, device TEXT, total_s REAL, sync_s REAL, trace_s REAL, write_s REAL, phase TEXT);
+CREATE INDEX IF NOT EXISTS frames_script_view ON frames (script, view, ts);
+CREATE INDEX IF NOT EXISTS runs_shot ON runs (shot, ts);
+"""
+
+
+def db_path(params=None):
+    """params → 환경변수 → 기본값. 꺼져 있으면 None."""
+    path = param(params, "BLOCKOUT_RENDER_DB", DEFAULT_PATH)
+    return None if path.lower() in ("", "0", "off") else path
+
+
+def connect(path):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    con = sqlite3.connect(path, timeout=30)   # 배치·워커·병렬 타일이 같은 파일에 쓴다
+    con.executescript(SCHEMA)
+    if "phase" not in {row[1] for row in con.execute("PRAGMA table_info(frames)")}:   # phase 열 이전 DB
+        con.execute("ALTER TABLE frames ADD COLUMN phase TEXT")
+    return con
+
+
+def shot_of(script, params):
+    if params.get("BLOCKOUT_SHOT"):
+        return str(params["BLOCKOUT_SHOT"])
+    m = _SHOT.search(script)
+    return m.group(0) if m else os.path.splitext(os.path.basename(script))[0]
+
+
+def rows(events):
+    """실행 1회의 이벤트 목록 → (runs 행 dict, frames 행 dict 목록)."""
+    by = {}
+    for e in events:
+        by.setdefault(e["event"], []).append(e)
+    first = events[0]
+    start = (by.get("run_start") or [{}])[0]
+    scene = (by.get("scene") or [{}])[0]
+    render = (by.get("render") or [{}])[0]
+    end = (by.get("run_end") or [{}])[0]
+    phases = {e["phase"]: e["seconds"] for e in by.get("phase", [])}
+    params = start.get("params") or {}
+    res = render.get("res") or [None, None]
+    device = render.get("device") or render.get("engine")
+    run = {"run_id": first["run_id"], "ts": first["ts"], "script": first["script"],
+           "shot": shot_of(first["script"], params), "host": start.get("host"), "blender": start.get("blender"),
+           "scene_hash": scene.get("scene_hash"), "engine": render.get("engine"), "device": device,
+           "samples": render.get("samples"), "res_x": res[0], "res_y": res[1], "pct": render.get("pct"),
+           "status": end.get("status", "unknown"), "error": end.get("error"),
+           "build_s": phases.get("build"), "render_s": phases.get("render"), "seconds": end.get("seconds"),
+           "peak_rss_mb": end.get("peak_rss_mb"), "params": json.dumps(params, ensure_ascii=False, default=str)}
+    scale = (render.get("pct") or 100) / 100
+    frames = [{"run_id": run["run_id"], "ts": f["ts"], "script": run["script"], "scene_hash": run["scene_hash"],
+               "view": f.get("view"), "frame": f.get("frame"), "samples": f.get("samples", run["samples"]),
+               "res_x": round(res[0] * scale) if res[0] else None, "res_y": round(res[1] * scale) if res[1] else None,
+               "device": device, "total_s": f.get("total_s"), "sync_s": f.get("sync_s"),
+               "trace_s": f.get("trace_s"), "write_s": f.get("write_s"), "phase": f.get("phase")}
+              for f in by.get("frame", [])]
+    return run, frames
+
+
+def insert(con, events):
+    run, frames = rows(events)
+    with con:
+        con.execute("DELETE FROM frames WHERE run_id = ?", (run["run_id"],))
+        con.execute(f"INSERT OR REPLACE INTO runs ({', '.join(run)}) VALUES ({', '.join('?' * len(run))})",
+                    tuple(run.values()))
+        if frames:
+            cols = list(frames[0])
+            con.executemany(f"INSERT INTO frames ({', '.join(cols)}) VALUES ({', '.join('?' * len(cols))})",
+                            [tuple(f[c] for c in cols) for f in frames])
+
+
+def record(events, params=None):
+    """telemetry.run() 끝에서 — 실행 1회의 이벤트를 적재. 실패해도 렌더는 죽이지 않는다."""
+    path = db_path(params)
+    if not path or not events:
+        return
+    try:
+        con = connect(path)
+        try:
+            insert(con, events)
+        finally:
+            con.close()
+    except sqlite3.Error as exc:
+        print(f"[renderdb] 기록 실패 {path}: {exc}", file=sys.stderr)
+
+
+# ── 질의 ──
+def percentile(vals, q):
+    """선형 보간 백분위 (q: 0~100)."""
+    vals = sorted(vals)
+    if not vals:
+        return None
+    k = (len(vals) - 1) * q / 100
+    lo = int(k)
+    hi = min(lo + 1, len(vals) - 1)
+    return vals[lo] + (vals[hi] - vals[lo]) * (k - lo)
+
+
+def _where(args, table="frames"):
+    sql, vals = [], []
+    if table == "frames":   # 프리패스 렌더는 뷰 렌더 시간이 아니다
+        sql.append("frames.phase IS NULL")
+    if args.script:
+        sql.append(f"{table}.script LIKE ?")
+        vals.append(f"%{args.script}%")
+    if getattr(args, "device", None):
+        sql.append(f"{table}.device LIKE ?")
+        vals.append(f"{args.device}%")
+    if args.days:
+        sql.append(f"{table}.ts >= ?")
+        vals.append(time.time() - args.days * 86400)
+    return (" WHERE " + " AND ".join(sql) if sql else ""), vals
+
+
+def _period(ts, by):
+    t = time.localtime(ts)
+    if by == "week":
+        return time.strftime("%G-W%V", t)
+    if by == "month":
+        return time.strftime("%Y-%m", t)
+    return time.strftime("%Y-%m-%d", t)
+
+
+def _table(header, body):
+    widths = [max(len(str(r[i])) for r in [header] + body) for i in range(len(header))]
+    for r in [header] + body:
+        print("  ".join(str(v).ljust(w) for v, w in zip(r, widths)).rstrip())
+
+
+def _s(v):
+    return "-" if v is None else f"{v:.2f}"
+
+
+def cmd_views(con, args):
+    """뷰 × 기간(× 디바이스)별 렌더 초 p50/p95."""
+    where, vals = _where(args)
+    groups = {}
+    for script, view, device, ts, total in con.execute(
+            f"SELECT script, view, device, ts, total_s FROM frames{where} ORDER BY ts", vals):
+        key = (os.path.basename(script), view, device, _period(ts, args.by))
+        groups.setdefault(key, []).append(total)
+    body = [[s, v, d, p, len(xs), _s(percentile(xs, 50)), _s(percentile(xs, 95))]
+            for (s, v, d, p), xs in sorted(groups.items())]
+    _table(["script", "view", "device", args.by, "n", "p50_s", "p95_s"], body)
+
+
+def cmd_frames(con, args):
+    """한 실행(기본: 조건에 맞는 최근 실행)의 프레임을 느린 순으로."""
+    run_id = args.run
+    if not run_id:
+        where, vals = _where(args, "runs")
+        row = con.execute(f"SELECT run_id FROM runs{where} ORDER BY ts DESC LIMIT 1", vals).fetchone()
+        if not row:
+            print("[renderdb] 맞는 실행 없음", file=sys.stderr)
+            return 1
+        run_id = row[0]
+    run = con.execute("SELECT script, device, samples, scene_hash FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+    print(f"run {run_id}  {run[0] if run else '?'}  device {run[1] if run else '?'}  hash {run[3] if run else '?'}")
+    body = [[v, f, smp, _s(t), _s(sy), _s(tr), _s(w)] for v, f, smp, t, sy, tr, w in con.execute(
+        "SELECT view, frame, samples, total_s, sync_s, trace_s, write_s FROM frames "
+        "WHERE run_id = ? AND phase IS NULL ORDER BY total_s DESC LIMIT ?", (run_id, args.limit))]
+    _table(["view", "frame", "samples", "total_s", "sync_s", "trace_s", "write_s"], body)
+    return 0
+
+
+def cmd_shots(con, args):
+    """샷별 비용 — 실행 수, 렌더 초 합(프레임 합), 실행당 평균 총 초, 최근 디바이스."""
+    where, vals = _where(args, "runs")
+    body = []
+    for shot, n, ok, render_sum, mean_s, last_device in con.execute(
+            f"SELECT shot, COUNT(*), SUM(status = 'ok'), SUM(render_s), AVG(seconds), "
+            f"(SELECT device FROM runs r2 WHERE r2.shot = runs.shot ORDER BY ts DESC LIMIT 1) "
+            f"FROM runs{where} GROUP BY shot ORDER BY SUM(render_s) DESC", vals):
+        body.append([shot, n, ok, _s(render_sum), _s(mean_s), last_device])
+    _table(["shot", "runs", "ok", "render_s_total", "run_s_mean", "last_device"], body)
+
+
+def cmd_ingest(con, args):
+    """telemetry.jsonl → DB (run_id 별로 묶어 다시 넣는다 — 이미 있는 실행은 덮어쓴다)."""
+    runs = {}
+    with open(args.jsonl, encoding="utf-8") as fh:
+        for line in fh:
+            if line.strip():
+                e = json.loads(line)
+                runs.setdefault(e["run_id"], []).append(e)
+    for events in runs.values():
+        insert(con, events)
+    print(f"[renderdb] {len(runs)} 실행 적재 ← {args.jsonl}")
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="블록아웃 렌더 이력 질의")
+    ap.add_argument("--db", default=None, help="기본: BLOCKOUT_RENDER_DB 또는 ~/.cache/blockout/renders.sqlite")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    def filters(p):
+        p.add_argument("--script", help="스크립트 경로 일부 (courtroom, blockout_v3 …)")
+        p.add_argument("--days", type=float, help="최근 N일만")
+        return p
+
+    p = filters(sub.add_parser("views", help="뷰별 렌더 초 p50/p95 추이"))
+    p.add_argument("--by", choices=("day", "week", "month"), default="day")
+    p.add_argument("--device", help="CPU / CPU-fallback / GPU …")
+    p = filters(sub.add_parser("frames", help="한 실행의 느린 프레임"))
+    p.add_argument("--run", help="run_id (기본: 최근 실행)")
+    p.add_argument("--limit", type=int, default=20)
+    filters(sub.add_parser("shots", help="샷별 렌더 비용"))
+    p = sub.add_parser("ingest", help="telemetry.jsonl 소급 적재")
+    p.add_argument("jsonl")
+    args = ap.parse_args(argv)
+
+    path = args.db or db_path() or DEFAULT_PATH
+    con = connect(path)
+    try:
+        return {"views": cmd_views, "frames": cmd_frames, "shots": cmd_shots, "ingest": cmd_ingest}[args.cmd](
+            con, args) or 0
+    finally:
+        con.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
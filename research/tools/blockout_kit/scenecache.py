@@ -0,0 +1,264 @@
+"""지은 씬 캐시 — 한 번 지은 블록아웃 씬을 .blend + glTF(+ USD) 로 떠 두고 다음 렌더는 빌드를 건너뛴다.
+
+법정·복도 기하가 필요한 곳(웹 뷰어, 점수 스크립트, 다음 렌더)마다 파이썬 빌더를 다시 돌리지 않으려고.
+  · Blender 렌더용  <키>.blend — 렌더 결과가 빌드와 똑같아야 하므로 원본 그대로(영역 광원·노드 재질 포함).
+  · 바깥 도구용     <키>.glb (+ <키>.usdc) — Blender 없이 읽는다. 재질 이름 유지, 반복 오브젝트는 메시 공유.
+  · <키>.json       스크립트·BUILD_PARAMS·오브젝트 수·인스턴싱 그룹(메시 → 오브젝트들)·파일 목록.
+
+인스턴싱: 빌더는 박스마다 primitive_cube_add 로 단위 큐브 메시를 새로 만들고 크기는 오브젝트 scale 에 둔다.
+그래서 (정점·면·재질) 이 같은 메시를 하나로 합치면 벤치·벽 패널·전경 기둥이 메시 1개 + 노드 N개가 된다
+(렌더 결과는 같다 — 같은 기하를 가리킬 뿐). glTF 는 공유 메시를 mesh 하나로, USD 는 instanceable 로 쓴다.
+Workbench 스크립트의 오브젝트 색은 glTF 에 남도록 color_RRGGBB 재질을 오브젝트 슬롯에 붙여 내보낸다 —
+이 변형은 내보내기 전용이라 .blend 는 그 전에 저장하고, 캐시를 새로 쓴 실행도 .blend 를 다시 열어 렌더한다.
+
+키 = sha1(스크립트 소스 + BUILD_PARAMS 값 + BUILD_INPUTS 파일 내용 + Blender 버전). 스크립트를 고치면 자연히 새 키.
+빌더가 스크립트 밖 파일(요약 JSON·컴파일된 샷 스펙 등)을 읽으면 스크립트에 BUILD_INPUTS 로 적는다 —
+스크립트 폴더 기준 상대 경로, 또는 "$PARAM"(그 param 값이 가리키는 파일). 파일이 바뀌면 새 키.
+
+  BLOCKOUT_SCENE_CACHE  "1" — 캐시가 있으면 열고 없으면 지어서 쓴다 / "refresh" — 늘 새로 지어 덮어쓴다
+                        (기본: 끔 — 예전처럼 늘 빌드)
+  BLOCKOUT_SCENE_DIR    캐시 폴더 (기본 ~/.cache/blockout/scenes)
+
+내보내기만 (Blender 안):
+  blender --background --python research/tools/blockout_kit/scenecache.py -- export SCRIPT [--param K=V] [--usd] [--out-dir D]
+바깥 도구 (표준 라이브러리): read_glb(path) → (glTF JSON, 바이너리), instancing(gltf) → {메시: [노드]}
+"""
+import argparse
+import ast
+import hashlib
+import json
+import os
+import struct
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from blockout_kit.overrides import param  # noqa: E402
+
+DEFAULT_DIR = os.path.join(os.path.expanduser("~"), ".cache", "blockout", "scenes")
+
+
+def build_params(build):
+    """build 함수가 정의된 모듈의 BUILD_PARAMS (단독 실행 __main__ 이든 배치 임포트든 함수 전역에서 본다).
+    없으면 None — BLOCKOUT_* 밖 params 전부를 키에 넣는다(덜 재사용하지만 틀리진 않는다)."""
+    return getattr(build, "__globals__", {}).get("BUILD_PARAMS")
+
+
+def declared_inputs(script):
+    """(Blender 밖에서도) 스크립트 소스의 최상위 BUILD_INPUTS 리터럴 — 임포트하지 않는다(bpy 없이 sceneir 가 쓴다)."""
+    with open(script, encoding="utf-8") as fh:
+        tree = ast.parse(fh.read(), script)
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(getattr(t, "id", None) == "BUILD_INPUTS" for t in node.targets):
+            return tuple(ast.literal_eval(node.value))
+    return ()
+
+
+def input_paths(script, params, declared):
+    """BUILD_INPUTS 항목 → 절대 경로 목록. "$PARAM" 은 그 param 값(비었으면 건너뜀, 상대면 현재 폴더 기준 —
+    스크립트의 open 과 같다), 나머지는 스크립트 폴더 기준."""
+    out = []
+    for item in declared:
+        if item.startswith("$"):
+            value = param(params, item[1:])
+            if value:
+                out.append(os.path.abspath(value))
+        else:
+            out.append(os.path.join(os.path.dirname(os.path.abspath(script)), item))
+    return out
+
+
+def hash_inputs(h, script, params, declared):
+    """빌드가 읽는 파일 내용을 해시에 더한다. 선언이 없으면 아무것도 안 더한다 — 예전 키 그대로."""
+    for path in input_paths(script, params, declared):
+        h.update(path.encode())
+        try:
+            with open(path, "rb") as fh:
+                h.update(hashlib.sha1(fh.read()).digest())
+        except OSError:   # 없는 파일도 키에 — 생기면 새 키 (빌드는 어차피 실패한다)
+            h.update(b"missing")
+
+
+def cache_key(script, build, params):
+    import bpy
+    names = build_params(build)
+    if names is None:
+        names = sorted(k for k in (params or {}) if not k.startswith("BLOCKOUT_"))
+    h = hashlib.sha1()
+    with open(script, "rb") as fh:
+        h.update(fh.read())
+    h.update(json.dumps({k: param(params, k) for k in names}, sort_keys=True).encode())
+    hash_inputs(h, script, params, getattr(build, "__globals__", {}).get("BUILD_INPUTS", ()))
+    h.update(param(params, "BLOCKOUT_INSTANCE").encode())   # 빈 값이면 키가 예전 그대로
+    h.update(bpy.app.version_string.encode())
+    return f"{os.path.splitext(os.path.basename(script))[0]}-{h.hexdigest()[:12]}"
+
+
+# ── Blender 안 ──
+def _signature(me):
+    co = tuple(round(c, 6) for v in me.vertices for c in v.co)
+    polys = tuple(tuple(p.vertices) for p in me.polygons)
+    mats = tuple(m.name if m else "" for m in me.materials)
+    return hashlib.sha1(repr((co, polys, mats)).encode()).hexdigest()
+
+
+def share_meshes(scene, objects=None):
+    """같은 기하·재질의 메시를 하나로 — 반환: {남긴 메시 이름: [오브젝트 이름…]} (2개 이상 쓰는 것만).
+    objects 를 주면 그 오브젝트들만 (컬렉션 인스턴스 부품까지 — instancing.apply)."""
+    import bpy
+    first, groups = {}, {}
+    for ob in scene.objects if objects is None else objects:
+        if ob.type != "MESH":
+            continue
+        keep = first.setdefault(_signature(ob.data), ob.data)
+        if keep is not ob.data:
+            old = ob.data
+            ob.data = keep
+            if old.users == 0:
+                bpy.data.meshes.remove(old)
+        groups.setdefault(keep.name, []).append(ob.name)
+    return {k: v for k, v in groups.items() if len(v) > 1}
+
+
+def color_materials(scene):
+    """재질 없는 메시 오브젝트의 오브젝트 색 → color_RRGGBB 재질(오브젝트 슬롯). 내보내기 전용."""
+    import bpy
+    made = {}
+    for ob in scene.objects:
+        if ob.type != "MESH" or any(s.material for s in ob.material_slots):
+            continue
+        rgb = tuple(ob.color[:3])
+        name = "color_" + "".join(f"{round(c * 255):02x}" for c in rgb)
+        m = made.get(name) or bpy.data.materials.get(name)
+        if m is None:
+            m = bpy.data.materials.new(name)
+            m.diffuse_color = (*rgb, 1.0)
+            m.use_nodes = True
+            m.node_tree.nodes["Principled BSDF"].inputs["Base Color"].default_value = (*rgb, 1.0)
+        made[name] = m
+        if not ob.material_slots:
+            ob.data.materials.append(None)
+        ob.material_slots[0].link = "OBJECT"
+        ob.material_slots[0].material = m
+    return sorted(made)
+
+
+def export(scene, base, usd=False, meta=None):
+    """씬 → base.blend / base.glb / (base.usdc) / base.json. 씬을 바꾼다(메시 공유·색 재질) — 렌더하려면 .blend 를 다시 연다."""
+    import bpy
+    os.makedirs(os.path.dirname(os.path.abspath(base)), exist_ok=True)
+    t0 = time.perf_counter()
+    meshes_before = len({ob.data.name for ob in scene.objects if ob.type == "MESH"})
+    groups = share_meshes(scene)
+    bpy.ops.wm.save_as_mainfile(filepath=base + ".blend", copy=True, compress=True)
+    files = [base + ".blend"]
+    colors = color_materials(scene)
+    bpy.ops.export_scene.gltf(filepath=base + ".glb", export_format="GLB", export_cameras=True,
+                              export_lights=True, export_extras=True, export_animations=True)
+    files.append(base + ".glb")
+    if usd:
+        try:
+            bpy.ops.wm.usd_export(filepath=base + ".usdc", export_materials=True, export_animation=True,
+                                  use_instancing=True, selected_objects_only=False)
+            files.append(base + ".usdc")
+        except (RuntimeError, TypeError) as exc:   # USD 미포함 빌드·옵션 이름 차이 — glTF 만으로도 쓸 수 있다
+            print(f"[scenecache] USD 내보내기 실패: {exc}", file=sys.stderr)
+    info = dict(meta or {}, blender=bpy.app.version_string, objects=len(scene.objects),
+                meshes_before=meshes_before, meshes=len({ob.data.name for ob in scene.objects if ob.type == "MESH"}),
+                instancing=groups, color_materials=colors, files=[os.path.basename(f) for f in files],
+                export_s=round(time.perf_counter() - t0, 3))
+    with open(base + ".json", "w", encoding="utf-8") as fh:
+        json.dump(info, fh, ensure_ascii=False, indent=1)
+    return info
+
+
+def load(blend):
+    import bpy
+    bpy.ops.wm.open_mainfile(filepath=blend)
+    return bpy.context.scene
+
+
+def build(script, build_fn, params):
+    """telemetry.run 의 build 단계 — (scene, 캐시 상태). 상태: None(끔) / "hit" / "miss"."""
+    mode = param(params, "BLOCKOUT_SCENE_CACHE").lower()
+    if mode in ("", "0", "off"):
+        return build_fn(params), None
+    base = os.path.join(param(params, "BLOCKOUT_SCENE_DIR", DEFAULT_DIR), cache_key(script, build_fn, params))
+    if mode != "refresh" and os.path.exists(base + ".blend"):
+        return load(base + ".blend"), "hit"
+    scene = build_fn(params)
+    names = build_params(build_fn) or ()
+    export(scene, base, meta={"script": os.path.basename(script), "build_params": {k: param(params, k) for k in names}})
+    return load(base + ".blend"), "miss"   # 내보내기용 변형 전 상태로 렌더
+
+
+# ── Blender 밖 ──
+def read_glb(path):
+    """GLB → (glTF JSON dict, BIN 청크 bytes)."""
+    with open(path, "rb") as fh:
+        data = fh.read()
+    magic, version, _ = struct.unpack_from("<4sII", data, 0)
+    if magic != b"glTF" or version != 2:
+        raise ValueError(f"GLB 2.0 아님: {path}")
+    pos, doc, binary = 12, None, b""
+    while pos < len(data):
+        n, kind = struct.unpack_from("<I4s", data, pos)
+        chunk = data[pos + 8:pos + 8 + n]
+        if kind == b"JSON":
+            doc = json.loads(chunk)
+        elif kind == b"BIN\x00":
+            binary = chunk
+        pos += 8 + n
+    return doc, binary
+
+
+def instancing(gltf):
+    """{메시 이름: [그 메시를 쓰는 노드 이름…]} — 노드 2개 이상이 공유하는 것만."""
+    meshes = gltf.get("meshes", [])
+    out = {}
+    for node in gltf.get("nodes", []):
+        if "mesh" in node:
+            out.setdefault(meshes[node["mesh"]].get("name", str(node["mesh"])), []).append(node.get("name"))
+    return {k: v for k, v in out.items() if len(v) > 1}
+
+
+def main(argv):
+    ap = argparse.ArgumentParser(description="블록아웃 씬 → .blend / glTF / USD 캐시")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    p = sub.add_parser("export", help="(Blender 안) 스크립트를 지어 내보낸다")
+    p.add_argument("script")
+    p.add_argument("--param", action="append", default=[], help="K=V (여러 번)")
+    p.add_argument("--usd", action="store_true", help="USD(.usdc) 도 쓴다")
+    p.add_argument("--out-dir", help="기본: BLOCKOUT_SCENE_DIR 또는 ~/.cache/blockout/scenes")
+    p = sub.add_parser("info", help="GLB 요약 — 노드·메시·재질 수와 인스턴싱 (Blender 밖)")
+    p.add_argument("glb")
+    args = ap.parse_args(argv)
+
+    if args.cmd == "info":
+        gltf, _ = read_glb(args.glb)
+        inst = instancing(gltf)
+        print(f"노드 {len(gltf.get('nodes', []))} · 메시 {len(gltf.get('meshes', []))} · "
+              f"재질 {len(gltf.get('materials', []))} · 공유 메시 {len(inst)}")
+        for mesh, nodes in sorted(inst.items(), key=lambda kv: -len(kv[1])):
+            print(f"  {mesh:24s} ×{len(nodes):3d}  {', '.join(nodes[:4])}{' …' if len(nodes) > 4 else ''}")
+        return 0
+
+    from blockout_kit.batch import Runner, resolve_script
+    params = dict(kv.split("=", 1) for kv in args.param)
+    path = resolve_script(args.script)
+    mod = Runner().module(path)
+    scene = mod.build_scene(params)
+    mod.configure_render(scene, params)
+    out_dir = args.out_dir or param(params, "BLOCKOUT_SCENE_DIR", DEFAULT_DIR)
+    base = os.path.join(out_dir, cache_key(path, mod.build_scene, params))
+    names = getattr(mod, "BUILD_PARAMS", ())
+    info = export(scene, base, usd=args.usd,
+                  meta={"script": os.path.basename(path), "build_params": {k: param(params, k) for k in names}})
+    print(f"[scenecache] 오브젝트 {info['objects']} · 메시 {info['meshes_before']} → {info['meshes']} "
+          f"(공유 그룹 {len(info['instancing'])}) → {base}.{{{','.join(f.rsplit('.', 1)[1] for f in info['files'])}}}")
+    return 0
+
+
+if __name__ == "__main__":
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else sys.argv[1:]
+    sys.exit(main(argv))
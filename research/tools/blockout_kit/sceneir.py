@@ -0,0 +1,308 @@
+"""씬 IR(중간 표현) 캡처 + diff — 변형 스크립트가 "딱 1축"만 바꿨는지 기계로 확인한다.
+
+blockout_v3.py 는 v2 대비 전경 기둥 열만 추가했다고 적혀 있지만 파일은 통째 복사본이다. 200줄 두 개를
+눈으로 대조하는 대신 두 씬을 지어(build_scene + configure_render, 렌더 없음) 오브젝트 이름별로
+변환·치수·색/재질·키프레임과 렌더 설정을 비교한다.
+
+IR 은 JSON 1개: {"script", "render": {...}, "world": {...}, "objects": {이름: {...}}}. 숫자는 1e-5 로 반올림.
+오브젝트 필드 — type, parent, loc/rot/scale/dims, color, materials(이름·기본색), mesh(정점·면 수),
+data(카메라 렌즈·광원 에너지 등), keys({"location[0]": [[프레임, 값], ...]}), hide_render.
+--geometry 면 메시 로컬 정점·면(geom)도 담는다 — raster.py 가 Blender 없이 이 IR 을 그린다.
+
+캡처 (Blender 안):
+  blender --background --python research/tools/blockout_kit/sceneir.py -- capture SCRIPT... --out-dir DIR [--param K=V] [--geometry]
+diff (Blender 밖 — IR 끼리는 Blender 없이 1초 안):
+  python research/tools/blockout_kit/sceneir.py diff A B [--allow 'fg_post_*'] [--ignore render.filepath]
+    A/B 가 .py 면 Blender 1회로 둘 다 캡처한다. IR 은 ~/.cache/blockout/ir/ 에 스크립트 내용(+ 스크립트가
+    BUILD_INPUTS 로 적은 파일 내용 — scenecache 와 같은 규칙) 해시로 캐시하므로, 둘 다 안 고쳤으면 다음 diff 는
+    Blender 를 띄우지 않는다.
+
+종료 코드: 차이가 없거나 전부 --allow 오브젝트 안이면 0, 그 밖에 차이가 있으면 1 (diff(1) 관례).
+"""
+import argparse
+import fnmatch
+import hashlib
+import json
+import os
+import re
+import subprocess
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from blockout_kit import scenecache  # noqa: E402
+
+CACHE = os.path.join(os.path.expanduser("~"), ".cache", "blockout", "ir")
+DEFAULT_IGNORE = ("render.filepath", "object.geom")   # 출력 경로는 변형마다 다르다 / 기하는 mesh·dims 로 본다
+TOL = 1e-4
+_NUM = re.compile(r"\d+")
+
+
+def _r(v):
+    if isinstance(v, float):
+        return round(v, 5)
+    if isinstance(v, (list, tuple)):
+        return [_r(x) for x in v]
+    return v
+
+
+# ── 캡처 (Blender 안) ──
+def _fcurves(action):
+    """Blender 4.4+ 레이어 액션과 예전 액션 둘 다."""
+    if action is None:
+        return []
+    if hasattr(action, "layers") and action.layers:
+        return [fc for layer in action.layers for strip in layer.strips
+                for bag in getattr(strip, "channelbags", ()) for fc in bag.fcurves]
+    return list(getattr(action, "fcurves", ()))
+
+
+def _keys(idblock):
+    anim = getattr(idblock, "animation_data", None)
+    out = {}
+    for fc in _fcurves(anim.action if anim else None):
+        out[f"{fc.data_path}[{fc.array_index}]"] = [[_r(k.co[0]), _r(k.co[1])] for k in fc.keyframe_points]
+    return out
+
+
+def _material(m):
+    color = list(m.diffuse_color)
+    if m.use_nodes and m.node_tree:
+        bsdf = m.node_tree.nodes.get("Principled BSDF")
+        if bsdf:
+            color = list(bsdf.inputs["Base Color"].default_value)
+    return {"name": m.name, "color": _r(color)}
+
+
+def _data(ob):
+    d = ob.data
+    if ob.type == "CAMERA":
+        return {"lens": _r(d.lens), "sensor_width": _r(d.sensor_width), "sensor_fit": d.sensor_fit,
+                "clip": _r([d.clip_start, d.clip_end])}
+    if ob.type == "LIGHT":
+        info = {"light": d.type, "energy": _r(d.energy), "color": _r(list(d.color))}
+        for k in ("size", "size_y", "spot_size"):
+            if hasattr(d, k):
+                info[k] = _r(getattr(d, k))
+        return info
+    return {}
+
+
+def capture(scene, script=None, geometry=False):
+    """씬 → IR dict. geometry 면 메시 오브젝트에 로컬 정점(평탄 목록)·면(정점 인덱스) 을 붙인다."""
+    r = scene.render
+    render = {"engine": r.engine, "res": [r.resolution_x, r.resolution_y], "pct": r.resolution_percentage,
+              "fps": r.fps, "frames": [scene.frame_start, scene.frame_end], "format": r.image_settings.file_format,
+              "filepath": r.filepath, "film_transparent": r.film_transparent,
+              "view_transform": scene.view_settings.view_transform, "look": scene.view_settings.look,
+              "exposure": _r(scene.view_settings.exposure), "camera": scene.camera.name if scene.camera else None}
+    if r.engine == "CYCLES":
+        render.update(samples=scene.cycles.samples, denoise=scene.cycles.use_denoising,
+                      adaptive=scene.cycles.use_adaptive_sampling)
+    elif r.engine == "BLENDER_WORKBENCH":
+        sh = scene.display.shading
+        render.update(light=sh.light, color_type=sh.color_type, cavity=sh.show_cavity, shadows=sh.show_shadows,
+                      aa=scene.display.render_aa)
+    objects = {}
+    for ob in scene.objects:
+        rec = {"type": ob.type, "parent": ob.parent.name if ob.parent else None,
+               "loc": _r(list(ob.location)), "rot": _r(list(ob.rotation_euler)), "scale": _r(list(ob.scale)),
+               "dims": _r(list(ob.dimensions)), "color": _r(list(ob.color)),
+               "materials": [_material(s.material) for s in ob.material_slots if s.material],
+               "hide_render": ob.hide_render}
+        if ob.type == "MESH":
+            rec["mesh"] = [len(ob.data.vertices), len(ob.data.polygons)]
+            if geometry:
+                rec["geom"] = {"v": [_r(c) for v in ob.data.vertices for c in v.co],
+                               "f": [list(p.vertices) for p in ob.data.polygons]}
+        data = _data(ob)
+        if data:
+            rec["data"] = data
+        keys = _keys(ob)
+        if ob.data is not None:
+            keys.update({f"data.{k}": v for k, v in _keys(ob.data).items()})
+        if keys:
+            rec["keys"] = keys
+        objects[ob.name] = rec
+    world = {}
+    if scene.world:
+        world["color"] = _r(list(scene.world.color))
+    return {"script": script, "render": render, "world": world, "objects": objects}
+
+
+def capture_script(path, params=None, geometry=False):
+    """스크립트 모듈의 build_scene + configure_render 만 돌려 IR 을 뽑는다 (렌더 없음)."""
+    from blockout_kit.batch import REPO, Runner
+    mod = Runner().module(path)
+    if mod is None:
+        raise SystemExit(f"[sceneir] build_scene/configure_render/render 가 없는 스크립트: {path}")
+    scene = mod.build_scene(params)
+    mod.configure_render(scene, params)
+    return capture(scene, os.path.relpath(path, REPO), geometry)
+
+
+def cache_path(script, params, geometry=False):
+    with open(script, "rb") as fh:
+        h = hashlib.sha1(fh.read())
+    h.update(json.dumps(params, sort_keys=True).encode())
+    scenecache.hash_inputs(h, script, params, scenecache.declared_inputs(script))
+    kind = ".geom.ir.json" if geometry else ".ir.json"
+    return os.path.join(CACHE, f"{os.path.splitext(os.path.basename(script))[0]}-{h.hexdigest()[:12]}{kind}")
+
+
+def load(refs, params, blender, geometry=False):
+    """IR JSON 경로·스크립트 목록 → IR 목록. 캐시에 없는 스크립트는 Blender 1회로 한꺼번에 캡처."""
+    paths = [cache_path(os.path.abspath(r), params, geometry) if r.endswith(".py") else r for r in refs]
+    todo = [(os.path.abspath(r), p) for r, p in zip(refs, paths) if r.endswith(".py") and not os.path.exists(p)]
+    if todo:
+        cmd = [blender, "--background", "--factory-startup", "--python", os.path.abspath(__file__), "--",
+               "capture", *[s for s, _ in todo], *[f"--out={p}" for _, p in todo],
+               *[f"--param={k}={v}" for k, v in params.items()], *(["--geometry"] if geometry else [])]
+        proc = subprocess.run(cmd, capture_output=True, text=True)
+        if proc.returncode != 0 or not all(os.path.exists(p) for _, p in todo):
+            sys.stderr.write(proc.stdout[-2000:] + proc.stderr[-2000:])
+            raise SystemExit(f"[sceneir] 캡처 실패: {[s for s, _ in todo]}")
+    irs = []
+    for p in paths:
+        with open(p, encoding="utf-8") as fh:
+            irs.append(json.load(fh))
+    return irs
+
+
+# ── diff (어디서나) ──
+def _same(a, b):
+    if isinstance(a, (int, float)) and isinstance(b, (int, float)) and not isinstance(a, bool):
+        return abs(a - b) <= TOL
+    if isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(_same(x, y) for x, y in zip(a, b))
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(_same(a[k], b[k]) for k in a)
+    return a == b
+
+
+def _fmt(v, width=48):
+    s = json.dumps(v, ensure_ascii=False)
+    return s if len(s) <= width else s[:width - 1] + "…"
+
+
+def _key_change(a, b):
+    """키프레임 채널 1개 변화 요약."""
+    if a is None or b is None:
+        return f"{'추가' if a is None else '삭제'} ({len(b or a)} 키)"
+    if len(a) != len(b):
+        return f"키 {len(a)} → {len(b)}"
+    worst = max(zip(a, b), key=lambda p: max(abs(p[0][0] - p[1][0]), abs(p[0][1] - p[1][1])))
+    return f"{len(a)} 키 중 최대 변화 f{worst[0][0]}: {worst[0][1]} → {worst[1][1]}"
+
+
+def diff(a, b, ignore=DEFAULT_IGNORE):
+    """IR 두 개 → 변경 목록 [(영역, 이름, 필드, 설명)]. 영역: render/world/added/removed/object."""
+    out = []
+    for area in ("render", "world"):
+        for k in sorted(set(a[area]) | set(b[area])):
+            if f"{area}.{k}" in ignore:
+                continue
+            va, vb = a[area].get(k), b[area].get(k)
+            if not _same(va, vb):
+                out.append((area, area, k, f"{_fmt(va)} → {_fmt(vb)}"))
+    oa, ob = a["objects"], b["objects"]
+    for name in sorted(set(ob) - set(oa)):
+        out.append(("added", name, None, ob[name]["type"]))
+    for name in sorted(set(oa) - set(ob)):
+        out.append(("removed", name, None, oa[name]["type"]))
+    for name in sorted(set(oa) & set(ob)):
+        ra, rb = oa[name], ob[name]
+        for k in sorted(set(ra) | set(rb)):
+            if f"object.{k}" in ignore:
+                continue
+            va, vb = ra.get(k), rb.get(k)
+            if _same(va, vb):
+                continue
+            if k == "keys":
+                for ch in sorted(set(va or {}) | set(vb or {})):
+                    ka, kb = (va or {}).get(ch), (vb or {}).get(ch)
+                    if not _same(ka, kb):
+                        out.append(("object", name, f"keys {ch}", _key_change(ka, kb)))
+            else:
+                out.append(("object", name, k, f"{_fmt(va)} → {_fmt(vb)}"))
+    return out
+
+
+def family(name):
+    """이름의 숫자를 # 로 — fg_post_3 → fg_post_#. 같은 패밀리 = 같은 루프가 만든 오브젝트."""
+    return _NUM.sub("#", name)
+
+
+def report(a, b, changes, allow):
+    """압축 리포트 — 추가/삭제는 패밀리로 묶고, 같은 필드 변경도 패밀리로 묶는다. 반환: 허용 밖 변경 수."""
+    allowed = [c for c in changes if c[0] in ("added", "removed", "object")
+               and any(fnmatch.fnmatchcase(c[1], p) for p in allow)]
+    print(f"A {a.get('script') or '?'}  ({len(a['objects'])} 오브젝트)")
+    print(f"B {b.get('script') or '?'}  ({len(b['objects'])} 오브젝트)")
+    if not changes:
+        print("= 차이 없음")
+        return 0
+    groups = {}
+    for c in changes:
+        groups.setdefault((c[0], family(c[1]), c[2]), []).append(c)
+    for (area, fam, field), cs in groups.items():
+        mark = "  " if all(c in allowed for c in cs) else "! "
+        if area in ("added", "removed"):
+            sign = "+" if area == "added" else "-"
+            print(f"{mark}{sign} {fam if len(cs) > 1 else cs[0][1]}{f' ×{len(cs)}' if len(cs) > 1 else ''}  ({cs[0][3]})")
+        elif area in ("render", "world"):
+            print(f"{mark}~ {area}.{field}: {cs[0][3]}")
+        else:
+            label = f"{fam} ×{len(cs)}" if len(cs) > 1 else cs[0][1]
+            print(f"{mark}~ {label}.{field}: {cs[0][3]}{' …' if len(cs) > 1 else ''}")
+    fams = sorted({family(c[1]) for c in changes if c[0] not in ("render", "world")})
+    bad = len(changes) - len(allowed)
+    print(f"= 변경 {len(changes)} (허용 밖 {bad}) · 오브젝트 패밀리 {len(fams)}: {', '.join(fams) or '-'}")
+    return bad
+
+
+def _params(kvs):
+    return dict(kv.split("=", 1) for kv in kvs)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="블록아웃 씬 IR 캡처 · diff")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    p = sub.add_parser("capture", help="(Blender 안) 스크립트 → IR JSON")
+    p.add_argument("scripts", nargs="+")
+    p.add_argument("--out", action="append", default=[], help="스크립트 순서대로 출력 파일 (없으면 --out-dir)")
+    p.add_argument("--out-dir", help="스크립트별 <이름>.ir.json")
+    p.add_argument("--param", action="append", default=[], help="K=V (여러 번)")
+    p.add_argument("--geometry", action="store_true", help="메시 정점·면까지 (raster.py 용)")
+    p = sub.add_parser("diff", help="IR/스크립트 두 개 비교")
+    p.add_argument("a")
+    p.add_argument("b")
+    p.add_argument("--allow", action="append", default=[], help="차이를 허용할 오브젝트 이름 glob (여러 번)")
+    p.add_argument("--ignore", action="append", default=list(DEFAULT_IGNORE),
+                   help="무시할 필드 (render.samples, object.color …)")
+    p.add_argument("--param", action="append", default=[], help="스크립트 캡처 params K=V")
+    args = ap.parse_args(argv)
+
+    if args.cmd == "capture":
+        from blockout_kit.batch import resolve_script
+        params = _params(args.param)
+        for i, s in enumerate(args.scripts):
+            path = resolve_script(s)
+            out = args.out[i] if i < len(args.out) else os.path.join(
+                args.out_dir or ".", os.path.splitext(os.path.basename(path))[0] + ".ir.json")
+            ir = capture_script(path, params, args.geometry)
+            os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+            with open(out, "w", encoding="utf-8") as fh:
+                json.dump(ir, fh, ensure_ascii=False, indent=1)
+            print(f"[sceneir] {len(ir['objects'])} 오브젝트 → {out}")
+        return 0
+
+    blender = os.environ.get("BLENDER", "blender")
+    params = _params(args.param)
+    a, b = load([args.a, args.b], params, blender)
+    return 1 if report(a, b, diff(a, b, set(args.ignore)), args.allow) else 0
+
+
+if __name__ == "__main__":
+    # Blender 안(capture)에서는 "--" 뒤 인자만 스크립트 몫이다
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else sys.argv[1:]
+    sys.exit(main(argv))
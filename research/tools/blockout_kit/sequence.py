@@ -0,0 +1,300 @@
+"""시퀀스 프리비즈 — 세트를 한 번 짓고 샷 여러 개를 카메라 마커로 이어 한 번에 렌더한다.
+
+한 씬의 샷들(sh_04_16 질주 등)은 스크립트마다 세트를 새로 짓는다 — 씬 단위 프리비즈가 샷 수만큼 빌드를
+치른다. 시퀀스는 세트 스크립트의 build_scene() 을 1번 부르고, 스펙의 샷을 타임라인에 이어 붙인다:
+
+  샷 = id + frames + 피사체 트랙 + 카메라 트랙. 샷 i 는 전역 프레임 [start_i, start_i + frames - 1]
+       (1부터 빈틈없이). 샷마다 카메라 오브젝트 cam_<id> 를 만들고 그 start 에 마커를 붙인다 —
+       애니 렌더가 마커에서 카메라를 바꾼다(컷). 렌더는 PNG 프레임 1벌 → VSE 로 샷별 MP4 + 이은 MP4.
+  피사체 트랙 (세트에 있는 오브젝트 이름 → 아래 중 하나). 트랙을 준 오브젝트는 세트 애니를 지우고 다시 키한다:
+    {"from": F}                     세트 스크립트가 준 애니를 세트 프레임 F 부터 (기본 1) — 샷 길이만큼 표본
+    {"keys": [[f, [x,y,z]], [f, [x,y,z], [rx,ry,rz]] …]}   샷 로컬 프레임 f(1부터) 선형 키, 회전은 도(°)
+    샷에 안 나오는 동안은 직전 샷의 마지막 포즈를 유지한다.
+  카메라 트랙:
+    {"lens": 35, "keys": [[f, [x,y,z], [tx,ty,tz]] …]}   위치 + 바라볼 점 (키 1개 = 고정 카메라)
+    {"lens": 35, "follow": "runner", "axes": "x", "offset": [0,-6,1.1], "rot": [90,0,0]}
+        피사체를 따라간다 — axes 축만 피사체 위치를 더한다. rot(도) 대신 "look": [dx,dy,dz] 면 피사체+look 을 본다.
+
+스펙 (JSON, 경로는 저장소 루트 기준 또는 절대):
+  {"script": "research/experiments/previz-video-reference-ab/blockout_sh_04_16.py",
+   "params": {},                                     # 선택 — 세트 스크립트 params
+   "shots": [{"id": "sh_04_16", "frames": 168, "subjects": {"runner": {"from": 1}},
+              "camera": {"lens": 35, "follow": "runner", "axes": "x", "offset": [0, -6, 1.1], "rot": [90, 0, 0]}}]}
+
+출력 (BLOCKOUT_OUT 또는 --out, 기본 스펙 옆 <이름>.sequence/): frames/seq_####.png, <샷 id>.mp4,
+sequence.mp4, sequence.json(샷별 전역 구간·카메라·클립). 세트 스크립트의 해상도·엔진·BLOCKOUT_* 는 그대로
+따르고, 프레임 구간(BLOCKOUT_FRAME_*)은 시퀀스가 정한다. 계측의 script 는 스펙 경로, frame 이벤트 view 는 샷 id.
+씬 캐시(BLOCKOUT_SCENE_CACHE)는 쓰지 않는다 — 캐시 키가 스크립트 1개 기준이라 세트+스펙 조합을 못 가른다.
+
+실행 (Blender 안):
+  blender --background --python research/tools/blockout_kit/sequence.py -- sequence.json [--shots a,b] [--out dir]
+"""
+import argparse
+import json
+import math
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from blockout_kit import telemetry  # noqa: E402
+from blockout_kit.batch import Runner, resolve_script  # noqa: E402
+from blockout_kit.overrides import param  # noqa: E402
+
+
+def load_spec(path, only=None):
+    """스펙 → (doc, 샷 목록 — start/end 를 채운 것). only 는 렌더할 샷 id 목록 (구간은 그 샷들로 다시 잇는다)."""
+    with open(path, encoding="utf-8") as fh:
+        doc = json.load(fh)
+    shots = doc["shots"]
+    ids = [s["id"] for s in shots]
+    if len(set(ids)) != len(ids):
+        raise ValueError(f"샷 id 중복: {sorted({i for i in ids if ids.count(i) > 1})}")
+    if only:
+        unknown = [i for i in only if i not in ids]
+        if unknown:
+            raise ValueError(f"스펙에 없는 샷: {unknown} (있는 샷: {', '.join(ids)})")
+        shots = [s for s in shots if s["id"] in only]
+    start, out = 1, []
+    for s in shots:
+        if int(s["frames"]) < 1:
+            raise ValueError(f"{s['id']}: frames 는 1 이상")
+        out.append(dict(s, start=start, end=start + int(s["frames"]) - 1))
+        start += int(s["frames"])
+    return doc, out
+
+
+def shot_at(shots, frame):
+    for s in shots:
+        if s["start"] <= frame <= s["end"]:
+            return s
+    return None
+
+
+# ── 트랙 (Blender 안) ──
+def _key(ob, frame, loc=None, rot=None):
+    if loc is not None:
+        ob.location = loc
+        ob.keyframe_insert(data_path="location", frame=frame)
+    if rot is not None:
+        ob.rotation_euler = rot
+        ob.keyframe_insert(data_path="rotation_euler", frame=frame)
+
+
+def lay_subjects(scene, shots):
+    """피사체 트랙 → 전역 타임라인 키. "from" 트랙은 세트 애니를 지우기 전에 표본을 뜬다."""
+    tracked = {}
+    for s in shots:
+        for name in s.get("subjects") or {}:
+            ob = scene.objects.get(name)
+            if ob is None:
+                raise ValueError(f"{s['id']}: 세트에 '{name}' 오브젝트가 없다")
+            tracked[name] = ob
+    need = {}   # 세트 프레임 → [(샷 id, 이름, 로컬 k)]
+    for s in shots:
+        for name, tr in (s.get("subjects") or {}).items():
+            if "keys" not in tr:
+                for k in range(int(s["frames"])):
+                    need.setdefault(int(tr.get("from", 1)) + k, []).append((s["id"], name, k))
+    sampled = {}
+    for f in sorted(need):
+        scene.frame_set(f)
+        for sid, name, k in need[f]:
+            ob = tracked[name]
+            sampled[sid, name, k] = (tuple(ob.location), tuple(ob.rotation_euler))
+
+    last = {}   # 이름 → (마지막 키 전역 프레임, 위치, 회전) — 샷 사이 포즈 유지
+    for ob in tracked.values():
+        ob.animation_data_clear()
+    for s in shots:
+        for name, tr in (s.get("subjects") or {}).items():
+            ob = tracked[name]
+            if name in last and last[name][0] < s["start"] - 1:
+                _key(ob, s["start"] - 1, *last[name][1:])   # 빠져 있던 샷 동안 직전 포즈
+            if "keys" in tr:
+                for key in tr["keys"]:
+                    rot = tuple(math.radians(v) for v in key[2]) if len(key) > 2 else None
+                    _key(ob, s["start"] + int(key[0]) - 1, tuple(key[1]), rot)
+                    held = rot if rot is not None else last.get(name, (0, None, None))[2]
+                    last[name] = (s["start"] + int(key[0]) - 1, tuple(key[1]), held)
+            else:
+                for k in range(int(s["frames"])):
+                    loc, rot = sampled[s["id"], name, k]
+                    _key(ob, s["start"] + k, loc, rot)
+                last[name] = (s["end"], loc, rot)
+    return sorted(tracked)
+
+
+def lay_camera(scene, shot):
+    """샷 카메라 cam_<id> + 트랙 키 + 샷 시작 마커."""
+    import bpy
+    from mathutils import Vector
+    tr = shot["camera"]
+    data = bpy.data.cameras.new(f"cam_{shot['id']}")
+    data.lens = float(tr.get("lens", 35))
+    if scene.camera is not None and scene.camera.type == "CAMERA":   # 세트 카메라의 클립 거리
+        data.clip_start, data.clip_end = scene.camera.data.clip_start, scene.camera.data.clip_end
+    cam = bpy.data.objects.new(f"cam_{shot['id']}", data)
+    scene.collection.objects.link(cam)
+
+    def aim(frame, loc, target, prev):
+        d = Vector(target) - Vector(loc)
+        rot = d.to_track_quat("-Z", "Y").to_euler("XYZ", prev) if prev is not None else d.to_track_quat("-Z", "Y").to_euler()
+        _key(cam, frame, tuple(loc), tuple(rot))
+        return rot
+
+    if "follow" in tr:
+        sub = scene.objects.get(tr["follow"])
+        if sub is None:
+            raise ValueError(f"{shot['id']}: follow 대상 '{tr['follow']}' 이 세트에 없다")
+        axes = tr.get("axes", "xyz")
+        offset = tr.get("offset", (0.0, 0.0, 0.0))
+        rot = tuple(math.radians(v) for v in tr["rot"]) if "rot" in tr else None
+        prev = None
+        for f in range(shot["start"], shot["end"] + 1):
+            scene.frame_set(f)
+            p = sub.matrix_world.translation
+            loc = tuple((p[i] if "xyz"[i] in axes else 0.0) + offset[i] for i in range(3))
+            if rot is not None:
+                _key(cam, f, loc, rot)
+            else:
+                look = tr.get("look", (0.0, 0.0, 1.0))
+                prev = aim(f, loc, tuple(p[i] + look[i] for i in range(3)), prev)
+    else:
+        prev = None
+        for key in tr["keys"]:
+            prev = aim(shot["start"] + int(key[0]) - 1, key[1], key[2], prev)
+    marker = scene.timeline_markers.new(shot["id"], frame=shot["start"])
+    marker.camera = cam
+    return cam
+
+
+def lay_out(scene, shots):
+    import bpy
+    bpy.context.preferences.edit.keyframe_new_interpolation_type = "LINEAR"   # 트랙 사이는 선형
+    scene.timeline_markers.clear()
+    subjects = lay_subjects(scene, shots)
+    cams = [lay_camera(scene, s) for s in shots]
+    scene.camera = cams[0]
+    scene.frame_set(1)
+    return subjects
+
+
+# ── 렌더 (Blender 안) ──
+def video_settings(scene):
+    """블록아웃 스크립트들과 같은 h264 MP4 (Blender 5.x: media_type 먼저)."""
+    if hasattr(scene.render.image_settings, "media_type"):
+        scene.render.image_settings.media_type = "VIDEO"
+    scene.render.image_settings.file_format = "FFMPEG"
+    scene.render.ffmpeg.format = "MPEG4"
+    scene.render.ffmpeg.codec = "H264"
+    scene.render.ffmpeg.constant_rate_factor = "MEDIUM"
+    scene.render.ffmpeg.audio_codec = "NONE"
+
+
+def encode(scene, clips, files=None):
+    """렌더한 프레임(scene 의 frame_start~frame_end) → VSE 이미지 스트립 1개 → 구간마다 MP4.
+    clips: [(경로, 시작, 끝)] — 씬 프레임 번호. files 를 주면 프레임마다 그 파일(같은 폴더 — 반복 가능, progressive.py).
+    인코딩 씬은 blockout_encode 표시 — 계측이 렌더 프레임으로 세지 않는다."""
+    import bpy
+    if files is None:
+        files = [scene.render.frame_path(frame=f) for f in range(scene.frame_start, scene.frame_end + 1)]
+    edit = bpy.data.scenes.new("sequence_edit")
+    edit["blockout_encode"] = True
+    try:
+        pct = scene.render.resolution_percentage / 100
+        edit.render.resolution_x = round(scene.render.resolution_x * pct)
+        edit.render.resolution_y = round(scene.render.resolution_y * pct)
+        edit.render.resolution_percentage = 100
+        edit.render.fps = scene.render.fps
+        video_settings(edit)
+        ed = edit.sequence_editor_create()
+        strips = ed.strips if hasattr(ed, "strips") else ed.sequences   # 4.4+ strips, 그 전 sequences
+        strip = strips.new_image(name="frames", filepath=files[0], channel=1, frame_start=scene.frame_start)
+        for path in files[1:]:
+            strip.elements.append(os.path.basename(path))
+        for path, a, b in clips:
+            edit.frame_start, edit.frame_end = a, b
+            edit.render.filepath = path
+            bpy.ops.render.render(animation=True, scene=edit.name)
+    finally:
+        bpy.data.scenes.remove(edit)
+
+
+class Sequence:
+    """스펙 1개 — telemetry.run 의 build / configure / render 를 준다."""
+
+    def __init__(self, spec_path, params=None, only=None):
+        self.spec_path = os.path.abspath(spec_path)
+        self.doc, self.shots = load_spec(self.spec_path, only)
+        self.script = resolve_script(self.doc["script"])
+        self.mod = Runner().module(self.script)
+        if self.mod is None:
+            raise ValueError(f"세트 스크립트에 build_scene/configure_render/render 가 없다: {self.script}")
+        default = os.path.splitext(self.spec_path)[0] + ".sequence"
+        self.out_dir = os.path.abspath(param(params, "BLOCKOUT_OUT") or self.doc.get("out") or default)
+        self.subjects = []
+
+    def build(self, params):
+        scene = self.mod.build_scene(params)
+        self.subjects = lay_out(scene, self.shots)
+        return scene
+
+    def configure(self, scene, params):
+        self.mod.configure_render(scene, params)
+        scene.frame_start, scene.frame_end, scene.frame_step = 1, self.shots[-1]["end"], 1
+        if hasattr(scene.render.image_settings, "media_type"):
+            scene.render.image_settings.media_type = "IMAGE"
+        scene.render.image_settings.file_format = "PNG"
+        scene.render.filepath = os.path.join(self.out_dir, "frames", "seq_")
+
+    def render(self, scene, params):
+        import bpy
+
+        def on_frame(sc, *_):   # frame 이벤트 view = 샷 id
+            s = shot_at(self.shots, sc.frame_current)
+            sc["blockout_view"] = s["id"] if s else ""
+
+        os.makedirs(os.path.join(self.out_dir, "frames"), exist_ok=True)
+        bpy.app.handlers.frame_change_pre.append(on_frame)
+        try:
+            bpy.ops.render.render(animation=True)
+        finally:
+            bpy.app.handlers.frame_change_pre.remove(on_frame)
+            scene["blockout_view"] = ""
+        clips = [(os.path.join(self.out_dir, f"{s['id']}.mp4"), s["start"], s["end"]) for s in self.shots]
+        clips.append((os.path.join(self.out_dir, "sequence.mp4"), 1, self.shots[-1]["end"]))
+        encode(scene, clips)
+        report = {"spec": self.spec_path, "script": os.path.relpath(self.script, telemetry.REPO),
+                  "fps": scene.render.fps, "frames": self.shots[-1]["end"], "subjects": self.subjects,
+                  "sequence": clips[-1][0],
+                  "shots": [{"id": s["id"], "start": s["start"], "end": s["end"], "frames": int(s["frames"]),
+                             "camera": f"cam_{s['id']}", "clip": path}
+                            for s, (path, _, _) in zip(self.shots, clips)]}
+        with open(os.path.join(self.out_dir, "sequence.json"), "w", encoding="utf-8") as fh:
+            json.dump(report, fh, ensure_ascii=False, indent=2)
+        print(f"[sequence] DONE 샷 {len(self.shots)}개 · {report['frames']}프레임 · 세트 빌드 1회 → {self.out_dir}")
+        return [path for path, _, _ in clips]
+
+
+def run(spec_path, params=None, only=None):
+    """스펙 1개를 telemetry.run 으로 — 반환: 샷별 MP4 + sequence.mp4 경로."""
+    seq = Sequence(spec_path, params, only)
+    params = dict(seq.doc.get("params") or {}, **(params or {}))
+    params["BLOCKOUT_SCENE_CACHE"] = "off"
+    return telemetry.run(seq.spec_path, params, seq.build, seq.configure, seq.render)
+
+
+def main(argv):
+    ap = argparse.ArgumentParser(description="세트 1번 빌드 + 샷 여러 개를 카메라 마커로 이어 한 번에 렌더")
+    ap.add_argument("spec")
+    ap.add_argument("--shots", default="", help="이 샷들만 (쉼표) — 구간은 그 샷들로 다시 잇는다")
+    ap.add_argument("--out", help="출력 폴더 (기본 BLOCKOUT_OUT 또는 스펙 옆 <이름>.sequence/)")
+    args = ap.parse_args(argv)
+    params = {"BLOCKOUT_OUT": args.out} if args.out else {}
+    run(args.spec, params, [s for s in args.shots.split(",") if s])
+    return 0
+
+
+if __name__ == "__main__":
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    sys.exit(main(argv))
@@ -0,0 +1,286 @@
+"""블록아웃 계측 — 단계별 시간·씬 규모·렌더 동기화/패스트레이싱·메모리·출력 크기를 JSONL 이벤트로.
+
+스크립트의 main(params) 와 batch.py Runner 가 둘 다 run() 으로 build → configure → render 를 돌리므로
+단독 실행·배치·워커 어느 쪽이든 같은 이벤트가 남는다. 한 줄 = 이벤트 1개, 모든 줄에 run_id·script.
+
+  run_start  params, blender 버전, 호스트, pid
+  phase      build / configure / render 단계 초 (+ 그 시점 최대 RSS, build 는 씬 캐시 hit/miss — scenecache.py)
+  instancing 메시 공유 전/후 고유 메시·메시 MB, 인스턴스 수, 조립품 (BLOCKOUT_INSTANCE — instancing.py)
+  evalcache  평가된 프리미티브 캐시 hits / misses / disk_hits / eval_s (BLOCKOUT_EVAL_CACHE — evalcache.py)
+  scene      오브젝트·메시 수, 평가된 삼각형 수, depsgraph 평가 초, scene_hash(평가된 기하·변환 지문)
+  render     엔진·해상도·샘플·디바이스(GPU 실패 → CPU-fallback 이 여기 드러난다), 적용한 CPU 프로필 키(autotune.py)
+  frame      렌더 1회(스틸 1장·애니 1프레임): view, samples, sync_s(씬 동기화) / trace_s(첫 샘플~끝) /
+             write_s(저장·인코딩). 노이즈 프리패스(씬 blockout_prepass — 법정 §13)는 phase="prepass"
+  output     출력 파일·바이트 (프레임 접두어면 그 프레임들 합)
+  (완료 이벤트 — 파일이 써지는 즉시 경로·sha256 — 는 따로 BLOCKOUT_EVENTS 스트림으로: completions.py)
+  passes     보조 패스 폴더별 프레임 수·바이트·패스·엔진이 못 준 패스 (BLOCKOUT_PASSES — passes.py)
+  run_end    ok / failed(error), 총 초, 최대 RSS
+
+sync/trace 는 Cycles 렌더 통계 문자열에 "Sample n/N" 이 처음 뜬 시각으로 가른다 — Workbench·EEVEE 는
+샘플 통계가 없어 trace_s 없이 total_s 만 남는다. write_s 는 render_post → render_write 사이(파일 저장·
+MP4 인코딩 근사). 최대 RSS 는 프로세스 수명 최댓값이라 배치·워커에선 단조 증가한다.
+
+실행이 끝나면 이벤트를 renderdb.py 의 SQLite 이력에도 넣는다 — 실행 간 질의(p50/p95·느린 프레임·샷 비용)는
+거기서 한다.
+
+  BLOCKOUT_TELEMETRY  이벤트 파일 (기본 ~/.cache/blockout/telemetry.jsonl, "off" 면 끈다)
+  BLOCKOUT_RENDER_DB  SQLite 이력 (기본 ~/.cache/blockout/renders.sqlite, "off" 면 끈다)
+"""
+import contextlib
+import glob
+import hashlib
+import itertools
+import json
+import os
+import re
+import socket
+import sys
+import time
+
+from blockout_kit import completions, evalcache, instancing, passes, renderdb, scenecache
+from blockout_kit.overrides import param
+
+REPO = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", ".."))
+DEFAULT_PATH = os.path.join(os.path.expanduser("~"), ".cache", "blockout", "telemetry.jsonl")
+_SAMPLE = re.compile(r"Sample \d+/\d+|Path Tracing")
+_FRAME_SUFFIX = re.compile(r"[_.-]?#*\d*$")
+_seq = itertools.count()
+
+
+def peak_rss_mb():
+    try:
+        import resource
+    except ImportError:   # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)   # macOS 는 바이트, 리눅스는 KB
+
+
+def output_bytes(path):
+    """파일이면 그 크기, 프레임 접두어(frame_)면 그 접두어로 시작하는 파일들 합."""
+    if os.path.isfile(path):
+        return os.path.getsize(path), 1
+    files = [f for f in glob.glob(glob.escape(path) + "*") if os.path.isfile(f)]
+    return sum(os.path.getsize(f) for f in files), len(files)
+
+
+def view_name(scene):
+    """프레임 이벤트의 뷰 이름 — 씬 "blockout_view" 속성이 있으면 그것, 없으면 출력 파일 이름(프레임 번호 뗀)."""
+    view = scene.get("blockout_view")
+    if view:
+        return str(view)
+    stem = os.path.splitext(os.path.basename(scene.render.filepath))[0]
+    return _FRAME_SUFFIX.sub("", stem) or stem
+
+
+def cycles_device(scene):
+    """실제로 쓰일 Cycles 디바이스 — GPU 를 골랐어도 켜진 GPU 장치가 없으면 Cycles 는 CPU 로 돈다."""
+    import bpy
+    if scene.cycles.device != "GPU":
+        return "CPU-fallback" if scene.get("gpu_fallback") else "CPU"
+    try:
+        prefs = bpy.context.preferences.addons["cycles"].preferences
+        gpus = [d for d in prefs.devices if d.use and d.type != "CPU"]
+    except (KeyError, AttributeError):
+        return "CPU-fallback"
+    return f"GPU:{prefs.compute_device_type}" if gpus else "CPU-fallback"
+
+
+class Telemetry:
+    def __init__(self, script, params=None):
+        self.script = os.path.relpath(os.path.abspath(script), REPO)
+        self.run_id = f"{time.strftime('%Y%m%dT%H%M%S')}-{os.getpid()}-{next(_seq)}"
+        path = param(params, "BLOCKOUT_TELEMETRY", DEFAULT_PATH)
+        self.path = None if path.lower() in ("", "0", "off") else path
+        self.t0 = time.perf_counter()
+        self.params = dict(params or {})
+        self.events = []   # 이 실행의 이벤트 — 끝에 renderdb 로
+        self._frame = None
+        self._handlers = []
+        self.stream = completions.open_stream(params)
+        self.completed = set()   # 완료 이벤트를 낸 파일 — run() 끝의 출력 목록과 겹치지 않게
+
+    def emit(self, event, **fields):
+        rec = {"ts": round(time.time(), 3), "run_id": self.run_id, "script": self.script, "event": event, **fields}
+        self.events.append(rec)
+        if not self.path:
+            return
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as fh:
+                fh.write(json.dumps(rec, ensure_ascii=False, default=str) + "\n")
+        except OSError as exc:   # 계측 실패로 렌더를 죽이지 않는다
+            print(f"[telemetry] 기록 실패 {self.path}: {exc}", file=sys.stderr)
+            self.path = None
+
+    @contextlib.contextmanager
+    def phase(self, name, **fields):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.emit("phase", phase=name, seconds=round(time.perf_counter() - t0, 4),
+                      peak_rss_mb=peak_rss_mb(), **fields)
+
+    def scene_stats(self, scene):
+        """depsgraph 를 평가시켜 그 시간과 평가 후 삼각형 수를 잰다 (모디파이어·인스턴스 반영).
+        scene_hash 는 평가된 오브젝트별 (이름, 타입, 월드 행렬, 정점·면 수) 의 지문 — 같은 스크립트라도
+        기하가 바뀌었으면 이력에서 갈라 볼 수 있게. 받을 곳(JSONL·renderdb)이 없으면 평가하지 않는다 —
+        메시마다 to_mesh() 를 부르는 비용을 계측을 끈 렌더가 내지 않게."""
+        if not self.path and not renderdb.db_path(self.params):
+            return
+        import bpy
+        t0 = time.perf_counter()
+        dg = bpy.context.evaluated_depsgraph_get()
+        dg.update()
+        eval_s = time.perf_counter() - t0
+        tris = 0
+        keys = []
+        for inst in dg.object_instances:
+            ob = inst.object
+            key = [ob.name, ob.type, [round(v, 4) for row in inst.matrix_world for v in row]]
+            if ob.type == "MESH":
+                me = ob.to_mesh()
+                tris += sum(len(p.vertices) - 2 for p in me.polygons)
+                key += [len(me.vertices), len(me.polygons)]
+                ob.to_mesh_clear()
+            keys.append(json.dumps(key))
+        digest = hashlib.sha1("\n".join(sorted(keys)).encode()).hexdigest()[:12]
+        self.emit("scene", objects=len(scene.objects), meshes=len(bpy.data.meshes),
+                  materials=len(bpy.data.materials), triangles=tris, depsgraph_s=round(eval_s, 4),
+                  scene_hash=digest)
+
+    def render_settings(self, scene):
+        r = scene.render
+        info = {"engine": r.engine, "res": [r.resolution_x, r.resolution_y], "pct": r.resolution_percentage,
+                "frames": [scene.frame_start, scene.frame_end], "format": r.image_settings.file_format}
+        if r.engine == "CYCLES":
+            info.update(samples=scene.cycles.samples, device=cycles_device(scene),
+                        adaptive=scene.cycles.use_adaptive_sampling, denoise=scene.cycles.use_denoising,
+                        profile=scene.get("render_profile") or None)
+        self.emit("render", **info)
+
+    # ── 렌더 핸들러: 프레임마다 sync / trace / write ──
+    def _on_pre(self, scene, *_):
+        if scene.get("blockout_encode"):   # 이미 렌더한 프레임을 잇는 인코딩 씬 (sequence.py) — 렌더가 아니다
+            return
+        self._frame = {"frame": scene.frame_current, "file": os.path.basename(scene.render.filepath),
+                       "view": view_name(scene), "t_pre": time.perf_counter(), "t_sample": None, "t_post": None,
+                       "path": scene.render.frame_path(frame=scene.frame_current),
+                       "movie": scene.render.is_movie_format}
+        if scene.get("blockout_prepass"):   # 뷰 이름은 진짜 뷰와 같다 (시드 접미사를 떼므로) — 단계로 가른다
+            self._frame["phase"] = "prepass"
+        if scene.render.engine == "CYCLES":   # 뷰마다 예산이 다르다 (법정 §13)
+            self._frame["samples"] = scene.cycles.samples
+
+    def _on_stats(self, *args):
+        f = self._frame
+        if f and f["t_sample"] is None and any(isinstance(a, str) and _SAMPLE.search(a) for a in args):
+            f["t_sample"] = time.perf_counter()
+
+    def _on_post(self, *_):
+        if self._frame:
+            self._frame["t_post"] = time.perf_counter()
+
+    def _on_write(self, *_):
+        self._flush_frame(time.perf_counter())
+
+    def _flush_frame(self, t_write=None):
+        f, self._frame = self._frame, None
+        if not f or f["t_post"] is None:
+            return
+        rec = {"frame": f["frame"], "file": f["file"], "view": f["view"], "total_s": round(f["t_post"] - f["t_pre"], 4)}
+        if "samples" in f:
+            rec["samples"] = f["samples"]
+        if "phase" in f:
+            rec["phase"] = f["phase"]
+        if f["t_sample"] is not None:
+            rec["sync_s"] = round(f["t_sample"] - f["t_pre"], 4)
+            rec["trace_s"] = round(f["t_post"] - f["t_sample"], 4)
+        if t_write is not None:
+            rec["write_s"] = round(t_write - f["t_post"], 4)
+        self.emit("frame", **rec)
+        if "phase" in f:   # 프리패스 PNG 는 임시 폴더 — 곧 지워지니 완료로 알리지 않는다
+            return
+        if t_write is not None and not f["movie"] and os.path.isfile(f["path"]):   # MP4 는 닫힐 때 (run)
+            self.complete(f["path"], view=f["view"], frame=f["frame"], render_s=rec["total_s"],
+                          write_s=rec["write_s"])
+
+    def complete(self, path, **fields):
+        """완료 이벤트 1줄 (BLOCKOUT_EVENTS 가 켜져 있을 때만)."""
+        if self.stream is None:
+            return
+        self.completed.add(os.path.abspath(path))
+        self.stream.write(completions.complete_record(path, run_id=self.run_id, script=self.script, **fields,
+                                                      since_start_s=round(time.perf_counter() - self.t0, 3)))
+
+    def attach(self):
+        import bpy
+        h = bpy.app.handlers
+        self._handlers = [(h.render_pre, self._on_pre), (h.render_stats, self._on_stats),
+                          (h.render_post, self._on_post), (h.render_write, self._on_write)]
+        for lst, fn in self._handlers:
+            lst.append(fn)
+
+    def detach(self):
+        for lst, fn in self._handlers:
+            if fn in lst:
+                lst.remove(fn)
+        self._handlers = []
+        self._flush_frame()   # 저장 없이 끝난 렌더(프리패스 등)도 남긴다
+
+
+def run(script, params, build, configure, render, scene=None):
+    """build(scene 이 있으면 생략 — 배치 재사용) → configure → render 를 계측하며 돈다. 반환: 출력 경로 목록."""
+    tel = Telemetry(script, params)
+    import bpy
+    tel.emit("run_start", params=dict(params or {}), reused_scene=scene is not None,
+             blender=bpy.app.version_string, host=socket.gethostname(), pid=os.getpid())
+    outputs = []
+    try:
+        if scene is None:
+            t0 = time.perf_counter()
+            scene, cache = scenecache.build(script, build, params)
+            tel.emit("phase", phase="build", seconds=round(time.perf_counter() - t0, 4),
+                     peak_rss_mb=peak_rss_mb(), cache=cache)
+            shared = instancing.apply(scene, params)
+            if shared:
+                tel.emit("instancing", **shared)
+            cached = evalcache.take_stats()
+            if cached:
+                tel.emit("evalcache", **cached)
+        tel.scene_stats(scene)
+        with tel.phase("configure"):
+            configure(scene, params)
+        tel.render_settings(scene)
+        aux = passes.attach(scene, params)
+        tel.attach()
+        t_render = time.perf_counter()
+        try:
+            with tel.phase("render"):
+                outputs = render(scene, params) or []
+        finally:
+            tel.detach()
+            if aux:
+                aux.detach()
+        for path in outputs:   # MP4 등 — 프레임 핸들러가 알리지 않은 완성 파일
+            if os.path.isfile(path) and os.path.abspath(path) not in tel.completed:
+                tel.complete(path, view=view_name(scene), frame=None,
+                             render_s=round(time.perf_counter() - t_render, 4))
+        for path in outputs:
+            size, files = output_bytes(path)
+            tel.emit("output", path=path, bytes=size, files=files)
+        for rec in aux.summary() if aux else ():
+            tel.emit("passes", **rec)
+    except BaseException as exc:
+        tel.emit("run_end", status="failed", error=f"{type(exc).__name__}: {exc}",
+                 seconds=round(time.perf_counter() - tel.t0, 3), peak_rss_mb=peak_rss_mb())
+        renderdb.record(tel.events, tel.params)
+        if tel.stream:
+            tel.stream.close()
+        raise
+    tel.emit("run_end", status="ok", seconds=round(time.perf_counter() - tel.t0, 3), peak_rss_mb=peak_rss_mb())
+    renderdb.record(tel.events, tel.params)
+    if tel.stream:
+        tel.stream.close()
+    return outputs
@@ -0,0 +1,173 @@
+"""고해상도 스틸 1장을 N개 영역으로 쪼개 Blender N개 프로세스에서 병렬 렌더 → 무손실로 잇는다.
+
+뷰를 나눠 병렬화할 수 없는 단일 스틸(4K 배경 플레이트·뷰 시트 한 장)용. 각 프로세스는
+BLOCKOUT_REGION 으로 자기 영역 + 이음새 여유(overlap)만 그리고, 이미지는 전체 크기 BMP로 쓴다
+(잘라내지 않으니 타일끼리 픽셀 좌표가 같다). 잇기는 각 타일의 코어 영역만 바이트 그대로 옮기고,
+이음새 검사는 이웃 타일이 **둘 다 그린** overlap 띠를 바이트 단위로 비교한다 — Cycles 디노이저·
+AA 필터가 영역 가장자리에서 달라지면 여기서 숫자로 드러난다.
+
+실행 (Blender 밖, 표준 라이브러리만):
+  python research/tools/blockout_kit/tiled.py \\
+    --script research/experiments/bg-viewsheet-from-3d/courtroom_blockout.py \\
+    --res 3840x2160 --tiles 4 --env BG3D_VIEWS=view_bench_eye --env BG3D_SAMPLES=160 \\
+    --out research/experiments/bg-viewsheet-from-3d/views_4k/view_bench_eye.png
+  python research/tools/blockout_kit/tiled.py \\
+    --script research/experiments/previz-bg-plate-ab/blockout_plate_sh_04_19.py \\
+    --res 3840x2160 --tiles 6 --out research/experiments/previz-bg-plate-ab/plates/blockout_grey_4k.png
+
+Blender 경로는 BLENDER 환경변수(기본 "blender"). 이음새 평균 차가 --seam-tol(8비트 단계)을 넘으면
+결과는 쓰되 종료 코드 2 — overlap 을 넓히거나(--overlap) 디노이저 영향인지 확인할 것.
+"""
+import argparse
+import json
+import math
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from blockout_kit.images import read_bmp, write_png  # noqa: E402
+
+
+def grid(n):
+    """n 을 cols×rows 로 — 정사각에 가장 가까운 약수 쌍 (소수면 세로 띠 n개)."""
+    for cols in range(math.ceil(math.sqrt(n)), n + 1):
+        if n % cols == 0:
+            return cols, n // cols
+    return n, 1
+
+
+def layout(w, h, n, overlap):
+    """타일 목록 — 코어 픽셀 영역(위→아래 좌표)과 Blender 영역(0~1, 아래→위, overlap 포함)."""
+    cols, rows = grid(n)
+    xs = [round(i * w / cols) for i in range(cols + 1)]
+    ys = [round(j * h / rows) for j in range(rows + 1)]
+    tiles = []
+    for r in range(rows):
+        for c in range(cols):
+            x0, x1, y0, y1 = xs[c], xs[c + 1], ys[r], ys[r + 1]
+            rx0, rx1 = max(0, x0 - overlap), min(w, x1 + overlap)
+            ry0, ry1 = max(0, y0 - overlap), min(h, y1 + overlap)
+            tiles.append({"r": r, "c": c, "core": (x0, x1, y0, y1),
+                          "region": (rx0 / w, rx1 / w, (h - ry1) / h, (h - ry0) / h)})
+    return cols, rows, tiles
+
+
+def render_tiles(blender, script, res, tiles, env_extra, tmp):
+    threads = max(1, (os.cpu_count() or 1) // len(tiles))
+    procs = []
+    for i, t in enumerate(tiles):
+        t["path"] = os.path.join(tmp, f"tile_{i:02d}.bmp")
+        env = dict(os.environ, **env_extra,
+                   BLOCKOUT_RES=res, BLOCKOUT_FORMAT="BMP", BLOCKOUT_OUT=t["path"],
+                   BLOCKOUT_REGION=",".join(f"{v:.6f}" for v in t["region"]))
+        log = open(os.path.join(tmp, f"tile_{i:02d}.log"), "w")
+        cmd = [blender, "--background", "-t", str(threads), "--python", script]
+        procs.append((t, subprocess.Popen(cmd, env=env, stdout=log, stderr=subprocess.STDOUT), log, time.time()))
+    for t, p, log, t0 in procs:
+        code = p.wait()
+        log.close()
+        t["seconds"] = round(time.time() - t0, 2)
+        if code != 0 or not os.path.exists(t["path"]):
+            raise SystemExit(f"[tiled] 타일 {t['r']},{t['c']} 실패 (exit {code}) — 로그: {log.name}")
+
+
+def _band_diff(a_rows, b_rows, x0, x1, y0, y1):
+    total, peak, n = 0, 0, 0
+    for y in range(y0, y1):
+        ra, rb = a_rows[y][x0 * 3:x1 * 3], b_rows[y][x0 * 3:x1 * 3]
+        for u, v in zip(ra, rb):
+            d = u - v if u > v else v - u
+            total += d
+            if d > peak:
+                peak = d
+        n += len(ra)
+    return (total / n if n else 0.0), peak
+
+
+def seam_report(tiles, images, cols, rows, w, h, overlap):
+    """이웃 타일이 둘 다 그린 overlap 띠(코어 경계 ±overlap/2)를 비교."""
+    by_rc = {(t["r"], t["c"]): i for i, t in enumerate(tiles)}
+    half = max(1, overlap // 2)
+    seams = []
+    for t in tiles:
+        x0, x1, y0, y1 = t["core"]
+        i = by_rc[(t["r"], t["c"])]
+        if t["c"] + 1 < cols:
+            j = by_rc[(t["r"], t["c"] + 1)]
+            mean, peak = _band_diff(images[i], images[j], max(0, x1 - half), min(w, x1 + half), y0, y1)
+            seams.append({"between": [i, j], "axis": "x", "at": x1, "mean": round(mean, 4), "max": peak})
+        if t["r"] + 1 < rows:
+            j = by_rc[(t["r"] + 1, t["c"])]
+            mean, peak = _band_diff(images[i], images[j], x0, x1, max(0, y1 - half), min(h, y1 + half))
+            seams.append({"between": [i, j], "axis": "y", "at": y1, "mean": round(mean, 4), "max": peak})
+    return seams
+
+
+def stitch(tiles, images, h):
+    out = []
+    for y in range(h):
+        row = []
+        for i, t in enumerate(tiles):
+            x0, x1, y0, y1 = t["core"]
+            if y0 <= y < y1:
+                row.append(images[i][y][x0 * 3:x1 * 3])
+        out.append(b"".join(row))
+    return out
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="스틸 1장 영역 분할 병렬 렌더 + 무손실 잇기")
+    ap.add_argument("--script", required=True, help="블록아웃 스크립트 (스틸 1장을 렌더하는 것)")
+    ap.add_argument("--res", default="3840x2160")
+    ap.add_argument("--tiles", type=int, default=4)
+    ap.add_argument("--overlap", type=int, default=16, help="이음새 여유 픽셀 (코어 바깥 양쪽)")
+    ap.add_argument("--seam-tol", type=float, default=0.5, help="이음새 평균 차 허용치 (8비트 단계)")
+    ap.add_argument("--env", action="append", default=[], help="K=V — 스크립트 환경변수 (여러 번)")
+    ap.add_argument("--out", required=True)
+    ap.add_argument("--keep-tiles", action="store_true")
+    args = ap.parse_args(argv)
+
+    w, h = (int(v) for v in args.res.lower().split("x"))
+    cols, rows, tiles = layout(w, h, args.tiles, args.overlap)
+    env_extra = dict(kv.split("=", 1) for kv in args.env)
+    blender = os.environ.get("BLENDER", "blender")
+    t0 = time.time()
+    tmp = tempfile.mkdtemp(prefix="blockout_tiles_")
+    print(f"[tiled] {args.res} → {cols}×{rows} 타일, overlap {args.overlap}px, 작업 폴더 {tmp}")
+    render_tiles(blender, os.path.abspath(args.script), args.res, tiles, env_extra, tmp)
+    render_s = time.time() - t0
+
+    images = []
+    for t in tiles:
+        tw, th, tile_rows = read_bmp(t["path"])
+        if (tw, th) != (w, h):
+            raise SystemExit(f"[tiled] 타일 크기 {tw}x{th} ≠ {w}x{h} — 스크립트가 BLOCKOUT_RES 를 안 읽는다")
+        images.append(tile_rows)
+    seams = seam_report(tiles, images, cols, rows, w, h, args.overlap)
+    os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+    write_png(args.out, w, h, stitch(tiles, images, h))
+
+    bad = [s for s in seams if s["mean"] > args.seam_tol]
+    report = {"script": args.script, "res": [w, h], "grid": [cols, rows], "overlap": args.overlap,
+              "env": env_extra, "render_seconds": round(render_s, 2),
+              "total_seconds": round(time.time() - t0, 2),
+              "tiles": [{k: t[k] for k in ("r", "c", "core", "region", "seconds")} for t in tiles],
+              "seams": seams, "seam_tol": args.seam_tol, "seams_ok": not bad}
+    with open(os.path.splitext(args.out)[0] + ".tiles.json", "w", encoding="utf-8") as fh:
+        json.dump(report, fh, ensure_ascii=False, indent=2)
+    if not args.keep_tiles:
+        shutil.rmtree(tmp, ignore_errors=True)
+    worst = max((s["mean"] for s in seams), default=0.0)
+    print(f"[tiled] DONE → {args.out} ({render_s:.1f}s 렌더, 이음새 최대 평균차 {worst:.3f})")
+    if bad:
+        print(f"[tiled] 이음새 {len(bad)}곳이 허용치 {args.seam_tol} 초과: {bad}", file=sys.stderr)
+        return 2
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
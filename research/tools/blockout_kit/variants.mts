@@ -0,0 +1,183 @@
+// 업로드용 변형 — 렌더가 끝난 PNG 스틸·MP4 를 다시 렌더하지 않고 WebP/AVIF·용량 상한 MP4 로 줄인다.
+//   드라이버(bg-run.mts·viz.mts)는 풀사이즈 PNG·MP4 를 생성 서비스에 올린다. 업로드 대역·지연을 줄이려고
+//   바이트 예산을 주면 이미 렌더된 파일에서 품질을 이진 탐색해 예산 안의 최고 품질을 찾는다.
+//   스틸: sharp(webp/avif quality), 동영상: ffmpeg libx264 CRF. 최저 품질로도 넘으면 3/4 씩 줄여 다시.
+//   결과는 원본 옆 <원본>.variants.json — 변형별 경로·포맷·바이트·품질·크기. 원본 크기·mtime 이 같으면 재사용.
+// 예산은 BLOCKOUT_UPLOAD_BUDGET("400k", "2m", 바이트) — 없으면 uploadable() 은 원본을 그대로 준다
+//   (드라이버는 A/B 실험이라 업로드 바이트가 바뀌면 변인이 된다 — 켠 실행은 manifest 에 변형을 남긴다).
+// 실행: pnpm dlx tsx research/tools/blockout_kit/variants.mts [--budget 400k] [--formats webp,avif,mp4] 파일...
+import { execFileSync } from 'node:child_process'
+import { existsSync, readFileSync, statSync, unlinkSync, writeFileSync } from 'node:fs'
+import { basename, dirname, extname, join } from 'node:path'
+import { fileURLToPath } from 'node:url'
+import sharp from 'sharp'
+
+export type VariantFormat = 'webp' | 'avif' | 'png' | 'mp4'
+
+export type Variant = {
+  path: string
+  format: VariantFormat
+  bytes: number
+  quality?: number // webp/avif quality (높을수록 좋다)
+  crf?: number // mp4 CRF (낮을수록 좋다)
+  width?: number
+  height?: number
+  within_budget: boolean
+}
+
+export type VariantManifest = {
+  source: string
+  source_bytes: number
+  source_mtime_ms: number
+  budget_bytes: number | null
+  created_at: string
+  variants: Variant[]
+}
+
+const MIME: Record<VariantFormat, string> = { webp: 'image/webp', avif: 'image/avif', png: 'image/png', mp4: 'video/mp4' }
+const STILL_Q = { webp: { min: 30, max: 95, dflt: 90 }, avif: { min: 25, max: 90, dflt: 60 } }
+const CRF = { best: 18, worst: 40, dflt: 23 }
+const SHRINK = 0.75
+const MAX_SHRINK = 3
+
+export function parseBytes(spec: string | number | undefined): number | null {
+  if (spec === undefined || spec === '') return null
+  if (typeof spec === 'number') return spec
+  const m = /^(\d+(?:\.\d+)?)\s*([kmg]?)b?$/i.exec(spec.trim())
+  if (!m) throw new Error(`바이트 예산 형식: 400k / 2m / 123456 (받은 값 ${spec})`)
+  return Math.round(Number(m[1]) * { '': 1, k: 1024, m: 1024 ** 2, g: 1024 ** 3 }[m[2].toLowerCase() as '' | 'k' | 'm' | 'g'])
+}
+
+const manifestPath = (src: string) => `${src}.variants.json`
+const stem = (src: string) => join(dirname(src), basename(src, extname(src)))
+
+/** fits(q) 가 참인 가장 좋은 q — lo..hi 에서 좋은 쪽이 hi (단조라고 본다). 없으면 null. */
+async function searchBest(lo: number, hi: number, fits: (q: number) => Promise<boolean>): Promise<number | null> {
+  if (!(await fits(lo))) return null
+  while (lo < hi) {
+    const mid = Math.ceil((lo + hi) / 2)
+    if (await fits(mid)) lo = mid
+    else hi = mid - 1
+  }
+  return lo
+}
+
+async function stillVariant(src: string, format: 'webp' | 'avif', budget: number | null): Promise<Variant> {
+  const meta = await sharp(src).metadata()
+  const range = STILL_Q[format]
+  const encode = (q: number, width: number) =>
+    sharp(src).resize({ width, withoutEnlargement: true })[format]({ quality: q }).toBuffer({ resolveWithObject: true })
+  let width = meta.width ?? 0
+  let best: { data: Buffer; info: sharp.OutputInfo; q: number } | null = null
+  if (budget === null) {
+    const { data, info } = await encode(range.dflt, width)
+    best = { data, info, q: range.dflt }
+  } else {
+    for (let shrink = 0; shrink <= MAX_SHRINK && !best; shrink++, width = Math.round(width * SHRINK)) {
+      const found: Record<number, { data: Buffer; info: sharp.OutputInfo }> = {}
+      const q = await searchBest(range.min, range.max, async (q) => {
+        found[q] = await encode(q, width)
+        return found[q].data.length <= budget
+      })
+      if (q !== null) best = { ...found[q], q }
+    }
+    if (!best) {   // 최소 크기·최저 품질로도 넘는다 — 그래도 가장 작은 것을 남기고 within_budget=false
+      const { data, info } = await encode(range.min, Math.round((meta.width ?? 0) * SHRINK ** MAX_SHRINK))
+      best = { data, info, q: range.min }
+    }
+  }
+  const path = `${stem(src)}.${format}`
+  writeFileSync(path, best.data)
+  return { path, format, bytes: best.data.length, quality: best.q, width: best.info.width, height: best.info.height,
+    within_budget: budget === null || best.data.length <= budget }
+}
+
+function encodeMp4(src: string, dest: string, crf: number, scale: number): number {
+  const vf = scale < 1 ? ['-vf', `scale=trunc(iw*${scale}/2)*2:trunc(ih*${scale}/2)*2`] : []
+  execFileSync('ffmpeg', ['-y', '-loglevel', 'error', '-i', src, ...vf, '-c:v', 'libx264', '-preset', 'medium',
+    '-crf', String(crf), '-pix_fmt', 'yuv420p', '-movflags', '+faststart', '-an', dest], { stdio: 'ignore' })
+  return statSync(dest).size
+}
+
+async function videoVariant(src: string, budget: number | null): Promise<Variant> {
+  const path = `${stem(src)}.small.mp4`
+  const tmp = `${path}.try.mp4`
+  let scale = 1
+  let crf: number | null = CRF.dflt
+  if (budget !== null) {
+    crf = null
+    for (let shrink = 0; shrink <= MAX_SHRINK; shrink++) {
+      scale = SHRINK ** shrink
+      // 좋은 쪽이 hi 가 되게 -CRF 로 탐색
+      const q = await searchBest(-CRF.worst, -CRF.best, async (q) => encodeMp4(src, tmp, -q, scale) <= budget)
+      if (q !== null) { crf = -q; break }
+    }
+    if (crf === null) crf = CRF.worst   // 최소 크기·최고 CRF 로도 넘는다 — within_budget=false 로 남긴다
+    if (existsSync(tmp)) unlinkSync(tmp)
+  }
+  const bytes = encodeMp4(src, path, crf, scale)
+  return { path, format: 'mp4', bytes, crf, within_budget: budget === null || bytes <= budget }
+}
+
+/** src 의 변형을 쓰고 manifest 를 돌려준다. 원본·예산이 같으면 기존 manifest 재사용. */
+export async function writeVariants(src: string, opts: { budget?: number | null; formats?: VariantFormat[] } = {}):
+  Promise<VariantManifest> {
+  const budget = opts.budget ?? parseBytes(process.env.BLOCKOUT_UPLOAD_BUDGET)
+  const st = statSync(src)
+  const isVideo = extname(src).toLowerCase() === '.mp4'
+  // 이 미디어로 만들 수 있는 포맷만 — 스틸은 webp/avif, 클립은 mp4. 못 만드는 포맷이 남으면 아래 재사용 검사가
+  // 영영 참이 안 돼 매번 다시 인코딩한다 (uploadable 의 기본 accept 에는 둘이 섞여 있다).
+  const producible: VariantFormat[] = isVideo ? ['mp4'] : ['webp', 'avif']
+  const formats = (opts.formats ?? producible).filter((f) => producible.includes(f))
+  const mpath = manifestPath(src)
+  if (existsSync(mpath)) {
+    const old: VariantManifest = JSON.parse(readFileSync(mpath, 'utf8'))
+    const same = old.source_bytes === st.size && old.source_mtime_ms === st.mtimeMs && old.budget_bytes === budget
+    if (same && formats.every((f) => old.variants.some((v) => v.format === f && existsSync(v.path)))) return old
+  }
+  const variants: Variant[] = [{ path: src, format: isVideo ? 'mp4' : 'png', bytes: st.size,
+    within_budget: budget === null || st.size <= budget }]
+  for (const f of formats) {
+    variants.push(f === 'mp4' ? await videoVariant(src, budget) : await stillVariant(src, f as 'webp' | 'avif', budget))
+  }
+  const manifest: VariantManifest = { source: src, source_bytes: st.size, source_mtime_ms: st.mtimeMs,
+    budget_bytes: budget, created_at: new Date().toISOString(), variants }
+  writeFileSync(mpath, JSON.stringify(manifest, null, 2))
+  return manifest
+}
+
+/** 업로드할 파일 — 예산이 없으면 원본. 있으면 accept 포맷 중 예산 안의 가장 작은 변형(없으면 가장 작은 것). */
+export async function uploadable(src: string, opts: { budget?: number | null; accept?: VariantFormat[] } = {}):
+  Promise<{ path: string; name: string; mime: string; bytes: number; variant: Variant | null }> {
+  const budget = opts.budget ?? parseBytes(process.env.BLOCKOUT_UPLOAD_BUDGET)
+  const original = { path: src, name: basename(src), mime: MIME[extname(src).toLowerCase() === '.mp4' ? 'mp4' : 'png'],
+    bytes: statSync(src).size, variant: null }
+  if (budget === null || original.bytes <= budget) return original
+  const accept = opts.accept ?? ['webp', 'png', 'mp4']
+  const manifest = await writeVariants(src, { budget, formats: accept.filter((f) => f !== 'png') })
+  const pool = manifest.variants.filter((v) => accept.includes(v.format))
+  const fitting = pool.filter((v) => v.within_budget)
+  const pick = (fitting.length ? fitting : pool).sort((a, b) => a.bytes - b.bytes)[0]
+  if (!pick) return original
+  return { path: pick.path, name: basename(pick.path), mime: MIME[pick.format], bytes: pick.bytes, variant: pick }
+}
+
+if (process.argv[1] === fileURLToPath(import.meta.url)) {
+  const args = process.argv.slice(2)
+  let budget: number | null = null
+  let formats: VariantFormat[] | undefined
+  const files: string[] = []
+  for (let i = 0; i < args.length; i++) {
+    if (args[i] === '--budget') budget = parseBytes(args[++i])
+    else if (args[i] === '--formats') formats = args[++i].split(',') as VariantFormat[]
+    else files.push(args[i])
+  }
+  if (!files.length) throw new Error('usage: variants.mts [--budget 400k] [--formats webp,avif,mp4] 파일...')
+  for (const f of files) {
+    const m = await writeVariants(f, { budget, formats })
+    for (const v of m.variants) {
+      console.log(`${v.within_budget ? ' ' : '!'} ${(v.bytes / 1024).toFixed(0).padStart(7)} KiB  ${v.format.padEnd(4)} ` +
+        `${v.quality !== undefined ? `q${v.quality}` : v.crf !== undefined ? `crf${v.crf}` : '원본'}  ${v.path}`)
+    }
+  }
+}
@@ -0,0 +1,49 @@
+// 상주 Blender 워커(worker.py) 클라이언트 — run.mts 드라이버가 블록아웃 잡을 시작 지연 없이 던질 때 쓴다.
+//   워커: blender --background --python research/tools/blockout_kit/worker.py -- --port 8765
+//   사용: const ids = await Promise.all(jobs.map(submitBlockout)); await waitBlockouts(ids)
+const BASE = `http://127.0.0.1:${process.env.BLOCKOUT_WORKER_PORT ?? '8765'}`
+
+export type BlockoutJob = {
+  script: string // 저장소 루트 기준 경로
+  params?: Record<string, string | number> // 스크립트 params — 환경변수와 같은 이름 (BG3D_* 등)
+  frame_start?: number
+  frame_end?: number
+  output?: string
+  priority?: number // 클수록 먼저
+}
+
+export type BlockoutJobStatus = {
+  id: string
+  state: 'queued' | 'running' | 'done' | 'failed'
+  seconds?: number
+  outputs?: string[]
+  builds?: number // 씬을 새로 지은 횟수 (0 = 직전 잡 씬 재사용)
+  reused?: number
+  error?: string
+  log?: string
+}
+
+export async function submitBlockout(job: BlockoutJob): Promise<string> {
+  const res = await fetch(`${BASE}/jobs`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify(job),
+  })
+  const body = await res.json()
+  if (!res.ok) throw new Error(`블록아웃 잡 거절: ${body.error}`)
+  return body.id
+}
+
+export async function waitBlockouts(ids: string[], pollMs = 500): Promise<BlockoutJobStatus[]> {
+  const done = new Map<string, BlockoutJobStatus>()
+  while (done.size < ids.length) {
+    for (const id of ids.filter((i) => !done.has(i))) {
+      const rec: BlockoutJobStatus = await (await fetch(`${BASE}/jobs/${id}`)).json()
+      if (rec.state === 'done' || rec.state === 'failed') done.set(id, rec)
+    }
+    if (done.size < ids.length) await new Promise((r) => setTimeout(r, pollMs))
+  }
+  const failed = [...done.values()].filter((r) => r.state === 'failed')
+  if (failed.length) throw new Error(`블록아웃 잡 실패: ${failed.map((r) => `${r.id} ${r.error}`).join('; ')}`)
+  return ids.map((id) => done.get(id)!)
+}
@@ -0,0 +1,216 @@
+"""상주 헤드리스 Blender 워커 — 한 번 뜬 Blender 가 로컬 HTTP 로 렌더 잡을 받아 차례로 돈다.
+
+블록아웃 스크립트마다 Blender 를 새로 띄우면 잡마다 수 초(Cycles 는 초기화까지 더)를 시작에 쓴다.
+워커는 그 비용을 한 번만 낸다. 잡 실행은 batch.py 의 Runner 와 같다 — 스크립트의 build_scene() 이
+씬을 새로 짓고(직전 잡과 스크립트·BUILD_PARAMS 가 같으면 그 씬을 재사용), params 는 환경변수가 아니라
+main(params) 경로로 직접 넘긴다. 씬을 새로 짓는 잡(재사용이 아니거나 앞 잡이 실패했을 때)은 공장 설정에서
+시작하니 오래 떠 있어도 앞 잡의 환경설정·씬 설정이 다음 잡에 새지 않는다 — 회귀 확인은 isolation.py.
+main() 없는 스크립트만 예전처럼 씬을 비우고 환경변수로 톱레벨 실행.
+
+  서버 (Blender 안):
+    blender --background --python research/tools/blockout_kit/worker.py -- --port 8765
+  잡 제출 (Blender 밖, 표준 라이브러리만):
+    python research/tools/blockout_kit/worker.py submit job.json [--wait] [--port 8765]
+
+잡 JSON:
+  {"script": "research/experiments/.../courtroom_blockout.py",   # 저장소 루트 기준 또는 절대 경로
+   "params": {"BG3D_SAMPLES": 24, "BG3D_VIEWS": "view_bench_eye"},  # 스크립트 환경변수와 같은 이름
+   "frame_start": 1, "frame_end": 24,                               # → BLOCKOUT_FRAME_START/END
+   "output": "/tmp/bench.png",                                      # → BLOCKOUT_OUT
+   "priority": 10}                                                  # 클수록 먼저 (같으면 먼저 온 순)
+
+HTTP:
+  POST /jobs          잡 제출 → {"id": ...}
+  GET  /jobs          전체 잡 상태
+  GET  /jobs/<id>     한 잡 상태 (queued|running|done|failed, seconds, log, error)
+  GET  /health        {"ok": true, "queued": n, "blender": "5.2.0"}
+  POST /shutdown      큐를 비우고 종료
+bpy 는 메인 스레드에서만 만진다 — HTTP 스레드는 큐에 넣기만 한다.
+"""
+import argparse
+import contextlib
+import heapq
+import io
+import itertools
+import json
+import os
+import sys
+import threading
+import time
+import traceback
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from blockout_kit.batch import Runner, job_params, resolve_script  # noqa: E402
+
+DEFAULT_PORT = 8765
+
+
+class _Tee(io.TextIOBase):
+    def __init__(self, *streams):
+        self.streams = streams
+
+    def write(self, s):
+        for st in self.streams:
+            st.write(s)
+        return len(s)
+
+    def flush(self):
+        for st in self.streams:
+            st.flush()
+
+
+class JobQueue:
+    def __init__(self):
+        self.heap = []
+        self.jobs = {}
+        self.seq = itertools.count()
+        self.cv = threading.Condition()
+        self.stopping = False
+
+    def submit(self, job):
+        resolve_script(job["script"])
+        with self.cv:
+            n = next(self.seq)
+            jid = f"j{n:05d}"
+            self.jobs[jid] = {"id": jid, "state": "queued", "job": job, "submitted_at": time.time()}
+            heapq.heappush(self.heap, (-int(job.get("priority", 0)), n, jid))
+            self.cv.notify()
+        return jid
+
+    def next(self, timeout=0.5):
+        with self.cv:
+            if not self.heap:
+                self.cv.wait(timeout)
+            if not self.heap:
+                return None
+            _, _, jid = heapq.heappop(self.heap)
+            self.jobs[jid]["state"] = "running"
+            return self.jobs[jid]
+
+    def status(self, jid=None):
+        with self.cv:
+            if jid is not None:
+                return dict(self.jobs[jid]) if jid in self.jobs else None
+            return [dict(j) for j in self.jobs.values()]
+
+
+def run_job(runner, rec):
+    """메인 스레드에서 잡 1개. 출력은 워커 로그와 잡 기록(log) 양쪽에 남긴다."""
+    job = rec["job"]
+    buf = io.StringIO()
+    t0 = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(_Tee(sys.stdout, buf)):
+            rec.update(runner.run(dict(job, params=job_params(job))))
+        rec["state"] = "done"
+    except BaseException as exc:  # noqa: BLE001 — 스크립트의 SystemExit 도 잡 실패로만 남긴다
+        rec["state"] = "failed"
+        rec["error"] = f"{type(exc).__name__}: {exc}"
+        buf.write(traceback.format_exc())
+    finally:
+        rec["seconds"] = round(time.perf_counter() - t0, 3)
+        rec["log"] = buf.getvalue()[-4000:]
+    print(f"[worker] {rec['id']} {rec['state']} {rec['seconds']}s ← {job['script']}")
+
+
+def make_handler(queue):
+    class Handler(BaseHTTPRequestHandler):
+        def _send(self, code, body):
+            data = json.dumps(body, ensure_ascii=False).encode()
+            self.send_response(code)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, fmt, *args):  # 기본 접근 로그는 렌더 로그를 덮는다
+            pass
+
+        def do_GET(self):
+            if self.path == "/health":
+                import bpy
+                self._send(200, {"ok": True, "queued": len(queue.heap),
+                                 "blender": bpy.app.version_string})
+            elif self.path == "/jobs":
+                self._send(200, queue.status())
+            elif self.path.startswith("/jobs/"):
+                rec = queue.status(self.path.rsplit("/", 1)[1])
+                self._send(200 if rec else 404, rec or {"error": "no such job"})
+            else:
+                self._send(404, {"error": "not found"})
+
+        def do_POST(self):
+            if self.path == "/shutdown":
+                queue.stopping = True
+                self._send(200, {"ok": True})
+                return
+            if self.path != "/jobs":
+                self._send(404, {"error": "not found"})
+                return
+            try:
+                n = int(self.headers.get("Content-Length", "0"))
+                job = json.loads(self.rfile.read(n) or b"{}")
+                self._send(202, {"id": queue.submit(job)})
+            except (KeyError, ValueError, FileNotFoundError) as exc:
+                self._send(400, {"error": f"{type(exc).__name__}: {exc}"})
+    return Handler
+
+
+def serve(port):
+    queue = JobQueue()
+    runner = Runner()
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(queue))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"[worker] http://127.0.0.1:{port} 대기 중")
+    while not queue.stopping or queue.heap:
+        rec = queue.next()
+        if rec is not None:
+            run_job(runner, rec)
+    server.shutdown()
+    print("[worker] 종료")
+
+
+def submit(path, port, wait):
+    """Blender 밖 클라이언트 — 잡 JSON(객체 또는 배열)을 제출하고, --wait 면 전부 끝날 때까지 기다린다."""
+    with open(path, encoding="utf-8") as fh:
+        jobs = json.load(fh)
+    base = f"http://127.0.0.1:{port}"
+    ids = []
+    for job in jobs if isinstance(jobs, list) else [jobs]:
+        req = urllib.request.Request(f"{base}/jobs", data=json.dumps(job).encode(),
+                                     headers={"Content-Type": "application/json"}, method="POST")
+        with urllib.request.urlopen(req) as res:
+            ids.append(json.load(res)["id"])
+    print(json.dumps(ids))
+    failed = 0
+    while wait and ids:
+        time.sleep(0.5)
+        for jid in list(ids):
+            with urllib.request.urlopen(f"{base}/jobs/{jid}") as res:
+                rec = json.load(res)
+            if rec["state"] in ("done", "failed"):
+                ids.remove(jid)
+                failed += rec["state"] == "failed"
+                print(f"{jid} {rec['state']} {rec.get('seconds')}s {rec.get('error', '')}")
+    return 1 if failed else 0
+
+
+def main(argv):
+    ap = argparse.ArgumentParser(description="상주 Blender 렌더 워커")
+    ap.add_argument("command", nargs="?", default="serve", choices=("serve", "submit"))
+    ap.add_argument("job", nargs="?", help="submit: 잡 JSON 경로")
+    ap.add_argument("--port", type=int, default=int(os.environ.get("BLOCKOUT_WORKER_PORT", DEFAULT_PORT)))
+    ap.add_argument("--wait", action="store_true")
+    args = ap.parse_args(argv)
+    if args.command == "submit":
+        return submit(args.job, args.port, args.wait)
+    serve(args.port)
+    return 0
+
+
+if __name__ == "__main__":
+    # Blender 는 "--" 뒤 인자만 스크립트 몫이다
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else sys.argv[1:]
+    sys.exit(main(argv))